@@ -4,11 +4,13 @@ from typing import Dict, List
 from ir.ir_types import Function, Instr, Var, Const
 from codegen.x86ir import (
     Program, Imm, Reg, Mem, Label, LabelDef,
-    Mov, Add, Sub, IMul, Cmp, Idiv, Jcc, Jmp, Ret, FrameRef, Push, Pop,
+    Mov, Add, Sub, IMul, Shl, Sar, Cmp, Idiv, Jcc, Jmp, Ret, FrameRef, Push, Pop,
     print_program,
 )
 from codegen.ra import allocate_registers_on_program
 
+EPILOGUE = "_Epilogue"   # label of the stack-mode epilogue shared by all returns
+
 # Virtual register naming
 
 @dataclass
@@ -131,9 +133,14 @@ def emit_mov(dst, a, vregs: VRegs, out: Program, frame: FrameLayout | None):
         raise TypeError("mov dst must be a Var")
 
 
+# signed condition codes for each comparison, and for its negation
+JCC = {"==":"je","!=":"jne","<":"jl","<=":"jle",">":"jg",">=":"jge"}
+JCC_NOT = {"==":"jne","!=":"je","<":"jge","<=":"jg",">":"jle",">=":"jl"}
+
+
 def emit_binop(dst, a, op, b, vregs: VRegs, out: Program,frame: FrameLayout | None):
     # comparisons -> booleanize (0/1)
-    comp_jcc = {"==":"je","!=":"jne","<":"jl","<=":"jle",">":"jg",">=":"jge"}
+    comp_jcc = JCC
     if op in comp_jcc:
         
         if isinstance(dst, Var) and is_temp(dst):
@@ -179,7 +186,10 @@ def emit_binop(dst, a, op, b, vregs: VRegs, out: Program,frame: FrameLayout | No
     if op == "%":
         raise NotImplementedError("Modulo (%) is not supported yet (by design).")
 
-    # arithmetic +, -, * (two-operand: dst := dst op src)
+    if op in ("<<", ">>") and not isinstance(b, Const):
+        raise NotImplementedError("Shifts are only emitted with a constant count.")
+
+    # arithmetic +, -, *, <<, >> (two-operand: dst := dst op src)
     # Choose accumulator 
     if isinstance(dst, Var) and is_temp(dst):
         dst_where = Reg(vregs.reg_of(dst.name))
@@ -202,6 +212,10 @@ def emit_binop(dst, a, op, b, vregs: VRegs, out: Program,frame: FrameLayout | No
         out.append(Sub(acc, src_op))
     elif op == "*":
         out.append(IMul(acc, src_op))
+    elif op == "<<":
+        out.append(Shl(acc, src_op))
+    elif op == ">>":
+        out.append(Sar(acc, src_op))
     else:
         raise NotImplementedError(f"Unsupported binop: {op}")
 
@@ -261,6 +275,21 @@ def emit_br(cond, tlabel: str, flabel: str, next_label: str, vregs: VRegs, out:
         out.append(Jcc("jne", Label(tlabel)))
         out.append(Jmp(Label(flabel)))
 
+def emit_cbr(a, op, b, tlabel: str, flabel: str, next_label: str, vregs: VRegs, out: Program, frame: FrameLayout | None):
+    """
+    Compare a with b and branch on op with one jcc (no 0/1 temp). As in
+    emit_br, a target that is the next block is reached by falling through.
+    """
+    left = ensure_in("R5", a, vregs, out, frame)
+    out.append(Cmp(left, opnd(b, vregs, frame)))
+    if next_label == flabel:
+        out.append(Jcc(JCC[op], Label(tlabel)))
+    elif next_label == tlabel:
+        out.append(Jcc(JCC_NOT[op], Label(flabel)))
+    else:
+        out.append(Jcc(JCC[op], Label(tlabel)))
+        out.append(Jmp(Label(flabel)))
+
 def emit_instr(ins: Instr, next_blk_label: str, vregs: VRegs, out: Program, frame: FrameLayout | None):
     k = ins.kind
     if k == "label":
@@ -273,8 +302,11 @@ def emit_instr(ins: Instr, next_blk_label: str, vregs: VRegs, out: Program, fram
         emit_unop(ins.dst, ins.op, ins.a, vregs, out, frame)
     elif k == "br":
         emit_br(ins.a, ins.tlabel, ins.flabel, next_blk_label, vregs, out, frame)
+    elif k == "cbr":
+        emit_cbr(ins.a, ins.op, ins.b, ins.tlabel, ins.flabel, next_blk_label, vregs, out, frame)
     elif k == "jmp":
-        out.append(Jmp(Label(ins.tlabel)))
+        if ins.tlabel != next_blk_label:   # else fall through
+            out.append(Jmp(Label(ins.tlabel)))
     elif k == "ret":
         if ins.a is None:
             # real x86 returns don’t carry an operand
@@ -306,6 +338,10 @@ def _dedupe_adjacent(lines):
 def _name(o):
     return getattr(o, "name", "").lower()
 
+def _is_epilogue_jmp(ins):
+    # a jump to the shared epilogue returns just like a Ret
+    return isinstance(ins, Jmp) and ins.target.name == EPILOGUE
+
 def _is_epilogue_ins(ins):
     # Treat stack epilogue as "transparent" between tail shuffles and ret
     return (isinstance(ins, Add) and isinstance(ins.dst, Reg) and _name(ins.dst) == "rsp") \
@@ -317,6 +353,7 @@ def peephole_ret_rax_program(prog: Program) -> Program:
     Handles both:
       - mov Rt, rax ; mov rax, Rt ; ret
       - mov Rt, rax ; mov rax, Rt ; (add rsp, K)? ; (pop rbp)? ; ret
+      - mov Rt, rax ; mov rax, Rt ; jmp _Epilogue
     Also drops 'mov rax, rax'.
     """
     out: Program = []
@@ -343,7 +380,7 @@ def peephole_ret_rax_program(prog: Program) -> Program:
                 j = i + 2
                 while j < n and _is_epilogue_ins(prog[j]):
                     j += 1
-                if j < n and isinstance(prog[j], Ret):
+                if j < n and (isinstance(prog[j], Ret) or _is_epilogue_jmp(prog[j])):
                     # Keep the epilogue (if any), drop the two movs
                     # Emit any epilogue between them and the ret, then the ret
                     # First, copy through everything from i+2 up to and including j
@@ -439,18 +476,20 @@ def emit_function(fn: Function, enable_ra: bool = False, frame_mode: str = "off"
 
     # If stack mode, fix every Ret to epilogue form
     if frame_mode == "stack":
-        patched = []
-        for ins in prog:
-            if isinstance(ins, Ret):
-                # replace with epilogue
-                if frame.size:
-                    patched.append(Add(Reg("RSP"), Imm(frame.size)))  # add back
-                # 'mov rsp, rbp; pop rbp'; 
-                patched.append(Pop(Reg("RBP")))                      # "pop rbp"
-                patched.append(Ret())
-            else:
-                patched.append(ins)
-        prog = patched
+        epilogue: Program = []
+        if frame.size:
+            epilogue.append(Add(Reg("RSP"), Imm(frame.size)))  # add back
+        # 'mov rsp, rbp; pop rbp'; 
+        epilogue.append(Pop(Reg("RBP")))                      # "pop rbp"
+        epilogue.append(Ret())
+        if sum(isinstance(ins, Ret) for ins in prog) > 1:
+            # several returns share one epilogue at the end
+            patched = [Jmp(Label(EPILOGUE)) if isinstance(ins, Ret) else ins for ins in prog]
+            if isinstance(patched[-1], Jmp) and patched[-1].target.name == EPILOGUE:
+                patched.pop()   # the last return falls through into it
+            prog = patched + [LabelDef(Label(EPILOGUE))] + epilogue
+        else:
+            prog = [x for ins in prog for x in (epilogue if isinstance(ins, Ret) else [ins])]
 
     # RA 
     if enable_ra and frame_mode == "stack":
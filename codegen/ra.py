@@ -22,6 +22,8 @@ from .x86ir import (
     Idiv,
     Mem,
     IMul,
+    Shl,
+    Sar,
     Jcc,
     Jmp,
     Program,
@@ -31,6 +33,8 @@ from .x86ir import (
     Pop,
 )
 
+from ir.analysis import solve_backward
+
 CALLER_SAVED = ["rax", "rcx", "rdx", "rsi", "rdi", "r8", "r9", "r10", "r11"]
 SPILL_SCRATCH = "r10"   # keep one scratch for spill reload/store
 
@@ -99,7 +103,7 @@ def reads_writes(ins: Instr) -> Tuple[Set[str], Set[str]]:
     if isinstance(ins, Mov):
         _add_vreg_read(ins.src, read)
         _add_vreg_write(ins.dst, write)
-    elif isinstance(ins, (Add, Sub, IMul)):
+    elif isinstance(ins, (Add, Sub, IMul, Shl, Sar)):
         # two-operand form: dst := dst op src
         _add_vreg_read(ins.dst, read)
         _add_vreg_read(ins.src, read)
@@ -136,7 +140,7 @@ def successors(p: Program) -> Dict[int, List[int]]:
     succ: Dict[int, List[int]] = defaultdict(list)
     for i, ins in enumerate(p):
         nxt = i + 1 if i + 1 < len(p) else None
-        if isinstance(ins, (Mov, Add, Sub, IMul, Cmp, Idiv, LabelDef, Push, Pop)):
+        if isinstance(ins, (Mov, Add, Sub, IMul, Shl, Sar, Cmp, Idiv, LabelDef, Push, Pop)):
             if nxt is not None:
                 succ[i].append(nxt)
         elif isinstance(ins, Ret):
@@ -155,6 +159,8 @@ def liveness(p: Program):
     """
     Standard backward liveness analysis.
     Returns IN, OUT, read, write lists indexed by instruction.
+    Solved with the same bit-vector worklist engine as the IR liveness
+    (ir.analysis.solve_backward), one bit per virtual register.
     """
     succ = successors(p)    #testing breakpoints
     read_list: List[Set[str]] = []
@@ -164,25 +170,34 @@ def liveness(p: Program):
         read_list.append(r)
         write_list.append(w)
 
-    IN: List[Set[str]] = [set() for _ in p]
-    OUT: List[Set[str]] = [set() for _ in p]
+    ids: Dict[str, int] = {}
+    for v in (v for rw in (read_list, write_list) for s in rw for v in s):
+        ids.setdefault(v, len(ids))
+
+    def bits(names: Set[str]) -> int:
+        m = 0
+        for v in names:
+            m |= 1 << ids[v]
+        return m
+
+    pred: Dict[int, List[int]] = defaultdict(list)
+    for i, outs in list(succ.items()):
+        for j in outs:
+            pred[j].append(i)
 
-    changed = True
-    while changed:
-        changed = False
-        for i in reversed(range(len(p))):
-            in_old, out_old = IN[i].copy(), OUT[i].copy()   #testing breaks
+    # IN[i] = read[i] ∪ (OUT[i] − write[i]), OUT[i] = ∪ IN[s]
+    order = list(reversed(range(len(p))))
+    use = {i: bits(read_list[i]) for i in order}
+    kill = {i: bits(write_list[i]) for i in order}
+    in_bits, out_bits = solve_backward(order, succ, pred, use, kill)
 
-            # OUT[i] = union of IN[s] for successors s
-            OUT[i].clear()
-            for j in succ[i]:
-                OUT[i] |= IN[j]
+    names = sorted(ids, key=ids.__getitem__)
 
-            # IN[i] = read[i] ∪ (OUT[i] − write[i])
-            IN[i] = read_list[i] | (OUT[i] - write_list[i])
+    def as_set(m: int) -> Set[str]:
+        return {names[k] for k in range(m.bit_length()) if m >> k & 1}
 
-            if IN[i] != in_old or OUT[i] != out_old:
-                changed = True
+    IN: List[Set[str]] = [as_set(in_bits[i]) for i in range(len(p))]
+    OUT: List[Set[str]] = [as_set(out_bits[i]) for i in range(len(p))]
 
     return IN, OUT, read_list, write_list
 
@@ -365,8 +380,8 @@ def rewrite_with_spills(
                     out.append(Mov(pdst, _phys(src, colors)))
             continue
 
-        # Add/Sub/IMul
-        if isinstance(ins, (Add, Sub, IMul)):
+        # Add/Sub/IMul/Shl/Sar
+        if isinstance(ins, (Add, Sub, IMul, Shl, Sar)):
             dst, src = ins.dst, ins.src
 
             # Spilled destination: load, op, store back
@@ -382,6 +397,10 @@ def rewrite_with_spills(
                     out.append(Add(Reg(SPILL_SCRATCH), s_op))
                 elif isinstance(ins, Sub):
                     out.append(Sub(Reg(SPILL_SCRATCH), s_op))
+                elif isinstance(ins, Shl):
+                    out.append(Shl(Reg(SPILL_SCRATCH), s_op))
+                elif isinstance(ins, Sar):
+                    out.append(Sar(Reg(SPILL_SCRATCH), s_op))
                 else:  # IMul
                     out.append(IMul(Reg(SPILL_SCRATCH), s_op))
 
@@ -397,6 +416,10 @@ def rewrite_with_spills(
                     out.append(Add(pdst, s_op))
                 elif isinstance(ins, Sub):
                     out.append(Sub(pdst, s_op))
+                elif isinstance(ins, Shl):
+                    out.append(Shl(pdst, s_op))
+                elif isinstance(ins, Sar):
+                    out.append(Sar(pdst, s_op))
                 else:  # IMul
                     out.append(IMul(pdst, s_op))
             continue
@@ -57,6 +57,16 @@ class IMul(Instr):
     dst: Reg
     src: Operand
 
+@dataclass
+class Shl(Instr):
+    dst: Reg
+    src: Imm      # shift count (only constant counts are emitted)
+
+@dataclass
+class Sar(Instr):
+    dst: Reg
+    src: Imm
+
 @dataclass
 class Cmp(Instr):
     a: Operand
@@ -127,6 +137,10 @@ def print_program(p: Program) -> List[str]:
             out.append(f"sub  {_op(ins.dst)}, {_op(ins.src)}")
         elif isinstance(ins, IMul):
             out.append(f"imul {_op(ins.dst)}, {_op(ins.src)}")
+        elif isinstance(ins, Shl):
+            out.append(f"shl  {_op(ins.dst)}, {_op(ins.src)}")
+        elif isinstance(ins, Sar):
+            out.append(f"sar  {_op(ins.dst)}, {_op(ins.src)}")
         elif isinstance(ins, Cmp):
             out.append(f"cmp  {_op(ins.a)}, {_op(ins.b)}")
         elif isinstance(ins, Idiv):
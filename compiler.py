@@ -12,7 +12,11 @@ from tac import generate_tac
 from ir.tac_adapter import tac_to_linear_ir, ir_to_tac
 from ir.builder import linear_to_blocks
 from ir.pipeline import optimize_function
+from ir.unroll import UNROLL_FACTOR
+from ir.passes import PASS_FNS, run_passes
 from ir.pretty import dump_blocks
+from ir.profile import ExecutionError, Profile, load_profiles, run_function, save_profiles
+from ir.ssa import to_ssa, from_ssa
 from codegen.pseudo_x86 import emit_function as emit_pseudo_x86
 
 def main():
@@ -34,10 +38,16 @@ def main():
     arg_parser.add_argument(
         '--passes',
         help='Comma-separated list of IR passes to run (overrides -O). '
-             'Options: constprop,constfold,drop_unreachable,dse,copyprop,algebra'
+             'Options: ' + ','.join(PASS_FNS)
     )
+    arg_parser.add_argument('--unroll-factor', type=int, default=UNROLL_FACTOR,
+                            help='Most body copies per trip when -O3 unrolls a loop partially (1 = full unrolling only, 0 = off)')
     arg_parser.add_argument('--trace-passes', action='store_true',
-                            help='After each pass, print IR basic blocks')
+                            help='After each pass, print the IR lines it changed')
+    arg_parser.add_argument('--profile-gen', metavar='FILE',
+                            help='Run the unoptimized IR and write block/branch counts to FILE')
+    arg_parser.add_argument('--profile-use', metavar='FILE',
+                            help='Guide block layout and unrolling with counts from a --profile-gen FILE')
     
     arg_parser.add_argument('--dump-blocks', action='store_true',
                         help='Print basic blocks after CFG building (pre-optimization)')
@@ -45,6 +55,8 @@ def main():
                             help='Include CFG successors in --dump-blocks output')
     arg_parser.add_argument('--dump-blocks-after', action='store_true',
                             help='Print basic blocks after optimization')
+    arg_parser.add_argument('--dump-ssa', action='store_true',
+                            help='Print the optimized blocks in SSA form (phis, x.N versions)')
     
         
     arg_parser.add_argument("--emit-pseudo-x86", action="store_true",
@@ -95,7 +107,7 @@ def main():
     # Decide if we need to parse (parser/semantic/symtab/tac all need the AST)
     need_parse = (
                     args.parser or args.semantic or args.symtab or args.tac
-                    or args.opt_level > 0 or args.constfold)
+                    or args.opt_level > 0 or args.constfold or args.passes)
     program_ast = None
 
     if need_parse:
@@ -146,11 +158,42 @@ def main():
         if args.dump_blocks:
             print(dump_blocks(fn, show_cfg=args.dump_cfg))
 
-        optimize_function(fn, opt_level=args.opt_level)
+        # profiles are keyed by the labels of the unoptimized IR
+        if args.profile_gen:
+            prof = Profile()
+            try:
+                result = run_function(fn, prof)
+            except ExecutionError as e:
+                print(f"Profiling error: {e}")
+                sys.exit(1)
+            save_profiles(args.profile_gen, {fn.name: prof})
+            print(f"Profile written to {args.profile_gen} ({fn.name} returned {result})")
+        if args.profile_use:
+            try:
+                fn.profile = load_profiles(args.profile_use).get(fn.name)
+            except (OSError, ValueError) as e:
+                print(f"Cannot read profile: {e}")
+                sys.exit(1)
+
+        if args.passes:
+            names = [n.strip() for n in args.passes.split(",") if n.strip()]
+            unknown = [n for n in names if n not in PASS_FNS]
+            if unknown:
+                print(f"Unknown pass(es): {', '.join(unknown)}")
+                sys.exit(1)
+            run_passes(fn, names, trace=args.trace_passes)
+        else:
+            optimize_function(fn, opt_level=args.opt_level, trace=args.trace_passes,
+                              unroll_factor=args.unroll_factor)
 
         if args.dump_blocks_after:
             print(dump_blocks(fn, show_cfg=args.dump_cfg))
 
+        if args.dump_ssa:
+            to_ssa(fn)
+            print(dump_blocks(fn, show_cfg=args.dump_cfg))
+            from_ssa(fn)
+
         if args.emit_pseudo_x86:
             print(emit_pseudo_x86(fn, enable_ra=args.ra, frame_mode=args.frame))
         else:
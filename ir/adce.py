@@ -0,0 +1,145 @@
+# ir/adce.py
+from typing import Dict, List, Set, Tuple
+from ir.ir_types import Function
+from ir.builder import build_cfg
+from ir.analysis import EXIT, get_cfg, get_loops, get_postdominators, instr_def, instr_uses
+from ir.dce import drop_unreachable
+from ir.gvn import _ssa_clone
+from ir.ssa import _phi_count
+
+Site = Tuple[str, int]
+
+
+def control_deps(fn: Function) -> Dict[str, Set[str]]:
+
+    """
+    PRE:  fn has valid blocks/CFG.
+    POST: Maps each block to the blocks whose branch decides whether it runs
+          (its postdominance frontier): B depends on A when B postdominates a
+          successor of A but does not strictly postdominate A.
+    """
+
+    succ, _ = get_cfg(fn)
+    pdt = get_postdominators(fn)
+    deps: Dict[str, Set[str]] = {}
+    for a in pdt.idom:
+        targets = set(succ.get(a, []))
+        if len(targets) < 2:
+            continue
+        for s in targets:
+            runner = s
+            while runner in pdt.idom and runner != pdt.idom[a]:
+                deps.setdefault(runner, set()).add(a)
+                runner = pdt.idom[runner]
+    return deps
+
+
+def _mark(cl: Function) -> Tuple[Set[Site], Set[str]]:
+
+    """
+    PRE:  cl is in SSA form.
+    POST: Returns the live sites of cl and the blocks whose terminator is live.
+          Roots are `ret`s, side effects, the branches that leave a loop, and
+          the branches of blocks that cannot reach a `ret`; a live site makes
+          the defs it reads live, and the branches its block is control
+          dependent on (a live phi: the branches of its predecessors).
+    """
+
+    succ, _ = get_cfg(cl)
+    pdt = get_postdominators(cl)
+    deps = control_deps(cl)
+    blocks = {b.label: b for b in cl.blocks}
+    defs: Dict[str, Site] = {}
+    for b in cl.blocks:
+        for i, ins in enumerate(b.instrs):
+            d = instr_def(ins)
+            if d is not None:
+                defs[d] = (b.label, i)
+
+    live: Set[Site] = set()
+    branches: Set[str] = set()
+    work: List[Site] = []
+
+    def mark(site: Site) -> None:
+        if site not in live:
+            live.add(site)
+            work.append(site)
+
+    def mark_branch(lab: str) -> None:
+        if lab not in branches and blocks[lab].instrs:
+            branches.add(lab)
+            mark((lab, len(blocks[lab].instrs) - 1))
+
+    for b in cl.blocks:
+        for i, ins in enumerate(b.instrs):
+            if ins.kind == "ret" or ins.has_side_effect():
+                mark((b.label, i))
+        if b.label not in pdt.idom or pdt.idom[b.label] == EXIT and len(set(succ.get(b.label, []))) > 1:
+            mark_branch(b.label)   # no single block to jump to instead
+    for lp in get_loops(cl).loops:
+        for u, _ in lp.exits:
+            mark_branch(u)         # deleting a loop could make the program terminate
+
+    while work:
+        lab, i = work.pop()
+        ins = blocks[lab].instrs[i]
+        for u in instr_uses(ins):
+            if u in defs:
+                mark(defs[u])
+        for a in deps.get(lab, ()):
+            mark_branch(a)
+        if ins.kind == "phi":
+            for p in ins.phi_args:
+                if p in blocks:
+                    mark_branch(p)
+    return live, branches
+
+
+def aggressive_dce(fn: Function) -> Set[str]:
+
+    """
+    PRE:  fn has valid blocks/CFG (not in SSA form).
+    POST: Mark-and-sweep dead code elimination. Marking runs on an SSA clone
+          (see _mark), so a value only feeding itself, such as a counter
+          bumped in a loop and never read by anything live, is not marked.
+          Then, in fn:
+        - unmarked mov/binop/unop instructions are deleted
+        - a br/cbr that decides nothing live becomes a jmp to its block's
+          immediate postdominator, and the blocks it skipped are dropped
+          once unreachable
+        Returns the labels of blocks that changed or were deleted.
+    NOTE: Branches leaving a loop are always live, so loops themselves are
+          kept (with whatever is dead inside them removed): a loop that might
+          not terminate must not be deleted.
+    """
+
+    if not fn.blocks:
+        return set()
+    cl = _ssa_clone(fn)
+    live, branches = _mark(cl)
+    pdt = get_postdominators(cl)
+
+    originals = {b.label: b for b in fn.blocks}
+    dirty: Set[str] = set()
+    jumped = False
+    for b in cl.blocks:
+        orig = originals[b.label]
+        phis = _phi_count(b)
+        dead = [i - phis for i, ins in enumerate(b.instrs)
+                if i >= phis and ins.kind in ("mov", "binop", "unop")
+                and (b.label, i) not in live and not ins.has_side_effect()]
+        term = orig.instrs[-1] if orig.instrs else None
+        if term is not None and term.kind in ("br", "cbr") and b.label not in branches:
+            orig.rewrite(len(orig.instrs) - 1, "jmp", tlabel=pdt.idom[b.label])
+            jumped = True
+            dirty.add(b.label)
+        if dead:
+            orig.delete(dead)
+            dirty.add(b.label)
+
+    if jumped:
+        build_cfg(fn)
+        dirty |= drop_unreachable(fn)
+    elif dirty:
+        fn.invalidate("instrs")
+    return dirty
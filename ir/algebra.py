@@ -1,69 +1,253 @@
-from ir.ir_types import Instr, Var, Const, Function
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+from ir.ir_types import Block, Instr, Var, Const, Function, Value
+
+_PASS = "algebra"   # key for Block.seen (skip blocks unchanged since the last run)
+
+COMMUTATIVE = {"+", "*", "==", "!=", "&&", "||"}
+MIRROR = {"<": ">", "<=": ">=", ">": "<", ">=": "<="}              # c < x  ==  x > c
+NEGATE = {"==": "!=", "!=": "==", "<": ">=", ">=": "<", ">": "<=", "<=": ">"}
+REFLEXIVE = {"==": 1, "!=": 0, "<": 0, "<=": 1, ">": 0, ">=": 1}   # x op x
+
+
+def _pow2(n: int) -> bool:
+    return n > 1 and n & (n - 1) == 0
+
+
+def _log2(n: int) -> int:
+    return n.bit_length() - 1
+
+
+# Rewrite rules: (pattern, result) or (pattern, result, condition).
+#
+# A pattern is (op, p) for a unop or (op, p, q) for a binop, where each
+# operand is
+#   int        that constant
+#   "c..."     any Const           "v..."  any Var          other str  any value
+#   tuple      a Var whose def earlier in the block matches the sub-pattern
+# A name used twice must bind equal values. A result has the same shape,
+# with names replaced by their bindings and callables called with the
+# bound constants ({name: int}); a bare name/int/callable result is a mov.
+# A condition is called with the bound constants.
+# Rules for one (kind, op) are tried in table order.
+
+Pattern = Union[int, str, tuple]
+Rule = tuple
+
+RULES: List[Rule] = [
+    # identities
+    (("+", "x", 0), "x"),
+    (("+", 0, "x"), "x"),
+    (("-", "x", 0), "x"),
+    (("-", 0, "x"), ("-", "x")),
+    (("-", "x", "x"), 0),
+    (("*", "x", 1), "x"),
+    (("*", 1, "x"), "x"),
+    (("*", "x", 0), 0),
+    (("*", 0, "x"), 0),
+    (("*", "x", -1), ("-", "x")),
+    (("*", -1, "x"), ("-", "x")),
+    (("/", "x", 1), "x"),
+    (("/", "x", -1), ("-", "x")),
+    (("%", "x", 1), 0),
+    (("%", "x", -1), 0),
+    (("+", "x", ("-", "y")), ("-", "x", "y")),
+    (("-", "x", ("-", "y")), ("+", "x", "y")),
+    (("-", ("-", "x")), "x"),
+    (("!", ("!", "x")), ("!=", "x", 0)),
+    *[(("!", (op, "x", "y")), (neg, "x", "y")) for op, neg in NEGATE.items()],
+    *[((op, "x", "x"), r) for op, r in REFLEXIVE.items()],
+    (("&&", "x", 0), 0),
+    (("&&", "x", "c"), ("!=", "x", 0), lambda k: k["c"] != 0),
+    (("||", "x", 0), ("!=", "x", 0)),
+    (("||", "x", "c"), 1, lambda k: k["c"] != 0),
+
+    # reassociation of constant operands
+    (("+", ("+", "x", "c1"), "c2"), ("+", "x", lambda k: k["c1"] + k["c2"])),
+    (("+", ("-", "x", "c1"), "c2"), ("+", "x", lambda k: k["c2"] - k["c1"])),
+    (("+", ("-", "c1", "x"), "c2"), ("-", lambda k: k["c1"] + k["c2"], "x")),
+    (("-", ("+", "x", "c1"), "c2"), ("+", "x", lambda k: k["c1"] - k["c2"])),
+    (("-", ("-", "x", "c1"), "c2"), ("-", "x", lambda k: k["c1"] + k["c2"])),
+    (("-", "c1", ("+", "x", "c2")), ("-", lambda k: k["c1"] - k["c2"], "x")),
+    (("-", "c1", ("-", "x", "c2")), ("-", lambda k: k["c1"] + k["c2"], "x")),
+    (("*", ("*", "x", "c1"), "c2"), ("*", "x", lambda k: k["c1"] * k["c2"])),
+    (("*", ("<<", "x", "c1"), "c2"), ("*", "x", lambda k: k["c2"] << k["c1"])),
+    (("<<", ("<<", "x", "c1"), "c2"), ("<<", "x", lambda k: k["c1"] + k["c2"])),
+    ((">>", (">>", "x", "c1"), "c2"), (">>", "x", lambda k: k["c1"] + k["c2"])),
+    (("/", ("/", "x", "c1"), "c2"), ("/", "x", lambda k: k["c1"] * k["c2"]),
+     lambda k: k["c1"] > 0 and k["c2"] > 0),
+
+    # powers of two (`/` is not here: codegen's idiv truncates, sar floors,
+    # so x/2^k is x>>k only for x >= 0, which vrp proves and rewrites)
+    (("*", "x", "c"), ("<<", "x", lambda k: _log2(k["c"])), lambda k: _pow2(k["c"])),
+
+    # canonical form: constant operand on the right
+    *[((op, "c", "v"), (op, "v", "c")) for op in sorted(COMMUTATIVE)],
+    *[((op, "c", "v"), (MIRROR[op], "v", "c")) for op in MIRROR],
+]
+
+
+class DefTable:
+
+    """
+    Block-local map from a variable to the binop/unop that last defined it,
+    kept only while that instruction's operands still hold the same values
+    (so the instruction could be re-evaluated at the current point).
+    """
+
+    def __init__(self) -> None:
+        self.defs: Dict[str, Instr] = {}
+        self.users: Dict[str, Set[str]] = {}
+
+    def get(self, name: str) -> Optional[Instr]:
+        return self.defs.get(name)
+
+    def kill(self, name: str) -> None:
+        self.defs.pop(name, None)
+        for u in self.users.pop(name, ()):
+            ins = self.defs.get(u)
+            if ins is not None and name in _var_names(ins):
+                del self.defs[u]
+
+    def record(self, ins: Instr) -> None:
+        """Account for ins, the next instruction of the block."""
+        if ins.kind not in ("mov", "binop", "unop") or not isinstance(ins.dst, Var):
+            return
+        d = ins.dst.name
+        self.kill(d)
+        names = _var_names(ins)
+        if ins.kind != "mov" and d not in names:
+            self.defs[d] = ins
+            for n in names:
+                self.users.setdefault(n, set()).add(d)
+
+
+def _var_names(ins: Instr) -> List[str]:
+    return [v.name for v in (ins.a, ins.b) if isinstance(v, Var)]
+
+
+def _same(x: Value, y: Value) -> bool:
+    if isinstance(x, Const) and isinstance(y, Const):
+        return x.value == y.value
+    return isinstance(x, Var) and isinstance(y, Var) and x.name == y.name
+
+
+Binds = Dict[str, Value]
+Matcher = Callable[[Optional[Value], Binds, Optional[DefTable]], bool]
+InstrMatcher = Callable[[Instr, Binds, Optional[DefTable]], bool]
+
+
+def _compile_operand(p: Pattern) -> Matcher:
+    if isinstance(p, int):
+        return lambda v, m, defs: isinstance(v, Const) and v.value == p
+    if isinstance(p, str):
+        want = Const if p[0] == "c" else Var if p[0] == "v" else (Var, Const)
+
+        def bind(v, m, defs):
+            if not isinstance(v, want):
+                return False
+            old = m.get(p)
+            if old is None:
+                m[p] = v
+                return True
+            return _same(old, v)
+        return bind
+
+    inner = _compile_instr(p)
+
+    def nested(v, m, defs):
+        ins = defs.get(v.name) if defs is not None and isinstance(v, Var) else None
+        return ins is not None and inner(ins, m, defs)
+    return nested
+
+
+def _compile_instr(p: tuple) -> InstrMatcher:
+    kind = "unop" if len(p) == 2 else "binop"
+    op = p[0]
+    ma = _compile_operand(p[1])
+    mb = _compile_operand(p[2]) if kind == "binop" else None
+
+    def match(ins, m, defs):
+        if ins.kind != kind or ins.op != op or not ma(ins.a, m, defs):
+            return False
+        return mb is None or mb(ins.b, m, defs)
+    return match
+
+
+def _build(r, m: Binds) -> Value:
+    if isinstance(r, int):
+        return Const(r)
+    if isinstance(r, str):
+        return m[r]
+    return Const(r({n: v.value for n, v in m.items() if isinstance(v, Const)}))
 
-def _is_const0(v): return isinstance(v, Const) and v.value == 0
-def _is_const1(v): return isinstance(v, Const) and v.value == 1
 
-def algebra_simplify_function(fn: Function) -> bool:
-    changed = False
-
-    for b in fn.blocks:
-        out = []
-        for ins in b.instrs:
-            if ins.kind == "binop" and isinstance(ins.dst, Var):
-                op, a, c = ins.op, ins.a, ins.b
-
-
-                # x + 0 / 0 + x
-
-                if op == "+":
-                    if _is_const0(c) and isinstance(a, (Var, Const)):
-                        out.append(Instr(kind="mov", dst=ins.dst, a=a))
-                        changed = True
-                        continue
-                
-                # x - 0
-
-                if op == "-" and _is_const0(c) and isinstance(a, (Var, Const)):
-                        out.append(Instr(kind="mov", dst=ins.dst, a=a))
-                        changed = True
-                        continue
-                
-                # x * 1 / 1 * x / x * 0 / 0 * x
-
-                if op == "*":
-                    if _is_const1(c) and isinstance(a, (Var, Const)):
-                        out.append(Instr(kind="mov", dst=ins.dst, a=a))
-                        changed = True
-                        continue
-
-                    if _is_const1(c) and isinstance(a, (Var, Const)):
-                        out.append(Instr(kind="mov", dst=ins.dst, a=a))
-                        changed = True
-                        continue
+def _compile_rule(rule: Rule) -> Tuple[InstrMatcher, Callable[[Block, int, Binds], bool]]:
+    pattern, result = rule[0], rule[1]
+    cond = rule[2] if len(rule) > 2 else None
+    match = _compile_instr(pattern)
+
+    def apply(b: Block, i: int, m: Binds) -> bool:
+        if cond is not None and not cond({n: v.value for n, v in m.items() if isinstance(v, Const)}):
+            return False
+        dst = b.instrs[i].dst
+        if not isinstance(result, tuple):
+            return b.rewrite(i, "mov", dst=dst, a=_build(result, m))
+        if len(result) == 2:
+            return b.rewrite(i, "unop", dst=dst, op=result[0], a=_build(result[1], m))
+        return b.rewrite(i, "binop", dst=dst, op=result[0],
+                         a=_build(result[1], m), b=_build(result[2], m))
+    return match, apply
+
+
+def _index(rules: List[Rule]) -> Dict[Tuple[str, str], list]:
+    # (kind, op) of the top pattern -> compiled rules, in table order
+    table: Dict[Tuple[str, str], list] = {}
+    for rule in rules:
+        kind = "unop" if len(rule[0]) == 2 else "binop"
+        table.setdefault((kind, rule[0][0]), []).append(_compile_rule(rule))
+    return table
+
+
+_INDEX = _index(RULES)
 
 
-                    if _is_const1(c):
-                        out.append(Instr(kind="mov", dst=ins.dst, a=Const(0)))
-                        changed = True
-                        continue
+def simplify_at(b: Block, i: int, defs: Optional[DefTable] = None) -> bool:
 
+    """
+    PRE:  0 <= i < len(b.instrs); defs (if given) describes the instructions
+          before i in b (see DefTable).
+    POST: Rewrites b.instrs[i] in place with the first matching rule of
+          RULES, repeatedly until none applies; returns True iff it changed.
+          Nested patterns only match when defs is given.
+    """
 
-                    if _is_const1(c):
-                        out.append(Instr(kind="mov", dst=ins.dst, a=Const(0)))
-                        changed = True
-                        continue
-
-
-                # x / 1
-
-                if op == "/" and _is_const1(c) and isinstance(a, (Var, Const)):
-                    out.append(Instr(kind="mov", dst=ins.dst, a=a))
-                    changed = True
-                    continue
-
-            out.append(ins)
-
-        b.instrs = out
-
-    return changed
+    changed = False
+    while True:
+        ins = b.instrs[i]
+        if ins.kind not in ("binop", "unop") or not isinstance(ins.dst, Var):
+            return changed
+        for match, apply in _INDEX.get((ins.kind, ins.op), ()):
+            m: Binds = {}
+            if match(ins, m, defs) and apply(b, i, m):
+                changed = True
+                break
+        else:
+            return changed
+
+
+def algebra_simplify_function(fn: Function) -> Set[str]:
+    dirty: Set[str] = set()
 
+    for b in fn.blocks:
+        if b.is_clean_for(_PASS):
+            continue   # unchanged since this pass last saw it
+        defs = DefTable()
+        for i in range(len(b.instrs)):
+            if simplify_at(b, i, defs):
+                dirty.add(b.label)
+            defs.record(b.instrs[i])
+        b.mark_clean_for(_PASS)
+
+    if dirty:
+        fn.invalidate("instrs")
+    return dirty
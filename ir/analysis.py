@@ -0,0 +1,505 @@
+# ir/analysis.py
+"""
+Cached analyses over an IR Function.
+
+Every get_*() returns the cached result from fn.analyses when there is one,
+otherwise computes it and caches it. Mutations drop stale results through
+fn.invalidate("cfg" / "instrs") (build_cfg does this for the CFG), so passes
+and codegen share one copy instead of each recomputing its own.
+
+    cfg        -> (succ, pred)             see ir/builder.build_cfg
+    rpo        -> [label, ...]             reachable blocks in reverse postorder
+    dominators -> DomTree
+    postdominators -> DomTree              rooted at the virtual EXIT node
+    frontiers  -> {label: set of labels}   dominance frontiers
+    liveness   -> Liveness                 bit-vectors, one bit per variable
+    loops      -> LoopInfo                 natural loops, innermost first
+    copies     -> AvailCopies              copies `x = y` holding on entry to each block
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+from ir.ir_types import Function, Instr, Var
+from ir.builder import build_cfg, reverse_postorder
+
+EXIT = "<exit>"   # virtual root of the postdominator tree; never a block label
+
+
+# Per-instruction reads/writes
+
+# Returns the set of variable names read by this instruction (no Consts, no dst).
+
+def instr_uses(ins: Instr) -> Set[str]:
+    s = set()
+    if ins.kind == "mov":
+        if isinstance(ins.a, Var): s.add(ins.a.name)
+    elif ins.kind in ("binop", "cbr"):
+        if isinstance(ins.a, Var): s.add(ins.a.name)
+        if isinstance(ins.b, Var): s.add(ins.b.name)
+    elif ins.kind == "unop":
+        if isinstance(ins.a, Var): s.add(ins.a.name)
+    elif ins.kind == "br":
+        if isinstance(ins.a, Var): s.add(ins.a.name)
+    elif ins.kind == "ret":
+        if ins.a is not None and isinstance(ins.a, Var): s.add(ins.a.name)
+    elif ins.kind == "phi":
+        s.update(v.name for v in ins.phi_args.values() if isinstance(v, Var))
+    return s
+
+# Returns the destination variable name defined by this instruction, or None.
+
+def instr_def(ins: Instr) -> Optional[str]:
+    if ins.kind in ("mov", "binop", "unop", "phi") and ins.dst is not None:
+        return ins.dst.name
+    return None
+
+
+# Generic bit-vector solver
+
+def solve_backward(order: List[Hashable],
+                   succ: Dict[Hashable, List[Hashable]],
+                   pred: Dict[Hashable, List[Hashable]],
+                   use: Dict[Hashable, int],
+                   kill: Dict[Hashable, int]) -> Tuple[Dict[Hashable, int], Dict[Hashable, int]]:
+
+    """
+    PRE:  order lists every node once (postorder converges fastest); use/kill
+          are bit-vectors per node.
+    POST: Returns (IN, OUT) with OUT[n] = OR of IN[s] over succ[n] and
+          IN[n] = use[n] | (OUT[n] & ~kill[n]), iterated to the fixed point.
+    NOTE: Shared by IR liveness and the instruction-level liveness in codegen/ra.
+    """
+
+    IN  = {n: 0 for n in order}
+    OUT = {n: 0 for n in order}
+    queued = set(order)
+    work = deque(order)
+    while work:
+        n = work.popleft()
+        queued.discard(n)
+        out = 0
+        for s in succ.get(n, ()):
+            out |= IN.get(s, 0)
+        OUT[n] = out
+        new_in = use[n] | (out & ~kill[n])
+        if new_in != IN[n]:
+            IN[n] = new_in
+            for p in pred.get(n, ()):
+                if p in IN and p not in queued:
+                    queued.add(p)
+                    work.append(p)
+    return IN, OUT
+
+def solve_forward(order: List[Hashable],
+                  succ: Dict[Hashable, List[Hashable]],
+                  pred: Dict[Hashable, List[Hashable]],
+                  gen: Dict[Hashable, int],
+                  kill: Dict[Hashable, int]) -> Tuple[Dict[Hashable, int], Dict[Hashable, int]]:
+
+    """
+    PRE:  order lists the reachable nodes once, entry first (RPO converges
+          fastest); gen/kill are bit-vectors per node.
+    POST: Returns (IN, OUT) for a must-problem: IN[entry] = 0, otherwise
+          IN[n] = AND of OUT[p] over the preds p in order, and
+          OUT[n] = gen[n] | (IN[n] & ~kill[n]), iterated to the greatest
+          fixed point (every OUT starts all-ones).
+    """
+
+    if not order:
+        return {}, {}
+    full = -1   # all-ones; & with a finite vector is exact
+    IN  = {n: 0 for n in order}
+    OUT = {n: full for n in order}
+    entry = order[0]
+    queued = set(order)
+    work = deque(order)
+    while work:
+        n = work.popleft()
+        queued.discard(n)
+        if n == entry:
+            inn = 0
+        else:
+            inn = full
+            for p in pred.get(n, ()):
+                if p in OUT:
+                    inn &= OUT[p]
+        IN[n] = inn
+        new_out = gen[n] | (inn & ~kill[n])
+        if new_out != OUT[n]:
+            OUT[n] = new_out
+            for s in succ.get(n, ()):
+                if s in IN and s not in queued:
+                    queued.add(s)
+                    work.append(s)
+    return IN, OUT
+
+
+# Result types
+
+@dataclass
+class Liveness:
+    """
+    ids      maps variable name -> bit index (dense, first-appearance order)
+    live_in  maps block label -> bit-vector of variables live on entry
+    live_out maps block label -> bit-vector of variables live on exit
+    """
+    ids: Dict[str, int]
+    live_in: Dict[str, int]
+    live_out: Dict[str, int]
+
+    def bits(self, names: Iterable[str]) -> int:
+        m = 0
+        for n in names:
+            m |= 1 << self.ids[n]
+        return m
+
+    def names(self, bits: int) -> Set[str]:
+        return {n for n, i in self.ids.items() if bits >> i & 1}
+
+    def live_out_has(self, label: str, name: str) -> bool:
+        i = self.ids.get(name)
+        return i is not None and bool(self.live_out.get(label, 0) >> i & 1)
+
+    def live_in_has(self, label: str, name: str) -> bool:
+        i = self.ids.get(name)
+        return i is not None and bool(self.live_in.get(label, 0) >> i & 1)
+
+
+@dataclass
+class AvailCopies:
+    """
+    copies   lists every distinct copy `dst = src` (var to var) as (dst, src);
+             bit i of a vector stands for copies[i]
+    avail_in maps block label -> bit-vector of copies that hold on entry on
+             every path (reachable blocks only)
+    """
+    copies: List[Tuple[str, str]]
+    avail_in: Dict[str, int]
+
+    def at_entry(self, label: str) -> List[Tuple[str, str]]:
+        bits = self.avail_in.get(label, 0)
+        return [c for i, c in enumerate(self.copies) if bits >> i & 1]
+
+
+@dataclass
+class DomTree:
+    """
+    idom     maps each reachable label -> immediate dominator (entry -> None)
+    children maps label -> labels it immediately dominates (in RPO order)
+    """
+    idom: Dict[str, Optional[str]]
+    children: Dict[str, List[str]]
+    _pre: Dict[str, int] = field(default_factory=dict, repr=False)
+    _post: Dict[str, int] = field(default_factory=dict, repr=False)
+
+    def dominates(self, a: str, b: str) -> bool:
+        """True iff a dominates b (reflexive). Unreachable blocks dominate nothing."""
+        if a not in self._pre or b not in self._pre:
+            return False
+        return self._pre[a] <= self._pre[b] and self._post[b] <= self._post[a]
+
+    def preorder(self) -> List[str]:
+        return sorted(self._pre, key=self._pre.__getitem__)
+
+
+@dataclass
+class Loop:
+    """
+    header  is the single entry block of the natural loop
+    body    is every block in the loop, header included
+    latches are the blocks with a back edge to the header
+    exits   are the (inside, outside) CFG edges leaving the loop
+    """
+    header: str
+    body: Set[str]
+    latches: List[str]
+    exits: List[Tuple[str, str]]
+    depth: int = 1
+
+
+@dataclass
+class LoopInfo:
+    """loops are innermost first; depth maps label -> number of enclosing loops."""
+    loops: List[Loop]
+    depth: Dict[str, int]
+
+    def loop_of(self, header: str) -> Optional[Loop]:
+        return next((lp for lp in self.loops if lp.header == header), None)
+
+
+# Computations
+
+def get_cfg(fn: Function):
+    if "cfg" not in fn.analyses:
+        build_cfg(fn)       # caches itself
+    return fn.analyses["cfg"]
+
+def get_rpo(fn: Function) -> List[str]:
+    if "rpo" not in fn.analyses:
+        get_cfg(fn)
+        fn.analyses["rpo"] = reverse_postorder(fn)
+    return fn.analyses["rpo"]
+
+def _dom_tree(rpo: List[str], pred: Dict[str, List[str]]) -> DomTree:
+    # Cooper/Harvey/Kennedy over rpo (entry first); pred gives each node's
+    # predecessors in the graph being dominated
+    index = {lab: i for i, lab in enumerate(rpo)}
+    idom: Dict[str, Optional[str]] = {}
+    if rpo:
+        entry = rpo[0]
+        idom[entry] = entry
+
+        def intersect(a: str, b: str) -> str:
+            while a != b:
+                while index[a] > index[b]: a = idom[a]
+                while index[b] > index[a]: b = idom[b]
+            return a
+
+        changed = True
+        while changed:
+            changed = False
+            for lab in rpo[1:]:
+                new = None
+                for p in pred.get(lab, []):
+                    if p in idom:
+                        new = p if new is None else intersect(p, new)
+                if new is not None and idom.get(lab) != new:
+                    idom[lab] = new
+                    changed = True
+        idom[entry] = None
+
+    children: Dict[str, List[str]] = {lab: [] for lab in rpo}
+    for lab in rpo:
+        d = idom.get(lab)
+        if d is not None:
+            children[d].append(lab)
+
+    # pre/post numbering for O(1) dominance queries
+    pre: Dict[str, int] = {}
+    post: Dict[str, int] = {}
+    if rpo:
+        clock = 0
+        stack = [(rpo[0], iter(children[rpo[0]]))]
+        pre[rpo[0]] = clock; clock += 1
+        while stack:
+            lab, it = stack[-1]
+            nxt = next(it, None)
+            if nxt is None:
+                stack.pop()
+                post[lab] = clock; clock += 1
+            else:
+                pre[nxt] = clock; clock += 1
+                stack.append((nxt, iter(children[nxt])))
+
+    return DomTree(idom, children, pre, post)
+
+def get_dominators(fn: Function) -> DomTree:
+
+    """
+    PRE:  fn has blocks.
+    POST: Returns the dominator tree of the reachable blocks
+          (Cooper/Harvey/Kennedy iterative algorithm over RPO).
+    """
+
+    if "dominators" in fn.analyses:
+        return fn.analyses["dominators"]
+    dt = _dom_tree(get_rpo(fn), fn.pred)
+    fn.analyses["dominators"] = dt
+    return dt
+
+def get_postdominators(fn: Function) -> DomTree:
+
+    """
+    PRE:  fn has blocks.
+    POST: Returns the postdominator tree: dominators of the reversed CFG,
+          rooted at a virtual node EXIT that every `ret` block flows into.
+          Blocks that cannot reach a `ret` (e.g. an endless loop) are absent,
+          and a block whose immediate postdominator is EXIT has no single
+          block that every path from it must pass.
+    """
+
+    if "postdominators" in fn.analyses:
+        return fn.analyses["postdominators"]
+    get_cfg(fn)
+    rets = [b.label for b in fn.blocks if b.instrs and b.instrs[-1].kind == "ret"]
+    rsucc = {lab: list(ps) for lab, ps in fn.pred.items()}
+    rsucc[EXIT] = rets
+    rpred = {lab: list(ss) for lab, ss in fn.succ.items()}
+    for lab in rets:
+        rpred.setdefault(lab, []).append(EXIT)
+
+    # reverse postorder of the reversed CFG, from EXIT
+    seen = {EXIT}
+    order: List[str] = []
+    stack = [(EXIT, iter(rsucc[EXIT]))]
+    while stack:
+        lab, it = stack[-1]
+        for s in it:
+            if s not in seen:
+                seen.add(s)
+                stack.append((s, iter(rsucc.get(s, []))))
+                break
+        else:
+            stack.pop()
+            order.append(lab)
+    order.reverse()
+
+    pdt = _dom_tree(order, rpred)
+    fn.analyses["postdominators"] = pdt
+    return pdt
+
+def get_frontiers(fn: Function) -> Dict[str, Set[str]]:
+
+    """
+    PRE:  fn has blocks.
+    POST: Returns the dominance frontier of every reachable block
+          (Cooper/Harvey/Kennedy: walk up from each join's predecessors to its idom).
+    """
+
+    if "frontiers" in fn.analyses:
+        return fn.analyses["frontiers"]
+    dt = get_dominators(fn)
+    df: Dict[str, Set[str]] = {lab: set() for lab in dt.idom}
+    for lab in dt.idom:
+        for p in set(fn.pred.get(lab, [])):
+            if p not in dt.idom:
+                continue   # unreachable predecessor
+            runner = p
+            while runner is not None and runner != dt.idom[lab]:
+                df[runner].add(lab)
+                runner = dt.idom[runner]
+    fn.analyses["frontiers"] = df
+    return df
+
+def get_liveness(fn: Function) -> Liveness:
+
+    """
+    PRE:  fn has blocks.
+    POST: Returns block-level liveness as bit-vectors indexed by dense variable ids.
+    NOTE: Seeded in postorder (reverse of RPO); unreachable blocks are solved too.
+    """
+
+    if "liveness" in fn.analyses:
+        return fn.analyses["liveness"]
+    get_cfg(fn)
+
+    ids: Dict[str, int] = {}
+    USE: Dict[str, int] = {}
+    DEF: Dict[str, int] = {}
+    for b in fn.blocks:
+        u = d = 0
+        for ins in b.instrs:
+            # any use of a var not yet defined in this block contributes to USE
+            for v in instr_uses(ins):
+                if v not in ids: ids[v] = len(ids)
+                bit = 1 << ids[v]
+                if not d & bit:
+                    u |= bit
+            dv = instr_def(ins)
+            if dv is not None:
+                if dv not in ids: ids[dv] = len(ids)
+                d |= 1 << ids[dv]
+        USE[b.label] = u
+        DEF[b.label] = d
+
+    order = list(reversed(get_rpo(fn)))
+    seen = set(order)
+    order += [b.label for b in fn.blocks if b.label not in seen]
+    live_in, live_out = solve_backward(order, fn.succ, fn.pred, USE, DEF)
+
+    lv = Liveness(ids, live_in, live_out)
+    fn.analyses["liveness"] = lv
+    return lv
+
+def get_loops(fn: Function) -> LoopInfo:
+
+    """
+    PRE:  fn has blocks.
+    POST: Returns the natural loops of fn: one Loop per header (back edges to
+          the same header are merged), innermost first.
+    """
+
+    if "loops" in fn.analyses:
+        return fn.analyses["loops"]
+    dt = get_dominators(fn)
+    rpo = get_rpo(fn)
+
+    latches: Dict[str, List[str]] = {}
+    for u in rpo:
+        for h in fn.succ.get(u, []):
+            if dt.dominates(h, u):
+                latches.setdefault(h, []).append(u)
+
+    loops: List[Loop] = []
+    for h, ls in latches.items():
+        body = {h}
+        work = [u for u in ls if u != h]
+        body.update(work)
+        while work:
+            x = work.pop()
+            for p in fn.pred.get(x, []):
+                if p not in body and p in dt.idom:
+                    body.add(p)
+                    work.append(p)
+        exits = [(u, v) for u in rpo if u in body for v in fn.succ.get(u, []) if v not in body]
+        loops.append(Loop(h, body, ls, exits))
+
+    loops.sort(key=lambda lp: len(lp.body))
+    depth: Dict[str, int] = {b.label: 0 for b in fn.blocks}
+    for lp in loops:
+        for lab in lp.body:
+            depth[lab] += 1
+    for lp in loops:
+        lp.depth = depth[lp.header]
+
+    info = LoopInfo(loops, depth)
+    fn.analyses["loops"] = info
+    return info
+
+def get_copies(fn: Function) -> AvailCopies:
+
+    """
+    PRE:  fn has blocks.
+    POST: Returns the available copies of fn: `x = y` is available on entry
+          to a block when every path from the entry runs it with neither x
+          nor y redefined afterwards, so x == y holds there.
+    NOTE: A def of v kills every copy that mentions v, in either position.
+    """
+
+    if "copies" in fn.analyses:
+        return fn.analyses["copies"]
+    get_cfg(fn)
+
+    ids: Dict[Tuple[str, str], int] = {}
+    mentions: Dict[str, int] = {}     # variable -> bits of the copies naming it
+    for b in fn.blocks:
+        for ins in b.instrs:
+            if (ins.kind == "mov" and isinstance(ins.a, Var) and isinstance(ins.dst, Var)
+                    and ins.a.name != ins.dst.name):
+                pair = (ins.dst.name, ins.a.name)
+                if pair not in ids:
+                    ids[pair] = len(ids)
+                    for v in pair:
+                        mentions[v] = mentions.get(v, 0) | 1 << ids[pair]
+
+    GEN: Dict[str, int] = {}
+    KILL: Dict[str, int] = {}
+    for b in fn.blocks:
+        g = k = 0
+        for ins in b.instrs:
+            d = instr_def(ins)
+            if d is None:
+                continue
+            m = mentions.get(d, 0)
+            g &= ~m
+            k |= m
+            if ins.kind == "mov" and isinstance(ins.a, Var) and ins.a.name != d:
+                g |= 1 << ids[(d, ins.a.name)]
+        GEN[b.label] = g
+        KILL[b.label] = k
+
+    avail_in, _ = solve_forward(get_rpo(fn), fn.succ, fn.pred, GEN, KILL)
+    info = AvailCopies(list(ids), avail_in)
+    fn.analyses["copies"] = info
+    return info
@@ -39,7 +39,8 @@ def linear_to_blocks(func_name: str, linear: List[Instr]) -> Function:
     for ins in linear:
         if ins.kind == "label":
             # close previous block with fallthrough jmp if unterminated
-            if cur and cur.instrs and cur.instrs[-1].kind not in {"br","jmp","ret"}:
+            # (an empty block, e.g. an if/else join right before a loop label, too)
+            if cur is not None and (not cur.instrs or cur.instrs[-1].kind not in {"br","cbr","jmp","ret"}):
                 # fallthrough to this label
                 cur.instrs.append(Instr(kind="jmp", tlabel=ins.label))
             cur = Block(label=ins.label)
@@ -55,7 +56,7 @@ def linear_to_blocks(func_name: str, linear: List[Instr]) -> Function:
 
         cur.instrs.append(ins)
 
-        if ins.kind in {"br","jmp","ret"}:
+        if ins.kind in {"br","cbr","jmp","ret"}:
             cur = None  # next instruction starts a new block unless it's a label
 
     # Resolve FALLTHRU to the physical next block label to remove implicit fallthrough.
@@ -79,8 +80,9 @@ def linear_to_blocks(func_name: str, linear: List[Instr]) -> Function:
 def build_cfg(fn: Function) -> None:
 
     """
-    PRE:  fn.blocks is a list of blocks where the last instruction of each block is a terminator (br/jmp/ret).
-    POST: Populates fn.succ and fn.pred maps from terminators.
+    PRE:  fn.blocks is a list of blocks where the last instruction of each block is a terminator (br/cbr/jmp/ret).
+    POST: Populates fn.succ and fn.pred maps from terminators, drops cached
+          analyses derived from the old CFG and caches the new one.
     NOTE: Keep block terminator invariant intact or CFG becomes incorrect.
     """
     
@@ -90,7 +92,7 @@ def build_cfg(fn: Function) -> None:
         outs: List[str] = []
         if b.instrs:
             term = b.instrs[-1]
-            if term.kind == "br":
+            if term.kind in ("br", "cbr"):
                 if term.tlabel: outs.append(term.tlabel)
                 if term.flabel: outs.append(term.flabel)
             elif term.kind == "jmp":
@@ -102,3 +104,35 @@ def build_cfg(fn: Function) -> None:
         for v in outs:
             pred.setdefault(v, []).append(u)
     fn.succ, fn.pred = succ, pred
+    # everything derived from the old CFG is stale now
+    fn.invalidate("cfg")
+    fn.analyses["cfg"] = (succ, pred)
+
+
+def reverse_postorder(fn: Function) -> List[str]:
+
+    """
+    PRE:  fn.succ is up to date (see build_cfg).
+    POST: Returns the labels of blocks reachable from the entry block in
+          reverse postorder (every block precedes its non-back-edge successors).
+    NOTE: Iterative DFS so deep CFGs do not hit Python's recursion limit.
+    """
+
+    if not fn.blocks:
+        return []
+    start = fn.blocks[0].label
+    seen = {start}
+    post: List[str] = []
+    stack = [(start, iter(fn.succ.get(start, [])))]
+    while stack:
+        lab, it = stack[-1]
+        for s in it:
+            if s and s not in seen:
+                seen.add(s)
+                stack.append((s, iter(fn.succ.get(s, []))))
+                break
+        else:
+            stack.pop()
+            post.append(lab)
+    post.reverse()
+    return post
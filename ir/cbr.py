@@ -0,0 +1,79 @@
+# ir/cbr.py
+from typing import Dict, Optional, Set, Tuple
+from ir.ir_types import Block, Const, Function, Var, RELOPS
+from ir.analysis import instr_def, instr_uses
+from ir.algebra import MIRROR, NEGATE
+
+
+def _condition(term) -> Optional[Tuple[str, bool]]:
+    # (t, negated) for `br t`, `cbr t != 0` and `cbr t == 0`
+    if term.kind == "br" and isinstance(term.a, Var):
+        return term.a.name, False
+    if (term.kind == "cbr" and term.op in ("==", "!=") and isinstance(term.a, Var)
+            and isinstance(term.b, Const) and term.b.value == 0):
+        return term.a.name, term.op == "=="
+    return None
+
+
+def _fuse_terminator(b: Block, uses: Dict[str, int]) -> bool:
+    # one fusion step at the end of b; uses stays exact (t's one use goes away,
+    # the def's operands move into the cbr)
+    last = len(b.instrs) - 1
+    cond = _condition(b.instrs[last]) if last >= 0 else None
+    if cond is None or uses.get(cond[0]) != 1:
+        return False
+    t, negated = cond
+    j = next((j for j in range(last - 1, -1, -1) if instr_def(b.instrs[j]) == t), None)
+    if j is None:
+        return False
+    ins = b.instrs[j]
+    if ins.kind == "binop" and ins.op in RELOPS:
+        op, x, y = ins.op, ins.a, ins.b
+    elif ins.kind == "unop" and ins.op == "!":
+        op, x, y = "==", ins.a, Const(0)
+    else:
+        return False
+    operands = {v.name for v in (x, y) if isinstance(v, Var)}
+    if any(instr_def(between) in operands for between in b.instrs[j + 1:last]):
+        return False
+    if negated:
+        op = NEGATE[op]
+    if isinstance(x, Const) and isinstance(y, Var):
+        op, x, y = MIRROR.get(op, op), y, x
+
+    term = b.instrs[last]
+    b.rewrite(last, "cbr", op=op, a=x, b=y, tlabel=term.tlabel, flabel=term.flabel)
+    b.delete([j])
+    uses[t] = 0
+    return True
+
+
+def form_cbr_function(fn: Function) -> Set[str]:
+
+    """
+    PRE:  fn has valid blocks/CFG.
+    POST: A block ending in `t = a op b; ...; br t ? T : F` with op in RELOPS
+          ends in `cbr a op b ? T : F` instead and the def of t is deleted,
+          provided the br is the only use of t in fn and neither a nor b is
+          redefined between the def and the br. `t = !x` forms `cbr x == 0`,
+          and a constant left operand is mirrored to the right. This repeats
+          while the new terminator is itself `cbr t == 0` / `cbr t != 0` on
+          such a t (so `if (!(a < b))` becomes `cbr a >= b`). Returns the
+          labels of blocks that changed.
+    NOTE: Successor edges are unchanged, so the CFG stays valid.
+    """
+
+    uses: Dict[str, int] = {}
+    for b in fn.blocks:
+        for ins in b.instrs:
+            for n in instr_uses(ins):
+                uses[n] = uses.get(n, 0) + 1
+
+    dirty: Set[str] = set()
+    for b in fn.blocks:
+        while _fuse_terminator(b, uses):
+            dirty.add(b.label)
+
+    if dirty:
+        fn.invalidate("instrs")
+    return dirty
@@ -1,4 +1,8 @@
-from ir.ir_types import Const, Function, Instr
+from typing import Set
+from ir.ir_types import Block, Const, Function
+from ir.builder import build_cfg
+
+_PASS = "constfold"   # key for Block.seen (skip blocks unchanged since the last run)
 def _is_c(x): return isinstance(x, Const)
 
 def _bin(op,a,b):
@@ -15,6 +19,8 @@ def _bin(op,a,b):
     if op==">=":return 1 if a>=b else 0
     if op=="&&":return 1 if (a!=0 and b!=0) else 0
     if op=="||":return 1 if (a!=0 or  b!=0) else 0
+    if op=="<<":return a<<b if b>=0 else None
+    if op==">>":return a>>b if b>=0 else None
     return None
 
 def _un(op,a):
@@ -24,34 +30,58 @@ def _un(op,a):
     return None
 
 
+def fold_at(b: Block, i: int) -> bool:
+
+    """
+    PRE:  0 <= i < len(b.instrs).
+    POST: Rewrites b.instrs[i] in place to its folded form (mov dst, Const / jmp)
+          when every operand it needs is Const; returns True iff it did.
+          Division/mod by zero is not folded.
+    """
+
+    ins = b.instrs[i]
+    if ins.kind=="binop" and _is_c(ins.a) and _is_c(ins.b):
+        v=_bin(ins.op, ins.a.value, ins.b.value)
+        if v is not None:
+            return b.rewrite(i, "mov", dst=ins.dst, a=Const(v))
+    if ins.kind=="unop" and _is_c(ins.a):
+        v=_un(ins.op, ins.a.value)
+        if v is not None:
+            return b.rewrite(i, "mov", dst=ins.dst, a=Const(v))
+    if ins.kind=="br" and _is_c(ins.a):
+        target = ins.tlabel if ins.a.value!=0 else ins.flabel
+        return b.rewrite(i, "jmp", tlabel=target)
+    if ins.kind=="cbr" and _is_c(ins.a) and _is_c(ins.b):
+        target = ins.tlabel if _bin(ins.op, ins.a.value, ins.b.value) else ins.flabel
+        return b.rewrite(i, "jmp", tlabel=target)
+    return False
+
 
-def const_fold_function(fn: Function) -> bool:
+def const_fold_function(fn: Function) -> Set[str]:
 
     """
     PRE:  fn is block-structured. Some operands may already be Const via const-prop.
-    POST: Rewrites:
+    POST: Rewrites in place:
         - binop(Const,Const) -> mov dst, Const(result)
         - unop(Const)        -> mov dst, Const(result)
-        - br(Const)          -> jmp taken_target
-        Returns True if any rewrite occurred.
+        - br(Const)          -> jmp taken_target (CFG is rebuilt)
+        - cbr(Const, Const)  -> jmp taken_target (CFG is rebuilt)
+        Returns the labels of blocks where a rewrite occurred.
     NOTE: Division/mod by zero are NOT folded.
     """
     
-    changed=False
+    dirty: Set[str] = set()
+    folded_br = False
     for b in fn.blocks:
-        new=[]
-        for ins in b.instrs:
-            if ins.kind=="binop" and _is_c(ins.a) and _is_c(ins.b):
-                v=_bin(ins.op, ins.a.value, ins.b.value)
-                if v is not None:
-                    new.append(Instr(kind="mov", dst=ins.dst, a=Const(v))); changed=True; continue
-            if ins.kind=="unop" and _is_c(ins.a):
-                v=_un(ins.op, ins.a.value)
-                if v is not None:
-                    new.append(Instr(kind="mov", dst=ins.dst, a=Const(v))); changed=True; continue
-            if ins.kind=="br" and _is_c(ins.a):
-                target = ins.tlabel if ins.a.value!=0 else ins.flabel
-                new.append(Instr(kind="jmp", tlabel=target)); changed=True; continue
-            new.append(ins)
-        b.instrs=new
-    return changed
+        if b.is_clean_for(_PASS):
+            continue   # unchanged since this pass last saw it
+        for i in range(len(b.instrs)):
+            if fold_at(b, i):
+                dirty.add(b.label)
+                if b.instrs[i].kind=="jmp": folded_br = True
+        b.mark_clean_for(_PASS)
+    if folded_br:
+        build_cfg(fn)
+    elif dirty:
+        fn.invalidate("instrs")
+    return dirty
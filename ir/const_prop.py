@@ -1,6 +1,8 @@
-from typing import Dict
+from typing import Dict, Set
 from ir.ir_types import Const, Var, Instr, Function, Value
 
+_PASS = "constprop"   # key for Block.seen (skip blocks unchanged since the last run)
+
 def _const_of(v: Value, env: Dict[str, Const]) -> Value:
     if isinstance(v, Var):
         c = env.get(v.name)
@@ -9,68 +11,72 @@ def _const_of(v: Value, env: Dict[str, Const]) -> Value:
 
 
 
-def const_propagate_function(fn: Function) -> bool:
+def const_propagate_function(fn: Function) -> Set[str]:
 
     """
     PRE:  fn has valid blocks/CFG. Operands are Const or Var and no SSA required.
     POST: Performs local (per-block) forward constant/alias propagation:
         - Substitutes known Const and y->x aliases into uses
         - Updates `ret` BEFORE clearing the env so `return t` can become `return Const`
-        - Clears env at control-flow barriers (br/jmp/ret)
-        Returns True if any substitution was made.
+        - Clears env at control-flow barriers (br/cbr/jmp/ret)
+        Returns the labels of blocks where a substitution was made.
 
     """
 
-    changed = False
-    for b in fn.blocks: # 
+    dirty: Set[str] = set()
+    for b in fn.blocks:
+        if b.is_clean_for(_PASS):
+            continue   # unchanged since this pass last saw it
         env: Dict[str, Const] = {}
-        new: list[Instr] = []
 
-        for ins in b.instrs:
+        for i, ins in enumerate(b.instrs):
             k = ins.kind
             if k == "mov":
                 a = _const_of(ins.a, env)
-                # update the line if substituition was performed
+                # update the line in place if substitution was performed
                 if a is not ins.a:
-                    ins = Instr(kind="mov", dst = ins.dst, a = a)
-                    changed = True
+                    b.set(i, a = a)
+                    dirty.add(b.label)
                 # track constant binding if RHS is Const
                 if isinstance(ins.dst, Var):
                     if isinstance(a, Const):
                         env[ins.dst.name] = a
                     else:
                         env.pop(ins.dst.name, None)
-                new.append(ins)
 
             elif k == "binop":
                 a = _const_of(ins.a, env)
                 bval = _const_of(ins.b, env)
                 if a is not ins.a or bval is not ins.b:
-                    ins = Instr(kind = "binop", dst = ins.dst, op = ins.op, a = a, b = bval)
-                    changed = True
+                    b.set(i, a = a, b = bval)
+                    dirty.add(b.label)
 
                 # def kills const binding unless folded later
 
                 if isinstance(ins.dst, Var):
                     env.pop(ins.dst.name, None)
-                new.append(ins)
 
             elif k == "unop":
                 a = _const_of(ins.a, env)
                 if a is not ins.a:
-                    ins = Instr(kind = "unop", dst = ins.dst, op = ins.op, a = a)
-                    changed = True
+                    b.set(i, a = a)
+                    dirty.add(b.label)
 
                 if isinstance(ins.dst, Var):
                     env.pop(ins.dst.name, None)
-                new.append(ins)
 
             elif k == "br":
                 a = _const_of(ins.a, env)
                 if a is not ins.a:
-                    ins = Instr(kind = "br", a = a, tlabel = ins.tlabel, flabel = ins.flabel)
-                    changed = True
-                new.append(ins)
+                    b.set(i, a = a)
+                    dirty.add(b.label)
+
+            elif k == "cbr":
+                a = _const_of(ins.a, env)
+                bval = _const_of(ins.b, env)
+                if a is not ins.a or bval is not ins.b:
+                    b.set(i, a = a, b = bval)
+                    dirty.add(b.label)
 
             elif k in {"jmp", "ret"}:
                 # barrier: clear env to stay local and safe
@@ -79,16 +85,13 @@ def const_propagate_function(fn: Function) -> bool:
                     a = _const_of(ins.a, env)
 
                     if a is not ins.a:
-                        ins = Instr(kind = "ret", a = a)
-                        changed = True
-                new.append(ins)
+                        b.set(i, a = a)
+                        dirty.add(b.label)
 
                 env.clear()
 
-            else:
-
-                new.append(ins)
+        b.mark_clean_for(_PASS)
 
-        b.instrs = new
-    
-    return changed
\ No newline at end of file
+    if dirty:
+        fn.invalidate("instrs")
+    return dirty
@@ -1,39 +1,83 @@
-from typing import Dict, List
-from ir.ir_types import Instr, Var, Const, Function
-
-# Follow alias chain x->y->z; stop on cycles.
-# Follow alias chain x->y->z; stop on cycles; compress path on the way back.
-
-def _root(v: Var, env: Dict[str, str]) -> Var:
-    name = v.name
-    seen: list[str] = []
-    steps = 0
-    MAX_STEPS = max(32, len(env) + 1)  # dynamic safety cap
-
-    while name in env:
-        nxt = env[name]
-        if nxt == name or name in seen:                   # self-alias, trivial root
-            break                                         # cycle detected (a->...->a)
-        seen.append(name)
-        name = nxt
-        steps += 1
-        if steps > MAX_STEPS:             # pathological chain guard
-            break
-
-    # Path compression: flatten x->y->...->root to x->root for all seen
-    for s in seen:
-        env[s] = name
-    return Var(name)
-
-def _subst_val(val, env: Dict[str, str]):
-    return _root(val, env) if isinstance(val, Var) else val
-
-# Kill dst's mapping and any aliases pointing to dst (break chains).
-def _kill(env: Dict[str, str], dst_name: str):
-    env.pop(dst_name, None)  # remove dst -> ?
-    for k, v in list(env.items()):  # remove ? -> dst
-        if v == dst_name:
-            env.pop(k, None)
+from typing import Dict, List, Set, Tuple
+from ir.ir_types import Var, Const, Function
+from ir.analysis import get_copies
+
+_PASS = "copyprop"   # key for Block.seen (skip blocks unchanged since the last run)
+
+class AliasTable:
+
+    """
+    Block-local copy table.
+    - root[x]  = y means "x currently holds the same value as y", where y is
+      always a root (never itself a key of root), so lookups are one step.
+    - users[y] = every x with root[x] == y (reverse index), so redefining y
+      drops exactly its own aliases instead of scanning the whole table.
+    """
+
+    __slots__ = ("root", "users")
+
+    def __init__(self):
+        self.root: Dict[str, str] = {}
+        self.users: Dict[str, Set[str]] = {}
+
+    def find(self, name: str) -> str:
+        return self.root.get(name, name)
+
+    def kill(self, name: str) -> None:
+        # drop name -> ?
+        r = self.root.pop(name, None)
+        if r is not None:
+            self.users[r].discard(name)
+        # drop ? -> name
+        for u in self.users.pop(name, ()):
+            del self.root[u]
+
+    def link(self, dst: str, src_root: str) -> None:
+        self.root[dst] = src_root
+        self.users.setdefault(src_root, set()).add(dst)
+
+    def clear(self) -> None:
+        self.root.clear()
+        self.users.clear()
+
+def entry_aliases(copies: List[Tuple[str, str]]) -> AliasTable:
+
+    """
+    PRE:  copies are (dst, src) pairs that all hold at one point, e.g.
+          get_copies(fn).at_entry(label).
+    POST: Returns an AliasTable relating every variable of a pair to one
+          root of its group; the root is a src that is never a dst when
+          there is one, so values flow from the oldest name.
+    """
+
+    parent: Dict[str, str] = {}
+
+    def find(x: str) -> str:
+        while parent.get(x, x) != x:
+            x = parent[x]
+        return x
+
+    dsts = {d for d, _ in copies}
+    for d, s in copies:
+        rd, rs = find(d), find(s)
+        if rd == rs:
+            continue
+        if rs in dsts and rd not in dsts:
+            rd, rs = rs, rd
+        parent[rd] = rs
+
+    env = AliasTable()
+    for x in parent:
+        r = find(x)
+        if r != x:
+            env.link(x, r)
+    return env
+
+def _subst_val(val, env: AliasTable):
+    if isinstance(val, Var):
+        r = env.find(val.name)
+        return val if r == val.name else Var(r)
+    return val
 
 def _same_val(v1, v2) -> bool:
     if v1 is v2:
@@ -47,24 +91,30 @@ def _same_val(v1, v2) -> bool:
         return v1.value == v2.value
     return False
 
-def copy_propagate_function(fn: Function) -> bool:
+def copy_propagate_function(fn: Function) -> Set[str]:
     
     """
     PRE:  fn has valid blocks/CFG. Instructions include mov/binop/unop/br/jmp/ret.
-    POST: Local (per-block) copy propagation:
-        - Tracks y = x aliases; substitutes uses (compress chains)
-        - Kills aliases on redefinition and reverse-links to the redefined var
-        - Clears env on br/jmp/ret barriers
-    RET : True if any substitution occurred.
+    POST: Global copy propagation, editing instructions in place:
+        - Each block starts from the copies available on entry (every path
+          in ran `y = x` with neither side redefined since, see get_copies)
+        - Tracks y = x aliases; substitutes uses with the alias root
+        - Kills aliases on redefinition via the reverse-alias index
+        - Clears env on br/cbr/jmp/ret barriers
+        The copies themselves stay; dead_store_elim removes those no longer read.
+    NOTE: Every table operation is O(1) amortized, so a block costs time
+          linear in its length. A block is skipped when unchanged since the
+          last run and nothing is available on its entry.
+    RET : Labels of blocks where a substitution occurred.
     """
-    changed = False
+    dirty: Set[str] = set()
+    avail = get_copies(fn)
     for b in fn.blocks:
-        env: Dict[str, str] = {}   # var -> alias var
-        new: List[Instr] = []
-        for ins in b.instrs:
-            if len(env) > 5000:
-                raise RuntimeError(f"[copyprop] env too large ({len(env)}); possible alias leak")
-
+        seed = avail.at_entry(b.label)
+        if b.is_clean_for(_PASS) and not seed:
+            continue   # unchanged since this pass last saw it
+        env = entry_aliases(seed)
+        for i, ins in enumerate(b.instrs):
             k = ins.kind
 
             if k == "mov":
@@ -72,59 +122,57 @@ def copy_propagate_function(fn: Function) -> bool:
 
                 # changed only if the *value* differs, not just the object
                 if not _same_val(src, ins.a):
-                    ins = Instr(kind="mov", dst=ins.dst, a=src)
-                    changed = True
+                    b.set(i, a=src)
+                    dirty.add(b.label)
 
                 # kill knowledge about dst
                 if isinstance(ins.dst, Var):
-                    _kill(env, ins.dst.name)
+                    env.kill(ins.dst.name)
 
                 # record alias only for var->var and not self
                 if isinstance(src, Var) and isinstance(ins.dst, Var) and src.name != ins.dst.name:
-                    if env.get(src.name) == ins.dst.name:   # break 2-cycle
-                        env.pop(src.name, None)
-                    env[ins.dst.name] = src.name
-
-                new.append(ins)
+                    env.link(ins.dst.name, src.name)
 
             elif k == "binop":
                 a = _subst_val(ins.a, env)
                 bval = _subst_val(ins.b, env)
                 if not _same_val(a, ins.a) or not _same_val(bval, ins.b):
-                    ins = Instr(kind="binop", dst=ins.dst, op=ins.op, a=a, b=bval)
-                    changed = True
+                    b.set(i, a=a, b=bval)
+                    dirty.add(b.label)
                 if isinstance(ins.dst, Var):
-                    _kill(env, ins.dst.name)
-                new.append(ins)
+                    env.kill(ins.dst.name)
 
             elif k == "unop":
                 a = _subst_val(ins.a, env)
                 if not _same_val(a, ins.a):
-                    ins = Instr(kind="unop", dst=ins.dst, op=ins.op, a=a)
-                    changed = True
+                    b.set(i, a=a)
+                    dirty.add(b.label)
                 if isinstance(ins.dst, Var):
-                    _kill(env, ins.dst.name)
-                new.append(ins)
+                    env.kill(ins.dst.name)
 
             elif k == "br":
                 a = _subst_val(ins.a, env)
                 if not _same_val(a, ins.a):
-                    ins = Instr(kind="br", a=a, tlabel=ins.tlabel, flabel=ins.flabel)
-                    changed = True
-                new.append(ins)
+                    b.set(i, a=a)
+                    dirty.add(b.label)
+                env.clear()
+
+            elif k == "cbr":
+                a = _subst_val(ins.a, env)
+                bval = _subst_val(ins.b, env)
+                if not _same_val(a, ins.a) or not _same_val(bval, ins.b):
+                    b.set(i, a=a, b=bval)
+                    dirty.add(b.label)
                 env.clear()
 
             elif k == "ret":
                 a = _subst_val(ins.a, env)
                 if not _same_val(a, ins.a):
-                    ins = Instr(kind="ret", a=a)
-                    changed = True
-                new.append(ins)
+                    b.set(i, a=a)
+                    dirty.add(b.label)
                 env.clear()
 
-            else:
-                new.append(ins)
-
-
-        b.instrs = new
-    return changed
\ No newline at end of file
+        b.mark_clean_for(_PASS)
+    if dirty:
+        fn.invalidate("instrs")
+    return dirty
\ No newline at end of file
@@ -1,127 +1,62 @@
-from collections import deque
-from typing import Set, Dict
-from ir.ir_types import Function, Var, Instr
+from typing import Set
+from ir.ir_types import Function
 from ir.builder import build_cfg
+from ir.analysis import get_rpo, get_liveness, instr_uses as _uses, instr_def as _def
 
 
-def drop_unreachable(fn: Function) -> bool:
+def drop_unreachable(fn: Function) -> Set[str]:
 
     """
     PRE:  fn has blocks and a valid CFG with a single entry block (with the label '_entry').
-    POST: Removes blocks not reachable from entry via succ edges and rebuilds CFG.
-        Returns True if any block was deleted.
+    POST: Removes blocks not reachable from entry via succ edges and rebuilds CFG
+          (reachability comes from the cached RPO).
+        Returns the labels of the deleted blocks.
     NOTE: Run after const-fold so `br Const` -> `jmp` exposes unreachable arms.
     """
 
-    if not fn.blocks: return False
-    start = fn.blocks[0].label
-    seen:set[str]=set()
-    q=deque([start])
-    while q:
-        u=q.popleft()
-        if u in seen: continue
-        seen.add(u)
-        for v in fn.succ.get(u,[]): 
-            if v: q.append(v)
-    before=len(fn.blocks)
-    fn.blocks=[b for b in fn.blocks if b.label in seen]
+    if not fn.blocks: return set()
+    seen=set(get_rpo(fn))   # RPO covers exactly the blocks reachable from entry
+    dropped={b.label for b in fn.blocks if b.label not in seen}
+    if dropped:
+        for b in fn.blocks:
+            if b.label in dropped: b.touch("dropped (unreachable)")
+        fn.blocks=[b for b in fn.blocks if b.label in seen]
+        build_cfg(fn)
+    return dropped
 
-    build_cfg(fn)
-    return len(fn.blocks)!=before
+def dead_store_elim(fn) -> Set[str]:
 
-# Returns the set of variable names read by this instruction (no Consts, no dst).
-
-def _uses(ins) -> set[str]:
-    s = set()
-    if ins.kind == "mov":
-        if isinstance(ins.a, Var): s.add(ins.a.name)
-    elif ins.kind == "binop":
-        if isinstance(ins.a, Var): s.add(ins.a.name)
-        if isinstance(ins.b, Var): s.add(ins.b.name)
-    elif ins.kind == "unop":
-        if isinstance(ins.a, Var): s.add(ins.a.name)
-    elif ins.kind == "br":
-        if isinstance(ins.a, Var): s.add(ins.a.name)
-    elif ins.kind == "ret":
-        if ins.a is not None and isinstance(ins.a, Var): s.add(ins.a.name)
-    return s
-
-# Returns the destination variable name defined by this instruction, or None.
-
-def _def(ins) -> str | None:
-    if ins.kind in ("mov", "binop", "unop") and ins.dst is not None:
-        return ins.dst.name
-    return None
-
-def dead_store_elim(fn) -> bool:
-    
-    # dataflow to compute live_in/live_out 
-    blocks = fn.blocks
-    succ = fn.succ  # dict: label -> [succ labels]
-    live_in: dict[str, set[str]]  = {b.label: set() for b in blocks}
-    live_out: dict[str, set[str]] = {b.label: set() for b in blocks}
-
-    # Precompute per-block USE and DEF sets (classic formulation)
-    USE: dict[str, set[str]] = {}
-    DEF: dict[str, set[str]] = {}
-    for b in blocks:
-        u, d = set(), set()
-        for ins in b.instrs:
-            # any use of a var not yet defined in this block contributes to USE
-            for v in _uses(ins):
-                if v not in d:
-                    u.add(v)
-            # defs go to DEF
-            dv = _def(ins)
-            if dv is not None:
-                d.add(dv)
-        USE[b.label] = u
-        DEF[b.label] = d
-
-    changed = True
-    iters = 0
-    MAX_ITERS = 16
-    while changed and iters < MAX_ITERS:
-        changed = False
-        iters += 1
-        for b in blocks:
-            old_in  = live_in[b.label]
-            old_out = live_out[b.label]
-
-            # out[b] = ⋃ in[s] for all successors s
-            new_out = set()
-            for s in succ.get(b.label, []):
-                new_out |= live_in.get(s, set())
-
-            # in[b] = USE[b] ∪ (out[b] - DEF[b])
-            new_in = USE[b.label] | (new_out - DEF[b.label])
+    """
+    PRE:  fn has valid blocks/CFG.
+    POST: Removes pure defs whose destination is dead at the point of definition.
+          Liveness comes from the analysis cache (bit-vectors, one bit per
+          variable) and the per-block backward sweep is seeded from the
+          block's live-out bits.
+        Returns the labels of blocks where an instruction was deleted.
+    """
 
-            if new_out != old_out:
-                live_out[b.label] = new_out
-                changed = True
-            if new_in != old_in:
-                live_in[b.label] = new_in
-                changed = True
+    lv = get_liveness(fn)
+    ids, live_out = lv.ids, lv.live_out
 
     #  per-block backward sweep using live_out as seed 
-    any_removed = False
-    for b in blocks:
-        live = set(live_out[b.label])   # seed from successors
-        new_instrs: list[Instr] = []
-        for ins in reversed(b.instrs):
-            # add uses first
-            live |= _uses(ins)
+    dirty: Set[str] = set()
+    for b in fn.blocks:
+        live = live_out[b.label]   # seed from successors
+        dead: list[int] = []
+        for i in range(len(b.instrs) - 1, -1, -1):
+            ins = b.instrs[i]
             dv = _def(ins)
+            dbit = (1 << ids[dv]) if dv is not None else 0
             # drop pure defs that are dead at this point
-            if dv is not None and (not ins.has_side_effect()) and (dv not in live):
-                any_removed = True
-                # do not append (i.e., delete)
-            else:
-                new_instrs.append(ins)
-                # def kills the name (it becomes newly defined)
-                if dv is not None and dv in live:
-                    live.remove(dv)
-        new_instrs.reverse()
-        b.instrs = new_instrs
-
-    return any_removed
\ No newline at end of file
+            if dv is not None and (not ins.has_side_effect()) and not (live & dbit):
+                dead.append(i)
+                continue
+            # def kills the name first, then the instruction's own reads become live
+            live = (live & ~dbit) | lv.bits(_uses(ins))
+        if dead:
+            b.delete(dead)   # one compaction per block
+            dirty.add(b.label)
+
+    if dirty:
+        fn.invalidate("instrs")
+    return dirty
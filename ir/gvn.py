@@ -0,0 +1,116 @@
+# ir/gvn.py
+import copy
+from typing import Dict, List, Optional, Set, Tuple
+from ir.ir_types import Block, Const, Function, Instr, Var, Value
+from ir.builder import build_cfg
+from ir.analysis import get_dominators
+from ir.ssa import SEP, ssa_form, to_ssa
+from ir.algebra import COMMUTATIVE
+
+MIRROR = {">": "<", ">=": "<="}   # a > b  ==  b < a
+
+Token = Tuple[str, object]   # ("c", int) for constants, ("v", ssa name) otherwise
+
+
+def _expr_key(ins: Instr, val) -> Tuple:
+    # canonical (op, operand values) key; commutative operands are sorted
+    if ins.kind == "unop":
+        return ("u", ins.op, val(ins.a))
+    op, a, b = ins.op, val(ins.a), val(ins.b)
+    if op in MIRROR:
+        op, a, b = MIRROR[op], b, a
+    elif op in COMMUTATIVE and b < a:
+        a, b = b, a
+    return ("b", op, a, b)
+
+
+def _number(fn: Function) -> int:
+
+    """
+    PRE:  fn is in SSA form.
+    POST: Walks the dominator tree with a scoped table of available
+          expressions; a binop/unop whose key is already available from a
+          dominating def becomes `mov dst, <that def>`. Returns the number of
+          instructions rewritten.
+    """
+
+    dt = get_dominators(fn)
+    blocks = {b.label: b for b in fn.blocks}
+    vn: Dict[str, Token] = {}
+
+    def val(v: Optional[Value]) -> Token:
+        if isinstance(v, Const):
+            return ("c", v.value)
+        return vn.get(v.name, ("v", v.name))
+
+    avail: Dict[Tuple, str] = {}
+    undo: Dict[str, List[Tuple]] = {}
+    count = 0
+    walk: List[Tuple[str, bool]] = [(fn.blocks[0].label, False)]
+    while walk:
+        lab, leaving = walk.pop()
+        if leaving:
+            for key in undo.pop(lab):
+                del avail[key]
+            continue
+        b = blocks[lab]
+        added: List[Tuple] = []
+        for i, ins in enumerate(b.instrs):
+            k = ins.kind
+            if k == "mov":
+                vn[ins.dst.name] = val(ins.a)
+            elif k == "phi":
+                # a phi whose args all agree is just that value; an arg defined
+                # further down the dominator tree (back edge) is not numbered yet
+                args = ins.phi_args.values()
+                toks = {val(v) for v in args}
+                known = all(not isinstance(v, Var) or v.name in vn or SEP not in v.name for v in args)
+                vn[ins.dst.name] = toks.pop() if known and len(toks) == 1 else ("v", ins.dst.name)
+            elif k in ("binop", "unop"):
+                key = _expr_key(ins, val)
+                rep = avail.get(key)
+                if rep is not None:
+                    b.rewrite(i, "mov", dst=ins.dst, a=Var(rep))
+                    vn[ins.dst.name] = val(Var(rep))
+                    count += 1
+                else:
+                    avail[key] = ins.dst.name
+                    added.append(key)
+                    vn[ins.dst.name] = ("v", ins.dst.name)
+        undo[lab] = added
+        walk.append((lab, True))
+        for c in reversed(dt.children.get(lab, [])):
+            walk.append((c, False))
+    return count
+
+
+def _ssa_clone(fn: Function) -> Function:
+    # instructions are copied shallowly: SSA renaming replaces operands, never edits them
+    cl = Function(name=fn.name,
+                  blocks=[Block(label=b.label, instrs=[copy.copy(ins) for ins in b.instrs])
+                          for b in fn.blocks])
+    build_cfg(cl)
+    to_ssa(cl)
+    return cl
+
+
+def gvn_function(fn: Function) -> Set[str]:
+
+    """
+    PRE:  fn has valid blocks/CFG (not in SSA form).
+    POST: Dominator-based global value numbering: a binop/unop computing a
+          value already computed on every path to it (same op, operands with
+          the same value numbers, commutative operands in either order)
+          becomes a copy of the earlier result. Returns the labels of blocks
+          that changed.
+    NOTE: Numbering runs on SSA form. A clone is numbered first, so fn only
+          goes through the SSA round trip when something is redundant; each
+          changing run removes at least one binop/unop.
+    """
+
+    if not fn.blocks or _number(_ssa_clone(fn)) == 0:
+        return set()
+    with ssa_form(fn) as dirty:
+        _number(fn)
+    return dirty
+
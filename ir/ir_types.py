@@ -1,5 +1,6 @@
+import copy
 from dataclasses import dataclass, field
-from typing import List, Optional, Union, Dict
+from typing import Iterable, List, Optional, Union, Dict, Set
 
 
 # Values
@@ -10,13 +11,16 @@ class Var:   name: str
 Value = Union[Const, Var]
 
 # Ops to focus on now
-BINOPS = {"+","-","*","/","%","==","!=", "<","<=",">",">=","&&","||"}
+BINOPS = {"+","-","*","/","%","==","!=", "<","<=",">",">=","&&","||","<<",">>"}
 UNOPS  = {"+","-","!"}
+RELOPS = {"==","!=","<","<=",">",">="}   # the ops a cbr can test
 
 # Instruction
 @dataclass
 class Instr:
-    # kinds: "label","mov","binop","unop","br","jmp","ret"
+    # kinds: "label","mov","binop","unop","br","jmp","ret",
+    #        "cbr" (branch on `a op b`, op in RELOPS; see ir/cbr.py),
+    #        "phi" (SSA form only, see ir/ssa.py)
     kind: str
     dst: Optional[Var] = None
     op:  Optional[str] = None
@@ -27,6 +31,11 @@ class Instr:
     flabel: Optional[str] = None
     # for labels
     label: Optional[str] = None
+    # for phi: predecessor label -> incoming value (replace the dict, do not mutate it)
+    phi_args: Optional[Dict[str, Value]] = None
+    # for / and %: a divisor proved nonzero wherever it is read (see ir/vrp.py);
+    # only trusted while it still equals b
+    nonzero: Optional[Value] = None
 
     def has_side_effect(self) -> bool:
 
@@ -40,11 +49,122 @@ class Instr:
         # later add "store"/"call" here
         return False
 
+    def assign(self, **fields) -> bool:
+
+        """
+        PRE:  fields are Instr field names (kind, dst, op, a, b, tlabel, flabel, label, phi_args, nonzero).
+        POST: Updates those fields in place; returns True iff any value differed.
+        """
+
+        changed = False
+        for name, val in fields.items():
+            if getattr(self, name) != val:
+                setattr(self, name, val)
+                changed = True
+        return changed
+
+# Instruction fields a rewrite resets when the caller does not pass them.
+_SHAPE = ("dst", "op", "a", "b", "tlabel", "flabel", "label", "phi_args", "nonzero")
+
+@dataclass
+class Change:
+    """
+    One journal entry, recorded only while a journal is attached to a block.
+    label  is the block that changed
+    index  is the instruction position at the time of the change (-1 = whole block)
+    before is a snapshot of the instruction before the change (None for inserts)
+    after  is a snapshot after the change (None for deletions)
+    note   describes block-level changes ("dropped", "merged into B", ...)
+    """
+    label: str
+    index: int
+    before: Optional[Instr] = None
+    after: Optional[Instr] = None
+    note: str = ""
+
 # Basic block / Function
 @dataclass
 class Block:
     label: str
     instrs: List[Instr] = field(default_factory=list)
+    # bumped by every mutation; block-local passes remember the version they
+    # last left a block at (seen: pass name -> version) and skip it until it changes
+    version: int = field(default=0, compare=False)
+    seen: Dict[str, int] = field(default_factory=dict, repr=False, compare=False)
+
+    # change journal (see Function.start_journal); None = not recording
+    journal: Optional[List[Change]] = field(default=None, repr=False, compare=False)
+
+    def touch(self, note: str = "") -> None:
+        """Record that instrs was edited in place (note goes to the journal)."""
+        self.version += 1
+        if self.journal is not None and note:
+            self.journal.append(Change(self.label, -1, note=note))
+
+    # In-place mutation API: edits instructions without allocating new ones,
+    # bumps version and journals the change when recording.
+
+    def set(self, i: int, **fields) -> bool:
+        """Update fields of instrs[i] in place; returns True iff something changed."""
+        ins = self.instrs[i]
+        before = copy.copy(ins) if self.journal is not None else None
+        if not ins.assign(**fields):
+            return False
+        self.version += 1
+        if self.journal is not None:
+            self.journal.append(Change(self.label, i, before, copy.copy(ins)))
+        return True
+
+    def rewrite(self, i: int, kind: str, **fields) -> bool:
+        """Reshape instrs[i] in place into `kind`; fields not given are cleared."""
+        shape = {name: fields.get(name) for name in _SHAPE}
+        return self.set(i, kind=kind, **shape)
+
+    def delete(self, indices: Iterable[int]) -> None:
+        """Remove the instructions at the given positions (one compaction pass)."""
+        drop = set(indices)
+        if not drop:
+            return
+        if self.journal is not None:
+            for i in sorted(drop):
+                self.journal.append(Change(self.label, i, copy.copy(self.instrs[i]), None))
+        self.instrs[:] = [ins for i, ins in enumerate(self.instrs) if i not in drop]
+        self.version += 1
+
+    def insert(self, i: int, ins: Instr) -> None:
+        """Insert ins before position i."""
+        self.instrs.insert(i, ins)
+        self.version += 1
+        if self.journal is not None:
+            self.journal.append(Change(self.label, i, None, copy.copy(ins)))
+
+    def set_instrs(self, instrs: List[Instr]) -> None:
+        """Replace the instruction list wholesale and record the change."""
+        self.instrs = instrs
+        self.version += 1
+        if self.journal is not None:
+            self.journal.append(Change(self.label, -1, note="instructions replaced"))
+
+    def is_clean_for(self, pass_name: str) -> bool:
+        """True if pass_name already ran on this exact version of the block."""
+        return self.seen.get(pass_name) == self.version
+
+    def mark_clean_for(self, pass_name: str) -> None:
+        self.seen[pass_name] = self.version
+
+# Cached analyses (see ir/analysis.py) and the kinds of change each is computed from:
+#   "cfg"    - block list, terminators, succ/pred
+#   "instrs" - straight-line instruction contents of blocks
+ANALYSIS_INPUTS: Dict[str, Set[str]] = {
+    "cfg":        {"cfg"},
+    "rpo":        {"cfg"},
+    "dominators": {"cfg"},
+    "postdominators": {"cfg"},
+    "loops":      {"cfg"},
+    "frontiers":  {"cfg"},
+    "liveness":   {"cfg", "instrs"},
+    "copies":     {"cfg", "instrs"},
+}
 
 @dataclass
 class Function:
@@ -52,3 +172,46 @@ class Function:
     blocks: List[Block] = field(default_factory=list)
     succ: Dict[str, List[str]] = field(default_factory=dict)
     pred: Dict[str, List[str]] = field(default_factory=dict)
+    # analysis name -> cached result; only valid until the next invalidate()
+    analyses: Dict[str, object] = field(default_factory=dict, repr=False, compare=False)
+    # execution counts from --profile-use (an ir.profile.Profile), keyed by block label
+    profile: Optional[object] = field(default=None, repr=False, compare=False)
+
+    def invalidate(self, *changed: str) -> None:
+
+        """
+        PRE:  changed names what a mutation touched ("cfg" and/or "instrs").
+        POST: Drops every cached analysis computed from any of those inputs.
+        NOTE: Every pass that edits blocks must call this (build_cfg does it for "cfg").
+        """
+
+        hit = set(changed)
+        for kind in [k for k in self.analyses if ANALYSIS_INPUTS.get(k, {k}) & hit]:
+            del self.analyses[kind]
+
+    # Change journal: while recording, every block mutation made through the
+    # Block API is appended to self.journal.
+
+    journal: Optional[List[Change]] = field(default=None, repr=False, compare=False)
+
+    def start_journal(self) -> List[Change]:
+        """Start (or keep) recording and attach the journal to every current block."""
+        if self.journal is None:
+            self.journal = []
+        for b in self.blocks:
+            b.journal = self.journal
+        return self.journal
+
+    def stop_journal(self) -> None:
+        """Stop recording and detach the journal from every block."""
+        self.journal = None
+        for b in self.blocks:
+            b.journal = None
+
+    def take_journal(self) -> List[Change]:
+        """Return the changes recorded so far and clear the journal (keeps recording)."""
+        if self.journal is None:
+            return []
+        out = self.journal[:]
+        self.journal.clear()
+        return out
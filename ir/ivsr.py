@@ -0,0 +1,254 @@
+# ir/ivsr.py
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+from ir.ir_types import Const, Function, Instr, Var, Value
+from ir.builder import build_cfg
+from ir.analysis import Loop, get_liveness, get_loops, instr_def, instr_uses
+from ir.licm import ensure_preheader
+
+CMP_MIRROR = {"<": ">", "<=": ">=", ">": "<", ">=": "<=", "==": "==", "!=": "!="}
+
+Site = Tuple[str, int]
+
+
+@dataclass
+class BasicIV:
+    """
+    name  is the variable stepped once per visit of its def: name = name + step
+    step  is the constant added (negative for name - c)
+    site  is the def of name in the loop
+    temp  is the site of `t = name + c` when the def is the copy `name = t`
+    """
+    name: str
+    step: int
+    site: Site
+    temp: Optional[Site] = None
+
+
+def _step_of(ins: Instr, name: str) -> Optional[int]:
+    # c for name + c / c + name, -c for name - c, else None
+    if ins.kind != "binop":
+        return None
+    a, b = ins.a, ins.b
+    if ins.op == "+":
+        if isinstance(a, Var) and a.name == name and isinstance(b, Const): return b.value
+        if isinstance(b, Var) and b.name == name and isinstance(a, Const): return a.value
+    if ins.op == "-" and isinstance(a, Var) and a.name == name and isinstance(b, Const):
+        return -b.value
+    return None
+
+
+def find_basic_ivs(fn: Function, lp: Loop) -> Dict[str, BasicIV]:
+
+    """
+    PRE:  lp is a loop of fn.
+    POST: Returns the basic induction variables of lp: variables with exactly
+          one def in the loop, of the form i = i +/- c, or the TAC shape
+          `t = i +/- c; ...; i = t` within one block with neither t nor i
+          redefined in between.
+    """
+
+    blocks = {b.label: b for b in fn.blocks if b.label in lp.body}
+    defs: Dict[str, List[Site]] = {}
+    for lab, b in blocks.items():
+        for i, ins in enumerate(b.instrs):
+            d = instr_def(ins)
+            if d is not None:
+                defs.setdefault(d, []).append((lab, i))
+
+    ivs: Dict[str, BasicIV] = {}
+    for name, sites in defs.items():
+        if len(sites) != 1:
+            continue
+        lab, i = sites[0]
+        ins = blocks[lab].instrs[i]
+        step = _step_of(ins, name)
+        if step is not None:
+            ivs[name] = BasicIV(name, step, (lab, i))
+            continue
+        if ins.kind != "mov" or not isinstance(ins.a, Var):
+            continue
+        t = ins.a.name
+        for j in range(i - 1, -1, -1):
+            if instr_def(blocks[lab].instrs[j]) == t:
+                step = _step_of(blocks[lab].instrs[j], name)
+                if step is not None:
+                    ivs[name] = BasicIV(name, step, (lab, i), (lab, j))
+                break
+    return ivs
+
+
+def _fresh(names: Set[str], stem: str) -> str:
+    n = 0
+    while f"{stem}{n}" in names:
+        n += 1
+    names.add(f"{stem}{n}")
+    return f"{stem}{n}"
+
+
+def _reduce_loop(fn: Function, lp: Loop, names: Set[str]) -> Set[str]:
+
+    """
+    PRE:  analyses are up to date for fn.
+    POST: Strength-reduces lp (see strength_reduce_function) and returns the
+          labels of blocks that changed (empty iff nothing was done).
+    """
+
+    ivs = find_basic_ivs(fn, lp)
+    if not ivs:
+        return set()
+    blocks = {b.label: b for b in fn.blocks}
+    body = [b for b in fn.blocks if b.label in lp.body]
+    defined = {instr_def(ins) for b in body for ins in b.instrs} - {None}
+
+    def invariant(v: Value) -> bool:
+        return isinstance(v, Const) or v.name not in defined
+
+    # derived IVs: x = i * k with k invariant (either operand order), or
+    # x = i << c as i * 2**c
+    muls: List[Tuple[Site, str, Value]] = []
+    for b in body:
+        for i, ins in enumerate(b.instrs):
+            if ins.kind != "binop":
+                continue
+            if ins.op == "*":
+                pairs = ((ins.a, ins.b), (ins.b, ins.a))
+            elif ins.op == "<<" and isinstance(ins.b, Const) and ins.b.value >= 0:
+                pairs = ((ins.a, Const(1 << ins.b.value)),)
+            else:
+                continue
+            for iv, k in pairs:
+                if isinstance(iv, Var) and iv.name in ivs and invariant(k) and ins.dst.name != iv.name:
+                    muls.append(((b.label, i), iv.name, k))
+                    break
+    if not muls:
+        return set()
+    pre = ensure_preheader(fn, lp)
+    if pre is None:
+        return set()
+    blocks = {b.label: b for b in fn.blocks}
+    dirty: Set[str] = {pre.label}
+
+    def pre_add(ins: Instr) -> None:
+        pre.insert(len(pre.instrs) - 1, ins)
+
+    # one reduced variable r == i * k per (i, k); r += step * k after i's def
+    reduced: Dict[Tuple[str, object], str] = {}
+    after: Dict[Site, List[Instr]] = {}
+    for (lab, i), ivname, k in muls:
+        key = (ivname, ("c", k.value) if isinstance(k, Const) else ("v", k.name))
+        r = reduced.get(key)
+        if r is None:
+            iv = ivs[ivname]
+            r = _fresh(names, "t_iv")
+            reduced[key] = r
+            pre_add(Instr(kind="binop", dst=Var(r), op="*", a=Var(ivname), b=k))
+            if isinstance(k, Const):
+                delta: Value = Const(iv.step * k.value)
+            else:
+                delta = Var(_fresh(names, "t_iv"))
+                pre_add(Instr(kind="binop", dst=delta, op="*", a=k, b=Const(iv.step)))
+            after.setdefault(iv.site, []).append(Instr(kind="binop", dst=Var(r), op="+", a=Var(r), b=delta))
+        b = blocks[lab]
+        b.rewrite(i, "mov", dst=b.instrs[i].dst, a=Var(r))
+        dirty.add(lab)
+
+    dead = _replace_tests(fn, lp, ivs, reduced, blocks, pre_add, names, dirty)
+
+    for (lab, i), new in sorted(after.items(), key=lambda kv: -kv[0][1]):
+        for k, ins in enumerate(new):
+            blocks[lab].insert(i + 1 + k, ins)
+        dirty.add(lab)
+    for lab, objs in dead.items():
+        b = blocks[lab]
+        b.delete([i for i, ins in enumerate(b.instrs) if any(ins is o for o in objs)])
+        dirty.add(lab)
+    return dirty
+
+
+def _replace_tests(fn, lp, ivs, reduced, blocks, pre_add, names, dirty) -> Dict[str, List[Instr]]:
+
+    """
+    Linear function test replacement: when a basic IV i is only used by its
+    own update and by comparisons with invariants, and is dead after the
+    loop, each `c = i < n` (or `cbr i < n`) becomes `c = r < n*k` (operator
+    mirrored for k < 0) for a reduced r == i*k with constant k, and i's
+    update is removed.
+    Returns the instructions to delete, by block label.
+    """
+
+    lv = get_liveness(fn)
+    body = [b for b in fn.blocks if b.label in lp.body]
+    defined = {instr_def(ins) for b in body for ins in b.instrs} - {None}
+    dead: Dict[str, List[Instr]] = {}
+
+    for ivname, iv in ivs.items():
+        choice = next(((r, k[1]) for (n, k), r in reduced.items() if n == ivname and k[0] == "c" and k[1] != 0), None)
+        if choice is None or any(lv.live_in_has(v, ivname) for _, v in lp.exits):
+            continue
+        r, k = choice
+        update = {iv.site} | ({iv.temp} if iv.temp else set())
+        tests: List[Tuple[Site, Instr]] = []
+        ok = True
+        for b in body:
+            for i, ins in enumerate(b.instrs):
+                if ivname not in instr_uses(ins) or (b.label, i) in update:
+                    continue
+                other = ins.b if isinstance(ins.a, Var) and ins.a.name == ivname else ins.a
+                if (ins.kind in ("binop", "cbr") and ins.op in CMP_MIRROR and isinstance(other, (Var, Const))
+                        and not (isinstance(other, Var) and (other.name == ivname or other.name in defined))):
+                    tests.append(((b.label, i), ins))
+                else:
+                    ok = False
+        if iv.temp is not None:
+            t = blocks[iv.temp[0]].instrs[iv.temp[1]].dst.name
+            uses = sum(t in instr_uses(ins) for b in fn.blocks for ins in b.instrs)
+            ok = ok and uses == 1
+        if not ok or not tests:
+            continue
+
+        for (lab, i), ins in tests:
+            iv_left = isinstance(ins.a, Var) and ins.a.name == ivname
+            other = ins.b if iv_left else ins.a
+            if isinstance(other, Const):
+                bound: Value = Const(other.value * k)
+            else:
+                bound = Var(_fresh(names, "t_iv"))
+                pre_add(Instr(kind="binop", dst=bound, op="*", a=other, b=Const(k)))
+            op = ins.op if k > 0 else CMP_MIRROR[ins.op]
+            a, bv = (Var(r), bound) if iv_left else (bound, Var(r))
+            blocks[lab].set(i, op=op, a=a, b=bv)
+            dirty.add(lab)
+        for lab, i in update:
+            dead.setdefault(lab, []).append(blocks[lab].instrs[i])
+    return dead
+
+
+def strength_reduce_function(fn: Function) -> Set[str]:
+
+    """
+    PRE:  fn has valid blocks/CFG.
+    POST: For every loop (innermost first) and basic IV i (see find_basic_ivs),
+          each derived `x = i * k` (or `x = i << c`) with loop-invariant k
+          becomes `x = r`, where r is a new temp set to i * k in the
+          preheader and bumped by step * k right after i's update. Exit tests on i are then rewritten
+          in terms of r where that lets i's update go (see _replace_tests).
+          Returns the labels of blocks that changed.
+    NOTE: Analyses are rebuilt after each loop that changed; the preheader
+          multiply of an inner loop can then be reduced by the outer loop.
+    """
+
+    names = {v.name for b in fn.blocks for ins in b.instrs
+             for v in (ins.dst, ins.a, ins.b) if isinstance(v, Var)}
+    dirty: Set[str] = set()
+    progress = True
+    while progress:
+        progress = False
+        for lp in get_loops(fn).loops:
+            changed = _reduce_loop(fn, lp, names)
+            if changed:
+                dirty |= changed
+                build_cfg(fn)
+                progress = True
+                break
+    return dirty
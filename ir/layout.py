@@ -0,0 +1,164 @@
+# ir/layout.py
+from typing import Dict, List, Set, Tuple
+from ir.ir_types import Block, Function
+from ir.analysis import get_cfg, get_loops, get_rpo
+from ir.profile import runs_per_call
+
+LOOP_TAKEN = 0.9   # chance a branch stays in its loop (back edge or loop body)
+RET_TAKEN = 0.2    # chance a branch goes to a block that returns (an early return)
+LOOP_SCALE = 8     # a block one loop deeper is assumed to run this many times as often
+
+Edge = Tuple[str, str]
+
+
+def _falls_off(b: Block) -> bool:
+    # the function ends by running past b (no terminator), so b must stay last
+    return not b.instrs or b.instrs[-1].kind not in ("br", "cbr", "jmp", "ret")
+
+
+def _returns(b: Block) -> bool:
+    return _falls_off(b) or b.instrs[-1].kind == "ret"
+
+
+def edge_weights(fn: Function) -> Dict[Edge, float]:
+
+    """
+    PRE:  fn has valid blocks/CFG.
+    POST: Estimates how often each CFG edge runs per call. A br/cbr splits
+          its block's count by the taken ratio in fn.profile, else by the
+          first static rule that tells its two targets apart:
+        - loop: the target inside the branch's innermost loop gets LOOP_TAKEN
+        - return: the target that ends in `ret` gets RET_TAKEN
+        - otherwise half each
+        A block's count is its runs per call in fn.profile; blocks the
+        profile does not know get theirs by flowing counts forward in reverse
+        postorder from 1 at the entry, a loop header's (from outside the
+        loop) scaled by LOOP_SCALE.
+    """
+
+    succ, pred = get_cfg(fn)
+    info = get_loops(fn)
+    blocks = {b.label: b for b in fn.blocks}
+    headers = {lp.header for lp in info.loops}
+    back = {(u, lp.header) for lp in info.loops for u in lp.latches}
+
+    prob: Dict[Edge, float] = {}
+    for b in fn.blocks:
+        targets = [s for s in dict.fromkeys(succ.get(b.label, [])) if s in blocks]
+        if len(targets) != 2:
+            for s in targets:
+                prob[(b.label, s)] = 1.0
+            continue
+        t, f = targets
+        p = 0.5
+        seen = fn.profile.edges.get(b.label) if fn.profile is not None else None
+        lp = next((lp for lp in info.loops if b.label in lp.body), None)   # innermost
+        if seen and set(seen) <= {t, f}:
+            p = fn.profile.taken_ratio(b.label, t)
+        elif lp is not None and (t in lp.body) != (f in lp.body):
+            p = LOOP_TAKEN if t in lp.body else 1 - LOOP_TAKEN
+        elif _returns(blocks[t]) != _returns(blocks[f]):
+            p = RET_TAKEN if _returns(blocks[t]) else 1 - RET_TAKEN
+        prob[(b.label, t)] = p
+        prob[(b.label, f)] = 1 - p
+
+    freq: Dict[str, float] = {}
+    for lab in get_rpo(fn):
+        known = runs_per_call(fn, lab)
+        if known is not None:
+            freq[lab] = known
+            continue
+        ins = [p for p in dict.fromkeys(pred.get(lab, [])) if (p, lab) not in back]
+        n = sum(freq.get(p, 0.0) * prob.get((p, lab), 0.0) for p in ins) if ins else 1.0
+        freq[lab] = n * LOOP_SCALE if lab in headers else n
+    return {(u, v): freq.get(u, 0.0) * p for (u, v), p in prob.items()}
+
+
+def _chains(fn: Function, weights: Dict[Edge, float]) -> List[List[str]]:
+    # join blocks into fall-through chains, heaviest edge first: u -> v links
+    # when u still ends its chain and v still starts another. The back edge of
+    # a loop tested at the bottom is not linked, so the latch falls out of the
+    # loop instead of into its header.
+    index = {b.label: i for i, b in enumerate(fn.blocks)}
+    skip: Set[Edge] = set()
+    for lp in get_loops(fn).loops:
+        if any(u in lp.latches for u, _ in lp.exits):
+            skip |= {(u, lp.header) for u in lp.latches}
+    entry = fn.blocks[0].label
+    chain_of: Dict[str, List[str]] = {b.label: [b.label] for b in fn.blocks}
+    for (u, v), _ in sorted(weights.items(), key=lambda e: (-e[1], index[e[0][0]], index[e[0][1]])):
+        cu, cv = chain_of[u], chain_of[v]
+        if v == entry or (u, v) in skip or cu is cv or cu[-1] != u or cv[0] != v:
+            continue
+        cu.extend(cv)
+        for lab in cv:
+            chain_of[lab] = cu
+    seen: Set[int] = set()
+    out: List[List[str]] = []
+    for b in fn.blocks:
+        c = chain_of[b.label]
+        if id(c) not in seen:
+            seen.add(id(c))
+            out.append(c)
+    return out
+
+
+def layout_blocks(fn: Function) -> Set[str]:
+
+    """
+    PRE:  fn has valid blocks/CFG.
+    POST: Reorders fn.blocks so that likely successors follow their block
+          (Pettis-Hansen placement over edge_weights):
+        - chains: blocks are linked into fall-through chains, heaviest
+          edge first
+        - order: the entry's chain goes first, then repeatedly the chain
+          with the most weight coming in from blocks already placed (ties in
+          the old order); a block without a terminator stays last
+        Codegen then falls through instead of jumping along chain links, so
+        loop bodies run straight and cold blocks such as early returns move
+        out of the way. Returns the labels of blocks that moved; terminators
+        and the CFG are unchanged.
+    NOTE: A loop tested at the bottom keeps its latch last, so only the
+          back edge's conditional branch is taken on each trip.
+    """
+
+    if len(fn.blocks) < 3:
+        return set()
+    ends = [b for b in fn.blocks if _falls_off(b)]
+    if len(ends) > 1 or any(b.instrs and b.instrs[-1].kind in ("br", "cbr")
+                            and None in (b.instrs[-1].tlabel, b.instrs[-1].flabel) for b in fn.blocks):
+        return set()   # more than one way to run off the end
+
+    weights = edge_weights(fn)
+    chains = _chains(fn, weights)
+    tail: List[str] = []
+    if ends:
+        c = next(c for c in chains if c[-1] == ends[0].label)
+        if c is chains[0]:
+            if len(c) == 1:
+                return set()
+            tail = [c.pop()]   # the entry's chain cannot also be last
+        else:
+            chains.remove(c)
+            tail = c
+
+    order = list(chains[0])
+    placed = set(order)
+    rest = chains[1:]
+    while rest:
+        pull = [sum(w for (u, v), w in weights.items() if u in placed and v in c) for c in rest]
+        best = rest.pop(pull.index(max(pull)))   # the first of equal weights
+        order += best
+        placed.update(best)
+    order += tail
+
+    blocks = {b.label: b for b in fn.blocks}
+    old = [b.label for b in fn.blocks]
+    if order == old:
+        return set()
+    before = {lab: old[i - 1] if i else None for i, lab in enumerate(old)}
+    moved = {lab for i, lab in enumerate(order) if before[lab] != (order[i - 1] if i else None)}
+    for lab in moved:
+        blocks[lab].touch("moved (layout)")
+    fn.blocks = [blocks[lab] for lab in order]
+    return moved
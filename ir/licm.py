@@ -0,0 +1,149 @@
+# ir/licm.py
+from typing import Dict, List, Optional, Set, Tuple
+from ir.ir_types import Block, Const, Function, Instr, Var
+from ir.builder import build_cfg
+from ir.analysis import Loop, get_cfg, get_dominators, get_liveness, get_loops, get_rpo, instr_def
+
+
+def safe_to_speculate(ins: Instr) -> bool:
+
+    """
+    PRE:  ins is a mov/binop/unop.
+    POST: True iff executing ins on a path where it did not run before cannot
+          trap: only `/` and `%` can, so they need a constant nonzero divisor
+          or one that ir/vrp.py proved nonzero wherever it is read.
+    """
+
+    if ins.kind == "binop" and ins.op in ("/", "%"):
+        if isinstance(ins.b, Const):
+            return ins.b.value != 0
+        return ins.nonzero is not None and ins.nonzero == ins.b
+    return True
+
+
+def _unique(labels: List[str]) -> List[str]:
+    return list(dict.fromkeys(labels))
+
+
+def ensure_preheader(fn: Function, lp: Loop) -> Optional[Block]:
+    # the single outside predecessor if it only jumps to the header, else a new
+    # block that every outside predecessor is redirected through
+    succ, pred = get_cfg(fn)
+    outside = _unique([p for p in pred.get(lp.header, []) if p not in lp.body])
+    if not outside:
+        return None   # header is the function entry
+    blocks = {b.label: b for b in fn.blocks}
+    if len(outside) == 1 and succ.get(outside[0]) == [lp.header]:
+        return blocks[outside[0]]
+
+    n = 0
+    while f"_Pre-Header{n}" in blocks:
+        n += 1
+    pre = Block(label=f"_Pre-Header{n}", instrs=[Instr(kind="jmp", tlabel=lp.header)])
+    pre.journal = fn.journal
+    for p in outside:
+        pb = blocks[p]
+        term = pb.instrs[-1]
+        pb.set(len(pb.instrs) - 1,
+               tlabel=pre.label if term.tlabel == lp.header else term.tlabel,
+               flabel=pre.label if term.flabel == lp.header else term.flabel)
+    fn.blocks.insert(fn.blocks.index(blocks[lp.header]), pre)
+    return pre
+
+
+def _invariants(fn: Function, lp: Loop) -> List[Tuple[str, int]]:
+
+    """
+    PRE:  analyses are up to date for fn.
+    POST: Returns the (label, index) sites in lp that can be hoisted, in an
+          order where every hoisted def precedes its hoisted uses. A site
+          `d = op(a, b)` qualifies when:
+        - every operand is a Const, has no def in the loop, or is defined by
+          an earlier hoisted site
+        - it is the only def of d in the loop and d is not live on entry to
+          the header (so every use of d in the loop sees this def)
+        - its block dominates every loop exit, or d is dead at every exit
+          target (hoisting also runs it when the loop body does not)
+        - it cannot trap when speculated (see safe_to_speculate)
+    """
+
+    dt = get_dominators(fn)
+    lv = get_liveness(fn)
+    blocks = {b.label: b for b in fn.blocks}
+    order = [lab for lab in get_rpo(fn) if lab in lp.body]
+
+    ndefs: Dict[str, int] = {}
+    for lab in order:
+        for ins in blocks[lab].instrs:
+            d = instr_def(ins)
+            if d is not None:
+                ndefs[d] = ndefs.get(d, 0) + 1
+
+    hoisted: Set[str] = set()
+
+    def invariant(v) -> bool:
+        return not isinstance(v, Var) or ndefs.get(v.name, 0) == 0 or v.name in hoisted
+
+    picked: List[Tuple[str, int]] = []
+    seen: Set[Tuple[str, int]] = set()
+    changed = True
+    while changed:
+        changed = False
+        for lab in order:
+            for i, ins in enumerate(blocks[lab].instrs):
+                if (lab, i) in seen or ins.kind not in ("mov", "binop", "unop"):
+                    continue
+                d = ins.dst.name
+                if ndefs[d] != 1 or lv.live_in_has(lp.header, d):
+                    continue
+                if not invariant(ins.a) or (ins.kind == "binop" and not invariant(ins.b)):
+                    continue
+                if not safe_to_speculate(ins):
+                    continue
+                if (not all(dt.dominates(lab, u) for u, _ in lp.exits)
+                        and any(lv.live_in_has(v, d) for _, v in lp.exits)):
+                    continue
+                seen.add((lab, i))
+                picked.append((lab, i))
+                hoisted.add(d)
+                changed = True
+    return picked
+
+
+def licm_function(fn: Function) -> Set[str]:
+
+    """
+    PRE:  fn has valid blocks/CFG.
+    POST: Hoists loop-invariant mov/binop/unop instructions (see _invariants)
+          into a preheader, innermost loops first. A preheader block is
+          created when the header has no single outside predecessor that
+          just jumps to it. Returns the labels of blocks that changed.
+    NOTE: Analyses are recomputed after every loop that changed, so code
+          hoisted out of an inner loop can move further out in the same run.
+    """
+
+    dirty: Set[str] = set()
+    progress = True
+    while progress:
+        progress = False
+        for lp in get_loops(fn).loops:
+            sites = _invariants(fn, lp)
+            if not sites:
+                continue
+            pre = ensure_preheader(fn, lp)
+            if pre is None:
+                continue
+            blocks = {b.label: b for b in fn.blocks}
+            at = len(pre.instrs) - 1
+            for k, (lab, i) in enumerate(sites):
+                pre.insert(at + k, blocks[lab].instrs[i])
+            by_block: Dict[str, List[int]] = {}
+            for lab, i in sites:
+                by_block.setdefault(lab, []).append(i)
+            for lab, idx in by_block.items():
+                blocks[lab].delete(idx)
+            dirty |= set(by_block) | {pre.label}
+            build_cfg(fn)   # new preheader / stale liveness
+            progress = True
+            break
+    return dirty
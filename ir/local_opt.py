@@ -0,0 +1,103 @@
+# ir/local_opt.py
+from typing import Dict, Optional, Set
+from ir.ir_types import Const, Var, Function, Value
+from ir.builder import build_cfg
+from ir.pass_manager import Pass
+from ir.analysis import get_copies
+from ir.copy_prop import AliasTable, entry_aliases
+from ir.const_fold import fold_at
+from ir.algebra import DefTable, simplify_at
+
+
+def _subst(v: Optional[Value], consts: Dict[str, Const], aliases: Optional[AliasTable]):
+    if not isinstance(v, Var):
+        return v
+    name = aliases.find(v.name) if aliases is not None else v.name
+    c = consts.get(name)
+    if c is not None:
+        return c
+    return v if name == v.name else Var(name)
+
+
+def local_optimize_function(fn: Function, consts: bool = True, copies: bool = True,
+                            algebra: bool = True) -> Set[str]:
+
+    """
+    PRE:  fn has valid blocks/CFG.
+    POST: One forward sweep per block doing, instruction by instruction and with
+          shared environments:
+        - constant propagation (var -> Const, if consts) and copy propagation
+          (var -> alias root, if copies) into every operand, edited in place
+        - constant folding of binop/unop/br/cbr on Const operands
+        - if algebra, the rewrite rules of ir/algebra.py, including the
+          nested ones that look through earlier defs in the block
+        A value folded or simplified on one line is visible to the next line in
+        the same sweep, so chains collapse without re-running separate passes.
+        Returns the labels of blocks that changed.
+    NOTE: Constants are block-local (envs start empty per block); aliases start
+          from the copies available on entry (see get_copies). Skips blocks
+          unchanged since its last run that have no such copies; rebuilds
+          the CFG if a br folded.
+          consts=False is for pipelines where ir/sccp.py propagates constants.
+    """
+
+    key = f"local[consts={consts},copies={copies},algebra={algebra}]"
+    dirty: Set[str] = set()
+    folded_br = False
+    avail = get_copies(fn) if copies else None
+    for b in fn.blocks:
+        seed = avail.at_entry(b.label) if avail is not None else []
+        if b.is_clean_for(key) and not seed:
+            continue   # unchanged since this pass last saw it
+        known: Dict[str, Const] = {}
+        aliases = entry_aliases(seed) if copies else None
+        defs = DefTable() if algebra else None
+
+        for i, ins in enumerate(b.instrs):
+            k = ins.kind
+            if k in ("mov", "binop", "unop"):
+                a = _subst(ins.a, known, aliases)
+                bval = _subst(ins.b, known, aliases) if k == "binop" else ins.b
+                changed = b.set(i, a=a, b=bval)
+                if fold_at(b, i) or (algebra and simplify_at(b, i, defs)):
+                    changed = True
+                if changed:
+                    dirty.add(b.label)
+
+                # the def kills whatever was known about dst
+                d = ins.dst.name
+                known.pop(d, None)
+                if aliases is not None:
+                    aliases.kill(d)
+                if ins.kind == "mov":
+                    if isinstance(ins.a, Const):
+                        if consts:
+                            known[d] = ins.a
+                    elif aliases is not None and isinstance(ins.a, Var) and ins.a.name != d:
+                        aliases.link(d, ins.a.name)   # already a root after _subst
+                if defs is not None:
+                    defs.record(ins)
+
+            elif k in ("br", "cbr", "ret"):
+                bval = _subst(ins.b, known, aliases) if k == "cbr" else ins.b
+                changed = b.set(i, a=_subst(ins.a, known, aliases), b=bval)
+                if fold_at(b, i):
+                    changed = folded_br = True
+                if changed:
+                    dirty.add(b.label)
+
+        b.mark_clean_for(key)
+
+    if folded_br:
+        build_cfg(fn)
+    elif dirty:
+        fn.invalidate("instrs")
+    return dirty
+
+
+def make_local_pass(consts: bool = True, copies: bool = True, algebra: bool = True) -> Pass:
+    """Pass spec for the fused local optimizer with the given features enabled."""
+    feats = frozenset({"instrs"})
+    reads = feats | {"cfg"} if copies else feats    # available copies follow the CFG
+    return Pass("local", lambda fn: local_optimize_function(fn, consts=consts, copies=copies, algebra=algebra),
+                reads, feats | {"cfg"})
@@ -0,0 +1,104 @@
+# ir/pass_manager.py
+from dataclasses import dataclass
+from typing import Callable, FrozenSet, List, Optional, Set
+from ir.ir_types import Function, ANALYSIS_INPUTS
+from ir.analysis import get_cfg
+
+# A pass reads / disturbs:
+#   "instrs" - straight-line instruction contents of blocks
+#   "cfg"    - block list, terminators and fn.succ / fn.pred
+# and may also require any cached analysis in ir.analysis (e.g. "liveness"),
+# which goes stale whenever one of its inputs does.
+
+
+@dataclass(frozen=True)
+class Pass:
+    """
+    name        is the name used by --passes / PASS_FNS
+    run         is the pass itself; returns the labels of blocks it changed
+    requires    is what the pass reads (a change to any of it re-schedules the pass)
+    invalidates is what the pass may change when it reports dirty blocks
+    idempotent  is False if a second run right after a changing run can find more work
+    """
+    name: str
+    run: Callable[[Function], Set[str]]
+    requires: FrozenSet[str]
+    invalidates: FrozenSet[str]
+    idempotent: bool = True
+
+
+def _stale(kinds: FrozenSet[str]) -> Set[str]:
+    out = set(kinds)
+    for analysis, inputs in ANALYSIS_INPUTS.items():
+        if inputs & kinds:
+            out.add(analysis)
+    return out
+
+
+class PassManager:
+
+    """
+    Runs an ordered list of passes to a fixed point.
+    - Every pass runs once up front (in list order).
+    - Passes drop their own stale analyses through fn.invalidate(); when a
+      pass dirties blocks, only the passes that require something it
+      invalidates (or an analysis built from it) go back on the worklist.
+    - The earliest pending pass in list order always runs next, and the run
+      ends when the worklist is empty (there is no iteration cap).
+    - The blocks a run changed are read off Block.version (plus blocks that
+      disappeared), so the dirty set is exact even if a pass under-reports.
+    """
+
+    def __init__(self, passes: List[Pass]):
+        self.passes = list(passes)
+
+    def run(self, fn: Function, on_pass: Optional[Callable[[Pass, Set[str]], None]] = None) -> Set[str]:
+
+        """
+        PRE:  fn has valid blocks.
+        POST: Runs the passes until none is pending and returns the labels of
+              every block dirtied along the way. on_pass(pass, dirty) is called
+              after each individual pass run (used by --trace-passes, which
+              also turns on fn's change journal).
+        """
+
+        n = len(self.passes)
+        pending = [True] * n
+        all_dirty: Set[str] = set()
+
+        i = 0
+        while i < n:
+            if not pending[i]:
+                i += 1
+                continue
+            p = self.passes[i]
+            pending[i] = False
+
+            get_cfg(fn)
+            if fn.journal is not None:
+                fn.start_journal()   # attach to blocks created since the last pass
+            before = {b.label: b.version for b in fn.blocks}
+            dirty = set(p.run(fn))
+            for b in fn.blocks:
+                if before.pop(b.label, None) != b.version:
+                    dirty.add(b.label)
+            dirty |= before.keys()   # removed blocks
+            if on_pass is not None:
+                on_pass(p, dirty)
+            if not dirty:
+                i += 1
+                continue
+
+            all_dirty |= dirty
+            stale = _stale(p.invalidates)
+            for j, q in enumerate(self.passes):
+                if j == i and p.idempotent:
+                    continue
+                if q.requires & stale:
+                    pending[j] = True
+            # restart from the earliest pending pass
+            i = pending.index(True) if True in pending else n
+
+        # leave fn with an up-to-date CFG for codegen / printing
+        get_cfg(fn)
+        return all_dirty
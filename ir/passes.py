@@ -1,34 +1,92 @@
 # ir/passes.py
-from typing import Callable, Dict, List
+from typing import Callable, Dict, List, Set
 from ir.ir_types import Function
+from ir.pass_manager import Pass, PassManager
 from ir.const_prop import const_propagate_function
 from ir.const_fold import const_fold_function
 from ir.dce import drop_unreachable, dead_store_elim
+from ir.fuse import fuse_straightline
+from ir.sccp import sccp_function
+from ir.gvn import gvn_function
+from ir.licm import licm_function
+from ir.ivsr import strength_reduce_function
+from ir.cbr import form_cbr_function
+from ir.thread import thread_jumps
+from ir.unroll import make_unroll_pass
+from ir.rotate import rotate_loops
+from ir.adce import aggressive_dce
+from ir.sink import sink_code
+from ir.tailmerge import merge_tails
+from ir.peephole import peephole_function
+from ir.vrp import vrp_function
+from ir.layout import layout_blocks
+from ir.local_opt import make_local_pass
+from ir.pretty import dump_changes
 
 # Only import these if these are working now
 try:
     from ir.copy_prop import copy_propagate_function
 except ImportError:
-    def copy_propagate_function(fn: Function) -> bool: return False
+    def copy_propagate_function(fn: Function) -> Set[str]: return set()
 try:
     from ir.algebra import algebra_simplify_function
 except ImportError:
-    def algebra_simplify_function(fn: Function) -> bool: return False
+    def algebra_simplify_function(fn: Function) -> Set[str]: return set()
 
-# Map canonical pass names to callables
-PASS_FNS: Dict[str, Callable[[Function], bool]] = {
-    "constprop":        const_propagate_function,
-    "constfold":        const_fold_function,
-    "drop_unreachable": drop_unreachable,
-    "dse":              dead_store_elim,          # dead store elimination
-    "copyprop":         copy_propagate_function,
-    "algebra":          algebra_simplify_function,
+_I   = frozenset({"instrs"})
+_CFG = frozenset({"cfg"})
+
+# Canonical pass names -> what each pass reads and what it may change
+PASSES: Dict[str, Pass] = {
+    "constprop":        Pass("constprop", const_propagate_function, _I, _I),
+    "constfold":        Pass("constfold", const_fold_function, _I, _I | _CFG),   # br Const -> jmp
+    "drop_unreachable": Pass("drop_unreachable", drop_unreachable, _CFG, _CFG),
+    "fuse":             Pass("fuse", fuse_straightline, _CFG, _I | _CFG),        # longer blocks
+    "dse":              Pass("dse", dead_store_elim, _CFG | {"liveness"}, _I,
+                             idempotent=False),                                 # dead store elimination
+    "copyprop":         Pass("copyprop", copy_propagate_function, _I | _CFG, _I),   # available copies across blocks
+    "algebra":          Pass("algebra", algebra_simplify_function, _I, _I),
+    "local":            make_local_pass(),                                   # all four above in one sweep
+    "peephole":         Pass("peephole", peephole_function, _I, _I),         # rules found offline by ir/superopt.py
+    "sccp":             Pass("sccp", sccp_function, _I | _CFG, _I | _CFG),       # global constants + dead edges
+    "gvn":              Pass("gvn", gvn_function, _I | _CFG, _I | _CFG),         # redundant expressions across blocks
+    "vrp":              Pass("vrp", vrp_function, _I | _CFG, _I | _CFG),         # value ranges: fold decided compares/branches
+    "licm":             Pass("licm", licm_function, _I | _CFG, _I | _CFG),       # hoist loop-invariant code
+    "ivsr":             Pass("ivsr", strength_reduce_function, _I | _CFG, _I | _CFG),  # i*k -> running sum
+    "cbr":              Pass("cbr", form_cbr_function, _I, _I),                 # t = a < b; br t -> cbr a < b
+    "thread":           Pass("thread", thread_jumps, _I | _CFG, _I | _CFG),      # bypass jmp-only blocks, known branches
+    "unroll":           make_unroll_pass(),                                  # constant-trip-count loops
+    "rotate":           Pass("rotate", rotate_loops, _I | _CFG, _I | _CFG),      # while loops tested at the bottom
+    "sink":             Pass("sink", sink_code, _CFG | {"liveness"}, _I),       # defs move into the one successor using them
+    "adce":             Pass("adce", aggressive_dce, _I | _CFG, _I | _CFG),      # mark-and-sweep from ret / live branches
+    "tailmerge":        Pass("tailmerge", merge_tails, _I | _CFG, _I | _CFG),   # identical block suffixes kept once
+    "layout":           Pass("layout", layout_blocks, _CFG, frozenset()),       # block order: likely successor falls through
 }
 
-def run_passes(fn: Function, names: List[str], trace: bool=False, dumper=None):
-    """Run passes by name, in order. If trace=True and dumper provided, print after each."""
-    for name in names:
-        fn_changed = PASS_FNS[name](fn)
-        if trace and dumper is not None:
-            print(f"\n;; after {name} (changed={fn_changed})")
-            print(dumper(fn))
+# Map canonical pass names to callables
+PASS_FNS: Dict[str, Callable[[Function], Set[str]]] = {n: p.run for n, p in PASSES.items()}
+
+def run_pipeline(fn: Function, passes: List[Pass], trace: bool=False, dumper=dump_changes) -> Set[str]:
+    """
+    Run Pass specs through the pass manager. The list order is the
+    scheduling priority and passes are re-run until a fixed point.
+    If trace=True, the change journal is recorded and dumper(changes) is
+    printed after each pass run (only the lines that pass changed).
+    """
+    def _trace(p: Pass, dirty: Set[str]):
+        print(f"\n;; after {p.name} (changed={bool(dirty)}, dirty=[{', '.join(sorted(dirty))}])")
+        changes = fn.take_journal()
+        if changes:
+            print(dumper(changes))
+
+    if not trace:
+        return PassManager(passes).run(fn)
+    fn.start_journal()
+    try:
+        return PassManager(passes).run(fn, on_pass=_trace)
+    finally:
+        fn.stop_journal()
+
+def run_passes(fn: Function, names: List[str], trace: bool=False, dumper=dump_changes) -> Set[str]:
+    """Run passes by name (see PASSES) through the pass manager."""
+    return run_pipeline(fn, [PASSES[name] for name in names], trace=trace, dumper=dumper)
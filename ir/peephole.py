@@ -0,0 +1,144 @@
+# ir/peephole.py
+import json
+import os
+from typing import Dict, List, Optional, Set, Tuple
+from ir.ir_types import Block, Const, Function, Instr, Var
+from ir.algebra import DefTable, Rule, _compile_rule
+
+_PASS = "peephole"   # key for Block.seen (skip blocks unchanged since the last run)
+
+DB_PATH = os.path.join(os.path.dirname(__file__), "superopt_rules.json")   # written by ir/superopt.py
+
+
+def _tuple(x):
+    return tuple(_tuple(s) for s in x) if isinstance(x, list) else x
+
+
+def load_rules(path: str = DB_PATH) -> List[Rule]:
+
+    """
+    PRE:  path is a rule database written by ir/superopt.py (or missing).
+    POST: Returns its rules as (pattern, result) pairs in the ir/algebra.py
+          rule format, in file order; [] if there is no such file.
+    """
+
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return []
+    return [(_tuple(p), _tuple(r)) for p, r in data.get("rules", [])]
+
+
+def _head(p) -> str:
+    # what an operand pattern needs: a def ("b+", "u-", ...), a constant, or anything
+    if isinstance(p, tuple):
+        return ("u" if len(p) == 2 else "b") + p[0]
+    return f"={p}" if isinstance(p, int) else "*"
+
+
+def _heads(v, defs: DefTable) -> List[str]:
+    out = ["*"]
+    if isinstance(v, Const):
+        out.append(f"={v.value}")
+    elif isinstance(v, Var):
+        ins = defs.get(v.name)
+        if ins is not None:
+            out.append(("u" if ins.kind == "unop" else "b") + ins.op)
+    return out
+
+
+class RuleTable:
+
+    """
+    Rules indexed by the instruction they rewrite and the heads of its
+    operand patterns, so an instruction only tries the few rules whose
+    shape it has. Rules are compiled (ir/algebra.py) on first use.
+    """
+
+    def __init__(self, rules: List[Rule]) -> None:
+        self.rules = rules
+        self.index: Dict[Tuple, List[int]] = {}
+        self.compiled: Dict[int, tuple] = {}
+        for n, (pattern, _) in enumerate(rules):
+            kind = "unop" if len(pattern) == 2 else "binop"
+            b = _head(pattern[2]) if kind == "binop" else None
+            self.index.setdefault((kind, pattern[0], _head(pattern[1]), b), []).append(n)
+
+    def lookup(self, ins: Instr, defs: DefTable) -> List[tuple]:
+        bs = _heads(ins.b, defs) if ins.kind == "binop" else [None]
+        hits = sorted(n for a in _heads(ins.a, defs) for b in bs
+                      for n in self.index.get((ins.kind, ins.op, a, b), ()))
+        out = []
+        for n in hits:
+            if n not in self.compiled:
+                self.compiled[n] = _compile_rule(self.rules[n])
+            out.append(self.compiled[n])
+        return out
+
+
+_TABLE: Optional[RuleTable] = None
+
+
+def rule_table() -> RuleTable:
+    """The rules of DB_PATH, loaded once."""
+    global _TABLE
+    if _TABLE is None:
+        _TABLE = RuleTable(load_rules())
+    return _TABLE
+
+
+def rewrite_at(table: RuleTable, b: Block, i: int, defs: DefTable) -> bool:
+
+    """
+    PRE:  0 <= i < len(b.instrs); defs describes the instructions before i
+          in b (see ir/algebra.DefTable).
+    POST: Rewrites b.instrs[i] in place with the first matching rule of
+          table, repeatedly until none applies; returns True iff it changed.
+    """
+
+    changed = False
+    while True:
+        ins = b.instrs[i]
+        if ins.kind not in ("binop", "unop") or not isinstance(ins.dst, Var):
+            return changed
+        for match, apply in table.lookup(ins, defs):
+            m: Dict = {}
+            if match(ins, m, defs) and apply(b, i, m):
+                changed = True
+                break
+        else:
+            return changed
+
+
+def peephole_function(fn: Function) -> Set[str]:
+
+    """
+    PRE:  fn has valid blocks.
+    POST: Applies the rules found offline by ir/superopt.py: an instruction
+          whose value, through the defs before it in its block, matches a
+          rule's 2-4 instruction pattern is replaced by the rule's single
+          instruction or value. The defs it no longer reads are left for
+          dead store elimination. Returns the labels of blocks that changed.
+    NOTE: Does nothing without a rule database (regenerate it with
+          `python -m ir.superopt`).
+    """
+
+    table = rule_table()
+    if not table.rules:
+        return set()
+    dirty: Set[str] = set()
+
+    for b in fn.blocks:
+        if b.is_clean_for(_PASS):
+            continue   # unchanged since this pass last saw it
+        defs = DefTable()
+        for i in range(len(b.instrs)):
+            if rewrite_at(table, b, i, defs):
+                dirty.add(b.label)
+            defs.record(b.instrs[i])
+        b.mark_clean_for(_PASS)
+
+    if dirty:
+        fn.invalidate("instrs")
+    return dirty
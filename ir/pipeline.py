@@ -1,44 +1,52 @@
-# ir/pipeline.py (excerpt)
-from ir.const_prop import const_propagate_function
-from ir.const_fold import const_fold_function
-from ir.dce import drop_unreachable, dead_store_elim
-from ir.fuse import fuse_straightline
-from ir.copy_prop import copy_propagate_function
-from ir.algebra import algebra_simplify_function
-
-
-def optimize_function(fn, opt_level: int = 0):
+# ir/pipeline.py
+from typing import List
+from ir.pass_manager import Pass
+from ir.passes import PASSES, run_pipeline
+from ir.pretty import dump_changes
+from ir.local_opt import make_local_pass
+from ir.unroll import UNROLL_FACTOR, make_unroll_pass
+
+
+def level_passes(opt_level: int, unroll_factor: int = UNROLL_FACTOR) -> List[Pass]:
+
+    """
+    Passes for an optimization level; list order is only the scheduling
+    priority, the pass manager re-runs whatever a change makes stale.
+      O1: constant prop + folding, jump threading, unreachable blocks,
+          fusion, dead stores, compare-and-branch fusion (cbr), block
+          layout (likely successors placed next, so codegen falls through)
+      O2: + copy propagation, global value numbering, value-range
+          propagation (vrp), loop-invariant code
+          motion, induction-variable strength reduction, loop rotation
+          (the test moves to the bottom of the loop), code sinking into
+          the one branch arm that uses a value, mark-and-sweep dead code
+          elimination (adce) and tail merging (identical block suffixes
+          kept once); constants come
+          from SCCP across the whole CFG instead of block-local constant
+          propagation
+      O3: + algebraic simplification, the superoptimizer's peephole rules
+          (ir/superopt_rules.json) and loop unrolling (full for small
+          constant trip counts, else by up to unroll_factor copies)
+    The local rewrites share one sweep per block (ir/local_opt.py).
+    """
+
+    if opt_level <= 1:
+        return [make_local_pass(copies=False, algebra=False), PASSES["thread"],
+                PASSES["drop_unreachable"], PASSES["fuse"], PASSES["dse"], PASSES["cbr"], PASSES["layout"]]
+    local = make_local_pass(consts=False, algebra=opt_level >= 3)
+    loops = [make_unroll_pass(unroll_factor)] if opt_level >= 3 else []
+    rules = [PASSES["peephole"]] if opt_level >= 3 else []
+    return [PASSES["sccp"], local, *rules, PASSES["gvn"], PASSES["vrp"], *loops, PASSES["licm"], PASSES["ivsr"],
+            PASSES["rotate"], PASSES["thread"], PASSES["drop_unreachable"], PASSES["fuse"],
+            PASSES["dse"], PASSES["sink"], PASSES["adce"], PASSES["cbr"],
+            PASSES["tailmerge"], PASSES["layout"]]
+
+
+def optimize_function(fn, opt_level: int = 0, trace: bool = False, dumper=dump_changes,
+                      unroll_factor: int = UNROLL_FACTOR):
 
     # no optimization
-    if opt_level == 0:
-        return
-
-    MAX_OUTER = 8
-    for _ in range(MAX_OUTER):
-        changed = False
-
-        # O1 core
-        if const_propagate_function(fn): changed = True
-        if const_fold_function(fn):      changed = True
-        if drop_unreachable(fn):         changed = True
-        if fuse_straightline(fn):        changed = True   # <--- add here
-        if dead_store_elim(fn):          changed = True
-
-        # O2 extras
-        if opt_level >= 2:
-
-            if copy_propagate_function(fn): changed = True
-            if const_fold_function(fn):      changed = True
-            if dead_store_elim(fn):          changed = True
-            if fuse_straightline(fn):        changed = True  # cleanup
-
-        # O3 extras
-        if opt_level >= 3:
-                
-            if algebra_simplify_function(fn): changed = True
-            if const_fold_function(fn):      changed = True
-            if dead_store_elim(fn):          changed = True
-            if fuse_straightline(fn):        changed = True  # cleanup
-
-        if not changed:
-            break
+    if opt_level <= 0:
+        return set()
+
+    return run_pipeline(fn, level_passes(opt_level, unroll_factor), trace=trace, dumper=dumper)
@@ -1,5 +1,6 @@
 # ir/pretty.py
-from ir.ir_types import Const, Instr, Function
+from typing import List
+from ir.ir_types import Change, Const, Instr, Function
 
 def _sv(v):
     if v is None: return ""
@@ -9,11 +10,19 @@ def _line(ins: Instr) -> str:
     k = ins.kind
     if k == "label": return f"{ins.label}:"
     if k == "mov":   return f"{ins.dst.name} = {_sv(ins.a)}"
-    if k == "binop": return f"{ins.dst.name} = {_sv(ins.a)} {ins.op} {_sv(ins.b)}"
+    if k == "binop":
+        line = f"{ins.dst.name} = {_sv(ins.a)} {ins.op} {_sv(ins.b)}"
+        if ins.nonzero is not None and ins.nonzero == ins.b:
+            line += f"  ;; {_sv(ins.b)} != 0"
+        return line
     if k == "unop":  return f"{ins.dst.name} = {ins.op} {_sv(ins.a)}"
     if k == "br":    return f"br {_sv(ins.a)} ? {ins.tlabel} : {ins.flabel}"
+    if k == "cbr":   return f"cbr {_sv(ins.a)} {ins.op} {_sv(ins.b)} ? {ins.tlabel} : {ins.flabel}"
     if k == "jmp":   return f"jmp {ins.tlabel}"
     if k == "ret":   return f"return {_sv(ins.a)}"
+    if k == "phi":
+        args = ", ".join(f"{p}: {_sv(v)}" for p, v in ins.phi_args.items())
+        return f"{ins.dst.name} = phi({args})"
     return f";; {k}"  # fallback
 
 def dump_blocks(fn: Function, show_cfg: bool = False) -> str:
@@ -28,3 +37,36 @@ def dump_blocks(fn: Function, show_cfg: bool = False) -> str:
             succs = ", ".join(fn.succ.get(b.label, []))
             lines.append(f"  ;; succ: [{succs}]")
     return "\n".join(lines)
+
+def dump_changes(changes: List[Change]) -> str:
+
+    """
+    One line per journal entry:
+      B1[2]: t1 = 2 + 3  ->  t1 = 5
+      B1[4]: - x = 1                 (deleted)
+      B1[0]: + jmp B2                (inserted)
+      B3: dropped (unreachable)      (block-level note)
+    Consecutive edits of the same line (e.g. propagate, then fold) are shown
+    as one before -> after.
+    """
+
+    merged: List[Change] = []
+    for c in changes:
+        last = merged[-1] if merged else None
+        if (last is not None and c.before is not None and last.after is not None
+                and (last.label, last.index) == (c.label, c.index) and last.after == c.before):
+            merged[-1] = Change(c.label, c.index, last.before, c.after)
+            continue
+        merged.append(c)
+
+    lines = []
+    for c in merged:
+        if c.index < 0:
+            lines.append(f"  {c.label}: {c.note}")
+        elif c.before is None:
+            lines.append(f"  {c.label}[{c.index}]: + {_line(c.after)}")
+        elif c.after is None:
+            lines.append(f"  {c.label}[{c.index}]: - {_line(c.before)}")
+        else:
+            lines.append(f"  {c.label}[{c.index}]: {_line(c.before)}  ->  {_line(c.after)}")
+    return "\n".join(lines)
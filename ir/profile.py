@@ -0,0 +1,131 @@
+# ir/profile.py
+import json
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+from ir.ir_types import Const, Function, Value
+from ir.const_fold import _bin, _un
+
+PROFILE_FUEL = 10_000_000   # most instructions one profiled run may execute
+
+
+class ExecutionError(Exception):
+    """The IR could not run to completion (division by zero, no fuel left, ...)."""
+
+
+@dataclass
+class Profile:
+    """
+    counts maps a block label to how many times the block ran
+    edges  maps a block label to {successor label: times control went there}
+    """
+    counts: Dict[str, int] = field(default_factory=dict)
+    edges: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    def count(self, label: str) -> Optional[int]:
+        return self.counts.get(label)
+
+    def taken_ratio(self, label: str, target: str) -> Optional[float]:
+        """Share of label's exits that went to target, or None if label never ran."""
+        out = self.edges.get(label)
+        total = sum(out.values()) if out else 0
+        return out.get(target, 0) / total if total else None
+
+    def per_call(self, label: str, entry: str) -> Optional[float]:
+        """How often label ran per run of the function (entered at entry)."""
+        n, calls = self.counts.get(label), self.counts.get(entry)
+        return n / calls if n is not None and calls else None
+
+
+def run_function(fn: Function, profile: Optional[Profile] = None, fuel: int = PROFILE_FUEL) -> Optional[int]:
+
+    """
+    PRE:  fn has valid blocks/CFG (not in SSA form).
+    POST: Executes fn from its entry block and returns the value of the `ret`
+          it reaches (None for a bare `ret` or running off the end). With
+          profile, every block run and every edge taken is counted into it.
+          Raises ExecutionError on a division by zero or after fuel
+          instructions.
+    NOTE: Variables start at 0 and values are unbounded integers, with `/` and
+          `%` rounding like const folding (see const_fold._bin).
+    """
+
+    env: Dict[str, int] = {}
+    blocks = {b.label: b for b in fn.blocks}
+
+    def val(v: Value) -> int:
+        return v.value if isinstance(v, Const) else env.get(v.name, 0)
+
+    def step(lab: str) -> None:
+        if profile is not None:
+            profile.counts[lab] = profile.counts.get(lab, 0) + 1
+
+    def edge(u: str, v: str) -> None:
+        if profile is not None:
+            out = profile.edges.setdefault(u, {})
+            out[v] = out.get(v, 0) + 1
+
+    if not fn.blocks:
+        return None
+    if profile is not None:
+        for blk in fn.blocks:
+            profile.counts.setdefault(blk.label, 0)   # known, but maybe never run
+    b = fn.blocks[0]
+    while True:
+        step(b.label)
+        nxt = None
+        for ins in b.instrs:
+            fuel -= 1
+            if fuel < 0:
+                raise ExecutionError(f"{fn.name}: out of fuel in {b.label}")
+            k = ins.kind
+            if k == "mov":
+                env[ins.dst.name] = val(ins.a)
+            elif k == "binop":
+                x, y = val(ins.a), val(ins.b)
+                r = _bin(ins.op, x, y)
+                if r is None:
+                    raise ExecutionError(f"{fn.name}: cannot evaluate {x} {ins.op} {y} in {b.label}")
+                env[ins.dst.name] = r
+            elif k == "unop":
+                env[ins.dst.name] = _un(ins.op, val(ins.a))
+            elif k == "br":
+                nxt = ins.tlabel if val(ins.a) != 0 else ins.flabel
+            elif k == "cbr":
+                nxt = ins.tlabel if _bin(ins.op, val(ins.a), val(ins.b)) else ins.flabel
+            elif k == "jmp":
+                nxt = ins.tlabel
+            elif k == "ret":
+                return val(ins.a) if ins.a is not None else None
+        if nxt is None:
+            return None   # ran off the end of the function
+        edge(b.label, nxt)
+        b = blocks[nxt]
+
+
+def save_profiles(path: str, profiles: Dict[str, Profile]) -> None:
+    """Write {function name: Profile} to path as JSON."""
+    data = {name: {"counts": p.counts, "edges": p.edges} for name, p in profiles.items()}
+    with open(path, "w") as f:
+        json.dump({"functions": data}, f, indent=2, sort_keys=True)
+
+
+def load_profiles(path: str) -> Dict[str, Profile]:
+    """Read a file written by save_profiles."""
+    with open(path) as f:
+        data = json.load(f)
+    return {name: Profile(dict(p.get("counts", {})), {u: dict(out) for u, out in p.get("edges", {}).items()})
+            for name, p in data.get("functions", {}).items()}
+
+
+def runs_per_call(fn: Function, label: str) -> Optional[float]:
+
+    """
+    PRE:  fn.blocks is not empty.
+    POST: From fn.profile: how often block label ran per call of fn (0 if it
+          never ran), or None without a profile entry for it (no profile, or
+          a block made by a pass after profiling).
+    """
+
+    if fn.profile is None:
+        return None
+    return fn.profile.per_call(label, fn.blocks[0].label)
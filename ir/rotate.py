@@ -0,0 +1,86 @@
+# ir/rotate.py
+import copy
+from typing import Dict, Set
+from ir.ir_types import Function, Var
+from ir.builder import build_cfg
+from ir.analysis import Loop, get_liveness, get_loops, instr_def
+from ir.ivsr import _fresh
+
+ROTATE_MAX = 6   # most header instructions (besides the branch) copied into the latch
+
+
+def _rotate_loop(fn: Function, lp: Loop, names: Set[str]) -> Set[str]:
+    # copy lp's header into its latch in place of the back-edge jmp; returns
+    # the labels of blocks that changed (empty iff lp was not rotated)
+    blocks = {b.label: b for b in fn.blocks}
+    h = blocks[lp.header]
+    if len(lp.latches) != 1:
+        return set()
+    latch = blocks[lp.latches[0]]
+    term = h.instrs[-1]
+    if latch is h or latch.instrs[-1].kind != "jmp" or term.kind not in ("br", "cbr"):
+        return set()
+    inside = [t for t in (term.tlabel, term.flabel) if t in lp.body]
+    if len(inside) != 1 or inside[0] == h.label or len(h.instrs) - 1 > ROTATE_MAX:
+        return set()   # not a top-tested loop, or a guard too big to copy
+
+    # temps the header defines and only reads itself get new names in the
+    # copy, so each copy of the test keeps a single use (see ir/cbr.py)
+    lv = get_liveness(fn)
+    ren: Dict[str, Var] = {}
+
+    def sub(v):
+        return ren.get(v.name, v) if isinstance(v, Var) else v
+
+    defs = [instr_def(ins) for ins in h.instrs[:-1]]
+    body = []
+    for ins in h.instrs[:-1]:
+        ins = copy.copy(ins)
+        ins.a, ins.b = sub(ins.a), sub(ins.b)
+        d = instr_def(ins)
+        if d is not None:
+            if lv.live_out_has(h.label, d) or defs.count(d) > 1:
+                ren.pop(d, None)
+            else:
+                ren[d] = Var(_fresh(names, "t_rot"))
+                ins.dst = ren[d]
+        body.append(ins)
+
+    at = len(latch.instrs) - 1
+    latch.rewrite(at, term.kind, op=term.op, a=sub(term.a), b=sub(term.b),
+                  tlabel=term.tlabel, flabel=term.flabel)
+    for k, ins in enumerate(body):
+        latch.insert(at + k, ins)
+    return {latch.label}
+
+
+def rotate_loops(fn: Function) -> Set[str]:
+
+    """
+    PRE:  fn has valid blocks/CFG (not in SSA form).
+    POST: Every loop whose header H ends in a br/cbr with one successor B in
+          the loop (a top-tested `while`), that has a single latch ending in
+          `jmp H`, and whose header has at most ROTATE_MAX other instructions,
+          is rotated: the latch's jmp is replaced by a copy of H's
+          instructions and branch. H then only runs once, as the guard on
+          entry, and the loop (now headed by B) is tested at the bottom, so
+          each trip runs one conditional branch instead of a branch and a jmp.
+          Temps that only the header reads are renamed in the copy.
+          Returns the labels of blocks that changed.
+    NOTE: The rotated latch ends in a br/cbr, so a loop is rotated at most once.
+    """
+
+    names = {v.name for b in fn.blocks for ins in b.instrs
+             for v in (ins.dst, ins.a, ins.b) if isinstance(v, Var)}
+    dirty: Set[str] = set()
+    progress = True
+    while progress:
+        progress = False
+        for lp in get_loops(fn).loops:
+            changed = _rotate_loop(fn, lp, names)
+            if changed:
+                dirty |= changed
+                build_cfg(fn)
+                progress = True
+                break
+    return dirty
@@ -0,0 +1,164 @@
+# ir/sccp.py
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+from ir.ir_types import Block, Const, Var, Function, Value
+from ir.builder import build_cfg
+from ir.analysis import get_cfg
+from ir.const_fold import _bin, _un, fold_at
+
+# Lattice per variable at a program point:
+#   name -> Const  the variable holds this constant on every executable path
+#   missing        unknown (bottom)
+# A block whose entry env is not computed yet is "not executable" (top).
+
+Env = Dict[str, Const]
+
+
+def _val(v: Optional[Value], env: Env) -> Optional[Value]:
+    if isinstance(v, Var):
+        return env.get(v.name, v)
+    return v
+
+
+def _transfer(ins, env: Env) -> None:
+    # update env for the value ins assigns (if any)
+    k = ins.kind
+    if k not in ("mov", "binop", "unop") or not isinstance(ins.dst, Var):
+        return
+    a = _val(ins.a, env)
+    res = None
+    if k == "mov":
+        res = a.value if isinstance(a, Const) else None
+    elif k == "binop":
+        bval = _val(ins.b, env)
+        if isinstance(a, Const) and isinstance(bval, Const):
+            res = _bin(ins.op, a.value, bval.value)
+    elif isinstance(a, Const):
+        res = _un(ins.op, a.value)
+    if res is None:
+        env.pop(ins.dst.name, None)
+    else:
+        env[ins.dst.name] = Const(res)
+
+
+def _out_edges(b: Block, env: Env, succ: List[str]) -> List[str]:
+    # successors reachable given the constants known at the end of b
+    term = b.instrs[-1] if b.instrs else None
+    if term is not None and term.kind == "br":
+        c = _val(term.a, env)
+        if isinstance(c, Const):
+            taken = term.tlabel if c.value != 0 else term.flabel
+            return [taken] if taken else []
+    if term is not None and term.kind == "cbr":
+        x, y = _val(term.a, env), _val(term.b, env)
+        if isinstance(x, Const) and isinstance(y, Const):
+            taken = term.tlabel if _bin(term.op, x.value, y.value) else term.flabel
+            return [taken] if taken else []
+    return [s for s in succ if s]
+
+
+def _meet(envs: List[Env]) -> Env:
+    # keep only bindings that every executable predecessor agrees on
+    first, rest = envs[0], envs[1:]
+    return {n: c for n, c in first.items()
+            if all(n in e and e[n].value == c.value for e in rest)}
+
+
+def sccp_analyze(fn: Function) -> Tuple[Dict[str, Env], Set[Tuple[str, str]]]:
+
+    """
+    PRE:  fn has blocks and a valid CFG.
+    POST: Returns (IN, executable) where IN maps each executable block to the
+          constants known on entry, and executable is the set of CFG edges
+          that can be taken. Blocks absent from IN are unreachable.
+    NOTE: Conditional constant propagation in the style of Wegman-Zadeck over
+          the (non-SSA) CFG: an edge becomes executable only when its source
+          is executable and its branch condition does not rule it out, and a
+          block's entry env is the meet over its executable in-edges only.
+          Envs only lose bindings once computed, so the worklist terminates.
+    """
+
+    succ, pred = get_cfg(fn)
+    blocks = {b.label: b for b in fn.blocks}
+    IN: Dict[str, Env] = {}
+    OUT: Dict[str, Env] = {}
+    executable: Set[Tuple[str, str]] = set()
+    if not fn.blocks:
+        return IN, executable
+
+    entry = fn.blocks[0].label
+    IN[entry] = {}
+    work = deque([entry])
+    queued = {entry}
+    while work:
+        lab = work.popleft()
+        queued.discard(lab)
+        b = blocks[lab]
+        env = dict(IN[lab])
+        for ins in b.instrs:
+            _transfer(ins, env)
+        OUT[lab] = env
+
+        for s in _out_edges(b, env, succ.get(lab, [])):
+            if s not in blocks:
+                continue
+            executable.add((lab, s))
+            ins_envs = [OUT[p] for p in pred.get(s, []) if (p, s) in executable and p in OUT]
+            new_in = _meet(ins_envs) if s != entry else {}
+            if s not in IN or new_in != IN[s]:
+                IN[s] = new_in
+                if s not in queued:
+                    queued.add(s)
+                    work.append(s)
+    return IN, executable
+
+
+def sccp_function(fn: Function) -> Set[str]:
+
+    """
+    PRE:  fn has valid blocks/CFG.
+    POST: Runs sccp_analyze and rewrites in place:
+        - uses of variables that are constant at that point -> Const
+        - binop/unop/br/cbr whose operands became Const are folded
+          (a br/cbr folds to a jmp along its only executable edge)
+        - blocks that are never executable are removed (CFG is rebuilt)
+        Returns the labels of blocks that changed or were removed.
+    NOTE: Unlike const_propagate_function, constants flow across block
+          boundaries (e.g. into loop headers and if/else arms).
+    """
+
+    IN, _ = sccp_analyze(fn)
+    dirty: Set[str] = set()
+    cfg_changed = False
+
+    for b in fn.blocks:
+        if b.label not in IN:
+            continue
+        env = dict(IN[b.label])
+        for i, ins in enumerate(b.instrs):
+            k = ins.kind
+            changed = False
+            if k in ("mov", "binop", "unop", "br", "cbr", "ret"):
+                a = _val(ins.a, env)
+                bval = _val(ins.b, env) if k in ("binop", "cbr") else ins.b
+                changed = (a is not ins.a or bval is not ins.b) and b.set(i, a=a, b=bval)
+                if fold_at(b, i):
+                    changed = True
+                    cfg_changed = cfg_changed or b.instrs[i].kind == "jmp"
+            if changed:
+                dirty.add(b.label)
+            _transfer(b.instrs[i], env)
+
+    dead = [b for b in fn.blocks if b.label not in IN]
+    if dead:
+        for b in dead:
+            b.touch("dropped (never executable)")
+            dirty.add(b.label)
+        fn.blocks = [b for b in fn.blocks if b.label in IN]
+        cfg_changed = True
+
+    if cfg_changed:
+        build_cfg(fn)
+    elif dirty:
+        fn.invalidate("instrs")
+    return dirty
@@ -0,0 +1,86 @@
+# ir/sink.py
+from typing import Dict, List, Set
+from ir.ir_types import Function, Instr
+from ir.analysis import get_cfg, get_liveness, get_rpo, instr_def, instr_uses
+
+
+def _top(instrs: List[Instr]) -> int:
+    # first position after any leading label/phi
+    i = 0
+    while i < len(instrs) and instrs[i].kind in ("label", "phi"):
+        i += 1
+    return i
+
+
+def sink_code(fn: Function) -> Set[str]:
+
+    """
+    PRE:  fn has valid blocks/CFG.
+    POST: Moves pure mov/binop/unop instructions out of a block ending in
+          br/cbr into the one successor where their result is used, so the
+          paths that do not need the value skip computing it. A def
+          `d = op(a, b)` in block B sinks into successor S when:
+        - d is live on entry to S and to no other successor of B
+        - B is S's only predecessor and S is not the entry (so S is never a
+          loop header and the code does not move into a loop)
+        - nothing after it in B reads or writes d or writes a or b
+        Sunk instructions keep their order at the top of S. Returns the
+        labels of blocks that changed.
+    NOTE: Blocks are visited in reverse postorder, so code sunk into S can
+          sink again out of S in the same run. Operands of a sunk def count
+          as used in S, so the defs feeding it can follow it.
+    """
+
+    succ, pred = get_cfg(fn)
+    lv = get_liveness(fn)
+    blocks = {b.label: b for b in fn.blocks}
+    entry = fn.blocks[0].label if fn.blocks else None
+    extra: Dict[str, Set[str]] = {}   # names read by code already sunk into a block
+
+    def live_in(lab: str, name: str) -> bool:
+        return lv.live_in_has(lab, name) or name in extra.get(lab, ())
+
+    dirty: Set[str] = set()
+    for lab in get_rpo(fn):
+        b = blocks[lab]
+        if not b.instrs or b.instrs[-1].kind not in ("br", "cbr"):
+            continue
+        targets = [s for s in dict.fromkeys(succ.get(lab, [])) if s in blocks]
+        homes = {s for s in targets if s != lab and s != entry and list(dict.fromkeys(pred.get(s, []))) == [lab]}
+        if not homes:
+            continue
+
+        reads: Set[str] = set(instr_uses(b.instrs[-1]))   # by what stays below
+        writes: Set[str] = set()
+        moved: Dict[str, List[Instr]] = {}
+        gone: List[int] = []
+        for i in range(len(b.instrs) - 2, -1, -1):
+            ins = b.instrs[i]
+            d = instr_def(ins)
+            uses = instr_uses(ins)
+            if ins.kind in ("mov", "binop", "unop") and d not in reads and d not in writes and not (uses & writes):
+                live = [s for s in targets if live_in(s, d)]
+                if len(live) == 1 and live[0] in homes:
+                    s = live[0]
+                    moved.setdefault(s, []).insert(0, ins)
+                    extra.setdefault(s, set()).update(uses)
+                    gone.append(i)
+                    continue
+            reads |= uses
+            if d is not None:
+                writes.add(d)
+
+        if not gone:
+            continue
+        b.delete(gone)
+        dirty.add(lab)
+        for s, instrs in moved.items():
+            sb = blocks[s]
+            at = _top(sb.instrs)
+            for k, ins in enumerate(instrs):
+                sb.insert(at + k, ins)
+            dirty.add(s)
+
+    if dirty:
+        fn.invalidate("instrs")
+    return dirty
@@ -0,0 +1,383 @@
+# ir/ssa.py
+"""
+SSA construction and destruction for the block IR.
+
+    to_ssa(fn)    pruned SSA: phis at the iterated dominance frontier of each
+                  variable's defs, only where the variable is live on entry;
+                  every def gets a fresh version name  x -> x.1, x.2, ...
+                  (a use with no reaching def keeps the bare name x)
+    from_ssa(fn)  phis -> parallel copies on the incoming edges (critical
+                  edges are split), sequentialized with a temp for cycles,
+                  then versions of the same variable whose live ranges do not
+                  interfere are coalesced back to one name
+    def_use(fn)   SSA def site and use sites of every name, for sparse passes
+    ssa_form(fn)  context manager: to_ssa on entry, from_ssa on exit, with the
+                  change journal recording only the net edit per block
+
+A phi is Instr(kind="phi", dst=Var, phi_args={pred_label: Value}); phis only
+ever appear at the top of a block and only between to_ssa and from_ssa.
+"""
+
+import copy
+import difflib
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from ir.ir_types import Block, Change, Function, Instr, Var, Value
+from ir.builder import build_cfg
+from ir.analysis import (get_cfg, get_dominators, get_frontiers, get_liveness,
+                         instr_def, instr_uses)
+from ir.dce import drop_unreachable
+
+SEP = "."   # version separator; TAC identifiers never contain it
+
+Site = Tuple[str, int]   # (block label, instruction index)
+
+
+def base_name(name: str) -> str:
+    return name.split(SEP, 1)[0]
+
+
+def _phi_count(b: Block) -> int:
+    n = 0
+    while n < len(b.instrs) and b.instrs[n].kind == "phi":
+        n += 1
+    return n
+
+
+def _unique(labels: List[str]) -> List[str]:
+    return list(dict.fromkeys(labels))
+
+
+# Construction
+
+def to_ssa(fn: Function) -> Set[str]:
+
+    """
+    PRE:  fn has valid blocks/CFG and is not in SSA form.
+    POST: fn is in pruned SSA form (see module docstring); unreachable blocks
+          are dropped first because renaming walks the dominator tree.
+          Returns the labels of blocks that changed.
+    """
+
+    dirty = set(drop_unreachable(fn))
+    if not fn.blocks:
+        return dirty
+    succ, pred = get_cfg(fn)
+    dt = get_dominators(fn)
+    df = get_frontiers(fn)
+    lv = get_liveness(fn)
+    blocks = {b.label: b for b in fn.blocks}
+
+    # 1) phi placement
+    defsites: Dict[str, Set[str]] = {}
+    for b in fn.blocks:
+        for ins in b.instrs:
+            d = instr_def(ins)
+            if d is not None:
+                defsites.setdefault(d, set()).add(b.label)
+
+    phis: Dict[str, List[str]] = {b.label: [] for b in fn.blocks}
+    for v, sites in defsites.items():
+        placed: Set[str] = set()
+        work = list(sites)
+        while work:
+            x = work.pop()
+            for y in df.get(x, ()):
+                if y in placed or not lv.live_in_has(y, v):
+                    continue
+                placed.add(y)
+                phis[y].append(v)
+                work.append(y)   # the phi is a new def of v
+
+    for lab, names in phis.items():
+        b = blocks[lab]
+        preds = _unique(pred.get(lab, []))
+        for i, v in enumerate(names):
+            b.insert(i, Instr(kind="phi", dst=Var(v), phi_args={p: Var(v) for p in preds}))
+        if names:
+            dirty.add(lab)
+
+    # 2) renaming, dominator-tree preorder with explicit stacks
+    counter: Dict[str, int] = {}
+    stacks: Dict[str, List[str]] = {}
+
+    def top(name: str) -> str:
+        st = stacks.get(name)
+        return st[-1] if st else name
+
+    def ren(v: Optional[Value]) -> Optional[Value]:
+        if isinstance(v, Var):
+            t = top(v.name)
+            return v if t == v.name else Var(t)
+        return v
+
+    pushed: Dict[str, List[str]] = {}
+    walk: List[Tuple[str, bool]] = [(fn.blocks[0].label, False)]
+    while walk:
+        lab, leaving = walk.pop()
+        if leaving:
+            for v in pushed.pop(lab):
+                stacks[v].pop()
+            continue
+        b = blocks[lab]
+        mine: List[str] = []
+        for i, ins in enumerate(b.instrs):
+            if ins.kind != "phi":
+                a, bv = ren(ins.a), ren(ins.b)
+                if a is not ins.a or bv is not ins.b:
+                    b.set(i, a=a, b=bv)
+            d = instr_def(ins)
+            if d is not None:
+                counter[d] = counter.get(d, 0) + 1
+                new = f"{d}{SEP}{counter[d]}"
+                stacks.setdefault(d, []).append(new)
+                mine.append(d)
+                b.set(i, dst=Var(new))
+        for s in _unique(succ.get(lab, [])):
+            sb = blocks.get(s)
+            if sb is None:
+                continue
+            for j, v in enumerate(phis[s]):
+                args = dict(sb.instrs[j].phi_args)
+                args[lab] = Var(top(v))
+                sb.set(j, phi_args=args)
+        dirty.add(lab)
+        pushed[lab] = mine
+        walk.append((lab, True))
+        for c in reversed(dt.children.get(lab, [])):
+            walk.append((c, False))
+
+    fn.invalidate("instrs")
+    return dirty
+
+
+# Destruction
+
+def sequentialize(pairs: List[Tuple[str, Value]], fresh) -> List[Tuple[str, Value]]:
+
+    """
+    PRE:  pairs is a parallel copy [(dst, src), ...] with distinct dsts.
+    POST: Returns an equivalent sequence of ordinary copies. A copy is emitted
+          once no other pending copy still reads its dst; a remaining cycle is
+          broken by saving one dst in fresh() first.
+    """
+
+    pending: Dict[str, Value] = {d: s for d, s in pairs if not (isinstance(s, Var) and s.name == d)}
+    out: List[Tuple[str, Value]] = []
+    while pending:
+        read = {s.name for s in pending.values() if isinstance(s, Var)}
+        ready = [d for d in pending if d not in read]
+        if ready:
+            for d in ready:
+                out.append((d, pending.pop(d)))
+            continue
+        d = next(iter(pending))       # every dst is still read: a cycle
+        tmp = fresh()
+        out.append((tmp, Var(d)))
+        for k, s in pending.items():
+            if isinstance(s, Var) and s.name == d:
+                pending[k] = Var(tmp)
+    return out
+
+
+def from_ssa(fn: Function) -> Set[str]:
+
+    """
+    PRE:  fn is in SSA form (phis only at block tops).
+    POST: No phis remain: each phi becomes copies at the end of its
+          predecessors (on a new block when the edge is critical), and SSA
+          versions are coalesced back to their base names where their live
+          ranges do not interfere. Returns the labels of blocks that changed.
+    """
+
+    succ, pred = get_cfg(fn)
+    blocks = {b.label: b for b in fn.blocks}
+    names = {v.name for b in fn.blocks for ins in b.instrs
+             for v in (ins.dst, ins.a, ins.b) if isinstance(v, Var)}
+    dirty: Set[str] = set()
+    split = False
+    ntmp = 0
+
+    def fresh() -> str:
+        nonlocal ntmp
+        while f"t_ssa{ntmp}" in names:
+            ntmp += 1
+        names.add(f"t_ssa{ntmp}")
+        return f"t_ssa{ntmp}"
+
+    nedge = 0
+    for b in list(fn.blocks):
+        n = _phi_count(b)
+        if n == 0:
+            continue
+        phis = b.instrs[:n]
+        for p in _unique(pred.get(b.label, [])):
+            copies = sequentialize([(phi.dst.name, phi.phi_args[p]) for phi in phis], fresh)
+            if not copies:
+                continue
+            pb = blocks[p]
+            if len(set(succ.get(p, []))) > 1:
+                # critical edge p -> b: route it through a new block
+                while f"_SSA-Edge{nedge}" in blocks:
+                    nedge += 1
+                eb = Block(label=f"_SSA-Edge{nedge}", instrs=[Instr(kind="jmp", tlabel=b.label)])
+                eb.journal = fn.journal
+                blocks[eb.label] = eb
+                fn.blocks.insert(fn.blocks.index(b), eb)
+                term = pb.instrs[-1]
+                pb.set(len(pb.instrs) - 1,
+                       tlabel=eb.label if term.tlabel == b.label else term.tlabel,
+                       flabel=eb.label if term.flabel == b.label else term.flabel)
+                dirty.add(p)
+                pb, split = eb, True
+            at = len(pb.instrs) - 1
+            for k, (d, s) in enumerate(copies):
+                pb.insert(at + k, Instr(kind="mov", dst=Var(d), a=s))
+            dirty.add(pb.label)
+        b.delete(range(n))
+        dirty.add(b.label)
+
+    if split:
+        build_cfg(fn)
+    elif dirty:
+        fn.invalidate("instrs")
+    return dirty | _coalesce(fn)
+
+
+def _coalesce(fn: Function) -> Set[str]:
+    # Rename versions of one base variable to a shared name unless their live
+    # ranges interfere (a def while another version is live, copies excepted).
+    lv = get_liveness(fn)
+    ids = lv.ids
+    name_of = {i: n for n, i in ids.items()}
+    mask: Dict[str, int] = {}
+    for n, i in ids.items():
+        mask[base_name(n)] = mask.get(base_name(n), 0) | (1 << i)
+
+    inter: Dict[str, Set[str]] = {n: set() for n in ids}
+    for b in fn.blocks:
+        live = lv.live_out[b.label]
+        for ins in reversed(b.instrs):
+            d = instr_def(ins)
+            if d is not None:
+                dbit = 1 << ids[d]
+                others = live & mask[base_name(d)] & ~dbit
+                if ins.kind == "mov" and isinstance(ins.a, Var):
+                    others &= ~(1 << ids[ins.a.name])   # same value, may share
+                while others:
+                    low = others & -others
+                    o = name_of[low.bit_length() - 1]
+                    inter[d].add(o); inter[o].add(d)
+                    others ^= low
+                live &= ~dbit
+            live |= lv.bits(instr_uses(ins))
+
+    # greedy: the bare name's group first, then versions in numbering order
+    def order(n: str):
+        head, _, ver = n.partition(SEP)
+        return (head, int(ver) if ver.isdigit() else 0)
+
+    rename: Dict[str, str] = {}
+    groups: Dict[str, List[Tuple[str, Set[str]]]] = {}
+    for n in sorted(ids, key=order):
+        gs = groups.setdefault(base_name(n), [])
+        for target, members in gs:
+            if not inter[n] & members:
+                members.add(n)
+                rename[n] = target
+                break
+        else:
+            target = base_name(n) if not gs else n
+            gs.append((target, {n}))
+            rename[n] = target
+
+    def ren(v: Optional[Value]) -> Optional[Value]:
+        if isinstance(v, Var) and rename.get(v.name, v.name) != v.name:
+            return Var(rename[v.name])
+        return v
+
+    dirty: Set[str] = set()
+    for b in fn.blocks:
+        selfcopy = []
+        for i, ins in enumerate(b.instrs):
+            if b.set(i, dst=ren(ins.dst), a=ren(ins.a), b=ren(ins.b)):
+                dirty.add(b.label)
+            if ins.kind == "mov" and isinstance(ins.a, Var) and ins.a.name == ins.dst.name:
+                selfcopy.append(i)
+        if selfcopy:
+            b.delete(selfcopy)
+            dirty.add(b.label)
+    if dirty:
+        fn.invalidate("instrs")
+    return dirty
+
+
+# Def-use chains
+
+def def_use(fn: Function) -> Tuple[Dict[str, Site], Dict[str, List[Site]]]:
+
+    """
+    PRE:  fn is in SSA form.
+    POST: Returns (defs, uses): the single def site of every SSA name and the
+          list of sites reading it (a phi reads its args at its own site).
+    """
+
+    defs: Dict[str, Site] = {}
+    uses: Dict[str, List[Site]] = {}
+    for b in fn.blocks:
+        for i, ins in enumerate(b.instrs):
+            d = instr_def(ins)
+            if d is not None:
+                defs[d] = (b.label, i)
+            for u in instr_uses(ins):
+                uses.setdefault(u, []).append((b.label, i))
+    return defs, uses
+
+
+# Round trip
+
+@contextmanager
+def ssa_form(fn: Function) -> Iterator[Set[str]]:
+
+    """
+    PRE:  fn is not in SSA form.
+    POST: Runs the with-body on fn in SSA form and destructs it afterwards.
+          Yields the set of changed block labels (complete once the block exits).
+    NOTE: Renaming touches nearly every line, so while tracing the journal is
+          paused and the net difference per block is recorded at the end.
+    """
+
+    journal = fn.journal
+    before = None
+    if journal is not None:
+        before = {b.label: [copy.copy(ins) for ins in b.instrs] for b in fn.blocks}
+        fn.stop_journal()
+    dirty = to_ssa(fn)
+    try:
+        yield dirty
+    finally:
+        dirty |= from_ssa(fn)
+        if journal is not None:
+            fn.journal = journal
+            fn.start_journal()
+            _record_diff(fn, before)
+
+
+def _record_diff(fn: Function, before: Dict[str, List[Instr]]) -> None:
+    # journal the line-level difference between the snapshot and fn
+    for b in fn.blocks:
+        old = before.pop(b.label, None)
+        if old is None:
+            fn.journal.append(Change(b.label, -1, note="new block"))
+            continue
+        sm = difflib.SequenceMatcher(a=[repr(i) for i in old], b=[repr(i) for i in b.instrs],
+                                     autojunk=False)
+        for tag, i1, i2, j1, j2 in sm.get_opcodes():
+            if tag == "equal":
+                continue
+            for k in range(max(i2 - i1, j2 - j1)):
+                was = old[i1 + k] if i1 + k < i2 else None
+                now = copy.copy(b.instrs[j1 + k]) if j1 + k < j2 else None
+                fn.journal.append(Change(b.label, j1 + k if now is not None else j2, was, now))
+    for lab in before:
+        fn.journal.append(Change(lab, -1, note="removed"))
@@ -0,0 +1,359 @@
+# ir/superopt.py
+"""
+Offline superoptimizer: finds short mov/binop/unop sequences that compute the
+same value as a longer one and writes them as rewrite rules (see
+ir/peephole.py, which applies them at compile time).
+
+    python -m ir.superopt [--max-instrs N] [--out FILE]
+"""
+import argparse
+import json
+import random
+from math import gcd
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from ir.ir_types import Block, Const, Instr, Var
+from ir.const_fold import _bin, _un
+from ir.algebra import COMMUTATIVE, MIRROR, DefTable, simplify_at
+from ir.peephole import DB_PATH
+
+MAX_INSTRS = 3                     # longest sequence searched by default
+# no / % (partial: zero divisor), && || (not lowered) or shifts (partial for
+# negative counts, and codegen needs a constant count)
+OPS = ["+", "-", "*", "==", "!=", "<", "<=", ">", ">="]
+UNOPS = ["-", "!"]
+LEAVES = ["x", "y", 0, 1, 2, -1]   # inputs of a sequence: two values and small constants
+SAMPLES = 16                       # inputs every candidate is evaluated on (its fingerprint)
+TESTS = 500                        # more random inputs a match must agree on before the proof
+
+# A term has the shape of an ir/algebra.py pattern: "x"/"y" (an input), an
+# int, (op, a) for a unop or (op, a, b) for a binop. Its size is the number
+# of instructions it takes.
+Term = Union[str, int, tuple]
+
+
+def size(t: Term) -> int:
+    return 0 if not isinstance(t, tuple) else 1 + sum(size(s) for s in t[1:])
+
+
+def _inputs(t: Term) -> List[str]:
+    # input names in order of first appearance
+    if isinstance(t, str):
+        return [t]
+    if isinstance(t, int):
+        return []
+    out: List[str] = []
+    for s in t[1:]:
+        out += [n for n in _inputs(s) if n not in out]
+    return out
+
+
+def _folds(t: Term) -> bool:
+    # some instruction of t has only constant operands
+    if not isinstance(t, tuple):
+        return False
+    return all(isinstance(s, int) for s in t[1:]) or any(_folds(s) for s in t[1:])
+
+
+def _const_first(t: Term) -> bool:
+    # a commutative or mirrorable op with its constant operand first, which
+    # ir/algebra.py turns around anyway
+    if not isinstance(t, tuple):
+        return False
+    if len(t) == 3 and (t[0] in COMMUTATIVE or t[0] in MIRROR) and isinstance(t[1], int):
+        return True
+    return any(_const_first(s) for s in t[1:])
+
+
+def evaluate(t: Term, env: Dict[str, int]) -> int:
+    if isinstance(t, str):
+        return env[t]
+    if isinstance(t, int):
+        return t
+    if len(t) == 2:
+        return _un(t[0], evaluate(t[1], env))
+    return _bin(t[0], evaluate(t[1], env), evaluate(t[2], env))
+
+
+# Symbolic proof. A value is normalized to a polynomial over the inputs and
+# over atoms for comparisons ("[lt p]" is 1 if p < 0, "[eq p]" is 1 if
+# p == 0, for a normalized polynomial p). Comparisons are brought to one of
+# those two forms (integers: p <= 0 iff p - 1 < 0, p != 0 iff not p == 0,
+# coefficients divided by their gcd), and the two atoms a comparison and its
+# negation could produce are reduced to one. Atoms are 0/1, so A * A = A.
+# Equal normal forms mean equal values for every input; the converse need
+# not hold, so an unproved rule is dropped.
+
+Poly = Dict[Tuple[str, ...], int]   # monomial (sorted factors) -> coefficient
+
+
+def _is_atom(f: str) -> bool:
+    return f.startswith("[")
+
+
+def _padd(p: Poly, q: Poly, k: int = 1) -> Poly:
+    out = dict(p)
+    for m, c in q.items():
+        out[m] = out.get(m, 0) + k * c
+        if out[m] == 0:
+            del out[m]
+    return out
+
+
+def _pmul(p: Poly, q: Poly) -> Poly:
+    out: Poly = {}
+    for m1, c1 in p.items():
+        for m2, c2 in q.items():
+            fs = list(m1) + [f for f in m2 if not (_is_atom(f) and f in m1)]
+            m = tuple(sorted(fs))
+            out[m] = out.get(m, 0) + c1 * c2
+            if out[m] == 0:
+                del out[m]
+    return out
+
+
+def _const(c: int) -> Poly:
+    return {(): c} if c else {}
+
+
+def _key(p: Poly) -> str:
+    return " ".join(f"{c:+d}*{'*'.join(m)}" for m, c in sorted(p.items()))
+
+
+def _peval(p: Poly, env: Dict[str, int]) -> int:
+    total = 0
+    for m, c in p.items():
+        for f in m:
+            c *= env[f]
+        total += c
+    return total
+
+
+def _atom(kind: str, p: Poly) -> Poly:
+    return {(f"[{kind} {_key(p)}]",): 1}
+
+
+def _compare(op: str, d: Poly) -> Poly:
+    # d op 0
+    if not any(d.keys() - {()}):
+        return _const(_bin(op, d.get((), 0), 0))
+    factors = sorted({f for m in d for f in m})
+    if all(_is_atom(f) for f in factors) and len(factors) <= 4:
+        # a function of a few 0/1 atoms: its multilinear form is exact
+        out: Poly = {}
+        for bits in range(1 << len(factors)):
+            env = {f: bits >> i & 1 for i, f in enumerate(factors)}
+            if _bin(op, _peval(d, env), 0):
+                term = _const(1)
+                for f, v in env.items():
+                    term = _pmul(term, {(f,): 1} if v else _padd(_const(1), {(f,): 1}, -1))
+                out = _padd(out, term)
+        return out
+    if op in (">", ">="):
+        op, d = MIRROR[op], _padd({}, d, -1)
+    if op == "<=":
+        op, d = "<", _padd(d, _const(-1))
+    if op == "!=":
+        return _padd(_const(1), _compare("==", d), -1)
+    c0 = d.get((), 0)
+    n = {m: c for m, c in d.items() if m}
+    g = 0
+    for c in n.values():
+        g = gcd(g, c)
+    lead = n[min(n)]
+    if op == "==":
+        if c0 % g:
+            return {}
+        if lead < 0:
+            g = -g
+        return _atom("eq", {m: c // g for m, c in d.items()})
+    e = _padd({m: c // g for m, c in n.items()}, _const(c0 // g))   # g*e + c0 < 0 iff e + c0//g < 0
+    if lead < 0:
+        return _padd(_const(1), _atom("lt", _padd(_padd({}, e, -1), _const(-1))), -1)
+    return _atom("lt", e)
+
+
+def normalize(t: Term) -> Optional[Poly]:
+    """The normal form of t, or None if t uses an operator the proof does not model."""
+    if isinstance(t, str):
+        return {(t,): 1}
+    if isinstance(t, int):
+        return _const(t)
+    args = [normalize(s) for s in t[1:]]
+    if any(a is None for a in args):
+        return None
+    op = t[0]
+    if len(t) == 2:
+        return _padd({}, args[0], -1) if op == "-" else _compare("==", args[0]) if op == "!" else None
+    a, b = args
+    if op == "+":
+        return _padd(a, b)
+    if op == "-":
+        return _padd(a, b, -1)
+    if op == "*":
+        return _pmul(a, b)
+    if op in ("==", "!=", "<", "<=", ">", ">="):
+        return _compare(op, _padd(a, b, -1))
+    return None
+
+
+def prove(t: Term, r: Term) -> bool:
+    nt, nr = normalize(t), normalize(r)
+    return nt is not None and nt == nr
+
+
+# Search
+
+def _points(n: int, rng: random.Random) -> List[Dict[str, int]]:
+    small = [-2, -1, 0, 1, 2, 3]
+    pts = [{"x": x, "y": y} for x, y in [(0, 0), (1, 1), (-1, 2), (2, -1), (3, 3), (0, 1), (1, 0), (-2, -2)]]
+    while len(pts) < n:
+        x = rng.choice(small) if rng.random() < 0.3 else rng.randint(-1000, 1000)
+        y = x + rng.choice([-1, 0, 1]) if rng.random() < 0.3 else rng.randint(-1000, 1000)
+        pts.append({"x": x, "y": y})
+    return pts
+
+
+def _variants(t: Term) -> Iterator[Term]:
+    # t with the operands of commutative / mirrorable ops in either order,
+    # except a constant before an input (algebra's canonical form puts it last)
+    if not isinstance(t, tuple):
+        yield t
+        return
+    if len(t) == 2:
+        for a in _variants(t[1]):
+            yield (t[0], a)
+        return
+    op = t[0]
+    for a in _variants(t[1]):
+        for b in _variants(t[2]):
+            yield (op, a, b)
+            if (op in COMMUTATIVE or op in MIRROR) and not isinstance(b, int):
+                yield (MIRROR.get(op, op), b, a)
+
+
+def _block_of(t: Term) -> Block:
+    # t as straight-line IR ending in d = ...
+    instrs: List[Instr] = []
+
+    def emit(s: Term):
+        if isinstance(s, str):
+            return Var(s)
+        if isinstance(s, int):
+            return Const(s)
+        args = [emit(a) for a in s[1:]]
+        dst = Var(f"t{len(instrs)}")
+        if len(s) == 2:
+            instrs.append(Instr(kind="unop", dst=dst, op=s[0], a=args[0]))
+        else:
+            instrs.append(Instr(kind="binop", dst=dst, op=s[0], a=args[0], b=args[1]))
+        return dst
+    emit(t)
+    return Block(label="_superopt", instrs=instrs)
+
+
+def _algebra_handles(t: Term) -> bool:
+    # ir/algebra.py's rules already rewrite the last instruction
+    b = _block_of(t)
+    defs = DefTable()
+    for i in range(len(b.instrs)):
+        if simplify_at(b, i, defs) and i == len(b.instrs) - 1:
+            return True
+        defs.record(b.instrs[i])
+    return False
+
+
+def search(max_instrs: int = MAX_INSTRS, seed: int = 0, log=None) -> List[Tuple[Term, Term]]:
+
+    """
+    PRE:  max_instrs >= 2.
+    POST: Returns (pattern, replacement) rules: every term of 2..max_instrs
+          instructions over LEAVES, OPS and UNOPS (by increasing size) that
+          computes the same value as a single instruction or a plain value,
+          paired with the first such term found. A match is found by equal
+          values on SAMPLES inputs, must agree on TESTS more random inputs,
+          and is kept only if prove() shows the two equal. Each pattern is
+          also listed with the operands of its commutative and mirrorable
+          ops swapped.
+    NOTE: Larger terms are only built from the first term of each value, so
+          a term with a reducible part is left to the rule for that part.
+          Terms with an all-constant instruction (folding handles it), with
+          a constant first where algebra would swap it, or that
+          ir/algebra.py already rewrites are skipped.
+    """
+
+    rng = random.Random(seed)
+    pts = _points(SAMPLES, rng)
+    tests = _points(TESTS, rng)
+    first: Dict[tuple, Term] = {}           # fingerprint -> smallest term with it
+    by_size: List[List[Tuple[Term, tuple]]] = [[]]
+    for leaf in LEAVES:
+        fp = tuple(evaluate(leaf, p) for p in pts)
+        first.setdefault(fp, leaf)
+        by_size[0].append((leaf, fp))
+
+    rules: List[Tuple[Term, Term]] = []
+    for k in range(1, max_instrs + 1):
+        found: List[Tuple[Term, tuple]] = []
+
+        def consider(t: Term, fp: tuple) -> None:
+            best = first.get(fp)
+            if best is None:
+                first[fp] = t
+                found.append((t, fp))
+                return
+            if k < 2 or size(best) > 1 or not _inputs(t) or _inputs(t)[0] != "x":
+                return
+            if _folds(t) or _const_first(t) or not set(_inputs(best)) <= set(_inputs(t)) or _algebra_handles(t):
+                return
+            if all(evaluate(t, p) == evaluate(best, p) for p in tests) and prove(t, best):
+                rules.append((t, best))
+
+        for op in UNOPS:
+            for a, fa in by_size[k - 1]:
+                consider((op, a), tuple(_un(op, v) for v in fa))
+        for i in range(k):
+            for a, fa in by_size[i]:
+                for b, fb in by_size[k - 1 - i]:
+                    for op in OPS:
+                        consider((op, a, b), tuple(_bin(op, u, v) for u, v in zip(fa, fb)))
+        by_size.append(found)
+        if log:
+            log(f"size {k}: {len(found)} new values, {len(rules)} rules")
+
+    out: List[Tuple[Term, Term]] = []
+    seen = set()
+    for t, r in rules:
+        for v in _variants(t):
+            if v not in seen:
+                seen.add(v)
+                out.append((v, r))
+    return out
+
+
+def _json(t: Term):
+    return [_json(s) for s in t] if isinstance(t, tuple) else t
+
+
+def save_rules(path: str, rules: List[Tuple[Term, Term]], max_instrs: int) -> None:
+    """Write rules as JSON (one rule per line), in the format ir/peephole.load_rules reads."""
+    head = {"max_instrs": max_instrs, "ops": OPS, "unops": UNOPS, "leaves": LEAVES}
+    with open(path, "w") as f:
+        f.write(json.dumps(head)[:-1] + ', "rules": [\n')
+        f.write(",\n".join(json.dumps([_json(t), _json(r)]) for t, r in rules))
+        f.write("\n]}\n")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Search for shorter equivalent IR sequences.")
+    ap.add_argument("--max-instrs", type=int, default=MAX_INSTRS,
+                    help=f"longest sequence to search (default {MAX_INSTRS})")
+    ap.add_argument("--seed", type=int, default=0, help="seed for the random test inputs")
+    ap.add_argument("--out", default=DB_PATH, help=f"rule database to write (default {DB_PATH})")
+    args = ap.parse_args()
+    rules = search(args.max_instrs, args.seed, log=print)
+    save_rules(args.out, rules, args.max_instrs)
+    print(f"{len(rules)} rules written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
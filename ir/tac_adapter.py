@@ -148,9 +148,10 @@ def ir_to_tac(fn: Function, header_comments: List[str]) -> List[str]:
     out.extend(header_comments)  # keep the "# function", "# decl ..." lines once
     seen_header = True
 
-    for b in fn.blocks:
+    for n, b in enumerate(fn.blocks):
         # print the real label
         out.append(f"{b.label}:")
+        nxt = fn.blocks[n + 1].label if n + 1 < len(fn.blocks) else None
         for ins in b.instrs:
             if ins.kind == "label":
                 # already emitted block label
@@ -164,6 +165,12 @@ def ir_to_tac(fn: Function, header_comments: List[str]) -> List[str]:
             elif ins.kind == "br":
                 # TAC is right now "ifFalse cond goto Lfalse"
                 out.append(f"ifFalse {_str_val(ins.a)} goto {ins.flabel}")
+                if ins.tlabel != nxt:
+                    out.append(f"goto {ins.tlabel}")   # true target is not the next block
+            elif ins.kind == "cbr":
+                out.append(f"ifFalse {_str_val(ins.a)} {ins.op} {_str_val(ins.b)} goto {ins.flabel}")
+                if ins.tlabel != nxt:
+                    out.append(f"goto {ins.tlabel}")
             elif ins.kind == "jmp":
                 out.append(f"goto {ins.tlabel}")
             elif ins.kind == "ret":
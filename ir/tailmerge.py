@@ -0,0 +1,131 @@
+# ir/tailmerge.py
+from typing import Dict, List, Optional, Set, Tuple
+from ir.ir_types import Block, Function, Instr, Var
+from ir.builder import build_cfg
+from ir.analysis import get_liveness, get_loops
+
+_STEM = "_Tail"   # label stem of blocks holding a merged suffix
+
+
+def _canon(b: Block, m: int, dead) -> Optional[Tuple]:
+    # b's last m instructions with every name the suffix defines before any
+    # use of it, and that is dead after b, renamed by order of definition;
+    # suffixes with equal forms compute the same thing
+    local: Dict[str, int] = {}
+    used: Set[str] = set()
+
+    def ren(v):
+        if isinstance(v, Var):
+            if v.name in local:
+                return local[v.name]
+            used.add(v.name)
+        return repr(v)
+
+    out = []
+    for ins in b.instrs[-m:]:
+        if ins.kind in ("label", "phi"):
+            return None
+        a, bb, nz = ren(ins.a), ren(ins.b), ren(ins.nonzero)
+        if ins.dst is not None and ins.dst.name not in local and ins.dst.name not in used and dead(ins.dst.name):
+            local[ins.dst.name] = len(local)
+        out.append((ins.kind, ins.op, a, bb, nz, ren(ins.dst), ins.tlabel, ins.flabel))
+    return tuple(out)
+
+
+def _saving(bs: List[Block], m: int, entry: str) -> int:
+    # instructions saved by keeping bs's common m-instruction suffix once: in
+    # a member that is nothing else, or else in a new block of m instructions
+    if any(len(b.instrs) == m and b.label != entry for b in bs):
+        return (len(bs) - 1) * (m - 1)
+    return len(bs) * (m - 1) - m
+
+
+def _best(group: List[Block], dead, entry: str) -> Tuple[int, int, List[Block]]:
+    # the blocks sharing the suffix that saves the most instructions when
+    # kept once: (saving, suffix length including the terminator, blocks)
+    best: Tuple[int, int, List[Block]] = (0, 0, [])
+    for m in range(2, max(len(b.instrs) for b in group) + 1):
+        same: Dict[Tuple, List[Block]] = {}
+        for b in group:
+            form = _canon(b, m, lambda name: dead(b.label, name)) if len(b.instrs) >= m else None
+            if form is not None:
+                same.setdefault(form, []).append(b)
+        for bs in same.values():
+            if len(bs) > 1 and _saving(bs, m, entry) > best[0]:
+                best = (_saving(bs, m, entry), m, bs)
+    return best
+
+
+def _merge_once(fn: Function, dirty: Set[str]) -> bool:
+    info = get_loops(fn)
+    lv = get_liveness(fn)
+    headers = {lp.header for lp in info.loops}
+    entry = fn.blocks[0].label
+
+    def innermost(lab: str) -> Optional[str]:
+        return next((lp.header for lp in info.loops if lab in lp.body), None)
+
+    groups: Dict[Tuple, List[Block]] = {}
+    for b in fn.blocks:
+        if b.label in headers or not b.instrs or b.instrs[-1].kind not in ("jmp", "ret", "br", "cbr"):
+            continue
+        t = b.instrs[-1]
+        groups.setdefault((innermost(b.label), t.kind, t.tlabel, t.flabel), []).append(b)
+
+    saved, m, members = 0, 0, []
+    for group in groups.values():
+        if len(group) > 1:
+            best = _best(group, lambda lab, name: not lv.live_out_has(lab, name), entry)
+            if best[0] > saved:
+                saved, m, members = best
+    if not members:
+        return False
+
+    # keep the suffix in a member that is nothing else, else in a new block
+    home = next((b for b in members if len(b.instrs) == m and b.label != entry), None)
+    if home is None:
+        labels = {b.label for b in fn.blocks}
+        n = 0
+        while f"{_STEM}{n}" in labels:
+            n += 1
+        home = Block(label=f"{_STEM}{n}", instrs=members[0].instrs[-m:])
+        home.journal = fn.journal
+        fn.blocks.insert(max(fn.blocks.index(b) for b in members) + 1, home)
+        dirty.add(home.label)
+    for b in members:
+        if b is home:
+            continue
+        k = len(b.instrs)
+        b.delete(range(k - m, k))
+        b.insert(k - m, Instr(kind="jmp", tlabel=home.label))
+        dirty.add(b.label)
+    return True
+
+
+def merge_tails(fn: Function) -> Set[str]:
+
+    """
+    PRE:  fn has valid blocks/CFG (not in SSA form).
+    POST: Cross-jumping: repeatedly finds blocks that end in the same
+          terminator (a jmp/ret/br/cbr equal in every field) and share a
+          longer identical suffix, and keeps that suffix only once:
+        - the set of blocks and suffix length that save the most
+          instructions are merged first, counting the new block's copy
+          when no member can hold the suffix; nothing is merged unless it
+          saves at least one instruction
+        - the suffix stays in a member that consists of nothing else, or
+          moves into a new `_Tail<n>` block placed after the last member;
+          every other member drops it and jumps there
+        Returns the labels of blocks that changed or were added.
+    NOTE: Only blocks in the same innermost loop are merged, and loop
+          headers are left alone, so every loop keeps its header and its
+          blocks stay in it. A member left as a bare `jmp` is bypassed
+          later by thread.
+    """
+
+    if not fn.blocks:
+        return set()
+    dirty: Set[str] = set()
+    while _merge_once(fn, dirty):
+        build_cfg(fn)
+    return dirty
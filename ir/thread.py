@@ -0,0 +1,271 @@
+# ir/thread.py
+import copy
+from typing import List, Optional, Set, Tuple
+from ir.ir_types import Block, Const, Function, Instr, Var, Value, RELOPS
+from ir.builder import build_cfg
+from ir.analysis import get_cfg, get_loops, get_rpo, instr_def
+from ir.const_fold import _bin
+from ir.sccp import Env, _transfer, _val
+from ir.algebra import MIRROR, NEGATE, _same
+
+MAX_DUP = 4   # most instructions copied to thread one edge
+
+# Orderings of (a, b) each comparison accepts: -1 a < b, 0 a == b, 1 a > b
+_ORDER = {"<": {-1}, "<=": {-1, 0}, "==": {0}, "!=": {-1, 1}, ">": {1}, ">=": {0, 1}}
+
+Rel = Tuple[str, Value, Value]   # a relation (op, a, b) known to hold
+
+
+_INF = float("inf")
+
+
+def _values(op: str, c: int) -> List[Tuple[float, float]]:
+    # {x : x op c} as disjoint closed intervals
+    return {"<": [(-_INF, c - 1)], "<=": [(-_INF, c)], "==": [(c, c)],
+            "!=": [(-_INF, c - 1), (c + 1, _INF)], ">": [(c + 1, _INF)], ">=": [(c, _INF)]}[op]
+
+
+def _var_const(r: Rel) -> Optional[Tuple[str, str, int]]:
+    # r as (x, op, c) meaning `x op c`, if it compares a variable with a constant
+    op, a, b = r
+    if isinstance(a, Var) and isinstance(b, Const):
+        return a.name, op, b.value
+    if isinstance(a, Const) and isinstance(b, Var):
+        return b.name, MIRROR.get(op, op), a.value
+    return None
+
+
+def _implies(fact: Rel, q: Rel) -> Optional[bool]:
+    # the value of q given that fact holds, or None if it does not follow
+    fop, fa, fb = fact
+    qop, qa, qb = q
+    if not (_same(qa, fa) and _same(qb, fb)):
+        if not (_same(qa, fb) and _same(qb, fa)):
+            return _implies_bounds(fact, q)
+        qop = MIRROR.get(qop, qop)
+    s, qs = _ORDER[fop], _ORDER[qop]
+    if s <= qs:
+        return True
+    if not s & qs:
+        return False
+    return None
+
+
+def _implies_bounds(fact: Rel, q: Rel) -> Optional[bool]:
+    # `x op1 c1` against `x op2 c2`, e.g. i >= 5 makes i < 3 false
+    f, g = _var_const(fact), _var_const(q)
+    if f is None or g is None or f[0] != g[0]:
+        return None
+    fs, qs = _values(f[1], f[2]), _values(g[1], g[2])
+    if all(any(lo >= qlo and hi <= qhi for qlo, qhi in qs) for lo, hi in fs):
+        return True
+    if all(hi < qlo or lo > qhi for lo, hi in fs for qlo, qhi in qs):
+        return False
+    return None
+
+
+def _relation_of(b: Block, end: int, name: str) -> Optional[Rel]:
+    # the comparison computed by the last def of name before b.instrs[end]
+    # (`!x` as x == 0), if its operands are not redefined after it
+    for j in range(end - 1, -1, -1):
+        ins = b.instrs[j]
+        if instr_def(ins) != name:
+            continue
+        if ins.kind == "binop" and ins.op in RELOPS:
+            rel = (ins.op, ins.a, ins.b)
+        elif ins.kind == "unop" and ins.op == "!":
+            rel = ("==", ins.a, Const(0))
+        else:
+            return None
+        used = {v.name for v in rel[1:] if isinstance(v, Var)}
+        if name in used or any(instr_def(x) in used for x in b.instrs[j + 1:end]):
+            return None
+        return rel
+    return None
+
+
+def _branch_rels(b: Block) -> List[Rel]:
+    # relations equivalent to "the terminator of b takes its true edge"
+    term = b.instrs[-1]
+    if term.kind == "cbr":
+        return [(term.op, term.a, term.b)]
+    rels: List[Rel] = [("!=", term.a, Const(0))]
+    if isinstance(term.a, Var):
+        rel = _relation_of(b, len(b.instrs) - 1, term.a.name)
+        if rel is not None:
+            rels.append(rel)
+    return rels
+
+
+def _edge_facts(p: Block, target: str) -> Tuple[Env, List[Rel]]:
+    # constants known at the end of p, and relations known on the edge p -> target
+    env: Env = {}
+    for ins in p.instrs[:-1]:
+        _transfer(ins, env)
+    term = p.instrs[-1]
+    if term.kind not in ("br", "cbr") or term.tlabel == term.flabel:
+        return env, []
+    rels = _branch_rels(p)
+    if term.tlabel == target:
+        return env, rels
+    return env, [(NEGATE[op], a, b) for op, a, b in rels]
+
+
+def _decide(b: Block, env: Env, facts: List[Rel]) -> Optional[str]:
+    # the successor b's branch takes given env/facts on entry, if determined
+    body = b.instrs[:-1]
+    defined = {instr_def(ins) for ins in body} - {None}
+    facts = [f for f in facts if not any(isinstance(v, Var) and v.name in defined for v in f[1:])]
+    env = dict(env)
+    for ins in body:
+        _transfer(ins, env)
+
+    term = b.instrs[-1]
+    for op, x, y in _branch_rels(b):
+        cx, cy = _val(x, env), _val(y, env)
+        if isinstance(cx, Const) and isinstance(cy, Const):
+            return term.tlabel if _bin(op, cx.value, cy.value) else term.flabel
+        for f in facts:
+            r = _implies(f, (op, x, y))
+            if r is not None:
+                return term.tlabel if r else term.flabel
+    return None
+
+
+def _retarget(b: Block, old: str, new: str) -> None:
+    # point b's terminator edges to old at new (a br/cbr with one target left
+    # becomes a jmp)
+    last = len(b.instrs) - 1
+    term = b.instrs[last]
+    t = new if term.tlabel == old else term.tlabel
+    f = new if term.flabel == old else term.flabel
+    if term.kind in ("br", "cbr") and t == f:
+        b.rewrite(last, "jmp", tlabel=t)
+    else:
+        b.set(last, tlabel=t, flabel=f)
+
+
+def _is_forwarder(b: Block) -> bool:
+    real = [ins for ins in b.instrs if ins.kind != "label"]
+    return len(real) == 1 and real[0].kind == "jmp"
+
+
+def _bypass_forwarders(fn: Function, dirty: Set[str]) -> bool:
+    # retarget every edge into a chain of `jmp`-only blocks to the chain's end
+    blocks = {b.label: b for b in fn.blocks}
+    entry = fn.blocks[0].label
+
+    def final(lab: str) -> str:
+        seen: Set[str] = set()
+        while lab != entry and lab in blocks and lab not in seen and _is_forwarder(blocks[lab]):
+            seen.add(lab)
+            lab = blocks[lab].instrs[-1].tlabel
+        return lab
+
+    changed = False
+    for b in fn.blocks:
+        if not b.instrs:
+            continue
+        term = b.instrs[-1]
+        if term.kind not in ("br", "cbr", "jmp"):
+            continue
+        for old in {term.tlabel, term.flabel} - {None}:
+            new = final(old)
+            if new != old:
+                _retarget(b, old, new)
+                dirty.add(b.label)
+                changed = True
+    return changed
+
+
+def _drop_bypassed(fn: Function, dirty: Set[str]) -> None:
+    reachable = set(get_rpo(fn))
+    if len(reachable) == len(fn.blocks):
+        return
+    for b in fn.blocks:
+        if b.label not in reachable:
+            b.touch("bypassed (jump threading)")
+            dirty.add(b.label)
+    fn.blocks = [b for b in fn.blocks if b.label in reachable]
+    build_cfg(fn)
+
+
+def _thread_edge(fn: Function, dirty: Set[str]) -> bool:
+    # thread one edge p -> b whose outcome at b's branch is known; False if none
+    _, pred = get_cfg(fn)
+    headers = {lp.header for lp in get_loops(fn).loops}
+    blocks = {b.label: b for b in fn.blocks}
+    entry = fn.blocks[0].label
+
+    for b in fn.blocks:
+        if (b.label == entry or b.label in headers or not b.instrs
+                or b.instrs[-1].kind not in ("br", "cbr")):
+            continue   # threading into a header would add a second loop entry
+        body = [ins for ins in b.instrs[:-1] if ins.kind != "label"]
+        if len(body) > MAX_DUP:
+            continue
+        for p in dict.fromkeys(pred.get(b.label, [])):
+            pb = blocks[p]
+            if p == b.label:
+                continue
+            target = _decide(b, *_edge_facts(pb, b.label))
+            if target is None or target == b.label:
+                continue
+            if pb.instrs[-1].kind == "jmp":
+                at = len(pb.instrs) - 1
+                for k, ins in enumerate(body):
+                    pb.insert(at + k, copy.copy(ins))
+                pb.set(len(pb.instrs) - 1, tlabel=target)
+            elif not body:
+                _retarget(pb, b.label, target)
+            else:
+                n = 0
+                while f"_Thread{n}" in blocks:
+                    n += 1
+                tb = Block(label=f"_Thread{n}",
+                           instrs=[copy.copy(ins) for ins in body] + [Instr(kind="jmp", tlabel=target)])
+                tb.journal = fn.journal
+                fn.blocks.insert(fn.blocks.index(pb) + 1, tb)
+                _retarget(pb, b.label, tb.label)
+                dirty.add(tb.label)
+            dirty.add(p)
+            return True
+    return False
+
+
+def thread_jumps(fn: Function) -> Set[str]:
+
+    """
+    PRE:  fn has valid blocks/CFG (not in SSA form).
+    POST: Repeats until nothing changes:
+        - an edge into a block that only jumps on (a forwarding block, or a
+          chain of them) is retargeted to the chain's end; a br/cbr whose
+          two targets become equal turns into a jmp
+        - an edge p -> b, where b is a br/cbr block of at most MAX_DUP other
+          instructions and b's branch outcome is known on that edge, goes
+          straight to the outcome. b's instructions are appended to p if p
+          ends in a jmp, else copied into a new `_Thread<n>` block on the
+          edge. The outcome is known from constants set in p (and b) or from
+          a relation p's own branch implies on that edge, e.g. on the true
+          edge of `cbr i < n`, a test `i <= n` or `n > i` is true.
+        Blocks left unreachable (the bypassed ones) are deleted. Returns the
+        labels of blocks that changed, were added or were deleted.
+    NOTE: Loop headers are never threaded into, so every loop keeps a single
+          entry; forwarding blocks are bypassed everywhere.
+    """
+
+    if not fn.blocks:
+        return set()
+    dirty: Set[str] = set()
+    progress = True
+    while progress:
+        progress = False
+        if _bypass_forwarders(fn, dirty):
+            build_cfg(fn)
+            _drop_bypassed(fn, dirty)
+            progress = True
+        if _thread_edge(fn, dirty):
+            build_cfg(fn)
+            _drop_bypassed(fn, dirty)
+            progress = True
+    return dirty
@@ -0,0 +1,234 @@
+# ir/unroll.py
+import copy
+from typing import Dict, List, Optional, Set, Tuple
+from ir.ir_types import Block, Const, Function, Instr, Var
+from ir.builder import build_cfg
+from ir.analysis import Loop, get_cfg, get_dominators, get_loops
+from ir.const_fold import _bin
+from ir.sccp import Env, _transfer, sccp_analyze
+from ir.algebra import MIRROR, NEGATE
+from ir.ivsr import find_basic_ivs
+from ir.thread import _relation_of
+from ir.profile import runs_per_call
+from ir.pass_manager import Pass
+
+UNROLL_FACTOR = 4      # most body copies per trip of a partially unrolled loop
+UNROLL_BUDGET = 64     # most instructions an unrolled loop may grow to
+MAX_TRIPS = 1 << 12    # trip counts are only computed up to here
+HOT_RUNS = 64          # a header profiled to run this often per call is hot...
+HOT_BUDGET_SCALE = 2   # ...and its loop may grow this many times larger
+
+_STEM = "_Unroll"      # label stem of cloned blocks; a loop headed by one is not unrolled again
+
+
+def _exit_test(b: Block, lp: Loop) -> Optional[Tuple[str, str, int, str, str]]:
+    # (i, op, c, inside, exit) when b's branch stays in lp iff `i op c`
+    term = b.instrs[-1]
+    if term.kind == "cbr":
+        rel = (term.op, term.a, term.b)
+    elif term.kind == "br" and isinstance(term.a, Var):
+        rel = _relation_of(b, len(b.instrs) - 1, term.a.name)
+    else:
+        return None
+    if rel is None:
+        return None
+    op, x, y = rel
+    if term.tlabel in lp.body and term.flabel not in lp.body:
+        inside, exit = term.tlabel, term.flabel
+    elif term.flabel in lp.body and term.tlabel not in lp.body:
+        op, inside, exit = NEGATE[op], term.flabel, term.tlabel
+    else:
+        return None
+    if isinstance(x, Const) and isinstance(y, Var):
+        op, x, y = MIRROR.get(op, op), y, x
+    if not (isinstance(x, Var) and isinstance(y, Const)):
+        return None
+    return x.name, op, y.value, inside, exit
+
+
+def trip_count(init: int, step: int, op: str, bound: int) -> Optional[int]:
+
+    """
+    PRE:  the loop test is `i op bound`, i starts at init and moves by step
+          once per iteration.
+    POST: Returns how many times the test holds before it first fails, or
+          None if that is more than MAX_TRIPS.
+    """
+
+    v = init
+    for n in range(MAX_TRIPS + 1):
+        if not _bin(op, v, bound):
+            return n
+        v += step
+    return None
+
+
+def _plan(fn: Function, lp: Loop, consts: Dict[str, Env]) -> Optional[Tuple[List[str], str, int]]:
+
+    """
+    PRE:  analyses are up to date for fn; consts is sccp_analyze(fn)[0].
+    POST: Returns (outside preds, exit label, trip count) if lp has the
+          shape unroll_function handles, else None.
+    """
+
+    succ, pred = get_cfg(fn)
+    blocks = {b.label: b for b in fn.blocks}
+    h = blocks[lp.header]
+    if lp.header.startswith(_STEM) or len(lp.latches) != 1 or len(set(lp.exits)) != 1:
+        return None
+    if any(o is not lp and o.header in lp.body for o in get_loops(fn).loops):
+        return None   # innermost loops only
+    latch = blocks[lp.latches[0]]
+    if latch is h or latch.instrs[-1].kind != "jmp" or lp.exits[0][0] != h.label:
+        return None
+
+    test = _exit_test(h, lp)
+    if test is None:
+        return None
+    name, op, bound, _, exit = test
+    iv = find_basic_ivs(fn, lp).get(name)
+    if iv is None or iv.site[0] == h.label or not get_dominators(fn).dominates(iv.site[0], latch.label):
+        return None   # i must step exactly once per trip, after the test
+
+    outside = list(dict.fromkeys(p for p in pred.get(h.label, []) if p not in lp.body))
+    inits = set()
+    for p in outside:
+        env = dict(consts.get(p, {}))
+        for ins in blocks[p].instrs:
+            _transfer(ins, env)
+        c = env.get(name)
+        inits.add(c.value if isinstance(c, Const) else None)
+    if len(inits) != 1 or None in inits:
+        return None
+    n = trip_count(inits.pop(), iv.step, op, bound)
+    if n is None:
+        return None
+    return outside, exit, n
+
+
+def _unroll_loop(fn: Function, lp: Loop, consts: Dict[str, Env], factor: int, budget: int) -> Set[str]:
+
+    """
+    PRE:  analyses are up to date for fn.
+    POST: Unrolls lp (see unroll_function) and returns the labels of blocks
+          that changed, were added or were deleted (empty iff nothing was done).
+    """
+
+    plan = _plan(fn, lp, consts)
+    runs = runs_per_call(fn, lp.header)
+    if plan is None or runs == 0:
+        return set()   # no known trip count, or never run in the profile
+    if runs is not None and runs >= HOT_RUNS:
+        budget *= HOT_BUDGET_SCALE
+    outside, exit, n = plan
+    body = [b for b in fn.blocks if b.label in lp.body]
+    size = sum(len(b.instrs) for b in body)
+
+    full = n * size <= budget
+    if not full:
+        copies = next((k for k in range(min(factor, n), 1, -1) if n % k == 0), 1)
+        if copies < 2 or copies * size > budget:
+            return set()
+    else:
+        copies = n
+
+    blocks = {b.label: b for b in fn.blocks}
+    h = blocks[lp.header]
+    inside = _exit_test(h, lp)[3]
+    k = 0
+
+    def fresh() -> str:
+        nonlocal k
+        while f"{_STEM}{k}" in blocks:
+            k += 1
+        blocks[f"{_STEM}{k}"] = None
+        return f"{_STEM}{k}"
+
+    maps = [{b.label: fresh() for b in body} for _ in range(copies)]
+    # where the back edge of the last copy goes: the header (now exiting) after
+    # a full unroll, the first copy's header (which keeps the test) otherwise
+    back = h.label if full else maps[0][h.label]
+
+    clones: List[Block] = []
+    for j, m in enumerate(maps):
+        nxt = maps[j + 1][h.label] if j + 1 < copies else back
+        for b in body:
+            nb = Block(label=m[b.label], instrs=[copy.copy(ins) for ins in b.instrs])
+            nb.journal = fn.journal
+            term = nb.instrs[-1]
+            if b is h and (full or j > 0):
+                nb.instrs[-1] = Instr(kind="jmp", tlabel=m[inside])   # the test holds here
+            else:
+                term.tlabel = nxt if term.tlabel == h.label else m.get(term.tlabel, term.tlabel)
+                if term.flabel is not None:
+                    term.flabel = nxt if term.flabel == h.label else m.get(term.flabel, term.flabel)
+            clones.append(nb)
+
+    first = maps[0][h.label] if copies else h.label
+    for p in outside:
+        pb = blocks[p]
+        term = pb.instrs[-1]
+        pb.set(len(pb.instrs) - 1,
+               tlabel=first if term.tlabel == h.label else term.tlabel,
+               flabel=first if term.flabel == h.label else term.flabel)
+    if full:
+        h.rewrite(len(h.instrs) - 1, "jmp", tlabel=exit)   # the test fails on the last visit
+    at = fn.blocks.index(h)
+    fn.blocks[at:at] = clones
+    build_cfg(fn)
+
+    dirty = set(outside) | {h.label} | {b.label for b in clones}
+    live = {b.label for b in fn.blocks} - {lab for lab in lp.body if lab != h.label or not full}
+    for b in body:
+        if b.label not in live:
+            b.touch("dropped (unrolled)")
+            dirty.add(b.label)
+    fn.blocks = [b for b in fn.blocks if b.label in live]
+    build_cfg(fn)
+    return dirty
+
+
+def unroll_function(fn: Function, factor: int = UNROLL_FACTOR, budget: int = UNROLL_BUDGET) -> Set[str]:
+
+    """
+    PRE:  fn has valid blocks/CFG (not in SSA form).
+    POST: Unrolls innermost loops with a known trip count n: loops whose only
+          exit is the header test `i op c` on a basic IV i (see
+          find_basic_ivs) that steps once per trip, with a constant c and a
+          constant start value on every entry edge (from sccp_analyze).
+        - full: if n copies of the loop fit in budget instructions, the loop
+          becomes n straight-line copies of its body, each header copy's
+          test replaced by a jmp; the header itself runs once more and
+          then jumps to the exit
+        - partial: otherwise, with k the largest divisor of n that is at
+          most factor, k copies of the body form the new loop; only the
+          first keeps the test, so k - 1 of every k compares and branches go
+        With a profile (fn.profile), loops whose header never ran are left
+        alone and loops whose header ran HOT_RUNS times per call or more get
+        HOT_BUDGET_SCALE times the budget. Returns the labels of blocks that
+        changed, were added or were deleted.
+    NOTE: The dead tests and the now-constant i in each copy are left to the
+          folding, DSE and fusion passes that run after it. Cloned blocks are
+          named `_Unroll<n>`, and a loop headed by one is not unrolled again.
+    """
+
+    dirty: Set[str] = set()
+    if factor < 1:
+        return dirty
+    progress = True
+    while progress:
+        progress = False
+        consts, _ = sccp_analyze(fn)
+        for lp in get_loops(fn).loops:
+            changed = _unroll_loop(fn, lp, consts, factor, budget)
+            if changed:
+                dirty |= changed
+                progress = True
+                break
+    return dirty
+
+
+def make_unroll_pass(factor: int = UNROLL_FACTOR, budget: int = UNROLL_BUDGET) -> Pass:
+    """Pass spec for loop unrolling with the given factor and size budget."""
+    feats = frozenset({"instrs", "cfg"})
+    return Pass("unroll", lambda fn: unroll_function(fn, factor=factor, budget=budget), feats, feats)
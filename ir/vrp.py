@@ -0,0 +1,378 @@
+# ir/vrp.py
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+from ir.ir_types import Const, Function, Instr, Var, Value, RELOPS
+from ir.builder import build_cfg
+from ir.analysis import get_cfg, get_liveness, get_rpo, instr_def
+from ir.const_fold import fold_at
+from ir.algebra import MIRROR, NEGATE, _log2, _pow2
+from ir.thread import _branch_rels
+
+# Lattice per variable at a program point:
+#   name -> (lo, hi)  every value the variable can hold there is in [lo, hi]
+#                     (lo may be -inf, hi may be inf)
+#   missing           unknown (any value)
+# A block whose entry env is not computed yet is not executable.
+
+Range = Tuple[float, float]
+RangeEnv = Dict[str, Range]
+
+_INF = float("inf")
+FULL: Range = (-_INF, _INF)
+_BOOL: Range = (0, 1)
+
+WIDEN_AFTER = 3   # entry envs a block may take before growing bounds jump to +-inf
+_BIG = 1 << 62    # finite bounds are kept below this (larger ones become +-inf)
+
+
+def _clamp(r: Range) -> Range:
+    lo, hi = r
+    lo = -_INF if lo < -_BIG else min(lo, _BIG)
+    hi = _INF if hi > _BIG else max(hi, -_BIG)
+    return (lo, hi)
+
+
+def _rng(v: Optional[Value], env: RangeEnv) -> Range:
+    if isinstance(v, Const):
+        return _clamp((v.value, v.value))
+    if isinstance(v, Var):
+        return env.get(v.name, FULL)
+    return FULL
+
+
+def _has0(r: Range) -> bool:
+    return r[0] <= 0 <= r[1]
+
+
+def _single(r: Range) -> Optional[int]:
+    return int(r[0]) if r[0] == r[1] and abs(r[0]) != _INF else None
+
+
+def _mul(x: float, y: float) -> float:
+    return 0 if x == 0 or y == 0 else x * y
+
+
+def _floordiv(x: float, y: int) -> float:
+    if abs(x) == _INF:
+        return x if y > 0 else -x
+    return x // y
+
+
+def compare(op: str, x: Range, y: Range) -> Optional[bool]:
+
+    """
+    PRE:  op in RELOPS; x and y are non-empty ranges.
+    POST: Returns the value of `a op b` for every a in x and b in y when they
+          all agree, else None.
+    """
+
+    lo, hi = x[0] - y[1], x[1] - y[0]   # range of a - b
+    if op == "<":  return True if hi < 0 else False if lo >= 0 else None
+    if op == "<=": return True if hi <= 0 else False if lo > 0 else None
+    if op == ">":  return True if lo > 0 else False if hi <= 0 else None
+    if op == ">=": return True if lo >= 0 else False if hi < 0 else None
+    eq = True if lo == hi == 0 else False if lo > 0 or hi < 0 else None
+    if op == "==" or eq is None:
+        return eq
+    return not eq
+
+
+def _binop(op: str, x: Range, y: Range) -> Range:
+    if op == "+":
+        return (x[0] + y[0], x[1] + y[1])
+    if op == "-":
+        return (x[0] - y[1], x[1] - y[0])
+    if op == "*":
+        cs = [_mul(p, q) for p in x for q in y]
+        return (min(cs), max(cs))
+    if op in RELOPS:
+        c = compare(op, x, y)
+        return _BOOL if c is None else (int(c), int(c))
+    if op == "&&":
+        if x == (0, 0) or y == (0, 0):
+            return (0, 0)
+        return (1, 1) if not _has0(x) and not _has0(y) else _BOOL
+    if op == "||":
+        if not _has0(x) or not _has0(y):
+            return (1, 1)
+        return (0, 0) if x == y == (0, 0) else _BOOL
+    if op == "/" and not _has0(y) and abs(y[0]) != _INF and abs(y[1]) != _INF:
+        cs = [_floordiv(p, int(q)) for p in x for q in y]
+        return (min(cs), max(cs))
+    if op == "%" and y[0] > 0:
+        return (0, y[1] - 1)
+    if op == "%" and y[1] < 0:
+        return (y[0] + 1, 0)
+    k = _single(y)
+    if op == "<<" and k is not None and 0 <= k < 64:
+        return (x[0] * 2 ** k, x[1] * 2 ** k)
+    if op == ">>" and k is not None and 0 <= k < 64:
+        return (_floordiv(x[0], 2 ** k), _floordiv(x[1], 2 ** k))
+    return FULL
+
+
+def _unop(op: str, x: Range) -> Range:
+    if op == "-":
+        return (-x[1], -x[0])
+    if op == "!":
+        if x == (0, 0):
+            return (1, 1)
+        return (0, 0) if not _has0(x) else _BOOL
+    return x
+
+
+def eval_range(ins: Instr, env: RangeEnv) -> Range:
+    """The range of the value ins (a mov/binop/unop) assigns, given env."""
+    if ins.kind == "mov":
+        return _rng(ins.a, env)
+    if ins.kind == "binop":
+        return _clamp(_binop(ins.op, _rng(ins.a, env), _rng(ins.b, env)))
+    return _clamp(_unop(ins.op, _rng(ins.a, env)))
+
+
+def _transfer(ins: Instr, env: RangeEnv) -> None:
+    d = instr_def(ins)
+    if d is None:
+        return
+    r = eval_range(ins, env)
+    if r == FULL:
+        env.pop(d, None)
+    else:
+        env[d] = r
+
+
+def _punch(r: Range, c: float) -> Range:
+    # r without the value c, when c is one of its ends
+    if r[0] == c:
+        return (c + 1, r[1])
+    if r[1] == c:
+        return (r[0], c - 1)
+    return r
+
+
+def _refine(env: RangeEnv, rel: Tuple[str, Value, Value]) -> bool:
+    # narrow env to the states where `a op b` holds; False if there are none
+    op, a, b = rel
+    x, y = _rng(a, env), _rng(b, env)
+    if op in (">", ">="):
+        op, a, b, x, y = MIRROR[op], b, a, y, x
+    if op == "<":
+        x, y = (x[0], min(x[1], y[1] - 1)), (max(y[0], x[0] + 1), y[1])
+    elif op == "<=":
+        x, y = (x[0], min(x[1], y[1])), (max(y[0], x[0]), y[1])
+    elif op == "==":
+        x = y = (max(x[0], y[0]), min(x[1], y[1]))
+    elif op == "!=":
+        if y[0] == y[1]:
+            x = _punch(x, y[0])
+        if x[0] == x[1]:
+            y = _punch(y, x[0])
+    for v, r in ((a, x), (b, y)):
+        if r[0] > r[1]:
+            return False
+        if isinstance(v, Var):
+            env[v.name] = r
+    return True
+
+
+def _join(envs: List[RangeEnv]) -> RangeEnv:
+    # smallest ranges covering every env (a name missing from one is unknown)
+    out = envs[0]
+    for e in envs[1:]:
+        out = {n: (min(lo, e[n][0]), max(hi, e[n][1])) for n, (lo, hi) in out.items() if n in e}
+    return dict(out)
+
+
+def _widen(old: RangeEnv, new: RangeEnv) -> RangeEnv:
+    # bounds that moved since old go straight to +-inf
+    out: RangeEnv = {}
+    for n, (lo, hi) in new.items():
+        if n in old:
+            r = (lo if lo >= old[n][0] else -_INF, hi if hi <= old[n][1] else _INF)
+            if r != FULL:
+                out[n] = r
+    return out
+
+
+def vrp_analyze(fn: Function) -> Tuple[Dict[str, RangeEnv], Set[Tuple[str, str]]]:
+
+    """
+    PRE:  fn has blocks and a valid CFG.
+    POST: Returns (IN, executable): the ranges known on entry to every
+          executable block, and the CFG edges that can be taken. Blocks
+          absent from IN are unreachable.
+    NOTE: Like sccp_analyze, but over intervals: the env on an edge out of a
+          br/cbr is narrowed by the branch condition (negated on the false
+          edge, including the comparison a `br t` tests), and an edge whose
+          narrowed env is empty is never executable. A block's entry env is
+          the join over its executable in-edges, widened after WIDEN_AFTER
+          changes so loops converge.
+    """
+
+    succ, pred = get_cfg(fn)
+    blocks = {b.label: b for b in fn.blocks}
+    IN: Dict[str, RangeEnv] = {}
+    EDGE: Dict[Tuple[str, str], RangeEnv] = {}
+    if not fn.blocks:
+        return IN, set()
+
+    entry = fn.blocks[0].label
+    IN[entry] = {}
+    changes: Dict[str, int] = {}
+    work = deque([entry])
+    queued = {entry}
+    while work:
+        lab = work.popleft()
+        queued.discard(lab)
+        b = blocks[lab]
+        env = dict(IN[lab])
+        for ins in b.instrs:
+            _transfer(ins, env)
+
+        term = b.instrs[-1] if b.instrs else None
+        targets = [s for s in dict.fromkeys(succ.get(lab, [])) if s in blocks]
+        for k, s in enumerate(targets):
+            e = env if k == len(targets) - 1 else dict(env)   # the last edge takes env itself
+            if term is not None and term.kind in ("br", "cbr") and term.tlabel != term.flabel:
+                rels = _branch_rels(b)
+                if s != term.tlabel:
+                    rels = [(NEGATE[op], x, y) for op, x, y in rels]
+                if not all(_refine(e, r) for r in rels):
+                    continue
+            if EDGE.get((lab, s)) == e:
+                continue
+            EDGE[(lab, s)] = e
+            if s == entry:
+                continue
+            new_in = _join([EDGE[(p, s)] for p in dict.fromkeys(pred.get(s, [])) if (p, s) in EDGE])
+            if s in IN:
+                changes[s] = changes.get(s, 0) + 1
+                if changes[s] > WIDEN_AFTER:
+                    new_in = _widen(IN[s], _join([IN[s], new_in]))
+            if new_in != IN.get(s):
+                IN[s] = new_in
+                if s not in queued:
+                    queued.add(s)
+                    work.append(s)
+    return IN, set(EDGE)
+
+
+def var_ranges(fn: Function) -> RangeEnv:
+
+    """
+    PRE:  fn has valid blocks/CFG.
+    POST: Returns, for each variable with a range narrower than FULL, a range
+          holding every value it takes anywhere in fn: the join over its defs
+          in reachable blocks, evaluated on these same ranges (no branch
+          conditions). Variables read before any def (live on entry to fn)
+          are unknown.
+    NOTE: Being flow-insensitive, the result stays true when later passes
+          move or copy defs, which is what Instr.nonzero relies on.
+    """
+
+    lv = get_liveness(fn)
+    reach = set(get_rpo(fn))
+    entry = fn.blocks[0].label if fn.blocks else None
+    sites = [ins for b in fn.blocks if b.label in reach for ins in b.instrs if instr_def(ins) is not None]
+    unknown = {ins.dst.name for ins in sites if lv.live_in_has(entry, ins.dst.name)}
+
+    pending = {ins.dst.name for ins in sites} - unknown
+    R: RangeEnv = {}     # a name in pending missing from R has no value yet
+    rounds = 0
+    changed = True
+    while changed:
+        changed = False
+        rounds += 1
+        for ins in sites:
+            d = ins.dst.name
+            if d in unknown or any(isinstance(v, Var) and v.name in pending
+                                   and v.name not in R for v in (ins.a, ins.b)):
+                continue
+            r = eval_range(ins, R)
+            old = R.get(d)
+            new = r if old is None else (min(old[0], r[0]), max(old[1], r[1]))
+            if old is not None and new != old and rounds > WIDEN_AFTER:
+                new = (new[0] if new[0] >= old[0] else -_INF, new[1] if new[1] <= old[1] else _INF)
+            if new != old:
+                R[d] = new
+                changed = True
+    return {n: r for n, r in R.items() if r != FULL}
+
+
+def vrp_function(fn: Function) -> Set[str]:
+
+    """
+    PRE:  fn has valid blocks/CFG.
+    POST: Runs vrp_analyze and rewrites in place:
+        - a variable whose range at a use is one value becomes that Const
+        - a comparison (or any binop/unop) whose result range is one value
+          becomes `mov dst, c`; `/` and `%` only when the divisor cannot be 0
+          there
+        - a br/cbr with one executable edge becomes a jmp, and never
+          executable blocks are removed (CFG is rebuilt)
+        - `x / 2^k` becomes `x >> k` when x >= 0 there (codegen's idiv
+          truncates and sar floors, so they differ for negative x)
+        - a `/` or `%` whose Var divisor cannot be 0 anywhere (var_ranges)
+          gets Instr.nonzero set, so LICM may speculate it
+        Returns the labels of blocks that changed or were removed.
+    NOTE: `if (i >= 0)` inside `while (i < n)` with i counting up from 0
+          folds: the header's range for i is [0, inf] after widening.
+    """
+
+    IN, executable = vrp_analyze(fn)
+    glob = var_ranges(fn)
+    dirty: Set[str] = set()
+    cfg_changed = False
+
+    for b in fn.blocks:
+        if b.label not in IN:
+            continue
+        env = dict(IN[b.label])
+        for i, ins in enumerate(b.instrs):
+            k = ins.kind
+            if k in ("mov", "binop", "unop", "br", "cbr", "ret"):
+                vals = {}
+                for f in ("a", "b"):
+                    v = getattr(ins, f)
+                    c = _single(_rng(v, env)) if isinstance(v, Var) else None
+                    if c is not None:
+                        vals[f] = Const(c)
+                if vals and b.set(i, **vals):
+                    dirty.add(b.label)
+            ins = b.instrs[i]
+            if k in ("binop", "unop"):
+                r = eval_range(ins, env)
+                c = _single(r)
+                traps = k == "binop" and ins.op in ("/", "%") and _has0(_rng(ins.b, env))
+                if c is not None and not traps:
+                    b.rewrite(i, "mov", dst=ins.dst, a=Const(c))
+                    dirty.add(b.label)
+                elif (k == "binop" and ins.op == "/" and isinstance(ins.b, Const) and _pow2(ins.b.value)
+                      and _rng(ins.a, env)[0] >= 0):
+                    b.rewrite(i, "binop", dst=ins.dst, op=">>", a=ins.a, b=Const(_log2(ins.b.value)))
+                    dirty.add(b.label)
+                elif (k == "binop" and ins.op in ("/", "%") and isinstance(ins.b, Var)
+                      and ins.b.name in glob and not _has0(glob[ins.b.name])):
+                    if b.set(i, nonzero=ins.b):
+                        dirty.add(b.label)
+            elif k in ("br", "cbr"):
+                taken = [s for s in dict.fromkeys((ins.tlabel, ins.flabel)) if (b.label, s) in executable]
+                if fold_at(b, i) or (len(taken) == 1 and ins.tlabel != ins.flabel
+                                     and b.rewrite(i, "jmp", tlabel=taken[0])):
+                    cfg_changed = True
+                    dirty.add(b.label)
+            _transfer(b.instrs[i], env)
+
+    dead = [b for b in fn.blocks if b.label not in IN]
+    if dead:
+        for b in dead:
+            b.touch("dropped (never executable)")
+            dirty.add(b.label)
+        fn.blocks = [b for b in fn.blocks if b.label in IN]
+        cfg_changed = True
+
+    if cfg_changed:
+        build_cfg(fn)
+    elif dirty:
+        fn.invalidate("instrs")
+    return dirty
@@ -0,0 +1,15 @@
+int main() {
+  int a, b, x;
+  a = 0;
+  b = 0;
+  while (a < 6) {
+    b = b + a;
+    if (b > 4) {        // x is never used, so this branch decides nothing
+      x = b * 2;
+    } else {
+      x = b - 1;
+    }
+    a = a + 1;
+  }
+  return a;             // 6
+}
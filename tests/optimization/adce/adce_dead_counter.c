@@ -0,0 +1,10 @@
+int main() {
+  int i, j;
+  i = 0;
+  j = 0;
+  while (i < 5) {
+    j = j + 2;          // j only feeds itself: live to dse, dead to adce
+    i = i + 1;
+  }
+  return i;             // 5
+}
@@ -0,0 +1,15 @@
+int main() {
+  int x, i, a, q;
+  x = 5;
+  i = 0;
+  while (i < 3) {
+    x = (x / 4) * 8 + x;   // -> (x >> 2) << 3 (x >= 0, so vrp may shift)
+    i = i + 1;
+  }
+  a = 0;
+  while (a * a < 50) {
+    a = a - 1;
+  }
+  q = (a + 1) / 4;         // -7 / 4 == -1: must stay idiv, sar would give -2
+  return x + q;            // 109 + -1 == 108
+}
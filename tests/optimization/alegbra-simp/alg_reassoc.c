@@ -0,0 +1,13 @@
+int main() {
+  int x, i, y, z, w;
+  x = 3;
+  i = 0;
+  while (i < 4) {
+    x = x * 2 + i;
+    i = i + 1;
+  }
+  y = ((x + 1) + 2) - 5;   // -> x + -2
+  z = (3 * y) * 5;         // -> y * 15
+  w = z - z + !!x;         // -> x != 0
+  return y + z + w;
+}
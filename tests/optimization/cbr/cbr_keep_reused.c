@@ -0,0 +1,15 @@
+int main() {
+    int a;
+    int b;
+    int c;
+    a = 0;
+    b = 0;
+    while (a < 5) {
+        a = a + 2;
+    }
+    c = a > 5;              // c is also returned, so its br stays a br
+    if (c) {
+        b = 1;
+    }
+    return b + c;
+}
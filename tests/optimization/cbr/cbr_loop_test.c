@@ -0,0 +1,13 @@
+int main() {
+    int i;
+    int s;
+    i = 0;
+    s = 0;
+    while (i < 10) {        // t = i < 10; br t  ->  cbr i < 10
+        if (!(s > 7)) {     // t = s > 7; t2 = !t; br t2  ->  cbr s <= 7
+            s = s + i;
+        }
+        i = i + 1;
+    }
+    return s;
+}
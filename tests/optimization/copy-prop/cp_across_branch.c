@@ -0,0 +1,12 @@
+int main() {
+  int a, x, y, z;
+  a = 5;
+  z = 1;
+  x = a;          // x -> a holds on entry to both arms and the join
+  if (z > 0) {
+    y = x + 1;    // becomes a + 1
+  } else {
+    y = x - 1;    // becomes a - 1
+  }
+  return y + x;   // becomes y + a, so x = a is a dead store -> 11
+}
@@ -0,0 +1,10 @@
+int main() {
+  int a, x, z;
+  a = 2;
+  z = 1;
+  x = a;          // x -> a ...
+  if (z > 0) {
+    a = 9;        // ... killed on this path only
+  }
+  return x + a;   // x -> a is not available at the join: x stays -> 11
+}
@@ -0,0 +1,9 @@
+int main() {
+  int a, b, c, d;
+  a = 3;
+  b = a;      // b -> a
+  c = b;      // c -> a (root, not b)
+  d = c;      // d -> a
+  a = 10;     // kills b, c and d's alias to a in one step
+  return d + a;   // 13: d must still read the old a
+}
@@ -0,0 +1,18 @@
+int main() {
+    int i;
+    int j;
+    int w;
+    int s;
+    i = 2;
+    j = 3;
+    w = 0;
+    s = 0;
+    while (w < 4) {
+        s = s + i * w + j;
+        if (s > 10) {
+            s = s - (w * i + j);
+        }
+        w = w + 1;
+    }
+    return s;
+}
@@ -0,0 +1,14 @@
+int main() {
+    int a;
+    int b;
+    int x;
+    int y;
+    a = 7;
+    b = a - 3;
+    while (b < 20) {
+        x = a + b;
+        y = b + a;
+        b = x + y;
+    }
+    return b;
+}
@@ -0,0 +1,18 @@
+int main() {
+  int x, i, j, k;
+  x = 5;      // live: only read deep inside the loop nest
+  x = x;      // self-copy must not kill the store above
+  i = 0;
+  while (i < 2) {
+    j = 0;
+    while (j < 2) {
+      k = 0;
+      while (k < 2) {
+        k = k + x;
+      }
+      j = j + 1;
+    }
+    i = i + 1;
+  }
+  return k;   // 5
+}
@@ -0,0 +1,16 @@
+int main() {
+    int i;
+    int w;
+    int s;
+    w = 0;
+    while (w < 3) {
+        w = w + 1;
+    }
+    i = 0;
+    s = 0;
+    while (i < 5) {
+        s = s + i * w + i;   // i * w reduced; i still needed for "+ i"
+        i = i + 1;
+    }
+    return s + i;
+}
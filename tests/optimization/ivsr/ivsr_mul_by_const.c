@@ -0,0 +1,18 @@
+int main() {
+    int i;
+    int n;
+    int x;
+    int s;
+    n = 0;
+    while (n < 10) {
+        n = n + 1;
+    }
+    i = 0;
+    s = 0;
+    while (i < n) {
+        x = i * 8;       // becomes a running sum bumped by 8
+        s = s + x;
+        i = i + 1;       // i only feeds the test: the test moves to the sum
+    }
+    return s;
+}
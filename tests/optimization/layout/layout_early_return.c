@@ -0,0 +1,14 @@
+int main() {
+    int i;
+    int s;
+    i = 0;
+    s = 0;
+    while (i < 50) {
+        if (s > 5000) {      // cold: the early return is placed after the loop
+            return 0;
+        }
+        s = s + i;
+        i = i + 1;
+    }
+    return s;            // 1225
+}
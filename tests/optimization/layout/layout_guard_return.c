@@ -0,0 +1,17 @@
+int main() {
+    int n;
+    int s;
+    n = 0;
+    while (n * n < 30) { // n is not a compile-time constant below
+        n = n + 1;
+    }
+    if (n > 100) {       // cold: the early return moves to the end, and the
+        return 0;            // main path falls through instead of jumping
+    }
+    s = 0;
+    while (n > 0) {
+        s = s + n;
+        n = n - 1;
+    }
+    return s;            // 21
+}
@@ -0,0 +1,18 @@
+int main() {
+    int a;
+    int b;
+    int i;
+    int s;
+    a = 0;
+    while (a < 6) {      // a, b are not compile-time constants below
+        a = a + 1;
+    }
+    b = a - 1;
+    i = 0;
+    s = 0;
+    while (i < 10) {
+        s = s + a * b + i;   // a * b is hoisted in front of the loop
+        i = i + 1;
+    }
+    return s;
+}
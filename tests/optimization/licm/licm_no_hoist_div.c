@@ -0,0 +1,19 @@
+int main() {
+    int n;
+    int d;
+    int i;
+    int s;
+    n = 0;
+    while (n < 3) {
+        n = n + 1;
+    }
+    d = n - 3;           // 0 at run time, unknown to the optimizer
+    i = 0;
+    s = 0;
+    while (i < d) {      // never entered
+        s = s + 100 / d;     // must stay in the loop: hoisting it would divide by zero
+        s = s + n * 2;       // n * 2 is safe to hoist
+        i = i + 1;
+    }
+    return s;
+}
@@ -0,0 +1,17 @@
+int main() {
+    int i;
+    int a;
+    int b;
+    i = 0;
+    a = 0;
+    b = 0;
+    while (i < 100) {
+        if (i * i < 9) {     // true 3 times out of 100: with -O2 --profile-use
+            a = a + 1;           // the else arm falls through
+        } else {
+            b = b + i;
+        }
+        i = i + 1;
+    }
+    return a + b;        // 3 + 4947
+}
@@ -0,0 +1,23 @@
+int main() {
+    int n;
+    int i;
+    int s;
+    n = 0;
+    while (n * n < 30) { // n is 6 at run time, unknown to the optimizer
+        n = n + 1;
+    }
+    s = 0;
+    if (n > 50) {        // never true: with --profile-use -O3 this loop is
+        i = 0;               // not unrolled, the one below still is
+        while (i < 8) {
+            s = s + i * n;
+            i = i + 1;
+        }
+    }
+    i = 0;
+    while (i < 4) {
+        s = s + n;
+        i = i + 1;
+    }
+    return s;            // 24
+}
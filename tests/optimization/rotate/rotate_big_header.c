@@ -0,0 +1,10 @@
+int main() {
+  int i;
+  i = 0;
+  // the test takes more than ROTATE_MAX instructions, so the loop keeps
+  // its top test and the jmp back to it
+  while ((i + 1) * (i + 2) - (i + 3) * (i - 4) + i * i < 90) {
+    i = i + 1;
+  }
+  return i;
+}
@@ -0,0 +1,16 @@
+int main() {
+  int i, n, s;
+  n = 0;
+  s = 0;
+  while (s < 20) {      // n is not a constant after this loop
+    s = s + 3;
+    n = n + 1;
+  }
+  i = 0;
+  s = 0;
+  while (i < n) {       // the guard i < n stays ahead of the loop; the copy
+    s = s + i;          // at the bottom is the only branch per trip
+    i = i + 1;
+  }
+  return s;             // 21
+}
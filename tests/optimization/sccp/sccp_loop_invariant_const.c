@@ -0,0 +1,14 @@
+int main() {
+    int i;
+    int k;
+    int s;
+    i = 0;
+    k = 4;
+    s = 0;
+    while (i < 3) {
+        s = s + k * 2;
+        k = 4;
+        i = i + 1;
+    }
+    return s;
+}
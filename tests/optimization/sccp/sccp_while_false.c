@@ -0,0 +1,16 @@
+int main() {
+    int n;
+    int s;
+    n = 0;
+    s = 7;
+    if (s > 3) {
+        s = 10;
+    } else {
+        s = 10;
+    }
+    while (n > 0) {
+        s = s + n;
+        n = n - 1;
+    }
+    return s;
+}
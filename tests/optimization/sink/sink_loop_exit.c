@@ -0,0 +1,14 @@
+int main() {
+    int i;
+    int s;
+    int last;
+    i = 0;
+    s = 0;
+    last = 0;
+    while (i < 50) {
+        s = s + i;
+        last = s * 3 + 1;   // only read after the loop: sinks into the exit
+        i = i + 1;
+    }
+    return last;            // 3 * 1225 + 1 = 3676
+}
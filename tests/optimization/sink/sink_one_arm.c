@@ -0,0 +1,18 @@
+int main() {
+    int a;
+    int b;
+    int t;
+    int r;
+    a = 7;
+    b = 0;
+    while (b < 20) {
+        b = b + 3;
+    }
+    t = a * b + 5;      // only the then-arm reads t: it is computed there
+    if (b > 100) {
+        r = t;
+    } else {
+        r = b;
+    }
+    return r;           // 21
+}
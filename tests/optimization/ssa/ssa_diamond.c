@@ -0,0 +1,12 @@
+int main() {
+    int x;
+    int y;
+    x = 5;
+    y = x;
+    if (y > 3) {
+        x = x + 1;
+    } else {
+        x = x - 1;
+    }
+    return x + y;   // 11
+}
@@ -0,0 +1,16 @@
+int main() {
+    int a;
+    int b;
+    int t;
+    int i;
+    a = 1;
+    b = 2;
+    i = 0;
+    while (i < 3) {
+        t = a;
+        a = b;
+        b = t;
+        i = i + 1;
+    }
+    return a * 10 + b;   // 21
+}
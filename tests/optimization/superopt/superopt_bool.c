@@ -0,0 +1,15 @@
+int main() {
+    int a;
+    int b;
+    int r;
+    a = 0;
+    b = 40;
+    while (a * a < b) {
+        a = a + 1;
+        b = b - 1;
+    }
+    r = !(a - b);                   // -O3: a == b
+    r = r + ((a < b) + 1 > 1);      // -O3: a < b
+    r = r + -(b - a);               // -O3: a - b
+    return r;                       // a = 6, b = 34: 0 + 1 - 28 = -27
+}
@@ -0,0 +1,16 @@
+int main() {
+    int x;
+    int y;
+    int n;
+    x = 0;
+    y = 0;
+    n = 0;
+    while (x * x < 200) {
+        x = x + 1;
+        y = y + 3;
+        n = n + ((x - y) < 0);      // -O3: n + (x < y)
+        n = n + (x + y - y);        // -O3: n + x
+        n = n - ((x < y) == 0);     // -O3: n - (x >= y)
+    }
+    return n;                       // 15 + 120 - 0 = 135
+}
@@ -0,0 +1,15 @@
+int main() {
+    int a;
+    int p;
+    int q;
+    a = 4;
+    if (a > 3) {
+        p = 1;
+        q = a;              // `q = a; return p` ends both arms, but neither arm
+        return p;           // is only that: a new _Tail block would save nothing
+    } else {
+        p = 2;
+        q = a;              // and add a jmp, so `--passes tailmerge` leaves both
+        return p;           // arms alone
+    }
+}
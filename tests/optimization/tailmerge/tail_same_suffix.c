@@ -0,0 +1,17 @@
+int main() {
+    int a;
+    int b;
+    int c;
+    a = 0;
+    while (a * a < 40) {
+        a = a + 1;
+    }
+    if (a > 3) {
+        b = a + 1;
+        c = a * 5 + 7;      // same code (up to temp names) ends both arms:
+    } else {
+        b = a - 1;
+        c = a * 5 + 7;      // it is kept once and both arms jump to it
+    }
+    return c - b;           // 42 - 8 = 34
+}
@@ -0,0 +1,23 @@
+int main() {
+    int x;
+    int y;
+    int n;
+    x = 0;
+    y = 0;
+    n = 0;
+    while (x * x < 150) {
+        x = x + 1;
+        y = y + x;
+    }
+    if (y > 200) {
+        return y;
+    }
+    if (y > 100) {
+        return x * 3 + y;   // these three returns compute the same value and
+    }
+    if (y > 50) {
+        n = x * 3 + y;      // are kept once; with --frame stack the two
+        return n;           // returns left share one epilogue
+    }
+    return x * 3 + y;       // y = 91: 13 * 3 + 91 = 130
+}
@@ -0,0 +1,19 @@
+int main() {
+    int x;
+    int y;
+    int i;
+    x = 0;
+    y = 0;
+    i = 0;
+    while (i < 8) {
+        if (i > 2) {
+            if (i > 5) {
+                x = x + i;
+            }                   // empty join blocks: jmp-only after lowering
+        } else {
+            y = y + 1;
+        }
+        i = i + 1;
+    }
+    return x + y;
+}
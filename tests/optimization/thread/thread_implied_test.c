@@ -0,0 +1,20 @@
+int main() {
+    int a;
+    int b;
+    int i;
+    a = 0;
+    b = 0;
+    i = 0;
+    while (i < 10) {
+        if (i < 5) {
+            a = a + 1;
+        } else {
+            if (i < 3) {        // never true here: i >= 5 on this path
+                b = b + 100;
+            }
+            b = b + 1;
+        }
+        i = i + 1;
+    }
+    return a * 10 + b;
+}
@@ -0,0 +1,10 @@
+int main() {
+  int i, s;
+  i = 0;
+  s = 0;
+  while (i < 4) {       // 4 trips: -O3 copies the body 4 times, no compare left
+    s = s + i * 3;
+    i = i + 1;
+  }
+  return s;             // folds to 18
+}
@@ -0,0 +1,12 @@
+int main() {
+  int i, s, x;
+  i = 0;
+  s = 0;
+  x = 7;
+  while (i < 100) {     // too big to unroll fully: 4 copies per trip, one test
+    s = s + x;
+    x = x * 3 - s;
+    i = i + 1;
+  }
+  return s;
+}
@@ -0,0 +1,8013 @@
+int main() {
+  int a;
+  int v0;
+  int v1;
+  int v2;
+  int v3;
+  int v4;
+  int v5;
+  int v6;
+  int v7;
+  int v8;
+  int v9;
+  int v10;
+  int v11;
+  int v12;
+  int v13;
+  int v14;
+  int v15;
+  int v16;
+  int v17;
+  int v18;
+  int v19;
+  int v20;
+  int v21;
+  int v22;
+  int v23;
+  int v24;
+  int v25;
+  int v26;
+  int v27;
+  int v28;
+  int v29;
+  int v30;
+  int v31;
+  int v32;
+  int v33;
+  int v34;
+  int v35;
+  int v36;
+  int v37;
+  int v38;
+  int v39;
+  int v40;
+  int v41;
+  int v42;
+  int v43;
+  int v44;
+  int v45;
+  int v46;
+  int v47;
+  int v48;
+  int v49;
+  int v50;
+  int v51;
+  int v52;
+  int v53;
+  int v54;
+  int v55;
+  int v56;
+  int v57;
+  int v58;
+  int v59;
+  int v60;
+  int v61;
+  int v62;
+  int v63;
+  int v64;
+  int v65;
+  int v66;
+  int v67;
+  int v68;
+  int v69;
+  int v70;
+  int v71;
+  int v72;
+  int v73;
+  int v74;
+  int v75;
+  int v76;
+  int v77;
+  int v78;
+  int v79;
+  int v80;
+  int v81;
+  int v82;
+  int v83;
+  int v84;
+  int v85;
+  int v86;
+  int v87;
+  int v88;
+  int v89;
+  int v90;
+  int v91;
+  int v92;
+  int v93;
+  int v94;
+  int v95;
+  int v96;
+  int v97;
+  int v98;
+  int v99;
+  int v100;
+  int v101;
+  int v102;
+  int v103;
+  int v104;
+  int v105;
+  int v106;
+  int v107;
+  int v108;
+  int v109;
+  int v110;
+  int v111;
+  int v112;
+  int v113;
+  int v114;
+  int v115;
+  int v116;
+  int v117;
+  int v118;
+  int v119;
+  int v120;
+  int v121;
+  int v122;
+  int v123;
+  int v124;
+  int v125;
+  int v126;
+  int v127;
+  int v128;
+  int v129;
+  int v130;
+  int v131;
+  int v132;
+  int v133;
+  int v134;
+  int v135;
+  int v136;
+  int v137;
+  int v138;
+  int v139;
+  int v140;
+  int v141;
+  int v142;
+  int v143;
+  int v144;
+  int v145;
+  int v146;
+  int v147;
+  int v148;
+  int v149;
+  int v150;
+  int v151;
+  int v152;
+  int v153;
+  int v154;
+  int v155;
+  int v156;
+  int v157;
+  int v158;
+  int v159;
+  int v160;
+  int v161;
+  int v162;
+  int v163;
+  int v164;
+  int v165;
+  int v166;
+  int v167;
+  int v168;
+  int v169;
+  int v170;
+  int v171;
+  int v172;
+  int v173;
+  int v174;
+  int v175;
+  int v176;
+  int v177;
+  int v178;
+  int v179;
+  int v180;
+  int v181;
+  int v182;
+  int v183;
+  int v184;
+  int v185;
+  int v186;
+  int v187;
+  int v188;
+  int v189;
+  int v190;
+  int v191;
+  int v192;
+  int v193;
+  int v194;
+  int v195;
+  int v196;
+  int v197;
+  int v198;
+  int v199;
+  int v200;
+  int v201;
+  int v202;
+  int v203;
+  int v204;
+  int v205;
+  int v206;
+  int v207;
+  int v208;
+  int v209;
+  int v210;
+  int v211;
+  int v212;
+  int v213;
+  int v214;
+  int v215;
+  int v216;
+  int v217;
+  int v218;
+  int v219;
+  int v220;
+  int v221;
+  int v222;
+  int v223;
+  int v224;
+  int v225;
+  int v226;
+  int v227;
+  int v228;
+  int v229;
+  int v230;
+  int v231;
+  int v232;
+  int v233;
+  int v234;
+  int v235;
+  int v236;
+  int v237;
+  int v238;
+  int v239;
+  int v240;
+  int v241;
+  int v242;
+  int v243;
+  int v244;
+  int v245;
+  int v246;
+  int v247;
+  int v248;
+  int v249;
+  int v250;
+  int v251;
+  int v252;
+  int v253;
+  int v254;
+  int v255;
+  int v256;
+  int v257;
+  int v258;
+  int v259;
+  int v260;
+  int v261;
+  int v262;
+  int v263;
+  int v264;
+  int v265;
+  int v266;
+  int v267;
+  int v268;
+  int v269;
+  int v270;
+  int v271;
+  int v272;
+  int v273;
+  int v274;
+  int v275;
+  int v276;
+  int v277;
+  int v278;
+  int v279;
+  int v280;
+  int v281;
+  int v282;
+  int v283;
+  int v284;
+  int v285;
+  int v286;
+  int v287;
+  int v288;
+  int v289;
+  int v290;
+  int v291;
+  int v292;
+  int v293;
+  int v294;
+  int v295;
+  int v296;
+  int v297;
+  int v298;
+  int v299;
+  int v300;
+  int v301;
+  int v302;
+  int v303;
+  int v304;
+  int v305;
+  int v306;
+  int v307;
+  int v308;
+  int v309;
+  int v310;
+  int v311;
+  int v312;
+  int v313;
+  int v314;
+  int v315;
+  int v316;
+  int v317;
+  int v318;
+  int v319;
+  int v320;
+  int v321;
+  int v322;
+  int v323;
+  int v324;
+  int v325;
+  int v326;
+  int v327;
+  int v328;
+  int v329;
+  int v330;
+  int v331;
+  int v332;
+  int v333;
+  int v334;
+  int v335;
+  int v336;
+  int v337;
+  int v338;
+  int v339;
+  int v340;
+  int v341;
+  int v342;
+  int v343;
+  int v344;
+  int v345;
+  int v346;
+  int v347;
+  int v348;
+  int v349;
+  int v350;
+  int v351;
+  int v352;
+  int v353;
+  int v354;
+  int v355;
+  int v356;
+  int v357;
+  int v358;
+  int v359;
+  int v360;
+  int v361;
+  int v362;
+  int v363;
+  int v364;
+  int v365;
+  int v366;
+  int v367;
+  int v368;
+  int v369;
+  int v370;
+  int v371;
+  int v372;
+  int v373;
+  int v374;
+  int v375;
+  int v376;
+  int v377;
+  int v378;
+  int v379;
+  int v380;
+  int v381;
+  int v382;
+  int v383;
+  int v384;
+  int v385;
+  int v386;
+  int v387;
+  int v388;
+  int v389;
+  int v390;
+  int v391;
+  int v392;
+  int v393;
+  int v394;
+  int v395;
+  int v396;
+  int v397;
+  int v398;
+  int v399;
+  int v400;
+  int v401;
+  int v402;
+  int v403;
+  int v404;
+  int v405;
+  int v406;
+  int v407;
+  int v408;
+  int v409;
+  int v410;
+  int v411;
+  int v412;
+  int v413;
+  int v414;
+  int v415;
+  int v416;
+  int v417;
+  int v418;
+  int v419;
+  int v420;
+  int v421;
+  int v422;
+  int v423;
+  int v424;
+  int v425;
+  int v426;
+  int v427;
+  int v428;
+  int v429;
+  int v430;
+  int v431;
+  int v432;
+  int v433;
+  int v434;
+  int v435;
+  int v436;
+  int v437;
+  int v438;
+  int v439;
+  int v440;
+  int v441;
+  int v442;
+  int v443;
+  int v444;
+  int v445;
+  int v446;
+  int v447;
+  int v448;
+  int v449;
+  int v450;
+  int v451;
+  int v452;
+  int v453;
+  int v454;
+  int v455;
+  int v456;
+  int v457;
+  int v458;
+  int v459;
+  int v460;
+  int v461;
+  int v462;
+  int v463;
+  int v464;
+  int v465;
+  int v466;
+  int v467;
+  int v468;
+  int v469;
+  int v470;
+  int v471;
+  int v472;
+  int v473;
+  int v474;
+  int v475;
+  int v476;
+  int v477;
+  int v478;
+  int v479;
+  int v480;
+  int v481;
+  int v482;
+  int v483;
+  int v484;
+  int v485;
+  int v486;
+  int v487;
+  int v488;
+  int v489;
+  int v490;
+  int v491;
+  int v492;
+  int v493;
+  int v494;
+  int v495;
+  int v496;
+  int v497;
+  int v498;
+  int v499;
+  int v500;
+  int v501;
+  int v502;
+  int v503;
+  int v504;
+  int v505;
+  int v506;
+  int v507;
+  int v508;
+  int v509;
+  int v510;
+  int v511;
+  int v512;
+  int v513;
+  int v514;
+  int v515;
+  int v516;
+  int v517;
+  int v518;
+  int v519;
+  int v520;
+  int v521;
+  int v522;
+  int v523;
+  int v524;
+  int v525;
+  int v526;
+  int v527;
+  int v528;
+  int v529;
+  int v530;
+  int v531;
+  int v532;
+  int v533;
+  int v534;
+  int v535;
+  int v536;
+  int v537;
+  int v538;
+  int v539;
+  int v540;
+  int v541;
+  int v542;
+  int v543;
+  int v544;
+  int v545;
+  int v546;
+  int v547;
+  int v548;
+  int v549;
+  int v550;
+  int v551;
+  int v552;
+  int v553;
+  int v554;
+  int v555;
+  int v556;
+  int v557;
+  int v558;
+  int v559;
+  int v560;
+  int v561;
+  int v562;
+  int v563;
+  int v564;
+  int v565;
+  int v566;
+  int v567;
+  int v568;
+  int v569;
+  int v570;
+  int v571;
+  int v572;
+  int v573;
+  int v574;
+  int v575;
+  int v576;
+  int v577;
+  int v578;
+  int v579;
+  int v580;
+  int v581;
+  int v582;
+  int v583;
+  int v584;
+  int v585;
+  int v586;
+  int v587;
+  int v588;
+  int v589;
+  int v590;
+  int v591;
+  int v592;
+  int v593;
+  int v594;
+  int v595;
+  int v596;
+  int v597;
+  int v598;
+  int v599;
+  int v600;
+  int v601;
+  int v602;
+  int v603;
+  int v604;
+  int v605;
+  int v606;
+  int v607;
+  int v608;
+  int v609;
+  int v610;
+  int v611;
+  int v612;
+  int v613;
+  int v614;
+  int v615;
+  int v616;
+  int v617;
+  int v618;
+  int v619;
+  int v620;
+  int v621;
+  int v622;
+  int v623;
+  int v624;
+  int v625;
+  int v626;
+  int v627;
+  int v628;
+  int v629;
+  int v630;
+  int v631;
+  int v632;
+  int v633;
+  int v634;
+  int v635;
+  int v636;
+  int v637;
+  int v638;
+  int v639;
+  int v640;
+  int v641;
+  int v642;
+  int v643;
+  int v644;
+  int v645;
+  int v646;
+  int v647;
+  int v648;
+  int v649;
+  int v650;
+  int v651;
+  int v652;
+  int v653;
+  int v654;
+  int v655;
+  int v656;
+  int v657;
+  int v658;
+  int v659;
+  int v660;
+  int v661;
+  int v662;
+  int v663;
+  int v664;
+  int v665;
+  int v666;
+  int v667;
+  int v668;
+  int v669;
+  int v670;
+  int v671;
+  int v672;
+  int v673;
+  int v674;
+  int v675;
+  int v676;
+  int v677;
+  int v678;
+  int v679;
+  int v680;
+  int v681;
+  int v682;
+  int v683;
+  int v684;
+  int v685;
+  int v686;
+  int v687;
+  int v688;
+  int v689;
+  int v690;
+  int v691;
+  int v692;
+  int v693;
+  int v694;
+  int v695;
+  int v696;
+  int v697;
+  int v698;
+  int v699;
+  int v700;
+  int v701;
+  int v702;
+  int v703;
+  int v704;
+  int v705;
+  int v706;
+  int v707;
+  int v708;
+  int v709;
+  int v710;
+  int v711;
+  int v712;
+  int v713;
+  int v714;
+  int v715;
+  int v716;
+  int v717;
+  int v718;
+  int v719;
+  int v720;
+  int v721;
+  int v722;
+  int v723;
+  int v724;
+  int v725;
+  int v726;
+  int v727;
+  int v728;
+  int v729;
+  int v730;
+  int v731;
+  int v732;
+  int v733;
+  int v734;
+  int v735;
+  int v736;
+  int v737;
+  int v738;
+  int v739;
+  int v740;
+  int v741;
+  int v742;
+  int v743;
+  int v744;
+  int v745;
+  int v746;
+  int v747;
+  int v748;
+  int v749;
+  int v750;
+  int v751;
+  int v752;
+  int v753;
+  int v754;
+  int v755;
+  int v756;
+  int v757;
+  int v758;
+  int v759;
+  int v760;
+  int v761;
+  int v762;
+  int v763;
+  int v764;
+  int v765;
+  int v766;
+  int v767;
+  int v768;
+  int v769;
+  int v770;
+  int v771;
+  int v772;
+  int v773;
+  int v774;
+  int v775;
+  int v776;
+  int v777;
+  int v778;
+  int v779;
+  int v780;
+  int v781;
+  int v782;
+  int v783;
+  int v784;
+  int v785;
+  int v786;
+  int v787;
+  int v788;
+  int v789;
+  int v790;
+  int v791;
+  int v792;
+  int v793;
+  int v794;
+  int v795;
+  int v796;
+  int v797;
+  int v798;
+  int v799;
+  int v800;
+  int v801;
+  int v802;
+  int v803;
+  int v804;
+  int v805;
+  int v806;
+  int v807;
+  int v808;
+  int v809;
+  int v810;
+  int v811;
+  int v812;
+  int v813;
+  int v814;
+  int v815;
+  int v816;
+  int v817;
+  int v818;
+  int v819;
+  int v820;
+  int v821;
+  int v822;
+  int v823;
+  int v824;
+  int v825;
+  int v826;
+  int v827;
+  int v828;
+  int v829;
+  int v830;
+  int v831;
+  int v832;
+  int v833;
+  int v834;
+  int v835;
+  int v836;
+  int v837;
+  int v838;
+  int v839;
+  int v840;
+  int v841;
+  int v842;
+  int v843;
+  int v844;
+  int v845;
+  int v846;
+  int v847;
+  int v848;
+  int v849;
+  int v850;
+  int v851;
+  int v852;
+  int v853;
+  int v854;
+  int v855;
+  int v856;
+  int v857;
+  int v858;
+  int v859;
+  int v860;
+  int v861;
+  int v862;
+  int v863;
+  int v864;
+  int v865;
+  int v866;
+  int v867;
+  int v868;
+  int v869;
+  int v870;
+  int v871;
+  int v872;
+  int v873;
+  int v874;
+  int v875;
+  int v876;
+  int v877;
+  int v878;
+  int v879;
+  int v880;
+  int v881;
+  int v882;
+  int v883;
+  int v884;
+  int v885;
+  int v886;
+  int v887;
+  int v888;
+  int v889;
+  int v890;
+  int v891;
+  int v892;
+  int v893;
+  int v894;
+  int v895;
+  int v896;
+  int v897;
+  int v898;
+  int v899;
+  int v900;
+  int v901;
+  int v902;
+  int v903;
+  int v904;
+  int v905;
+  int v906;
+  int v907;
+  int v908;
+  int v909;
+  int v910;
+  int v911;
+  int v912;
+  int v913;
+  int v914;
+  int v915;
+  int v916;
+  int v917;
+  int v918;
+  int v919;
+  int v920;
+  int v921;
+  int v922;
+  int v923;
+  int v924;
+  int v925;
+  int v926;
+  int v927;
+  int v928;
+  int v929;
+  int v930;
+  int v931;
+  int v932;
+  int v933;
+  int v934;
+  int v935;
+  int v936;
+  int v937;
+  int v938;
+  int v939;
+  int v940;
+  int v941;
+  int v942;
+  int v943;
+  int v944;
+  int v945;
+  int v946;
+  int v947;
+  int v948;
+  int v949;
+  int v950;
+  int v951;
+  int v952;
+  int v953;
+  int v954;
+  int v955;
+  int v956;
+  int v957;
+  int v958;
+  int v959;
+  int v960;
+  int v961;
+  int v962;
+  int v963;
+  int v964;
+  int v965;
+  int v966;
+  int v967;
+  int v968;
+  int v969;
+  int v970;
+  int v971;
+  int v972;
+  int v973;
+  int v974;
+  int v975;
+  int v976;
+  int v977;
+  int v978;
+  int v979;
+  int v980;
+  int v981;
+  int v982;
+  int v983;
+  int v984;
+  int v985;
+  int v986;
+  int v987;
+  int v988;
+  int v989;
+  int v990;
+  int v991;
+  int v992;
+  int v993;
+  int v994;
+  int v995;
+  int v996;
+  int v997;
+  int v998;
+  int v999;
+  int v1000;
+  int v1001;
+  int v1002;
+  int v1003;
+  int v1004;
+  int v1005;
+  int v1006;
+  int v1007;
+  int v1008;
+  int v1009;
+  int v1010;
+  int v1011;
+  int v1012;
+  int v1013;
+  int v1014;
+  int v1015;
+  int v1016;
+  int v1017;
+  int v1018;
+  int v1019;
+  int v1020;
+  int v1021;
+  int v1022;
+  int v1023;
+  int v1024;
+  int v1025;
+  int v1026;
+  int v1027;
+  int v1028;
+  int v1029;
+  int v1030;
+  int v1031;
+  int v1032;
+  int v1033;
+  int v1034;
+  int v1035;
+  int v1036;
+  int v1037;
+  int v1038;
+  int v1039;
+  int v1040;
+  int v1041;
+  int v1042;
+  int v1043;
+  int v1044;
+  int v1045;
+  int v1046;
+  int v1047;
+  int v1048;
+  int v1049;
+  int v1050;
+  int v1051;
+  int v1052;
+  int v1053;
+  int v1054;
+  int v1055;
+  int v1056;
+  int v1057;
+  int v1058;
+  int v1059;
+  int v1060;
+  int v1061;
+  int v1062;
+  int v1063;
+  int v1064;
+  int v1065;
+  int v1066;
+  int v1067;
+  int v1068;
+  int v1069;
+  int v1070;
+  int v1071;
+  int v1072;
+  int v1073;
+  int v1074;
+  int v1075;
+  int v1076;
+  int v1077;
+  int v1078;
+  int v1079;
+  int v1080;
+  int v1081;
+  int v1082;
+  int v1083;
+  int v1084;
+  int v1085;
+  int v1086;
+  int v1087;
+  int v1088;
+  int v1089;
+  int v1090;
+  int v1091;
+  int v1092;
+  int v1093;
+  int v1094;
+  int v1095;
+  int v1096;
+  int v1097;
+  int v1098;
+  int v1099;
+  int v1100;
+  int v1101;
+  int v1102;
+  int v1103;
+  int v1104;
+  int v1105;
+  int v1106;
+  int v1107;
+  int v1108;
+  int v1109;
+  int v1110;
+  int v1111;
+  int v1112;
+  int v1113;
+  int v1114;
+  int v1115;
+  int v1116;
+  int v1117;
+  int v1118;
+  int v1119;
+  int v1120;
+  int v1121;
+  int v1122;
+  int v1123;
+  int v1124;
+  int v1125;
+  int v1126;
+  int v1127;
+  int v1128;
+  int v1129;
+  int v1130;
+  int v1131;
+  int v1132;
+  int v1133;
+  int v1134;
+  int v1135;
+  int v1136;
+  int v1137;
+  int v1138;
+  int v1139;
+  int v1140;
+  int v1141;
+  int v1142;
+  int v1143;
+  int v1144;
+  int v1145;
+  int v1146;
+  int v1147;
+  int v1148;
+  int v1149;
+  int v1150;
+  int v1151;
+  int v1152;
+  int v1153;
+  int v1154;
+  int v1155;
+  int v1156;
+  int v1157;
+  int v1158;
+  int v1159;
+  int v1160;
+  int v1161;
+  int v1162;
+  int v1163;
+  int v1164;
+  int v1165;
+  int v1166;
+  int v1167;
+  int v1168;
+  int v1169;
+  int v1170;
+  int v1171;
+  int v1172;
+  int v1173;
+  int v1174;
+  int v1175;
+  int v1176;
+  int v1177;
+  int v1178;
+  int v1179;
+  int v1180;
+  int v1181;
+  int v1182;
+  int v1183;
+  int v1184;
+  int v1185;
+  int v1186;
+  int v1187;
+  int v1188;
+  int v1189;
+  int v1190;
+  int v1191;
+  int v1192;
+  int v1193;
+  int v1194;
+  int v1195;
+  int v1196;
+  int v1197;
+  int v1198;
+  int v1199;
+  int v1200;
+  int v1201;
+  int v1202;
+  int v1203;
+  int v1204;
+  int v1205;
+  int v1206;
+  int v1207;
+  int v1208;
+  int v1209;
+  int v1210;
+  int v1211;
+  int v1212;
+  int v1213;
+  int v1214;
+  int v1215;
+  int v1216;
+  int v1217;
+  int v1218;
+  int v1219;
+  int v1220;
+  int v1221;
+  int v1222;
+  int v1223;
+  int v1224;
+  int v1225;
+  int v1226;
+  int v1227;
+  int v1228;
+  int v1229;
+  int v1230;
+  int v1231;
+  int v1232;
+  int v1233;
+  int v1234;
+  int v1235;
+  int v1236;
+  int v1237;
+  int v1238;
+  int v1239;
+  int v1240;
+  int v1241;
+  int v1242;
+  int v1243;
+  int v1244;
+  int v1245;
+  int v1246;
+  int v1247;
+  int v1248;
+  int v1249;
+  int v1250;
+  int v1251;
+  int v1252;
+  int v1253;
+  int v1254;
+  int v1255;
+  int v1256;
+  int v1257;
+  int v1258;
+  int v1259;
+  int v1260;
+  int v1261;
+  int v1262;
+  int v1263;
+  int v1264;
+  int v1265;
+  int v1266;
+  int v1267;
+  int v1268;
+  int v1269;
+  int v1270;
+  int v1271;
+  int v1272;
+  int v1273;
+  int v1274;
+  int v1275;
+  int v1276;
+  int v1277;
+  int v1278;
+  int v1279;
+  int v1280;
+  int v1281;
+  int v1282;
+  int v1283;
+  int v1284;
+  int v1285;
+  int v1286;
+  int v1287;
+  int v1288;
+  int v1289;
+  int v1290;
+  int v1291;
+  int v1292;
+  int v1293;
+  int v1294;
+  int v1295;
+  int v1296;
+  int v1297;
+  int v1298;
+  int v1299;
+  int v1300;
+  int v1301;
+  int v1302;
+  int v1303;
+  int v1304;
+  int v1305;
+  int v1306;
+  int v1307;
+  int v1308;
+  int v1309;
+  int v1310;
+  int v1311;
+  int v1312;
+  int v1313;
+  int v1314;
+  int v1315;
+  int v1316;
+  int v1317;
+  int v1318;
+  int v1319;
+  int v1320;
+  int v1321;
+  int v1322;
+  int v1323;
+  int v1324;
+  int v1325;
+  int v1326;
+  int v1327;
+  int v1328;
+  int v1329;
+  int v1330;
+  int v1331;
+  int v1332;
+  int v1333;
+  int v1334;
+  int v1335;
+  int v1336;
+  int v1337;
+  int v1338;
+  int v1339;
+  int v1340;
+  int v1341;
+  int v1342;
+  int v1343;
+  int v1344;
+  int v1345;
+  int v1346;
+  int v1347;
+  int v1348;
+  int v1349;
+  int v1350;
+  int v1351;
+  int v1352;
+  int v1353;
+  int v1354;
+  int v1355;
+  int v1356;
+  int v1357;
+  int v1358;
+  int v1359;
+  int v1360;
+  int v1361;
+  int v1362;
+  int v1363;
+  int v1364;
+  int v1365;
+  int v1366;
+  int v1367;
+  int v1368;
+  int v1369;
+  int v1370;
+  int v1371;
+  int v1372;
+  int v1373;
+  int v1374;
+  int v1375;
+  int v1376;
+  int v1377;
+  int v1378;
+  int v1379;
+  int v1380;
+  int v1381;
+  int v1382;
+  int v1383;
+  int v1384;
+  int v1385;
+  int v1386;
+  int v1387;
+  int v1388;
+  int v1389;
+  int v1390;
+  int v1391;
+  int v1392;
+  int v1393;
+  int v1394;
+  int v1395;
+  int v1396;
+  int v1397;
+  int v1398;
+  int v1399;
+  int v1400;
+  int v1401;
+  int v1402;
+  int v1403;
+  int v1404;
+  int v1405;
+  int v1406;
+  int v1407;
+  int v1408;
+  int v1409;
+  int v1410;
+  int v1411;
+  int v1412;
+  int v1413;
+  int v1414;
+  int v1415;
+  int v1416;
+  int v1417;
+  int v1418;
+  int v1419;
+  int v1420;
+  int v1421;
+  int v1422;
+  int v1423;
+  int v1424;
+  int v1425;
+  int v1426;
+  int v1427;
+  int v1428;
+  int v1429;
+  int v1430;
+  int v1431;
+  int v1432;
+  int v1433;
+  int v1434;
+  int v1435;
+  int v1436;
+  int v1437;
+  int v1438;
+  int v1439;
+  int v1440;
+  int v1441;
+  int v1442;
+  int v1443;
+  int v1444;
+  int v1445;
+  int v1446;
+  int v1447;
+  int v1448;
+  int v1449;
+  int v1450;
+  int v1451;
+  int v1452;
+  int v1453;
+  int v1454;
+  int v1455;
+  int v1456;
+  int v1457;
+  int v1458;
+  int v1459;
+  int v1460;
+  int v1461;
+  int v1462;
+  int v1463;
+  int v1464;
+  int v1465;
+  int v1466;
+  int v1467;
+  int v1468;
+  int v1469;
+  int v1470;
+  int v1471;
+  int v1472;
+  int v1473;
+  int v1474;
+  int v1475;
+  int v1476;
+  int v1477;
+  int v1478;
+  int v1479;
+  int v1480;
+  int v1481;
+  int v1482;
+  int v1483;
+  int v1484;
+  int v1485;
+  int v1486;
+  int v1487;
+  int v1488;
+  int v1489;
+  int v1490;
+  int v1491;
+  int v1492;
+  int v1493;
+  int v1494;
+  int v1495;
+  int v1496;
+  int v1497;
+  int v1498;
+  int v1499;
+  int v1500;
+  int v1501;
+  int v1502;
+  int v1503;
+  int v1504;
+  int v1505;
+  int v1506;
+  int v1507;
+  int v1508;
+  int v1509;
+  int v1510;
+  int v1511;
+  int v1512;
+  int v1513;
+  int v1514;
+  int v1515;
+  int v1516;
+  int v1517;
+  int v1518;
+  int v1519;
+  int v1520;
+  int v1521;
+  int v1522;
+  int v1523;
+  int v1524;
+  int v1525;
+  int v1526;
+  int v1527;
+  int v1528;
+  int v1529;
+  int v1530;
+  int v1531;
+  int v1532;
+  int v1533;
+  int v1534;
+  int v1535;
+  int v1536;
+  int v1537;
+  int v1538;
+  int v1539;
+  int v1540;
+  int v1541;
+  int v1542;
+  int v1543;
+  int v1544;
+  int v1545;
+  int v1546;
+  int v1547;
+  int v1548;
+  int v1549;
+  int v1550;
+  int v1551;
+  int v1552;
+  int v1553;
+  int v1554;
+  int v1555;
+  int v1556;
+  int v1557;
+  int v1558;
+  int v1559;
+  int v1560;
+  int v1561;
+  int v1562;
+  int v1563;
+  int v1564;
+  int v1565;
+  int v1566;
+  int v1567;
+  int v1568;
+  int v1569;
+  int v1570;
+  int v1571;
+  int v1572;
+  int v1573;
+  int v1574;
+  int v1575;
+  int v1576;
+  int v1577;
+  int v1578;
+  int v1579;
+  int v1580;
+  int v1581;
+  int v1582;
+  int v1583;
+  int v1584;
+  int v1585;
+  int v1586;
+  int v1587;
+  int v1588;
+  int v1589;
+  int v1590;
+  int v1591;
+  int v1592;
+  int v1593;
+  int v1594;
+  int v1595;
+  int v1596;
+  int v1597;
+  int v1598;
+  int v1599;
+  int v1600;
+  int v1601;
+  int v1602;
+  int v1603;
+  int v1604;
+  int v1605;
+  int v1606;
+  int v1607;
+  int v1608;
+  int v1609;
+  int v1610;
+  int v1611;
+  int v1612;
+  int v1613;
+  int v1614;
+  int v1615;
+  int v1616;
+  int v1617;
+  int v1618;
+  int v1619;
+  int v1620;
+  int v1621;
+  int v1622;
+  int v1623;
+  int v1624;
+  int v1625;
+  int v1626;
+  int v1627;
+  int v1628;
+  int v1629;
+  int v1630;
+  int v1631;
+  int v1632;
+  int v1633;
+  int v1634;
+  int v1635;
+  int v1636;
+  int v1637;
+  int v1638;
+  int v1639;
+  int v1640;
+  int v1641;
+  int v1642;
+  int v1643;
+  int v1644;
+  int v1645;
+  int v1646;
+  int v1647;
+  int v1648;
+  int v1649;
+  int v1650;
+  int v1651;
+  int v1652;
+  int v1653;
+  int v1654;
+  int v1655;
+  int v1656;
+  int v1657;
+  int v1658;
+  int v1659;
+  int v1660;
+  int v1661;
+  int v1662;
+  int v1663;
+  int v1664;
+  int v1665;
+  int v1666;
+  int v1667;
+  int v1668;
+  int v1669;
+  int v1670;
+  int v1671;
+  int v1672;
+  int v1673;
+  int v1674;
+  int v1675;
+  int v1676;
+  int v1677;
+  int v1678;
+  int v1679;
+  int v1680;
+  int v1681;
+  int v1682;
+  int v1683;
+  int v1684;
+  int v1685;
+  int v1686;
+  int v1687;
+  int v1688;
+  int v1689;
+  int v1690;
+  int v1691;
+  int v1692;
+  int v1693;
+  int v1694;
+  int v1695;
+  int v1696;
+  int v1697;
+  int v1698;
+  int v1699;
+  int v1700;
+  int v1701;
+  int v1702;
+  int v1703;
+  int v1704;
+  int v1705;
+  int v1706;
+  int v1707;
+  int v1708;
+  int v1709;
+  int v1710;
+  int v1711;
+  int v1712;
+  int v1713;
+  int v1714;
+  int v1715;
+  int v1716;
+  int v1717;
+  int v1718;
+  int v1719;
+  int v1720;
+  int v1721;
+  int v1722;
+  int v1723;
+  int v1724;
+  int v1725;
+  int v1726;
+  int v1727;
+  int v1728;
+  int v1729;
+  int v1730;
+  int v1731;
+  int v1732;
+  int v1733;
+  int v1734;
+  int v1735;
+  int v1736;
+  int v1737;
+  int v1738;
+  int v1739;
+  int v1740;
+  int v1741;
+  int v1742;
+  int v1743;
+  int v1744;
+  int v1745;
+  int v1746;
+  int v1747;
+  int v1748;
+  int v1749;
+  int v1750;
+  int v1751;
+  int v1752;
+  int v1753;
+  int v1754;
+  int v1755;
+  int v1756;
+  int v1757;
+  int v1758;
+  int v1759;
+  int v1760;
+  int v1761;
+  int v1762;
+  int v1763;
+  int v1764;
+  int v1765;
+  int v1766;
+  int v1767;
+  int v1768;
+  int v1769;
+  int v1770;
+  int v1771;
+  int v1772;
+  int v1773;
+  int v1774;
+  int v1775;
+  int v1776;
+  int v1777;
+  int v1778;
+  int v1779;
+  int v1780;
+  int v1781;
+  int v1782;
+  int v1783;
+  int v1784;
+  int v1785;
+  int v1786;
+  int v1787;
+  int v1788;
+  int v1789;
+  int v1790;
+  int v1791;
+  int v1792;
+  int v1793;
+  int v1794;
+  int v1795;
+  int v1796;
+  int v1797;
+  int v1798;
+  int v1799;
+  int v1800;
+  int v1801;
+  int v1802;
+  int v1803;
+  int v1804;
+  int v1805;
+  int v1806;
+  int v1807;
+  int v1808;
+  int v1809;
+  int v1810;
+  int v1811;
+  int v1812;
+  int v1813;
+  int v1814;
+  int v1815;
+  int v1816;
+  int v1817;
+  int v1818;
+  int v1819;
+  int v1820;
+  int v1821;
+  int v1822;
+  int v1823;
+  int v1824;
+  int v1825;
+  int v1826;
+  int v1827;
+  int v1828;
+  int v1829;
+  int v1830;
+  int v1831;
+  int v1832;
+  int v1833;
+  int v1834;
+  int v1835;
+  int v1836;
+  int v1837;
+  int v1838;
+  int v1839;
+  int v1840;
+  int v1841;
+  int v1842;
+  int v1843;
+  int v1844;
+  int v1845;
+  int v1846;
+  int v1847;
+  int v1848;
+  int v1849;
+  int v1850;
+  int v1851;
+  int v1852;
+  int v1853;
+  int v1854;
+  int v1855;
+  int v1856;
+  int v1857;
+  int v1858;
+  int v1859;
+  int v1860;
+  int v1861;
+  int v1862;
+  int v1863;
+  int v1864;
+  int v1865;
+  int v1866;
+  int v1867;
+  int v1868;
+  int v1869;
+  int v1870;
+  int v1871;
+  int v1872;
+  int v1873;
+  int v1874;
+  int v1875;
+  int v1876;
+  int v1877;
+  int v1878;
+  int v1879;
+  int v1880;
+  int v1881;
+  int v1882;
+  int v1883;
+  int v1884;
+  int v1885;
+  int v1886;
+  int v1887;
+  int v1888;
+  int v1889;
+  int v1890;
+  int v1891;
+  int v1892;
+  int v1893;
+  int v1894;
+  int v1895;
+  int v1896;
+  int v1897;
+  int v1898;
+  int v1899;
+  int v1900;
+  int v1901;
+  int v1902;
+  int v1903;
+  int v1904;
+  int v1905;
+  int v1906;
+  int v1907;
+  int v1908;
+  int v1909;
+  int v1910;
+  int v1911;
+  int v1912;
+  int v1913;
+  int v1914;
+  int v1915;
+  int v1916;
+  int v1917;
+  int v1918;
+  int v1919;
+  int v1920;
+  int v1921;
+  int v1922;
+  int v1923;
+  int v1924;
+  int v1925;
+  int v1926;
+  int v1927;
+  int v1928;
+  int v1929;
+  int v1930;
+  int v1931;
+  int v1932;
+  int v1933;
+  int v1934;
+  int v1935;
+  int v1936;
+  int v1937;
+  int v1938;
+  int v1939;
+  int v1940;
+  int v1941;
+  int v1942;
+  int v1943;
+  int v1944;
+  int v1945;
+  int v1946;
+  int v1947;
+  int v1948;
+  int v1949;
+  int v1950;
+  int v1951;
+  int v1952;
+  int v1953;
+  int v1954;
+  int v1955;
+  int v1956;
+  int v1957;
+  int v1958;
+  int v1959;
+  int v1960;
+  int v1961;
+  int v1962;
+  int v1963;
+  int v1964;
+  int v1965;
+  int v1966;
+  int v1967;
+  int v1968;
+  int v1969;
+  int v1970;
+  int v1971;
+  int v1972;
+  int v1973;
+  int v1974;
+  int v1975;
+  int v1976;
+  int v1977;
+  int v1978;
+  int v1979;
+  int v1980;
+  int v1981;
+  int v1982;
+  int v1983;
+  int v1984;
+  int v1985;
+  int v1986;
+  int v1987;
+  int v1988;
+  int v1989;
+  int v1990;
+  int v1991;
+  int v1992;
+  int v1993;
+  int v1994;
+  int v1995;
+  int v1996;
+  int v1997;
+  int v1998;
+  int v1999;
+  int v2000;
+  int v2001;
+  int v2002;
+  int v2003;
+  int v2004;
+  int v2005;
+  int v2006;
+  int v2007;
+  int v2008;
+  int v2009;
+  int v2010;
+  int v2011;
+  int v2012;
+  int v2013;
+  int v2014;
+  int v2015;
+  int v2016;
+  int v2017;
+  int v2018;
+  int v2019;
+  int v2020;
+  int v2021;
+  int v2022;
+  int v2023;
+  int v2024;
+  int v2025;
+  int v2026;
+  int v2027;
+  int v2028;
+  int v2029;
+  int v2030;
+  int v2031;
+  int v2032;
+  int v2033;
+  int v2034;
+  int v2035;
+  int v2036;
+  int v2037;
+  int v2038;
+  int v2039;
+  int v2040;
+  int v2041;
+  int v2042;
+  int v2043;
+  int v2044;
+  int v2045;
+  int v2046;
+  int v2047;
+  int v2048;
+  int v2049;
+  int v2050;
+  int v2051;
+  int v2052;
+  int v2053;
+  int v2054;
+  int v2055;
+  int v2056;
+  int v2057;
+  int v2058;
+  int v2059;
+  int v2060;
+  int v2061;
+  int v2062;
+  int v2063;
+  int v2064;
+  int v2065;
+  int v2066;
+  int v2067;
+  int v2068;
+  int v2069;
+  int v2070;
+  int v2071;
+  int v2072;
+  int v2073;
+  int v2074;
+  int v2075;
+  int v2076;
+  int v2077;
+  int v2078;
+  int v2079;
+  int v2080;
+  int v2081;
+  int v2082;
+  int v2083;
+  int v2084;
+  int v2085;
+  int v2086;
+  int v2087;
+  int v2088;
+  int v2089;
+  int v2090;
+  int v2091;
+  int v2092;
+  int v2093;
+  int v2094;
+  int v2095;
+  int v2096;
+  int v2097;
+  int v2098;
+  int v2099;
+  int v2100;
+  int v2101;
+  int v2102;
+  int v2103;
+  int v2104;
+  int v2105;
+  int v2106;
+  int v2107;
+  int v2108;
+  int v2109;
+  int v2110;
+  int v2111;
+  int v2112;
+  int v2113;
+  int v2114;
+  int v2115;
+  int v2116;
+  int v2117;
+  int v2118;
+  int v2119;
+  int v2120;
+  int v2121;
+  int v2122;
+  int v2123;
+  int v2124;
+  int v2125;
+  int v2126;
+  int v2127;
+  int v2128;
+  int v2129;
+  int v2130;
+  int v2131;
+  int v2132;
+  int v2133;
+  int v2134;
+  int v2135;
+  int v2136;
+  int v2137;
+  int v2138;
+  int v2139;
+  int v2140;
+  int v2141;
+  int v2142;
+  int v2143;
+  int v2144;
+  int v2145;
+  int v2146;
+  int v2147;
+  int v2148;
+  int v2149;
+  int v2150;
+  int v2151;
+  int v2152;
+  int v2153;
+  int v2154;
+  int v2155;
+  int v2156;
+  int v2157;
+  int v2158;
+  int v2159;
+  int v2160;
+  int v2161;
+  int v2162;
+  int v2163;
+  int v2164;
+  int v2165;
+  int v2166;
+  int v2167;
+  int v2168;
+  int v2169;
+  int v2170;
+  int v2171;
+  int v2172;
+  int v2173;
+  int v2174;
+  int v2175;
+  int v2176;
+  int v2177;
+  int v2178;
+  int v2179;
+  int v2180;
+  int v2181;
+  int v2182;
+  int v2183;
+  int v2184;
+  int v2185;
+  int v2186;
+  int v2187;
+  int v2188;
+  int v2189;
+  int v2190;
+  int v2191;
+  int v2192;
+  int v2193;
+  int v2194;
+  int v2195;
+  int v2196;
+  int v2197;
+  int v2198;
+  int v2199;
+  int v2200;
+  int v2201;
+  int v2202;
+  int v2203;
+  int v2204;
+  int v2205;
+  int v2206;
+  int v2207;
+  int v2208;
+  int v2209;
+  int v2210;
+  int v2211;
+  int v2212;
+  int v2213;
+  int v2214;
+  int v2215;
+  int v2216;
+  int v2217;
+  int v2218;
+  int v2219;
+  int v2220;
+  int v2221;
+  int v2222;
+  int v2223;
+  int v2224;
+  int v2225;
+  int v2226;
+  int v2227;
+  int v2228;
+  int v2229;
+  int v2230;
+  int v2231;
+  int v2232;
+  int v2233;
+  int v2234;
+  int v2235;
+  int v2236;
+  int v2237;
+  int v2238;
+  int v2239;
+  int v2240;
+  int v2241;
+  int v2242;
+  int v2243;
+  int v2244;
+  int v2245;
+  int v2246;
+  int v2247;
+  int v2248;
+  int v2249;
+  int v2250;
+  int v2251;
+  int v2252;
+  int v2253;
+  int v2254;
+  int v2255;
+  int v2256;
+  int v2257;
+  int v2258;
+  int v2259;
+  int v2260;
+  int v2261;
+  int v2262;
+  int v2263;
+  int v2264;
+  int v2265;
+  int v2266;
+  int v2267;
+  int v2268;
+  int v2269;
+  int v2270;
+  int v2271;
+  int v2272;
+  int v2273;
+  int v2274;
+  int v2275;
+  int v2276;
+  int v2277;
+  int v2278;
+  int v2279;
+  int v2280;
+  int v2281;
+  int v2282;
+  int v2283;
+  int v2284;
+  int v2285;
+  int v2286;
+  int v2287;
+  int v2288;
+  int v2289;
+  int v2290;
+  int v2291;
+  int v2292;
+  int v2293;
+  int v2294;
+  int v2295;
+  int v2296;
+  int v2297;
+  int v2298;
+  int v2299;
+  int v2300;
+  int v2301;
+  int v2302;
+  int v2303;
+  int v2304;
+  int v2305;
+  int v2306;
+  int v2307;
+  int v2308;
+  int v2309;
+  int v2310;
+  int v2311;
+  int v2312;
+  int v2313;
+  int v2314;
+  int v2315;
+  int v2316;
+  int v2317;
+  int v2318;
+  int v2319;
+  int v2320;
+  int v2321;
+  int v2322;
+  int v2323;
+  int v2324;
+  int v2325;
+  int v2326;
+  int v2327;
+  int v2328;
+  int v2329;
+  int v2330;
+  int v2331;
+  int v2332;
+  int v2333;
+  int v2334;
+  int v2335;
+  int v2336;
+  int v2337;
+  int v2338;
+  int v2339;
+  int v2340;
+  int v2341;
+  int v2342;
+  int v2343;
+  int v2344;
+  int v2345;
+  int v2346;
+  int v2347;
+  int v2348;
+  int v2349;
+  int v2350;
+  int v2351;
+  int v2352;
+  int v2353;
+  int v2354;
+  int v2355;
+  int v2356;
+  int v2357;
+  int v2358;
+  int v2359;
+  int v2360;
+  int v2361;
+  int v2362;
+  int v2363;
+  int v2364;
+  int v2365;
+  int v2366;
+  int v2367;
+  int v2368;
+  int v2369;
+  int v2370;
+  int v2371;
+  int v2372;
+  int v2373;
+  int v2374;
+  int v2375;
+  int v2376;
+  int v2377;
+  int v2378;
+  int v2379;
+  int v2380;
+  int v2381;
+  int v2382;
+  int v2383;
+  int v2384;
+  int v2385;
+  int v2386;
+  int v2387;
+  int v2388;
+  int v2389;
+  int v2390;
+  int v2391;
+  int v2392;
+  int v2393;
+  int v2394;
+  int v2395;
+  int v2396;
+  int v2397;
+  int v2398;
+  int v2399;
+  int v2400;
+  int v2401;
+  int v2402;
+  int v2403;
+  int v2404;
+  int v2405;
+  int v2406;
+  int v2407;
+  int v2408;
+  int v2409;
+  int v2410;
+  int v2411;
+  int v2412;
+  int v2413;
+  int v2414;
+  int v2415;
+  int v2416;
+  int v2417;
+  int v2418;
+  int v2419;
+  int v2420;
+  int v2421;
+  int v2422;
+  int v2423;
+  int v2424;
+  int v2425;
+  int v2426;
+  int v2427;
+  int v2428;
+  int v2429;
+  int v2430;
+  int v2431;
+  int v2432;
+  int v2433;
+  int v2434;
+  int v2435;
+  int v2436;
+  int v2437;
+  int v2438;
+  int v2439;
+  int v2440;
+  int v2441;
+  int v2442;
+  int v2443;
+  int v2444;
+  int v2445;
+  int v2446;
+  int v2447;
+  int v2448;
+  int v2449;
+  int v2450;
+  int v2451;
+  int v2452;
+  int v2453;
+  int v2454;
+  int v2455;
+  int v2456;
+  int v2457;
+  int v2458;
+  int v2459;
+  int v2460;
+  int v2461;
+  int v2462;
+  int v2463;
+  int v2464;
+  int v2465;
+  int v2466;
+  int v2467;
+  int v2468;
+  int v2469;
+  int v2470;
+  int v2471;
+  int v2472;
+  int v2473;
+  int v2474;
+  int v2475;
+  int v2476;
+  int v2477;
+  int v2478;
+  int v2479;
+  int v2480;
+  int v2481;
+  int v2482;
+  int v2483;
+  int v2484;
+  int v2485;
+  int v2486;
+  int v2487;
+  int v2488;
+  int v2489;
+  int v2490;
+  int v2491;
+  int v2492;
+  int v2493;
+  int v2494;
+  int v2495;
+  int v2496;
+  int v2497;
+  int v2498;
+  int v2499;
+  int v2500;
+  int v2501;
+  int v2502;
+  int v2503;
+  int v2504;
+  int v2505;
+  int v2506;
+  int v2507;
+  int v2508;
+  int v2509;
+  int v2510;
+  int v2511;
+  int v2512;
+  int v2513;
+  int v2514;
+  int v2515;
+  int v2516;
+  int v2517;
+  int v2518;
+  int v2519;
+  int v2520;
+  int v2521;
+  int v2522;
+  int v2523;
+  int v2524;
+  int v2525;
+  int v2526;
+  int v2527;
+  int v2528;
+  int v2529;
+  int v2530;
+  int v2531;
+  int v2532;
+  int v2533;
+  int v2534;
+  int v2535;
+  int v2536;
+  int v2537;
+  int v2538;
+  int v2539;
+  int v2540;
+  int v2541;
+  int v2542;
+  int v2543;
+  int v2544;
+  int v2545;
+  int v2546;
+  int v2547;
+  int v2548;
+  int v2549;
+  int v2550;
+  int v2551;
+  int v2552;
+  int v2553;
+  int v2554;
+  int v2555;
+  int v2556;
+  int v2557;
+  int v2558;
+  int v2559;
+  int v2560;
+  int v2561;
+  int v2562;
+  int v2563;
+  int v2564;
+  int v2565;
+  int v2566;
+  int v2567;
+  int v2568;
+  int v2569;
+  int v2570;
+  int v2571;
+  int v2572;
+  int v2573;
+  int v2574;
+  int v2575;
+  int v2576;
+  int v2577;
+  int v2578;
+  int v2579;
+  int v2580;
+  int v2581;
+  int v2582;
+  int v2583;
+  int v2584;
+  int v2585;
+  int v2586;
+  int v2587;
+  int v2588;
+  int v2589;
+  int v2590;
+  int v2591;
+  int v2592;
+  int v2593;
+  int v2594;
+  int v2595;
+  int v2596;
+  int v2597;
+  int v2598;
+  int v2599;
+  int v2600;
+  int v2601;
+  int v2602;
+  int v2603;
+  int v2604;
+  int v2605;
+  int v2606;
+  int v2607;
+  int v2608;
+  int v2609;
+  int v2610;
+  int v2611;
+  int v2612;
+  int v2613;
+  int v2614;
+  int v2615;
+  int v2616;
+  int v2617;
+  int v2618;
+  int v2619;
+  int v2620;
+  int v2621;
+  int v2622;
+  int v2623;
+  int v2624;
+  int v2625;
+  int v2626;
+  int v2627;
+  int v2628;
+  int v2629;
+  int v2630;
+  int v2631;
+  int v2632;
+  int v2633;
+  int v2634;
+  int v2635;
+  int v2636;
+  int v2637;
+  int v2638;
+  int v2639;
+  int v2640;
+  int v2641;
+  int v2642;
+  int v2643;
+  int v2644;
+  int v2645;
+  int v2646;
+  int v2647;
+  int v2648;
+  int v2649;
+  int v2650;
+  int v2651;
+  int v2652;
+  int v2653;
+  int v2654;
+  int v2655;
+  int v2656;
+  int v2657;
+  int v2658;
+  int v2659;
+  int v2660;
+  int v2661;
+  int v2662;
+  int v2663;
+  int v2664;
+  int v2665;
+  int v2666;
+  int v2667;
+  int v2668;
+  int v2669;
+  int v2670;
+  int v2671;
+  int v2672;
+  int v2673;
+  int v2674;
+  int v2675;
+  int v2676;
+  int v2677;
+  int v2678;
+  int v2679;
+  int v2680;
+  int v2681;
+  int v2682;
+  int v2683;
+  int v2684;
+  int v2685;
+  int v2686;
+  int v2687;
+  int v2688;
+  int v2689;
+  int v2690;
+  int v2691;
+  int v2692;
+  int v2693;
+  int v2694;
+  int v2695;
+  int v2696;
+  int v2697;
+  int v2698;
+  int v2699;
+  int v2700;
+  int v2701;
+  int v2702;
+  int v2703;
+  int v2704;
+  int v2705;
+  int v2706;
+  int v2707;
+  int v2708;
+  int v2709;
+  int v2710;
+  int v2711;
+  int v2712;
+  int v2713;
+  int v2714;
+  int v2715;
+  int v2716;
+  int v2717;
+  int v2718;
+  int v2719;
+  int v2720;
+  int v2721;
+  int v2722;
+  int v2723;
+  int v2724;
+  int v2725;
+  int v2726;
+  int v2727;
+  int v2728;
+  int v2729;
+  int v2730;
+  int v2731;
+  int v2732;
+  int v2733;
+  int v2734;
+  int v2735;
+  int v2736;
+  int v2737;
+  int v2738;
+  int v2739;
+  int v2740;
+  int v2741;
+  int v2742;
+  int v2743;
+  int v2744;
+  int v2745;
+  int v2746;
+  int v2747;
+  int v2748;
+  int v2749;
+  int v2750;
+  int v2751;
+  int v2752;
+  int v2753;
+  int v2754;
+  int v2755;
+  int v2756;
+  int v2757;
+  int v2758;
+  int v2759;
+  int v2760;
+  int v2761;
+  int v2762;
+  int v2763;
+  int v2764;
+  int v2765;
+  int v2766;
+  int v2767;
+  int v2768;
+  int v2769;
+  int v2770;
+  int v2771;
+  int v2772;
+  int v2773;
+  int v2774;
+  int v2775;
+  int v2776;
+  int v2777;
+  int v2778;
+  int v2779;
+  int v2780;
+  int v2781;
+  int v2782;
+  int v2783;
+  int v2784;
+  int v2785;
+  int v2786;
+  int v2787;
+  int v2788;
+  int v2789;
+  int v2790;
+  int v2791;
+  int v2792;
+  int v2793;
+  int v2794;
+  int v2795;
+  int v2796;
+  int v2797;
+  int v2798;
+  int v2799;
+  int v2800;
+  int v2801;
+  int v2802;
+  int v2803;
+  int v2804;
+  int v2805;
+  int v2806;
+  int v2807;
+  int v2808;
+  int v2809;
+  int v2810;
+  int v2811;
+  int v2812;
+  int v2813;
+  int v2814;
+  int v2815;
+  int v2816;
+  int v2817;
+  int v2818;
+  int v2819;
+  int v2820;
+  int v2821;
+  int v2822;
+  int v2823;
+  int v2824;
+  int v2825;
+  int v2826;
+  int v2827;
+  int v2828;
+  int v2829;
+  int v2830;
+  int v2831;
+  int v2832;
+  int v2833;
+  int v2834;
+  int v2835;
+  int v2836;
+  int v2837;
+  int v2838;
+  int v2839;
+  int v2840;
+  int v2841;
+  int v2842;
+  int v2843;
+  int v2844;
+  int v2845;
+  int v2846;
+  int v2847;
+  int v2848;
+  int v2849;
+  int v2850;
+  int v2851;
+  int v2852;
+  int v2853;
+  int v2854;
+  int v2855;
+  int v2856;
+  int v2857;
+  int v2858;
+  int v2859;
+  int v2860;
+  int v2861;
+  int v2862;
+  int v2863;
+  int v2864;
+  int v2865;
+  int v2866;
+  int v2867;
+  int v2868;
+  int v2869;
+  int v2870;
+  int v2871;
+  int v2872;
+  int v2873;
+  int v2874;
+  int v2875;
+  int v2876;
+  int v2877;
+  int v2878;
+  int v2879;
+  int v2880;
+  int v2881;
+  int v2882;
+  int v2883;
+  int v2884;
+  int v2885;
+  int v2886;
+  int v2887;
+  int v2888;
+  int v2889;
+  int v2890;
+  int v2891;
+  int v2892;
+  int v2893;
+  int v2894;
+  int v2895;
+  int v2896;
+  int v2897;
+  int v2898;
+  int v2899;
+  int v2900;
+  int v2901;
+  int v2902;
+  int v2903;
+  int v2904;
+  int v2905;
+  int v2906;
+  int v2907;
+  int v2908;
+  int v2909;
+  int v2910;
+  int v2911;
+  int v2912;
+  int v2913;
+  int v2914;
+  int v2915;
+  int v2916;
+  int v2917;
+  int v2918;
+  int v2919;
+  int v2920;
+  int v2921;
+  int v2922;
+  int v2923;
+  int v2924;
+  int v2925;
+  int v2926;
+  int v2927;
+  int v2928;
+  int v2929;
+  int v2930;
+  int v2931;
+  int v2932;
+  int v2933;
+  int v2934;
+  int v2935;
+  int v2936;
+  int v2937;
+  int v2938;
+  int v2939;
+  int v2940;
+  int v2941;
+  int v2942;
+  int v2943;
+  int v2944;
+  int v2945;
+  int v2946;
+  int v2947;
+  int v2948;
+  int v2949;
+  int v2950;
+  int v2951;
+  int v2952;
+  int v2953;
+  int v2954;
+  int v2955;
+  int v2956;
+  int v2957;
+  int v2958;
+  int v2959;
+  int v2960;
+  int v2961;
+  int v2962;
+  int v2963;
+  int v2964;
+  int v2965;
+  int v2966;
+  int v2967;
+  int v2968;
+  int v2969;
+  int v2970;
+  int v2971;
+  int v2972;
+  int v2973;
+  int v2974;
+  int v2975;
+  int v2976;
+  int v2977;
+  int v2978;
+  int v2979;
+  int v2980;
+  int v2981;
+  int v2982;
+  int v2983;
+  int v2984;
+  int v2985;
+  int v2986;
+  int v2987;
+  int v2988;
+  int v2989;
+  int v2990;
+  int v2991;
+  int v2992;
+  int v2993;
+  int v2994;
+  int v2995;
+  int v2996;
+  int v2997;
+  int v2998;
+  int v2999;
+  int v3000;
+  int v3001;
+  int v3002;
+  int v3003;
+  int v3004;
+  int v3005;
+  int v3006;
+  int v3007;
+  int v3008;
+  int v3009;
+  int v3010;
+  int v3011;
+  int v3012;
+  int v3013;
+  int v3014;
+  int v3015;
+  int v3016;
+  int v3017;
+  int v3018;
+  int v3019;
+  int v3020;
+  int v3021;
+  int v3022;
+  int v3023;
+  int v3024;
+  int v3025;
+  int v3026;
+  int v3027;
+  int v3028;
+  int v3029;
+  int v3030;
+  int v3031;
+  int v3032;
+  int v3033;
+  int v3034;
+  int v3035;
+  int v3036;
+  int v3037;
+  int v3038;
+  int v3039;
+  int v3040;
+  int v3041;
+  int v3042;
+  int v3043;
+  int v3044;
+  int v3045;
+  int v3046;
+  int v3047;
+  int v3048;
+  int v3049;
+  int v3050;
+  int v3051;
+  int v3052;
+  int v3053;
+  int v3054;
+  int v3055;
+  int v3056;
+  int v3057;
+  int v3058;
+  int v3059;
+  int v3060;
+  int v3061;
+  int v3062;
+  int v3063;
+  int v3064;
+  int v3065;
+  int v3066;
+  int v3067;
+  int v3068;
+  int v3069;
+  int v3070;
+  int v3071;
+  int v3072;
+  int v3073;
+  int v3074;
+  int v3075;
+  int v3076;
+  int v3077;
+  int v3078;
+  int v3079;
+  int v3080;
+  int v3081;
+  int v3082;
+  int v3083;
+  int v3084;
+  int v3085;
+  int v3086;
+  int v3087;
+  int v3088;
+  int v3089;
+  int v3090;
+  int v3091;
+  int v3092;
+  int v3093;
+  int v3094;
+  int v3095;
+  int v3096;
+  int v3097;
+  int v3098;
+  int v3099;
+  int v3100;
+  int v3101;
+  int v3102;
+  int v3103;
+  int v3104;
+  int v3105;
+  int v3106;
+  int v3107;
+  int v3108;
+  int v3109;
+  int v3110;
+  int v3111;
+  int v3112;
+  int v3113;
+  int v3114;
+  int v3115;
+  int v3116;
+  int v3117;
+  int v3118;
+  int v3119;
+  int v3120;
+  int v3121;
+  int v3122;
+  int v3123;
+  int v3124;
+  int v3125;
+  int v3126;
+  int v3127;
+  int v3128;
+  int v3129;
+  int v3130;
+  int v3131;
+  int v3132;
+  int v3133;
+  int v3134;
+  int v3135;
+  int v3136;
+  int v3137;
+  int v3138;
+  int v3139;
+  int v3140;
+  int v3141;
+  int v3142;
+  int v3143;
+  int v3144;
+  int v3145;
+  int v3146;
+  int v3147;
+  int v3148;
+  int v3149;
+  int v3150;
+  int v3151;
+  int v3152;
+  int v3153;
+  int v3154;
+  int v3155;
+  int v3156;
+  int v3157;
+  int v3158;
+  int v3159;
+  int v3160;
+  int v3161;
+  int v3162;
+  int v3163;
+  int v3164;
+  int v3165;
+  int v3166;
+  int v3167;
+  int v3168;
+  int v3169;
+  int v3170;
+  int v3171;
+  int v3172;
+  int v3173;
+  int v3174;
+  int v3175;
+  int v3176;
+  int v3177;
+  int v3178;
+  int v3179;
+  int v3180;
+  int v3181;
+  int v3182;
+  int v3183;
+  int v3184;
+  int v3185;
+  int v3186;
+  int v3187;
+  int v3188;
+  int v3189;
+  int v3190;
+  int v3191;
+  int v3192;
+  int v3193;
+  int v3194;
+  int v3195;
+  int v3196;
+  int v3197;
+  int v3198;
+  int v3199;
+  int v3200;
+  int v3201;
+  int v3202;
+  int v3203;
+  int v3204;
+  int v3205;
+  int v3206;
+  int v3207;
+  int v3208;
+  int v3209;
+  int v3210;
+  int v3211;
+  int v3212;
+  int v3213;
+  int v3214;
+  int v3215;
+  int v3216;
+  int v3217;
+  int v3218;
+  int v3219;
+  int v3220;
+  int v3221;
+  int v3222;
+  int v3223;
+  int v3224;
+  int v3225;
+  int v3226;
+  int v3227;
+  int v3228;
+  int v3229;
+  int v3230;
+  int v3231;
+  int v3232;
+  int v3233;
+  int v3234;
+  int v3235;
+  int v3236;
+  int v3237;
+  int v3238;
+  int v3239;
+  int v3240;
+  int v3241;
+  int v3242;
+  int v3243;
+  int v3244;
+  int v3245;
+  int v3246;
+  int v3247;
+  int v3248;
+  int v3249;
+  int v3250;
+  int v3251;
+  int v3252;
+  int v3253;
+  int v3254;
+  int v3255;
+  int v3256;
+  int v3257;
+  int v3258;
+  int v3259;
+  int v3260;
+  int v3261;
+  int v3262;
+  int v3263;
+  int v3264;
+  int v3265;
+  int v3266;
+  int v3267;
+  int v3268;
+  int v3269;
+  int v3270;
+  int v3271;
+  int v3272;
+  int v3273;
+  int v3274;
+  int v3275;
+  int v3276;
+  int v3277;
+  int v3278;
+  int v3279;
+  int v3280;
+  int v3281;
+  int v3282;
+  int v3283;
+  int v3284;
+  int v3285;
+  int v3286;
+  int v3287;
+  int v3288;
+  int v3289;
+  int v3290;
+  int v3291;
+  int v3292;
+  int v3293;
+  int v3294;
+  int v3295;
+  int v3296;
+  int v3297;
+  int v3298;
+  int v3299;
+  int v3300;
+  int v3301;
+  int v3302;
+  int v3303;
+  int v3304;
+  int v3305;
+  int v3306;
+  int v3307;
+  int v3308;
+  int v3309;
+  int v3310;
+  int v3311;
+  int v3312;
+  int v3313;
+  int v3314;
+  int v3315;
+  int v3316;
+  int v3317;
+  int v3318;
+  int v3319;
+  int v3320;
+  int v3321;
+  int v3322;
+  int v3323;
+  int v3324;
+  int v3325;
+  int v3326;
+  int v3327;
+  int v3328;
+  int v3329;
+  int v3330;
+  int v3331;
+  int v3332;
+  int v3333;
+  int v3334;
+  int v3335;
+  int v3336;
+  int v3337;
+  int v3338;
+  int v3339;
+  int v3340;
+  int v3341;
+  int v3342;
+  int v3343;
+  int v3344;
+  int v3345;
+  int v3346;
+  int v3347;
+  int v3348;
+  int v3349;
+  int v3350;
+  int v3351;
+  int v3352;
+  int v3353;
+  int v3354;
+  int v3355;
+  int v3356;
+  int v3357;
+  int v3358;
+  int v3359;
+  int v3360;
+  int v3361;
+  int v3362;
+  int v3363;
+  int v3364;
+  int v3365;
+  int v3366;
+  int v3367;
+  int v3368;
+  int v3369;
+  int v3370;
+  int v3371;
+  int v3372;
+  int v3373;
+  int v3374;
+  int v3375;
+  int v3376;
+  int v3377;
+  int v3378;
+  int v3379;
+  int v3380;
+  int v3381;
+  int v3382;
+  int v3383;
+  int v3384;
+  int v3385;
+  int v3386;
+  int v3387;
+  int v3388;
+  int v3389;
+  int v3390;
+  int v3391;
+  int v3392;
+  int v3393;
+  int v3394;
+  int v3395;
+  int v3396;
+  int v3397;
+  int v3398;
+  int v3399;
+  int v3400;
+  int v3401;
+  int v3402;
+  int v3403;
+  int v3404;
+  int v3405;
+  int v3406;
+  int v3407;
+  int v3408;
+  int v3409;
+  int v3410;
+  int v3411;
+  int v3412;
+  int v3413;
+  int v3414;
+  int v3415;
+  int v3416;
+  int v3417;
+  int v3418;
+  int v3419;
+  int v3420;
+  int v3421;
+  int v3422;
+  int v3423;
+  int v3424;
+  int v3425;
+  int v3426;
+  int v3427;
+  int v3428;
+  int v3429;
+  int v3430;
+  int v3431;
+  int v3432;
+  int v3433;
+  int v3434;
+  int v3435;
+  int v3436;
+  int v3437;
+  int v3438;
+  int v3439;
+  int v3440;
+  int v3441;
+  int v3442;
+  int v3443;
+  int v3444;
+  int v3445;
+  int v3446;
+  int v3447;
+  int v3448;
+  int v3449;
+  int v3450;
+  int v3451;
+  int v3452;
+  int v3453;
+  int v3454;
+  int v3455;
+  int v3456;
+  int v3457;
+  int v3458;
+  int v3459;
+  int v3460;
+  int v3461;
+  int v3462;
+  int v3463;
+  int v3464;
+  int v3465;
+  int v3466;
+  int v3467;
+  int v3468;
+  int v3469;
+  int v3470;
+  int v3471;
+  int v3472;
+  int v3473;
+  int v3474;
+  int v3475;
+  int v3476;
+  int v3477;
+  int v3478;
+  int v3479;
+  int v3480;
+  int v3481;
+  int v3482;
+  int v3483;
+  int v3484;
+  int v3485;
+  int v3486;
+  int v3487;
+  int v3488;
+  int v3489;
+  int v3490;
+  int v3491;
+  int v3492;
+  int v3493;
+  int v3494;
+  int v3495;
+  int v3496;
+  int v3497;
+  int v3498;
+  int v3499;
+  int v3500;
+  int v3501;
+  int v3502;
+  int v3503;
+  int v3504;
+  int v3505;
+  int v3506;
+  int v3507;
+  int v3508;
+  int v3509;
+  int v3510;
+  int v3511;
+  int v3512;
+  int v3513;
+  int v3514;
+  int v3515;
+  int v3516;
+  int v3517;
+  int v3518;
+  int v3519;
+  int v3520;
+  int v3521;
+  int v3522;
+  int v3523;
+  int v3524;
+  int v3525;
+  int v3526;
+  int v3527;
+  int v3528;
+  int v3529;
+  int v3530;
+  int v3531;
+  int v3532;
+  int v3533;
+  int v3534;
+  int v3535;
+  int v3536;
+  int v3537;
+  int v3538;
+  int v3539;
+  int v3540;
+  int v3541;
+  int v3542;
+  int v3543;
+  int v3544;
+  int v3545;
+  int v3546;
+  int v3547;
+  int v3548;
+  int v3549;
+  int v3550;
+  int v3551;
+  int v3552;
+  int v3553;
+  int v3554;
+  int v3555;
+  int v3556;
+  int v3557;
+  int v3558;
+  int v3559;
+  int v3560;
+  int v3561;
+  int v3562;
+  int v3563;
+  int v3564;
+  int v3565;
+  int v3566;
+  int v3567;
+  int v3568;
+  int v3569;
+  int v3570;
+  int v3571;
+  int v3572;
+  int v3573;
+  int v3574;
+  int v3575;
+  int v3576;
+  int v3577;
+  int v3578;
+  int v3579;
+  int v3580;
+  int v3581;
+  int v3582;
+  int v3583;
+  int v3584;
+  int v3585;
+  int v3586;
+  int v3587;
+  int v3588;
+  int v3589;
+  int v3590;
+  int v3591;
+  int v3592;
+  int v3593;
+  int v3594;
+  int v3595;
+  int v3596;
+  int v3597;
+  int v3598;
+  int v3599;
+  int v3600;
+  int v3601;
+  int v3602;
+  int v3603;
+  int v3604;
+  int v3605;
+  int v3606;
+  int v3607;
+  int v3608;
+  int v3609;
+  int v3610;
+  int v3611;
+  int v3612;
+  int v3613;
+  int v3614;
+  int v3615;
+  int v3616;
+  int v3617;
+  int v3618;
+  int v3619;
+  int v3620;
+  int v3621;
+  int v3622;
+  int v3623;
+  int v3624;
+  int v3625;
+  int v3626;
+  int v3627;
+  int v3628;
+  int v3629;
+  int v3630;
+  int v3631;
+  int v3632;
+  int v3633;
+  int v3634;
+  int v3635;
+  int v3636;
+  int v3637;
+  int v3638;
+  int v3639;
+  int v3640;
+  int v3641;
+  int v3642;
+  int v3643;
+  int v3644;
+  int v3645;
+  int v3646;
+  int v3647;
+  int v3648;
+  int v3649;
+  int v3650;
+  int v3651;
+  int v3652;
+  int v3653;
+  int v3654;
+  int v3655;
+  int v3656;
+  int v3657;
+  int v3658;
+  int v3659;
+  int v3660;
+  int v3661;
+  int v3662;
+  int v3663;
+  int v3664;
+  int v3665;
+  int v3666;
+  int v3667;
+  int v3668;
+  int v3669;
+  int v3670;
+  int v3671;
+  int v3672;
+  int v3673;
+  int v3674;
+  int v3675;
+  int v3676;
+  int v3677;
+  int v3678;
+  int v3679;
+  int v3680;
+  int v3681;
+  int v3682;
+  int v3683;
+  int v3684;
+  int v3685;
+  int v3686;
+  int v3687;
+  int v3688;
+  int v3689;
+  int v3690;
+  int v3691;
+  int v3692;
+  int v3693;
+  int v3694;
+  int v3695;
+  int v3696;
+  int v3697;
+  int v3698;
+  int v3699;
+  int v3700;
+  int v3701;
+  int v3702;
+  int v3703;
+  int v3704;
+  int v3705;
+  int v3706;
+  int v3707;
+  int v3708;
+  int v3709;
+  int v3710;
+  int v3711;
+  int v3712;
+  int v3713;
+  int v3714;
+  int v3715;
+  int v3716;
+  int v3717;
+  int v3718;
+  int v3719;
+  int v3720;
+  int v3721;
+  int v3722;
+  int v3723;
+  int v3724;
+  int v3725;
+  int v3726;
+  int v3727;
+  int v3728;
+  int v3729;
+  int v3730;
+  int v3731;
+  int v3732;
+  int v3733;
+  int v3734;
+  int v3735;
+  int v3736;
+  int v3737;
+  int v3738;
+  int v3739;
+  int v3740;
+  int v3741;
+  int v3742;
+  int v3743;
+  int v3744;
+  int v3745;
+  int v3746;
+  int v3747;
+  int v3748;
+  int v3749;
+  int v3750;
+  int v3751;
+  int v3752;
+  int v3753;
+  int v3754;
+  int v3755;
+  int v3756;
+  int v3757;
+  int v3758;
+  int v3759;
+  int v3760;
+  int v3761;
+  int v3762;
+  int v3763;
+  int v3764;
+  int v3765;
+  int v3766;
+  int v3767;
+  int v3768;
+  int v3769;
+  int v3770;
+  int v3771;
+  int v3772;
+  int v3773;
+  int v3774;
+  int v3775;
+  int v3776;
+  int v3777;
+  int v3778;
+  int v3779;
+  int v3780;
+  int v3781;
+  int v3782;
+  int v3783;
+  int v3784;
+  int v3785;
+  int v3786;
+  int v3787;
+  int v3788;
+  int v3789;
+  int v3790;
+  int v3791;
+  int v3792;
+  int v3793;
+  int v3794;
+  int v3795;
+  int v3796;
+  int v3797;
+  int v3798;
+  int v3799;
+  int v3800;
+  int v3801;
+  int v3802;
+  int v3803;
+  int v3804;
+  int v3805;
+  int v3806;
+  int v3807;
+  int v3808;
+  int v3809;
+  int v3810;
+  int v3811;
+  int v3812;
+  int v3813;
+  int v3814;
+  int v3815;
+  int v3816;
+  int v3817;
+  int v3818;
+  int v3819;
+  int v3820;
+  int v3821;
+  int v3822;
+  int v3823;
+  int v3824;
+  int v3825;
+  int v3826;
+  int v3827;
+  int v3828;
+  int v3829;
+  int v3830;
+  int v3831;
+  int v3832;
+  int v3833;
+  int v3834;
+  int v3835;
+  int v3836;
+  int v3837;
+  int v3838;
+  int v3839;
+  int v3840;
+  int v3841;
+  int v3842;
+  int v3843;
+  int v3844;
+  int v3845;
+  int v3846;
+  int v3847;
+  int v3848;
+  int v3849;
+  int v3850;
+  int v3851;
+  int v3852;
+  int v3853;
+  int v3854;
+  int v3855;
+  int v3856;
+  int v3857;
+  int v3858;
+  int v3859;
+  int v3860;
+  int v3861;
+  int v3862;
+  int v3863;
+  int v3864;
+  int v3865;
+  int v3866;
+  int v3867;
+  int v3868;
+  int v3869;
+  int v3870;
+  int v3871;
+  int v3872;
+  int v3873;
+  int v3874;
+  int v3875;
+  int v3876;
+  int v3877;
+  int v3878;
+  int v3879;
+  int v3880;
+  int v3881;
+  int v3882;
+  int v3883;
+  int v3884;
+  int v3885;
+  int v3886;
+  int v3887;
+  int v3888;
+  int v3889;
+  int v3890;
+  int v3891;
+  int v3892;
+  int v3893;
+  int v3894;
+  int v3895;
+  int v3896;
+  int v3897;
+  int v3898;
+  int v3899;
+  int v3900;
+  int v3901;
+  int v3902;
+  int v3903;
+  int v3904;
+  int v3905;
+  int v3906;
+  int v3907;
+  int v3908;
+  int v3909;
+  int v3910;
+  int v3911;
+  int v3912;
+  int v3913;
+  int v3914;
+  int v3915;
+  int v3916;
+  int v3917;
+  int v3918;
+  int v3919;
+  int v3920;
+  int v3921;
+  int v3922;
+  int v3923;
+  int v3924;
+  int v3925;
+  int v3926;
+  int v3927;
+  int v3928;
+  int v3929;
+  int v3930;
+  int v3931;
+  int v3932;
+  int v3933;
+  int v3934;
+  int v3935;
+  int v3936;
+  int v3937;
+  int v3938;
+  int v3939;
+  int v3940;
+  int v3941;
+  int v3942;
+  int v3943;
+  int v3944;
+  int v3945;
+  int v3946;
+  int v3947;
+  int v3948;
+  int v3949;
+  int v3950;
+  int v3951;
+  int v3952;
+  int v3953;
+  int v3954;
+  int v3955;
+  int v3956;
+  int v3957;
+  int v3958;
+  int v3959;
+  int v3960;
+  int v3961;
+  int v3962;
+  int v3963;
+  int v3964;
+  int v3965;
+  int v3966;
+  int v3967;
+  int v3968;
+  int v3969;
+  int v3970;
+  int v3971;
+  int v3972;
+  int v3973;
+  int v3974;
+  int v3975;
+  int v3976;
+  int v3977;
+  int v3978;
+  int v3979;
+  int v3980;
+  int v3981;
+  int v3982;
+  int v3983;
+  int v3984;
+  int v3985;
+  int v3986;
+  int v3987;
+  int v3988;
+  int v3989;
+  int v3990;
+  int v3991;
+  int v3992;
+  int v3993;
+  int v3994;
+  int v3995;
+  int v3996;
+  int v3997;
+  int v3998;
+  int v3999;
+  // 4000 copies in one block: -O2 must stay linear in block length here
+  // (vrp's var_ranges was quadratic: ~6s for this file, ~30s at 8000)
+  a = 0;
+  while (a * a < 50) {
+    a = a + 1;
+  }
+  v0 = a;
+  v1 = v0;
+  v2 = v1;
+  v3 = v2;
+  v4 = v3;
+  v5 = v4;
+  v6 = v5;
+  v7 = v6;
+  v8 = v7;
+  v9 = v8;
+  v10 = v9;
+  v11 = v10;
+  v12 = v11;
+  v13 = v12;
+  v14 = v13;
+  v15 = v14;
+  v16 = v15;
+  v17 = v16;
+  v18 = v17;
+  v19 = v18;
+  v20 = v19;
+  v21 = v20;
+  v22 = v21;
+  v23 = v22;
+  v24 = v23;
+  v25 = v24;
+  v26 = v25;
+  v27 = v26;
+  v28 = v27;
+  v29 = v28;
+  v30 = v29;
+  v31 = v30;
+  v32 = v31;
+  v33 = v32;
+  v34 = v33;
+  v35 = v34;
+  v36 = v35;
+  v37 = v36;
+  v38 = v37;
+  v39 = v38;
+  v40 = v39;
+  v41 = v40;
+  v42 = v41;
+  v43 = v42;
+  v44 = v43;
+  v45 = v44;
+  v46 = v45;
+  v47 = v46;
+  v48 = v47;
+  v49 = v48;
+  v50 = v49;
+  v51 = v50;
+  v52 = v51;
+  v53 = v52;
+  v54 = v53;
+  v55 = v54;
+  v56 = v55;
+  v57 = v56;
+  v58 = v57;
+  v59 = v58;
+  v60 = v59;
+  v61 = v60;
+  v62 = v61;
+  v63 = v62;
+  v64 = v63;
+  v65 = v64;
+  v66 = v65;
+  v67 = v66;
+  v68 = v67;
+  v69 = v68;
+  v70 = v69;
+  v71 = v70;
+  v72 = v71;
+  v73 = v72;
+  v74 = v73;
+  v75 = v74;
+  v76 = v75;
+  v77 = v76;
+  v78 = v77;
+  v79 = v78;
+  v80 = v79;
+  v81 = v80;
+  v82 = v81;
+  v83 = v82;
+  v84 = v83;
+  v85 = v84;
+  v86 = v85;
+  v87 = v86;
+  v88 = v87;
+  v89 = v88;
+  v90 = v89;
+  v91 = v90;
+  v92 = v91;
+  v93 = v92;
+  v94 = v93;
+  v95 = v94;
+  v96 = v95;
+  v97 = v96;
+  v98 = v97;
+  v99 = v98;
+  v100 = v99;
+  v101 = v100;
+  v102 = v101;
+  v103 = v102;
+  v104 = v103;
+  v105 = v104;
+  v106 = v105;
+  v107 = v106;
+  v108 = v107;
+  v109 = v108;
+  v110 = v109;
+  v111 = v110;
+  v112 = v111;
+  v113 = v112;
+  v114 = v113;
+  v115 = v114;
+  v116 = v115;
+  v117 = v116;
+  v118 = v117;
+  v119 = v118;
+  v120 = v119;
+  v121 = v120;
+  v122 = v121;
+  v123 = v122;
+  v124 = v123;
+  v125 = v124;
+  v126 = v125;
+  v127 = v126;
+  v128 = v127;
+  v129 = v128;
+  v130 = v129;
+  v131 = v130;
+  v132 = v131;
+  v133 = v132;
+  v134 = v133;
+  v135 = v134;
+  v136 = v135;
+  v137 = v136;
+  v138 = v137;
+  v139 = v138;
+  v140 = v139;
+  v141 = v140;
+  v142 = v141;
+  v143 = v142;
+  v144 = v143;
+  v145 = v144;
+  v146 = v145;
+  v147 = v146;
+  v148 = v147;
+  v149 = v148;
+  v150 = v149;
+  v151 = v150;
+  v152 = v151;
+  v153 = v152;
+  v154 = v153;
+  v155 = v154;
+  v156 = v155;
+  v157 = v156;
+  v158 = v157;
+  v159 = v158;
+  v160 = v159;
+  v161 = v160;
+  v162 = v161;
+  v163 = v162;
+  v164 = v163;
+  v165 = v164;
+  v166 = v165;
+  v167 = v166;
+  v168 = v167;
+  v169 = v168;
+  v170 = v169;
+  v171 = v170;
+  v172 = v171;
+  v173 = v172;
+  v174 = v173;
+  v175 = v174;
+  v176 = v175;
+  v177 = v176;
+  v178 = v177;
+  v179 = v178;
+  v180 = v179;
+  v181 = v180;
+  v182 = v181;
+  v183 = v182;
+  v184 = v183;
+  v185 = v184;
+  v186 = v185;
+  v187 = v186;
+  v188 = v187;
+  v189 = v188;
+  v190 = v189;
+  v191 = v190;
+  v192 = v191;
+  v193 = v192;
+  v194 = v193;
+  v195 = v194;
+  v196 = v195;
+  v197 = v196;
+  v198 = v197;
+  v199 = v198;
+  v200 = v199;
+  v201 = v200;
+  v202 = v201;
+  v203 = v202;
+  v204 = v203;
+  v205 = v204;
+  v206 = v205;
+  v207 = v206;
+  v208 = v207;
+  v209 = v208;
+  v210 = v209;
+  v211 = v210;
+  v212 = v211;
+  v213 = v212;
+  v214 = v213;
+  v215 = v214;
+  v216 = v215;
+  v217 = v216;
+  v218 = v217;
+  v219 = v218;
+  v220 = v219;
+  v221 = v220;
+  v222 = v221;
+  v223 = v222;
+  v224 = v223;
+  v225 = v224;
+  v226 = v225;
+  v227 = v226;
+  v228 = v227;
+  v229 = v228;
+  v230 = v229;
+  v231 = v230;
+  v232 = v231;
+  v233 = v232;
+  v234 = v233;
+  v235 = v234;
+  v236 = v235;
+  v237 = v236;
+  v238 = v237;
+  v239 = v238;
+  v240 = v239;
+  v241 = v240;
+  v242 = v241;
+  v243 = v242;
+  v244 = v243;
+  v245 = v244;
+  v246 = v245;
+  v247 = v246;
+  v248 = v247;
+  v249 = v248;
+  v250 = v249;
+  v251 = v250;
+  v252 = v251;
+  v253 = v252;
+  v254 = v253;
+  v255 = v254;
+  v256 = v255;
+  v257 = v256;
+  v258 = v257;
+  v259 = v258;
+  v260 = v259;
+  v261 = v260;
+  v262 = v261;
+  v263 = v262;
+  v264 = v263;
+  v265 = v264;
+  v266 = v265;
+  v267 = v266;
+  v268 = v267;
+  v269 = v268;
+  v270 = v269;
+  v271 = v270;
+  v272 = v271;
+  v273 = v272;
+  v274 = v273;
+  v275 = v274;
+  v276 = v275;
+  v277 = v276;
+  v278 = v277;
+  v279 = v278;
+  v280 = v279;
+  v281 = v280;
+  v282 = v281;
+  v283 = v282;
+  v284 = v283;
+  v285 = v284;
+  v286 = v285;
+  v287 = v286;
+  v288 = v287;
+  v289 = v288;
+  v290 = v289;
+  v291 = v290;
+  v292 = v291;
+  v293 = v292;
+  v294 = v293;
+  v295 = v294;
+  v296 = v295;
+  v297 = v296;
+  v298 = v297;
+  v299 = v298;
+  v300 = v299;
+  v301 = v300;
+  v302 = v301;
+  v303 = v302;
+  v304 = v303;
+  v305 = v304;
+  v306 = v305;
+  v307 = v306;
+  v308 = v307;
+  v309 = v308;
+  v310 = v309;
+  v311 = v310;
+  v312 = v311;
+  v313 = v312;
+  v314 = v313;
+  v315 = v314;
+  v316 = v315;
+  v317 = v316;
+  v318 = v317;
+  v319 = v318;
+  v320 = v319;
+  v321 = v320;
+  v322 = v321;
+  v323 = v322;
+  v324 = v323;
+  v325 = v324;
+  v326 = v325;
+  v327 = v326;
+  v328 = v327;
+  v329 = v328;
+  v330 = v329;
+  v331 = v330;
+  v332 = v331;
+  v333 = v332;
+  v334 = v333;
+  v335 = v334;
+  v336 = v335;
+  v337 = v336;
+  v338 = v337;
+  v339 = v338;
+  v340 = v339;
+  v341 = v340;
+  v342 = v341;
+  v343 = v342;
+  v344 = v343;
+  v345 = v344;
+  v346 = v345;
+  v347 = v346;
+  v348 = v347;
+  v349 = v348;
+  v350 = v349;
+  v351 = v350;
+  v352 = v351;
+  v353 = v352;
+  v354 = v353;
+  v355 = v354;
+  v356 = v355;
+  v357 = v356;
+  v358 = v357;
+  v359 = v358;
+  v360 = v359;
+  v361 = v360;
+  v362 = v361;
+  v363 = v362;
+  v364 = v363;
+  v365 = v364;
+  v366 = v365;
+  v367 = v366;
+  v368 = v367;
+  v369 = v368;
+  v370 = v369;
+  v371 = v370;
+  v372 = v371;
+  v373 = v372;
+  v374 = v373;
+  v375 = v374;
+  v376 = v375;
+  v377 = v376;
+  v378 = v377;
+  v379 = v378;
+  v380 = v379;
+  v381 = v380;
+  v382 = v381;
+  v383 = v382;
+  v384 = v383;
+  v385 = v384;
+  v386 = v385;
+  v387 = v386;
+  v388 = v387;
+  v389 = v388;
+  v390 = v389;
+  v391 = v390;
+  v392 = v391;
+  v393 = v392;
+  v394 = v393;
+  v395 = v394;
+  v396 = v395;
+  v397 = v396;
+  v398 = v397;
+  v399 = v398;
+  v400 = v399;
+  v401 = v400;
+  v402 = v401;
+  v403 = v402;
+  v404 = v403;
+  v405 = v404;
+  v406 = v405;
+  v407 = v406;
+  v408 = v407;
+  v409 = v408;
+  v410 = v409;
+  v411 = v410;
+  v412 = v411;
+  v413 = v412;
+  v414 = v413;
+  v415 = v414;
+  v416 = v415;
+  v417 = v416;
+  v418 = v417;
+  v419 = v418;
+  v420 = v419;
+  v421 = v420;
+  v422 = v421;
+  v423 = v422;
+  v424 = v423;
+  v425 = v424;
+  v426 = v425;
+  v427 = v426;
+  v428 = v427;
+  v429 = v428;
+  v430 = v429;
+  v431 = v430;
+  v432 = v431;
+  v433 = v432;
+  v434 = v433;
+  v435 = v434;
+  v436 = v435;
+  v437 = v436;
+  v438 = v437;
+  v439 = v438;
+  v440 = v439;
+  v441 = v440;
+  v442 = v441;
+  v443 = v442;
+  v444 = v443;
+  v445 = v444;
+  v446 = v445;
+  v447 = v446;
+  v448 = v447;
+  v449 = v448;
+  v450 = v449;
+  v451 = v450;
+  v452 = v451;
+  v453 = v452;
+  v454 = v453;
+  v455 = v454;
+  v456 = v455;
+  v457 = v456;
+  v458 = v457;
+  v459 = v458;
+  v460 = v459;
+  v461 = v460;
+  v462 = v461;
+  v463 = v462;
+  v464 = v463;
+  v465 = v464;
+  v466 = v465;
+  v467 = v466;
+  v468 = v467;
+  v469 = v468;
+  v470 = v469;
+  v471 = v470;
+  v472 = v471;
+  v473 = v472;
+  v474 = v473;
+  v475 = v474;
+  v476 = v475;
+  v477 = v476;
+  v478 = v477;
+  v479 = v478;
+  v480 = v479;
+  v481 = v480;
+  v482 = v481;
+  v483 = v482;
+  v484 = v483;
+  v485 = v484;
+  v486 = v485;
+  v487 = v486;
+  v488 = v487;
+  v489 = v488;
+  v490 = v489;
+  v491 = v490;
+  v492 = v491;
+  v493 = v492;
+  v494 = v493;
+  v495 = v494;
+  v496 = v495;
+  v497 = v496;
+  v498 = v497;
+  v499 = v498;
+  v500 = v499;
+  v501 = v500;
+  v502 = v501;
+  v503 = v502;
+  v504 = v503;
+  v505 = v504;
+  v506 = v505;
+  v507 = v506;
+  v508 = v507;
+  v509 = v508;
+  v510 = v509;
+  v511 = v510;
+  v512 = v511;
+  v513 = v512;
+  v514 = v513;
+  v515 = v514;
+  v516 = v515;
+  v517 = v516;
+  v518 = v517;
+  v519 = v518;
+  v520 = v519;
+  v521 = v520;
+  v522 = v521;
+  v523 = v522;
+  v524 = v523;
+  v525 = v524;
+  v526 = v525;
+  v527 = v526;
+  v528 = v527;
+  v529 = v528;
+  v530 = v529;
+  v531 = v530;
+  v532 = v531;
+  v533 = v532;
+  v534 = v533;
+  v535 = v534;
+  v536 = v535;
+  v537 = v536;
+  v538 = v537;
+  v539 = v538;
+  v540 = v539;
+  v541 = v540;
+  v542 = v541;
+  v543 = v542;
+  v544 = v543;
+  v545 = v544;
+  v546 = v545;
+  v547 = v546;
+  v548 = v547;
+  v549 = v548;
+  v550 = v549;
+  v551 = v550;
+  v552 = v551;
+  v553 = v552;
+  v554 = v553;
+  v555 = v554;
+  v556 = v555;
+  v557 = v556;
+  v558 = v557;
+  v559 = v558;
+  v560 = v559;
+  v561 = v560;
+  v562 = v561;
+  v563 = v562;
+  v564 = v563;
+  v565 = v564;
+  v566 = v565;
+  v567 = v566;
+  v568 = v567;
+  v569 = v568;
+  v570 = v569;
+  v571 = v570;
+  v572 = v571;
+  v573 = v572;
+  v574 = v573;
+  v575 = v574;
+  v576 = v575;
+  v577 = v576;
+  v578 = v577;
+  v579 = v578;
+  v580 = v579;
+  v581 = v580;
+  v582 = v581;
+  v583 = v582;
+  v584 = v583;
+  v585 = v584;
+  v586 = v585;
+  v587 = v586;
+  v588 = v587;
+  v589 = v588;
+  v590 = v589;
+  v591 = v590;
+  v592 = v591;
+  v593 = v592;
+  v594 = v593;
+  v595 = v594;
+  v596 = v595;
+  v597 = v596;
+  v598 = v597;
+  v599 = v598;
+  v600 = v599;
+  v601 = v600;
+  v602 = v601;
+  v603 = v602;
+  v604 = v603;
+  v605 = v604;
+  v606 = v605;
+  v607 = v606;
+  v608 = v607;
+  v609 = v608;
+  v610 = v609;
+  v611 = v610;
+  v612 = v611;
+  v613 = v612;
+  v614 = v613;
+  v615 = v614;
+  v616 = v615;
+  v617 = v616;
+  v618 = v617;
+  v619 = v618;
+  v620 = v619;
+  v621 = v620;
+  v622 = v621;
+  v623 = v622;
+  v624 = v623;
+  v625 = v624;
+  v626 = v625;
+  v627 = v626;
+  v628 = v627;
+  v629 = v628;
+  v630 = v629;
+  v631 = v630;
+  v632 = v631;
+  v633 = v632;
+  v634 = v633;
+  v635 = v634;
+  v636 = v635;
+  v637 = v636;
+  v638 = v637;
+  v639 = v638;
+  v640 = v639;
+  v641 = v640;
+  v642 = v641;
+  v643 = v642;
+  v644 = v643;
+  v645 = v644;
+  v646 = v645;
+  v647 = v646;
+  v648 = v647;
+  v649 = v648;
+  v650 = v649;
+  v651 = v650;
+  v652 = v651;
+  v653 = v652;
+  v654 = v653;
+  v655 = v654;
+  v656 = v655;
+  v657 = v656;
+  v658 = v657;
+  v659 = v658;
+  v660 = v659;
+  v661 = v660;
+  v662 = v661;
+  v663 = v662;
+  v664 = v663;
+  v665 = v664;
+  v666 = v665;
+  v667 = v666;
+  v668 = v667;
+  v669 = v668;
+  v670 = v669;
+  v671 = v670;
+  v672 = v671;
+  v673 = v672;
+  v674 = v673;
+  v675 = v674;
+  v676 = v675;
+  v677 = v676;
+  v678 = v677;
+  v679 = v678;
+  v680 = v679;
+  v681 = v680;
+  v682 = v681;
+  v683 = v682;
+  v684 = v683;
+  v685 = v684;
+  v686 = v685;
+  v687 = v686;
+  v688 = v687;
+  v689 = v688;
+  v690 = v689;
+  v691 = v690;
+  v692 = v691;
+  v693 = v692;
+  v694 = v693;
+  v695 = v694;
+  v696 = v695;
+  v697 = v696;
+  v698 = v697;
+  v699 = v698;
+  v700 = v699;
+  v701 = v700;
+  v702 = v701;
+  v703 = v702;
+  v704 = v703;
+  v705 = v704;
+  v706 = v705;
+  v707 = v706;
+  v708 = v707;
+  v709 = v708;
+  v710 = v709;
+  v711 = v710;
+  v712 = v711;
+  v713 = v712;
+  v714 = v713;
+  v715 = v714;
+  v716 = v715;
+  v717 = v716;
+  v718 = v717;
+  v719 = v718;
+  v720 = v719;
+  v721 = v720;
+  v722 = v721;
+  v723 = v722;
+  v724 = v723;
+  v725 = v724;
+  v726 = v725;
+  v727 = v726;
+  v728 = v727;
+  v729 = v728;
+  v730 = v729;
+  v731 = v730;
+  v732 = v731;
+  v733 = v732;
+  v734 = v733;
+  v735 = v734;
+  v736 = v735;
+  v737 = v736;
+  v738 = v737;
+  v739 = v738;
+  v740 = v739;
+  v741 = v740;
+  v742 = v741;
+  v743 = v742;
+  v744 = v743;
+  v745 = v744;
+  v746 = v745;
+  v747 = v746;
+  v748 = v747;
+  v749 = v748;
+  v750 = v749;
+  v751 = v750;
+  v752 = v751;
+  v753 = v752;
+  v754 = v753;
+  v755 = v754;
+  v756 = v755;
+  v757 = v756;
+  v758 = v757;
+  v759 = v758;
+  v760 = v759;
+  v761 = v760;
+  v762 = v761;
+  v763 = v762;
+  v764 = v763;
+  v765 = v764;
+  v766 = v765;
+  v767 = v766;
+  v768 = v767;
+  v769 = v768;
+  v770 = v769;
+  v771 = v770;
+  v772 = v771;
+  v773 = v772;
+  v774 = v773;
+  v775 = v774;
+  v776 = v775;
+  v777 = v776;
+  v778 = v777;
+  v779 = v778;
+  v780 = v779;
+  v781 = v780;
+  v782 = v781;
+  v783 = v782;
+  v784 = v783;
+  v785 = v784;
+  v786 = v785;
+  v787 = v786;
+  v788 = v787;
+  v789 = v788;
+  v790 = v789;
+  v791 = v790;
+  v792 = v791;
+  v793 = v792;
+  v794 = v793;
+  v795 = v794;
+  v796 = v795;
+  v797 = v796;
+  v798 = v797;
+  v799 = v798;
+  v800 = v799;
+  v801 = v800;
+  v802 = v801;
+  v803 = v802;
+  v804 = v803;
+  v805 = v804;
+  v806 = v805;
+  v807 = v806;
+  v808 = v807;
+  v809 = v808;
+  v810 = v809;
+  v811 = v810;
+  v812 = v811;
+  v813 = v812;
+  v814 = v813;
+  v815 = v814;
+  v816 = v815;
+  v817 = v816;
+  v818 = v817;
+  v819 = v818;
+  v820 = v819;
+  v821 = v820;
+  v822 = v821;
+  v823 = v822;
+  v824 = v823;
+  v825 = v824;
+  v826 = v825;
+  v827 = v826;
+  v828 = v827;
+  v829 = v828;
+  v830 = v829;
+  v831 = v830;
+  v832 = v831;
+  v833 = v832;
+  v834 = v833;
+  v835 = v834;
+  v836 = v835;
+  v837 = v836;
+  v838 = v837;
+  v839 = v838;
+  v840 = v839;
+  v841 = v840;
+  v842 = v841;
+  v843 = v842;
+  v844 = v843;
+  v845 = v844;
+  v846 = v845;
+  v847 = v846;
+  v848 = v847;
+  v849 = v848;
+  v850 = v849;
+  v851 = v850;
+  v852 = v851;
+  v853 = v852;
+  v854 = v853;
+  v855 = v854;
+  v856 = v855;
+  v857 = v856;
+  v858 = v857;
+  v859 = v858;
+  v860 = v859;
+  v861 = v860;
+  v862 = v861;
+  v863 = v862;
+  v864 = v863;
+  v865 = v864;
+  v866 = v865;
+  v867 = v866;
+  v868 = v867;
+  v869 = v868;
+  v870 = v869;
+  v871 = v870;
+  v872 = v871;
+  v873 = v872;
+  v874 = v873;
+  v875 = v874;
+  v876 = v875;
+  v877 = v876;
+  v878 = v877;
+  v879 = v878;
+  v880 = v879;
+  v881 = v880;
+  v882 = v881;
+  v883 = v882;
+  v884 = v883;
+  v885 = v884;
+  v886 = v885;
+  v887 = v886;
+  v888 = v887;
+  v889 = v888;
+  v890 = v889;
+  v891 = v890;
+  v892 = v891;
+  v893 = v892;
+  v894 = v893;
+  v895 = v894;
+  v896 = v895;
+  v897 = v896;
+  v898 = v897;
+  v899 = v898;
+  v900 = v899;
+  v901 = v900;
+  v902 = v901;
+  v903 = v902;
+  v904 = v903;
+  v905 = v904;
+  v906 = v905;
+  v907 = v906;
+  v908 = v907;
+  v909 = v908;
+  v910 = v909;
+  v911 = v910;
+  v912 = v911;
+  v913 = v912;
+  v914 = v913;
+  v915 = v914;
+  v916 = v915;
+  v917 = v916;
+  v918 = v917;
+  v919 = v918;
+  v920 = v919;
+  v921 = v920;
+  v922 = v921;
+  v923 = v922;
+  v924 = v923;
+  v925 = v924;
+  v926 = v925;
+  v927 = v926;
+  v928 = v927;
+  v929 = v928;
+  v930 = v929;
+  v931 = v930;
+  v932 = v931;
+  v933 = v932;
+  v934 = v933;
+  v935 = v934;
+  v936 = v935;
+  v937 = v936;
+  v938 = v937;
+  v939 = v938;
+  v940 = v939;
+  v941 = v940;
+  v942 = v941;
+  v943 = v942;
+  v944 = v943;
+  v945 = v944;
+  v946 = v945;
+  v947 = v946;
+  v948 = v947;
+  v949 = v948;
+  v950 = v949;
+  v951 = v950;
+  v952 = v951;
+  v953 = v952;
+  v954 = v953;
+  v955 = v954;
+  v956 = v955;
+  v957 = v956;
+  v958 = v957;
+  v959 = v958;
+  v960 = v959;
+  v961 = v960;
+  v962 = v961;
+  v963 = v962;
+  v964 = v963;
+  v965 = v964;
+  v966 = v965;
+  v967 = v966;
+  v968 = v967;
+  v969 = v968;
+  v970 = v969;
+  v971 = v970;
+  v972 = v971;
+  v973 = v972;
+  v974 = v973;
+  v975 = v974;
+  v976 = v975;
+  v977 = v976;
+  v978 = v977;
+  v979 = v978;
+  v980 = v979;
+  v981 = v980;
+  v982 = v981;
+  v983 = v982;
+  v984 = v983;
+  v985 = v984;
+  v986 = v985;
+  v987 = v986;
+  v988 = v987;
+  v989 = v988;
+  v990 = v989;
+  v991 = v990;
+  v992 = v991;
+  v993 = v992;
+  v994 = v993;
+  v995 = v994;
+  v996 = v995;
+  v997 = v996;
+  v998 = v997;
+  v999 = v998;
+  v1000 = v999;
+  v1001 = v1000;
+  v1002 = v1001;
+  v1003 = v1002;
+  v1004 = v1003;
+  v1005 = v1004;
+  v1006 = v1005;
+  v1007 = v1006;
+  v1008 = v1007;
+  v1009 = v1008;
+  v1010 = v1009;
+  v1011 = v1010;
+  v1012 = v1011;
+  v1013 = v1012;
+  v1014 = v1013;
+  v1015 = v1014;
+  v1016 = v1015;
+  v1017 = v1016;
+  v1018 = v1017;
+  v1019 = v1018;
+  v1020 = v1019;
+  v1021 = v1020;
+  v1022 = v1021;
+  v1023 = v1022;
+  v1024 = v1023;
+  v1025 = v1024;
+  v1026 = v1025;
+  v1027 = v1026;
+  v1028 = v1027;
+  v1029 = v1028;
+  v1030 = v1029;
+  v1031 = v1030;
+  v1032 = v1031;
+  v1033 = v1032;
+  v1034 = v1033;
+  v1035 = v1034;
+  v1036 = v1035;
+  v1037 = v1036;
+  v1038 = v1037;
+  v1039 = v1038;
+  v1040 = v1039;
+  v1041 = v1040;
+  v1042 = v1041;
+  v1043 = v1042;
+  v1044 = v1043;
+  v1045 = v1044;
+  v1046 = v1045;
+  v1047 = v1046;
+  v1048 = v1047;
+  v1049 = v1048;
+  v1050 = v1049;
+  v1051 = v1050;
+  v1052 = v1051;
+  v1053 = v1052;
+  v1054 = v1053;
+  v1055 = v1054;
+  v1056 = v1055;
+  v1057 = v1056;
+  v1058 = v1057;
+  v1059 = v1058;
+  v1060 = v1059;
+  v1061 = v1060;
+  v1062 = v1061;
+  v1063 = v1062;
+  v1064 = v1063;
+  v1065 = v1064;
+  v1066 = v1065;
+  v1067 = v1066;
+  v1068 = v1067;
+  v1069 = v1068;
+  v1070 = v1069;
+  v1071 = v1070;
+  v1072 = v1071;
+  v1073 = v1072;
+  v1074 = v1073;
+  v1075 = v1074;
+  v1076 = v1075;
+  v1077 = v1076;
+  v1078 = v1077;
+  v1079 = v1078;
+  v1080 = v1079;
+  v1081 = v1080;
+  v1082 = v1081;
+  v1083 = v1082;
+  v1084 = v1083;
+  v1085 = v1084;
+  v1086 = v1085;
+  v1087 = v1086;
+  v1088 = v1087;
+  v1089 = v1088;
+  v1090 = v1089;
+  v1091 = v1090;
+  v1092 = v1091;
+  v1093 = v1092;
+  v1094 = v1093;
+  v1095 = v1094;
+  v1096 = v1095;
+  v1097 = v1096;
+  v1098 = v1097;
+  v1099 = v1098;
+  v1100 = v1099;
+  v1101 = v1100;
+  v1102 = v1101;
+  v1103 = v1102;
+  v1104 = v1103;
+  v1105 = v1104;
+  v1106 = v1105;
+  v1107 = v1106;
+  v1108 = v1107;
+  v1109 = v1108;
+  v1110 = v1109;
+  v1111 = v1110;
+  v1112 = v1111;
+  v1113 = v1112;
+  v1114 = v1113;
+  v1115 = v1114;
+  v1116 = v1115;
+  v1117 = v1116;
+  v1118 = v1117;
+  v1119 = v1118;
+  v1120 = v1119;
+  v1121 = v1120;
+  v1122 = v1121;
+  v1123 = v1122;
+  v1124 = v1123;
+  v1125 = v1124;
+  v1126 = v1125;
+  v1127 = v1126;
+  v1128 = v1127;
+  v1129 = v1128;
+  v1130 = v1129;
+  v1131 = v1130;
+  v1132 = v1131;
+  v1133 = v1132;
+  v1134 = v1133;
+  v1135 = v1134;
+  v1136 = v1135;
+  v1137 = v1136;
+  v1138 = v1137;
+  v1139 = v1138;
+  v1140 = v1139;
+  v1141 = v1140;
+  v1142 = v1141;
+  v1143 = v1142;
+  v1144 = v1143;
+  v1145 = v1144;
+  v1146 = v1145;
+  v1147 = v1146;
+  v1148 = v1147;
+  v1149 = v1148;
+  v1150 = v1149;
+  v1151 = v1150;
+  v1152 = v1151;
+  v1153 = v1152;
+  v1154 = v1153;
+  v1155 = v1154;
+  v1156 = v1155;
+  v1157 = v1156;
+  v1158 = v1157;
+  v1159 = v1158;
+  v1160 = v1159;
+  v1161 = v1160;
+  v1162 = v1161;
+  v1163 = v1162;
+  v1164 = v1163;
+  v1165 = v1164;
+  v1166 = v1165;
+  v1167 = v1166;
+  v1168 = v1167;
+  v1169 = v1168;
+  v1170 = v1169;
+  v1171 = v1170;
+  v1172 = v1171;
+  v1173 = v1172;
+  v1174 = v1173;
+  v1175 = v1174;
+  v1176 = v1175;
+  v1177 = v1176;
+  v1178 = v1177;
+  v1179 = v1178;
+  v1180 = v1179;
+  v1181 = v1180;
+  v1182 = v1181;
+  v1183 = v1182;
+  v1184 = v1183;
+  v1185 = v1184;
+  v1186 = v1185;
+  v1187 = v1186;
+  v1188 = v1187;
+  v1189 = v1188;
+  v1190 = v1189;
+  v1191 = v1190;
+  v1192 = v1191;
+  v1193 = v1192;
+  v1194 = v1193;
+  v1195 = v1194;
+  v1196 = v1195;
+  v1197 = v1196;
+  v1198 = v1197;
+  v1199 = v1198;
+  v1200 = v1199;
+  v1201 = v1200;
+  v1202 = v1201;
+  v1203 = v1202;
+  v1204 = v1203;
+  v1205 = v1204;
+  v1206 = v1205;
+  v1207 = v1206;
+  v1208 = v1207;
+  v1209 = v1208;
+  v1210 = v1209;
+  v1211 = v1210;
+  v1212 = v1211;
+  v1213 = v1212;
+  v1214 = v1213;
+  v1215 = v1214;
+  v1216 = v1215;
+  v1217 = v1216;
+  v1218 = v1217;
+  v1219 = v1218;
+  v1220 = v1219;
+  v1221 = v1220;
+  v1222 = v1221;
+  v1223 = v1222;
+  v1224 = v1223;
+  v1225 = v1224;
+  v1226 = v1225;
+  v1227 = v1226;
+  v1228 = v1227;
+  v1229 = v1228;
+  v1230 = v1229;
+  v1231 = v1230;
+  v1232 = v1231;
+  v1233 = v1232;
+  v1234 = v1233;
+  v1235 = v1234;
+  v1236 = v1235;
+  v1237 = v1236;
+  v1238 = v1237;
+  v1239 = v1238;
+  v1240 = v1239;
+  v1241 = v1240;
+  v1242 = v1241;
+  v1243 = v1242;
+  v1244 = v1243;
+  v1245 = v1244;
+  v1246 = v1245;
+  v1247 = v1246;
+  v1248 = v1247;
+  v1249 = v1248;
+  v1250 = v1249;
+  v1251 = v1250;
+  v1252 = v1251;
+  v1253 = v1252;
+  v1254 = v1253;
+  v1255 = v1254;
+  v1256 = v1255;
+  v1257 = v1256;
+  v1258 = v1257;
+  v1259 = v1258;
+  v1260 = v1259;
+  v1261 = v1260;
+  v1262 = v1261;
+  v1263 = v1262;
+  v1264 = v1263;
+  v1265 = v1264;
+  v1266 = v1265;
+  v1267 = v1266;
+  v1268 = v1267;
+  v1269 = v1268;
+  v1270 = v1269;
+  v1271 = v1270;
+  v1272 = v1271;
+  v1273 = v1272;
+  v1274 = v1273;
+  v1275 = v1274;
+  v1276 = v1275;
+  v1277 = v1276;
+  v1278 = v1277;
+  v1279 = v1278;
+  v1280 = v1279;
+  v1281 = v1280;
+  v1282 = v1281;
+  v1283 = v1282;
+  v1284 = v1283;
+  v1285 = v1284;
+  v1286 = v1285;
+  v1287 = v1286;
+  v1288 = v1287;
+  v1289 = v1288;
+  v1290 = v1289;
+  v1291 = v1290;
+  v1292 = v1291;
+  v1293 = v1292;
+  v1294 = v1293;
+  v1295 = v1294;
+  v1296 = v1295;
+  v1297 = v1296;
+  v1298 = v1297;
+  v1299 = v1298;
+  v1300 = v1299;
+  v1301 = v1300;
+  v1302 = v1301;
+  v1303 = v1302;
+  v1304 = v1303;
+  v1305 = v1304;
+  v1306 = v1305;
+  v1307 = v1306;
+  v1308 = v1307;
+  v1309 = v1308;
+  v1310 = v1309;
+  v1311 = v1310;
+  v1312 = v1311;
+  v1313 = v1312;
+  v1314 = v1313;
+  v1315 = v1314;
+  v1316 = v1315;
+  v1317 = v1316;
+  v1318 = v1317;
+  v1319 = v1318;
+  v1320 = v1319;
+  v1321 = v1320;
+  v1322 = v1321;
+  v1323 = v1322;
+  v1324 = v1323;
+  v1325 = v1324;
+  v1326 = v1325;
+  v1327 = v1326;
+  v1328 = v1327;
+  v1329 = v1328;
+  v1330 = v1329;
+  v1331 = v1330;
+  v1332 = v1331;
+  v1333 = v1332;
+  v1334 = v1333;
+  v1335 = v1334;
+  v1336 = v1335;
+  v1337 = v1336;
+  v1338 = v1337;
+  v1339 = v1338;
+  v1340 = v1339;
+  v1341 = v1340;
+  v1342 = v1341;
+  v1343 = v1342;
+  v1344 = v1343;
+  v1345 = v1344;
+  v1346 = v1345;
+  v1347 = v1346;
+  v1348 = v1347;
+  v1349 = v1348;
+  v1350 = v1349;
+  v1351 = v1350;
+  v1352 = v1351;
+  v1353 = v1352;
+  v1354 = v1353;
+  v1355 = v1354;
+  v1356 = v1355;
+  v1357 = v1356;
+  v1358 = v1357;
+  v1359 = v1358;
+  v1360 = v1359;
+  v1361 = v1360;
+  v1362 = v1361;
+  v1363 = v1362;
+  v1364 = v1363;
+  v1365 = v1364;
+  v1366 = v1365;
+  v1367 = v1366;
+  v1368 = v1367;
+  v1369 = v1368;
+  v1370 = v1369;
+  v1371 = v1370;
+  v1372 = v1371;
+  v1373 = v1372;
+  v1374 = v1373;
+  v1375 = v1374;
+  v1376 = v1375;
+  v1377 = v1376;
+  v1378 = v1377;
+  v1379 = v1378;
+  v1380 = v1379;
+  v1381 = v1380;
+  v1382 = v1381;
+  v1383 = v1382;
+  v1384 = v1383;
+  v1385 = v1384;
+  v1386 = v1385;
+  v1387 = v1386;
+  v1388 = v1387;
+  v1389 = v1388;
+  v1390 = v1389;
+  v1391 = v1390;
+  v1392 = v1391;
+  v1393 = v1392;
+  v1394 = v1393;
+  v1395 = v1394;
+  v1396 = v1395;
+  v1397 = v1396;
+  v1398 = v1397;
+  v1399 = v1398;
+  v1400 = v1399;
+  v1401 = v1400;
+  v1402 = v1401;
+  v1403 = v1402;
+  v1404 = v1403;
+  v1405 = v1404;
+  v1406 = v1405;
+  v1407 = v1406;
+  v1408 = v1407;
+  v1409 = v1408;
+  v1410 = v1409;
+  v1411 = v1410;
+  v1412 = v1411;
+  v1413 = v1412;
+  v1414 = v1413;
+  v1415 = v1414;
+  v1416 = v1415;
+  v1417 = v1416;
+  v1418 = v1417;
+  v1419 = v1418;
+  v1420 = v1419;
+  v1421 = v1420;
+  v1422 = v1421;
+  v1423 = v1422;
+  v1424 = v1423;
+  v1425 = v1424;
+  v1426 = v1425;
+  v1427 = v1426;
+  v1428 = v1427;
+  v1429 = v1428;
+  v1430 = v1429;
+  v1431 = v1430;
+  v1432 = v1431;
+  v1433 = v1432;
+  v1434 = v1433;
+  v1435 = v1434;
+  v1436 = v1435;
+  v1437 = v1436;
+  v1438 = v1437;
+  v1439 = v1438;
+  v1440 = v1439;
+  v1441 = v1440;
+  v1442 = v1441;
+  v1443 = v1442;
+  v1444 = v1443;
+  v1445 = v1444;
+  v1446 = v1445;
+  v1447 = v1446;
+  v1448 = v1447;
+  v1449 = v1448;
+  v1450 = v1449;
+  v1451 = v1450;
+  v1452 = v1451;
+  v1453 = v1452;
+  v1454 = v1453;
+  v1455 = v1454;
+  v1456 = v1455;
+  v1457 = v1456;
+  v1458 = v1457;
+  v1459 = v1458;
+  v1460 = v1459;
+  v1461 = v1460;
+  v1462 = v1461;
+  v1463 = v1462;
+  v1464 = v1463;
+  v1465 = v1464;
+  v1466 = v1465;
+  v1467 = v1466;
+  v1468 = v1467;
+  v1469 = v1468;
+  v1470 = v1469;
+  v1471 = v1470;
+  v1472 = v1471;
+  v1473 = v1472;
+  v1474 = v1473;
+  v1475 = v1474;
+  v1476 = v1475;
+  v1477 = v1476;
+  v1478 = v1477;
+  v1479 = v1478;
+  v1480 = v1479;
+  v1481 = v1480;
+  v1482 = v1481;
+  v1483 = v1482;
+  v1484 = v1483;
+  v1485 = v1484;
+  v1486 = v1485;
+  v1487 = v1486;
+  v1488 = v1487;
+  v1489 = v1488;
+  v1490 = v1489;
+  v1491 = v1490;
+  v1492 = v1491;
+  v1493 = v1492;
+  v1494 = v1493;
+  v1495 = v1494;
+  v1496 = v1495;
+  v1497 = v1496;
+  v1498 = v1497;
+  v1499 = v1498;
+  v1500 = v1499;
+  v1501 = v1500;
+  v1502 = v1501;
+  v1503 = v1502;
+  v1504 = v1503;
+  v1505 = v1504;
+  v1506 = v1505;
+  v1507 = v1506;
+  v1508 = v1507;
+  v1509 = v1508;
+  v1510 = v1509;
+  v1511 = v1510;
+  v1512 = v1511;
+  v1513 = v1512;
+  v1514 = v1513;
+  v1515 = v1514;
+  v1516 = v1515;
+  v1517 = v1516;
+  v1518 = v1517;
+  v1519 = v1518;
+  v1520 = v1519;
+  v1521 = v1520;
+  v1522 = v1521;
+  v1523 = v1522;
+  v1524 = v1523;
+  v1525 = v1524;
+  v1526 = v1525;
+  v1527 = v1526;
+  v1528 = v1527;
+  v1529 = v1528;
+  v1530 = v1529;
+  v1531 = v1530;
+  v1532 = v1531;
+  v1533 = v1532;
+  v1534 = v1533;
+  v1535 = v1534;
+  v1536 = v1535;
+  v1537 = v1536;
+  v1538 = v1537;
+  v1539 = v1538;
+  v1540 = v1539;
+  v1541 = v1540;
+  v1542 = v1541;
+  v1543 = v1542;
+  v1544 = v1543;
+  v1545 = v1544;
+  v1546 = v1545;
+  v1547 = v1546;
+  v1548 = v1547;
+  v1549 = v1548;
+  v1550 = v1549;
+  v1551 = v1550;
+  v1552 = v1551;
+  v1553 = v1552;
+  v1554 = v1553;
+  v1555 = v1554;
+  v1556 = v1555;
+  v1557 = v1556;
+  v1558 = v1557;
+  v1559 = v1558;
+  v1560 = v1559;
+  v1561 = v1560;
+  v1562 = v1561;
+  v1563 = v1562;
+  v1564 = v1563;
+  v1565 = v1564;
+  v1566 = v1565;
+  v1567 = v1566;
+  v1568 = v1567;
+  v1569 = v1568;
+  v1570 = v1569;
+  v1571 = v1570;
+  v1572 = v1571;
+  v1573 = v1572;
+  v1574 = v1573;
+  v1575 = v1574;
+  v1576 = v1575;
+  v1577 = v1576;
+  v1578 = v1577;
+  v1579 = v1578;
+  v1580 = v1579;
+  v1581 = v1580;
+  v1582 = v1581;
+  v1583 = v1582;
+  v1584 = v1583;
+  v1585 = v1584;
+  v1586 = v1585;
+  v1587 = v1586;
+  v1588 = v1587;
+  v1589 = v1588;
+  v1590 = v1589;
+  v1591 = v1590;
+  v1592 = v1591;
+  v1593 = v1592;
+  v1594 = v1593;
+  v1595 = v1594;
+  v1596 = v1595;
+  v1597 = v1596;
+  v1598 = v1597;
+  v1599 = v1598;
+  v1600 = v1599;
+  v1601 = v1600;
+  v1602 = v1601;
+  v1603 = v1602;
+  v1604 = v1603;
+  v1605 = v1604;
+  v1606 = v1605;
+  v1607 = v1606;
+  v1608 = v1607;
+  v1609 = v1608;
+  v1610 = v1609;
+  v1611 = v1610;
+  v1612 = v1611;
+  v1613 = v1612;
+  v1614 = v1613;
+  v1615 = v1614;
+  v1616 = v1615;
+  v1617 = v1616;
+  v1618 = v1617;
+  v1619 = v1618;
+  v1620 = v1619;
+  v1621 = v1620;
+  v1622 = v1621;
+  v1623 = v1622;
+  v1624 = v1623;
+  v1625 = v1624;
+  v1626 = v1625;
+  v1627 = v1626;
+  v1628 = v1627;
+  v1629 = v1628;
+  v1630 = v1629;
+  v1631 = v1630;
+  v1632 = v1631;
+  v1633 = v1632;
+  v1634 = v1633;
+  v1635 = v1634;
+  v1636 = v1635;
+  v1637 = v1636;
+  v1638 = v1637;
+  v1639 = v1638;
+  v1640 = v1639;
+  v1641 = v1640;
+  v1642 = v1641;
+  v1643 = v1642;
+  v1644 = v1643;
+  v1645 = v1644;
+  v1646 = v1645;
+  v1647 = v1646;
+  v1648 = v1647;
+  v1649 = v1648;
+  v1650 = v1649;
+  v1651 = v1650;
+  v1652 = v1651;
+  v1653 = v1652;
+  v1654 = v1653;
+  v1655 = v1654;
+  v1656 = v1655;
+  v1657 = v1656;
+  v1658 = v1657;
+  v1659 = v1658;
+  v1660 = v1659;
+  v1661 = v1660;
+  v1662 = v1661;
+  v1663 = v1662;
+  v1664 = v1663;
+  v1665 = v1664;
+  v1666 = v1665;
+  v1667 = v1666;
+  v1668 = v1667;
+  v1669 = v1668;
+  v1670 = v1669;
+  v1671 = v1670;
+  v1672 = v1671;
+  v1673 = v1672;
+  v1674 = v1673;
+  v1675 = v1674;
+  v1676 = v1675;
+  v1677 = v1676;
+  v1678 = v1677;
+  v1679 = v1678;
+  v1680 = v1679;
+  v1681 = v1680;
+  v1682 = v1681;
+  v1683 = v1682;
+  v1684 = v1683;
+  v1685 = v1684;
+  v1686 = v1685;
+  v1687 = v1686;
+  v1688 = v1687;
+  v1689 = v1688;
+  v1690 = v1689;
+  v1691 = v1690;
+  v1692 = v1691;
+  v1693 = v1692;
+  v1694 = v1693;
+  v1695 = v1694;
+  v1696 = v1695;
+  v1697 = v1696;
+  v1698 = v1697;
+  v1699 = v1698;
+  v1700 = v1699;
+  v1701 = v1700;
+  v1702 = v1701;
+  v1703 = v1702;
+  v1704 = v1703;
+  v1705 = v1704;
+  v1706 = v1705;
+  v1707 = v1706;
+  v1708 = v1707;
+  v1709 = v1708;
+  v1710 = v1709;
+  v1711 = v1710;
+  v1712 = v1711;
+  v1713 = v1712;
+  v1714 = v1713;
+  v1715 = v1714;
+  v1716 = v1715;
+  v1717 = v1716;
+  v1718 = v1717;
+  v1719 = v1718;
+  v1720 = v1719;
+  v1721 = v1720;
+  v1722 = v1721;
+  v1723 = v1722;
+  v1724 = v1723;
+  v1725 = v1724;
+  v1726 = v1725;
+  v1727 = v1726;
+  v1728 = v1727;
+  v1729 = v1728;
+  v1730 = v1729;
+  v1731 = v1730;
+  v1732 = v1731;
+  v1733 = v1732;
+  v1734 = v1733;
+  v1735 = v1734;
+  v1736 = v1735;
+  v1737 = v1736;
+  v1738 = v1737;
+  v1739 = v1738;
+  v1740 = v1739;
+  v1741 = v1740;
+  v1742 = v1741;
+  v1743 = v1742;
+  v1744 = v1743;
+  v1745 = v1744;
+  v1746 = v1745;
+  v1747 = v1746;
+  v1748 = v1747;
+  v1749 = v1748;
+  v1750 = v1749;
+  v1751 = v1750;
+  v1752 = v1751;
+  v1753 = v1752;
+  v1754 = v1753;
+  v1755 = v1754;
+  v1756 = v1755;
+  v1757 = v1756;
+  v1758 = v1757;
+  v1759 = v1758;
+  v1760 = v1759;
+  v1761 = v1760;
+  v1762 = v1761;
+  v1763 = v1762;
+  v1764 = v1763;
+  v1765 = v1764;
+  v1766 = v1765;
+  v1767 = v1766;
+  v1768 = v1767;
+  v1769 = v1768;
+  v1770 = v1769;
+  v1771 = v1770;
+  v1772 = v1771;
+  v1773 = v1772;
+  v1774 = v1773;
+  v1775 = v1774;
+  v1776 = v1775;
+  v1777 = v1776;
+  v1778 = v1777;
+  v1779 = v1778;
+  v1780 = v1779;
+  v1781 = v1780;
+  v1782 = v1781;
+  v1783 = v1782;
+  v1784 = v1783;
+  v1785 = v1784;
+  v1786 = v1785;
+  v1787 = v1786;
+  v1788 = v1787;
+  v1789 = v1788;
+  v1790 = v1789;
+  v1791 = v1790;
+  v1792 = v1791;
+  v1793 = v1792;
+  v1794 = v1793;
+  v1795 = v1794;
+  v1796 = v1795;
+  v1797 = v1796;
+  v1798 = v1797;
+  v1799 = v1798;
+  v1800 = v1799;
+  v1801 = v1800;
+  v1802 = v1801;
+  v1803 = v1802;
+  v1804 = v1803;
+  v1805 = v1804;
+  v1806 = v1805;
+  v1807 = v1806;
+  v1808 = v1807;
+  v1809 = v1808;
+  v1810 = v1809;
+  v1811 = v1810;
+  v1812 = v1811;
+  v1813 = v1812;
+  v1814 = v1813;
+  v1815 = v1814;
+  v1816 = v1815;
+  v1817 = v1816;
+  v1818 = v1817;
+  v1819 = v1818;
+  v1820 = v1819;
+  v1821 = v1820;
+  v1822 = v1821;
+  v1823 = v1822;
+  v1824 = v1823;
+  v1825 = v1824;
+  v1826 = v1825;
+  v1827 = v1826;
+  v1828 = v1827;
+  v1829 = v1828;
+  v1830 = v1829;
+  v1831 = v1830;
+  v1832 = v1831;
+  v1833 = v1832;
+  v1834 = v1833;
+  v1835 = v1834;
+  v1836 = v1835;
+  v1837 = v1836;
+  v1838 = v1837;
+  v1839 = v1838;
+  v1840 = v1839;
+  v1841 = v1840;
+  v1842 = v1841;
+  v1843 = v1842;
+  v1844 = v1843;
+  v1845 = v1844;
+  v1846 = v1845;
+  v1847 = v1846;
+  v1848 = v1847;
+  v1849 = v1848;
+  v1850 = v1849;
+  v1851 = v1850;
+  v1852 = v1851;
+  v1853 = v1852;
+  v1854 = v1853;
+  v1855 = v1854;
+  v1856 = v1855;
+  v1857 = v1856;
+  v1858 = v1857;
+  v1859 = v1858;
+  v1860 = v1859;
+  v1861 = v1860;
+  v1862 = v1861;
+  v1863 = v1862;
+  v1864 = v1863;
+  v1865 = v1864;
+  v1866 = v1865;
+  v1867 = v1866;
+  v1868 = v1867;
+  v1869 = v1868;
+  v1870 = v1869;
+  v1871 = v1870;
+  v1872 = v1871;
+  v1873 = v1872;
+  v1874 = v1873;
+  v1875 = v1874;
+  v1876 = v1875;
+  v1877 = v1876;
+  v1878 = v1877;
+  v1879 = v1878;
+  v1880 = v1879;
+  v1881 = v1880;
+  v1882 = v1881;
+  v1883 = v1882;
+  v1884 = v1883;
+  v1885 = v1884;
+  v1886 = v1885;
+  v1887 = v1886;
+  v1888 = v1887;
+  v1889 = v1888;
+  v1890 = v1889;
+  v1891 = v1890;
+  v1892 = v1891;
+  v1893 = v1892;
+  v1894 = v1893;
+  v1895 = v1894;
+  v1896 = v1895;
+  v1897 = v1896;
+  v1898 = v1897;
+  v1899 = v1898;
+  v1900 = v1899;
+  v1901 = v1900;
+  v1902 = v1901;
+  v1903 = v1902;
+  v1904 = v1903;
+  v1905 = v1904;
+  v1906 = v1905;
+  v1907 = v1906;
+  v1908 = v1907;
+  v1909 = v1908;
+  v1910 = v1909;
+  v1911 = v1910;
+  v1912 = v1911;
+  v1913 = v1912;
+  v1914 = v1913;
+  v1915 = v1914;
+  v1916 = v1915;
+  v1917 = v1916;
+  v1918 = v1917;
+  v1919 = v1918;
+  v1920 = v1919;
+  v1921 = v1920;
+  v1922 = v1921;
+  v1923 = v1922;
+  v1924 = v1923;
+  v1925 = v1924;
+  v1926 = v1925;
+  v1927 = v1926;
+  v1928 = v1927;
+  v1929 = v1928;
+  v1930 = v1929;
+  v1931 = v1930;
+  v1932 = v1931;
+  v1933 = v1932;
+  v1934 = v1933;
+  v1935 = v1934;
+  v1936 = v1935;
+  v1937 = v1936;
+  v1938 = v1937;
+  v1939 = v1938;
+  v1940 = v1939;
+  v1941 = v1940;
+  v1942 = v1941;
+  v1943 = v1942;
+  v1944 = v1943;
+  v1945 = v1944;
+  v1946 = v1945;
+  v1947 = v1946;
+  v1948 = v1947;
+  v1949 = v1948;
+  v1950 = v1949;
+  v1951 = v1950;
+  v1952 = v1951;
+  v1953 = v1952;
+  v1954 = v1953;
+  v1955 = v1954;
+  v1956 = v1955;
+  v1957 = v1956;
+  v1958 = v1957;
+  v1959 = v1958;
+  v1960 = v1959;
+  v1961 = v1960;
+  v1962 = v1961;
+  v1963 = v1962;
+  v1964 = v1963;
+  v1965 = v1964;
+  v1966 = v1965;
+  v1967 = v1966;
+  v1968 = v1967;
+  v1969 = v1968;
+  v1970 = v1969;
+  v1971 = v1970;
+  v1972 = v1971;
+  v1973 = v1972;
+  v1974 = v1973;
+  v1975 = v1974;
+  v1976 = v1975;
+  v1977 = v1976;
+  v1978 = v1977;
+  v1979 = v1978;
+  v1980 = v1979;
+  v1981 = v1980;
+  v1982 = v1981;
+  v1983 = v1982;
+  v1984 = v1983;
+  v1985 = v1984;
+  v1986 = v1985;
+  v1987 = v1986;
+  v1988 = v1987;
+  v1989 = v1988;
+  v1990 = v1989;
+  v1991 = v1990;
+  v1992 = v1991;
+  v1993 = v1992;
+  v1994 = v1993;
+  v1995 = v1994;
+  v1996 = v1995;
+  v1997 = v1996;
+  v1998 = v1997;
+  v1999 = v1998;
+  v2000 = v1999;
+  v2001 = v2000;
+  v2002 = v2001;
+  v2003 = v2002;
+  v2004 = v2003;
+  v2005 = v2004;
+  v2006 = v2005;
+  v2007 = v2006;
+  v2008 = v2007;
+  v2009 = v2008;
+  v2010 = v2009;
+  v2011 = v2010;
+  v2012 = v2011;
+  v2013 = v2012;
+  v2014 = v2013;
+  v2015 = v2014;
+  v2016 = v2015;
+  v2017 = v2016;
+  v2018 = v2017;
+  v2019 = v2018;
+  v2020 = v2019;
+  v2021 = v2020;
+  v2022 = v2021;
+  v2023 = v2022;
+  v2024 = v2023;
+  v2025 = v2024;
+  v2026 = v2025;
+  v2027 = v2026;
+  v2028 = v2027;
+  v2029 = v2028;
+  v2030 = v2029;
+  v2031 = v2030;
+  v2032 = v2031;
+  v2033 = v2032;
+  v2034 = v2033;
+  v2035 = v2034;
+  v2036 = v2035;
+  v2037 = v2036;
+  v2038 = v2037;
+  v2039 = v2038;
+  v2040 = v2039;
+  v2041 = v2040;
+  v2042 = v2041;
+  v2043 = v2042;
+  v2044 = v2043;
+  v2045 = v2044;
+  v2046 = v2045;
+  v2047 = v2046;
+  v2048 = v2047;
+  v2049 = v2048;
+  v2050 = v2049;
+  v2051 = v2050;
+  v2052 = v2051;
+  v2053 = v2052;
+  v2054 = v2053;
+  v2055 = v2054;
+  v2056 = v2055;
+  v2057 = v2056;
+  v2058 = v2057;
+  v2059 = v2058;
+  v2060 = v2059;
+  v2061 = v2060;
+  v2062 = v2061;
+  v2063 = v2062;
+  v2064 = v2063;
+  v2065 = v2064;
+  v2066 = v2065;
+  v2067 = v2066;
+  v2068 = v2067;
+  v2069 = v2068;
+  v2070 = v2069;
+  v2071 = v2070;
+  v2072 = v2071;
+  v2073 = v2072;
+  v2074 = v2073;
+  v2075 = v2074;
+  v2076 = v2075;
+  v2077 = v2076;
+  v2078 = v2077;
+  v2079 = v2078;
+  v2080 = v2079;
+  v2081 = v2080;
+  v2082 = v2081;
+  v2083 = v2082;
+  v2084 = v2083;
+  v2085 = v2084;
+  v2086 = v2085;
+  v2087 = v2086;
+  v2088 = v2087;
+  v2089 = v2088;
+  v2090 = v2089;
+  v2091 = v2090;
+  v2092 = v2091;
+  v2093 = v2092;
+  v2094 = v2093;
+  v2095 = v2094;
+  v2096 = v2095;
+  v2097 = v2096;
+  v2098 = v2097;
+  v2099 = v2098;
+  v2100 = v2099;
+  v2101 = v2100;
+  v2102 = v2101;
+  v2103 = v2102;
+  v2104 = v2103;
+  v2105 = v2104;
+  v2106 = v2105;
+  v2107 = v2106;
+  v2108 = v2107;
+  v2109 = v2108;
+  v2110 = v2109;
+  v2111 = v2110;
+  v2112 = v2111;
+  v2113 = v2112;
+  v2114 = v2113;
+  v2115 = v2114;
+  v2116 = v2115;
+  v2117 = v2116;
+  v2118 = v2117;
+  v2119 = v2118;
+  v2120 = v2119;
+  v2121 = v2120;
+  v2122 = v2121;
+  v2123 = v2122;
+  v2124 = v2123;
+  v2125 = v2124;
+  v2126 = v2125;
+  v2127 = v2126;
+  v2128 = v2127;
+  v2129 = v2128;
+  v2130 = v2129;
+  v2131 = v2130;
+  v2132 = v2131;
+  v2133 = v2132;
+  v2134 = v2133;
+  v2135 = v2134;
+  v2136 = v2135;
+  v2137 = v2136;
+  v2138 = v2137;
+  v2139 = v2138;
+  v2140 = v2139;
+  v2141 = v2140;
+  v2142 = v2141;
+  v2143 = v2142;
+  v2144 = v2143;
+  v2145 = v2144;
+  v2146 = v2145;
+  v2147 = v2146;
+  v2148 = v2147;
+  v2149 = v2148;
+  v2150 = v2149;
+  v2151 = v2150;
+  v2152 = v2151;
+  v2153 = v2152;
+  v2154 = v2153;
+  v2155 = v2154;
+  v2156 = v2155;
+  v2157 = v2156;
+  v2158 = v2157;
+  v2159 = v2158;
+  v2160 = v2159;
+  v2161 = v2160;
+  v2162 = v2161;
+  v2163 = v2162;
+  v2164 = v2163;
+  v2165 = v2164;
+  v2166 = v2165;
+  v2167 = v2166;
+  v2168 = v2167;
+  v2169 = v2168;
+  v2170 = v2169;
+  v2171 = v2170;
+  v2172 = v2171;
+  v2173 = v2172;
+  v2174 = v2173;
+  v2175 = v2174;
+  v2176 = v2175;
+  v2177 = v2176;
+  v2178 = v2177;
+  v2179 = v2178;
+  v2180 = v2179;
+  v2181 = v2180;
+  v2182 = v2181;
+  v2183 = v2182;
+  v2184 = v2183;
+  v2185 = v2184;
+  v2186 = v2185;
+  v2187 = v2186;
+  v2188 = v2187;
+  v2189 = v2188;
+  v2190 = v2189;
+  v2191 = v2190;
+  v2192 = v2191;
+  v2193 = v2192;
+  v2194 = v2193;
+  v2195 = v2194;
+  v2196 = v2195;
+  v2197 = v2196;
+  v2198 = v2197;
+  v2199 = v2198;
+  v2200 = v2199;
+  v2201 = v2200;
+  v2202 = v2201;
+  v2203 = v2202;
+  v2204 = v2203;
+  v2205 = v2204;
+  v2206 = v2205;
+  v2207 = v2206;
+  v2208 = v2207;
+  v2209 = v2208;
+  v2210 = v2209;
+  v2211 = v2210;
+  v2212 = v2211;
+  v2213 = v2212;
+  v2214 = v2213;
+  v2215 = v2214;
+  v2216 = v2215;
+  v2217 = v2216;
+  v2218 = v2217;
+  v2219 = v2218;
+  v2220 = v2219;
+  v2221 = v2220;
+  v2222 = v2221;
+  v2223 = v2222;
+  v2224 = v2223;
+  v2225 = v2224;
+  v2226 = v2225;
+  v2227 = v2226;
+  v2228 = v2227;
+  v2229 = v2228;
+  v2230 = v2229;
+  v2231 = v2230;
+  v2232 = v2231;
+  v2233 = v2232;
+  v2234 = v2233;
+  v2235 = v2234;
+  v2236 = v2235;
+  v2237 = v2236;
+  v2238 = v2237;
+  v2239 = v2238;
+  v2240 = v2239;
+  v2241 = v2240;
+  v2242 = v2241;
+  v2243 = v2242;
+  v2244 = v2243;
+  v2245 = v2244;
+  v2246 = v2245;
+  v2247 = v2246;
+  v2248 = v2247;
+  v2249 = v2248;
+  v2250 = v2249;
+  v2251 = v2250;
+  v2252 = v2251;
+  v2253 = v2252;
+  v2254 = v2253;
+  v2255 = v2254;
+  v2256 = v2255;
+  v2257 = v2256;
+  v2258 = v2257;
+  v2259 = v2258;
+  v2260 = v2259;
+  v2261 = v2260;
+  v2262 = v2261;
+  v2263 = v2262;
+  v2264 = v2263;
+  v2265 = v2264;
+  v2266 = v2265;
+  v2267 = v2266;
+  v2268 = v2267;
+  v2269 = v2268;
+  v2270 = v2269;
+  v2271 = v2270;
+  v2272 = v2271;
+  v2273 = v2272;
+  v2274 = v2273;
+  v2275 = v2274;
+  v2276 = v2275;
+  v2277 = v2276;
+  v2278 = v2277;
+  v2279 = v2278;
+  v2280 = v2279;
+  v2281 = v2280;
+  v2282 = v2281;
+  v2283 = v2282;
+  v2284 = v2283;
+  v2285 = v2284;
+  v2286 = v2285;
+  v2287 = v2286;
+  v2288 = v2287;
+  v2289 = v2288;
+  v2290 = v2289;
+  v2291 = v2290;
+  v2292 = v2291;
+  v2293 = v2292;
+  v2294 = v2293;
+  v2295 = v2294;
+  v2296 = v2295;
+  v2297 = v2296;
+  v2298 = v2297;
+  v2299 = v2298;
+  v2300 = v2299;
+  v2301 = v2300;
+  v2302 = v2301;
+  v2303 = v2302;
+  v2304 = v2303;
+  v2305 = v2304;
+  v2306 = v2305;
+  v2307 = v2306;
+  v2308 = v2307;
+  v2309 = v2308;
+  v2310 = v2309;
+  v2311 = v2310;
+  v2312 = v2311;
+  v2313 = v2312;
+  v2314 = v2313;
+  v2315 = v2314;
+  v2316 = v2315;
+  v2317 = v2316;
+  v2318 = v2317;
+  v2319 = v2318;
+  v2320 = v2319;
+  v2321 = v2320;
+  v2322 = v2321;
+  v2323 = v2322;
+  v2324 = v2323;
+  v2325 = v2324;
+  v2326 = v2325;
+  v2327 = v2326;
+  v2328 = v2327;
+  v2329 = v2328;
+  v2330 = v2329;
+  v2331 = v2330;
+  v2332 = v2331;
+  v2333 = v2332;
+  v2334 = v2333;
+  v2335 = v2334;
+  v2336 = v2335;
+  v2337 = v2336;
+  v2338 = v2337;
+  v2339 = v2338;
+  v2340 = v2339;
+  v2341 = v2340;
+  v2342 = v2341;
+  v2343 = v2342;
+  v2344 = v2343;
+  v2345 = v2344;
+  v2346 = v2345;
+  v2347 = v2346;
+  v2348 = v2347;
+  v2349 = v2348;
+  v2350 = v2349;
+  v2351 = v2350;
+  v2352 = v2351;
+  v2353 = v2352;
+  v2354 = v2353;
+  v2355 = v2354;
+  v2356 = v2355;
+  v2357 = v2356;
+  v2358 = v2357;
+  v2359 = v2358;
+  v2360 = v2359;
+  v2361 = v2360;
+  v2362 = v2361;
+  v2363 = v2362;
+  v2364 = v2363;
+  v2365 = v2364;
+  v2366 = v2365;
+  v2367 = v2366;
+  v2368 = v2367;
+  v2369 = v2368;
+  v2370 = v2369;
+  v2371 = v2370;
+  v2372 = v2371;
+  v2373 = v2372;
+  v2374 = v2373;
+  v2375 = v2374;
+  v2376 = v2375;
+  v2377 = v2376;
+  v2378 = v2377;
+  v2379 = v2378;
+  v2380 = v2379;
+  v2381 = v2380;
+  v2382 = v2381;
+  v2383 = v2382;
+  v2384 = v2383;
+  v2385 = v2384;
+  v2386 = v2385;
+  v2387 = v2386;
+  v2388 = v2387;
+  v2389 = v2388;
+  v2390 = v2389;
+  v2391 = v2390;
+  v2392 = v2391;
+  v2393 = v2392;
+  v2394 = v2393;
+  v2395 = v2394;
+  v2396 = v2395;
+  v2397 = v2396;
+  v2398 = v2397;
+  v2399 = v2398;
+  v2400 = v2399;
+  v2401 = v2400;
+  v2402 = v2401;
+  v2403 = v2402;
+  v2404 = v2403;
+  v2405 = v2404;
+  v2406 = v2405;
+  v2407 = v2406;
+  v2408 = v2407;
+  v2409 = v2408;
+  v2410 = v2409;
+  v2411 = v2410;
+  v2412 = v2411;
+  v2413 = v2412;
+  v2414 = v2413;
+  v2415 = v2414;
+  v2416 = v2415;
+  v2417 = v2416;
+  v2418 = v2417;
+  v2419 = v2418;
+  v2420 = v2419;
+  v2421 = v2420;
+  v2422 = v2421;
+  v2423 = v2422;
+  v2424 = v2423;
+  v2425 = v2424;
+  v2426 = v2425;
+  v2427 = v2426;
+  v2428 = v2427;
+  v2429 = v2428;
+  v2430 = v2429;
+  v2431 = v2430;
+  v2432 = v2431;
+  v2433 = v2432;
+  v2434 = v2433;
+  v2435 = v2434;
+  v2436 = v2435;
+  v2437 = v2436;
+  v2438 = v2437;
+  v2439 = v2438;
+  v2440 = v2439;
+  v2441 = v2440;
+  v2442 = v2441;
+  v2443 = v2442;
+  v2444 = v2443;
+  v2445 = v2444;
+  v2446 = v2445;
+  v2447 = v2446;
+  v2448 = v2447;
+  v2449 = v2448;
+  v2450 = v2449;
+  v2451 = v2450;
+  v2452 = v2451;
+  v2453 = v2452;
+  v2454 = v2453;
+  v2455 = v2454;
+  v2456 = v2455;
+  v2457 = v2456;
+  v2458 = v2457;
+  v2459 = v2458;
+  v2460 = v2459;
+  v2461 = v2460;
+  v2462 = v2461;
+  v2463 = v2462;
+  v2464 = v2463;
+  v2465 = v2464;
+  v2466 = v2465;
+  v2467 = v2466;
+  v2468 = v2467;
+  v2469 = v2468;
+  v2470 = v2469;
+  v2471 = v2470;
+  v2472 = v2471;
+  v2473 = v2472;
+  v2474 = v2473;
+  v2475 = v2474;
+  v2476 = v2475;
+  v2477 = v2476;
+  v2478 = v2477;
+  v2479 = v2478;
+  v2480 = v2479;
+  v2481 = v2480;
+  v2482 = v2481;
+  v2483 = v2482;
+  v2484 = v2483;
+  v2485 = v2484;
+  v2486 = v2485;
+  v2487 = v2486;
+  v2488 = v2487;
+  v2489 = v2488;
+  v2490 = v2489;
+  v2491 = v2490;
+  v2492 = v2491;
+  v2493 = v2492;
+  v2494 = v2493;
+  v2495 = v2494;
+  v2496 = v2495;
+  v2497 = v2496;
+  v2498 = v2497;
+  v2499 = v2498;
+  v2500 = v2499;
+  v2501 = v2500;
+  v2502 = v2501;
+  v2503 = v2502;
+  v2504 = v2503;
+  v2505 = v2504;
+  v2506 = v2505;
+  v2507 = v2506;
+  v2508 = v2507;
+  v2509 = v2508;
+  v2510 = v2509;
+  v2511 = v2510;
+  v2512 = v2511;
+  v2513 = v2512;
+  v2514 = v2513;
+  v2515 = v2514;
+  v2516 = v2515;
+  v2517 = v2516;
+  v2518 = v2517;
+  v2519 = v2518;
+  v2520 = v2519;
+  v2521 = v2520;
+  v2522 = v2521;
+  v2523 = v2522;
+  v2524 = v2523;
+  v2525 = v2524;
+  v2526 = v2525;
+  v2527 = v2526;
+  v2528 = v2527;
+  v2529 = v2528;
+  v2530 = v2529;
+  v2531 = v2530;
+  v2532 = v2531;
+  v2533 = v2532;
+  v2534 = v2533;
+  v2535 = v2534;
+  v2536 = v2535;
+  v2537 = v2536;
+  v2538 = v2537;
+  v2539 = v2538;
+  v2540 = v2539;
+  v2541 = v2540;
+  v2542 = v2541;
+  v2543 = v2542;
+  v2544 = v2543;
+  v2545 = v2544;
+  v2546 = v2545;
+  v2547 = v2546;
+  v2548 = v2547;
+  v2549 = v2548;
+  v2550 = v2549;
+  v2551 = v2550;
+  v2552 = v2551;
+  v2553 = v2552;
+  v2554 = v2553;
+  v2555 = v2554;
+  v2556 = v2555;
+  v2557 = v2556;
+  v2558 = v2557;
+  v2559 = v2558;
+  v2560 = v2559;
+  v2561 = v2560;
+  v2562 = v2561;
+  v2563 = v2562;
+  v2564 = v2563;
+  v2565 = v2564;
+  v2566 = v2565;
+  v2567 = v2566;
+  v2568 = v2567;
+  v2569 = v2568;
+  v2570 = v2569;
+  v2571 = v2570;
+  v2572 = v2571;
+  v2573 = v2572;
+  v2574 = v2573;
+  v2575 = v2574;
+  v2576 = v2575;
+  v2577 = v2576;
+  v2578 = v2577;
+  v2579 = v2578;
+  v2580 = v2579;
+  v2581 = v2580;
+  v2582 = v2581;
+  v2583 = v2582;
+  v2584 = v2583;
+  v2585 = v2584;
+  v2586 = v2585;
+  v2587 = v2586;
+  v2588 = v2587;
+  v2589 = v2588;
+  v2590 = v2589;
+  v2591 = v2590;
+  v2592 = v2591;
+  v2593 = v2592;
+  v2594 = v2593;
+  v2595 = v2594;
+  v2596 = v2595;
+  v2597 = v2596;
+  v2598 = v2597;
+  v2599 = v2598;
+  v2600 = v2599;
+  v2601 = v2600;
+  v2602 = v2601;
+  v2603 = v2602;
+  v2604 = v2603;
+  v2605 = v2604;
+  v2606 = v2605;
+  v2607 = v2606;
+  v2608 = v2607;
+  v2609 = v2608;
+  v2610 = v2609;
+  v2611 = v2610;
+  v2612 = v2611;
+  v2613 = v2612;
+  v2614 = v2613;
+  v2615 = v2614;
+  v2616 = v2615;
+  v2617 = v2616;
+  v2618 = v2617;
+  v2619 = v2618;
+  v2620 = v2619;
+  v2621 = v2620;
+  v2622 = v2621;
+  v2623 = v2622;
+  v2624 = v2623;
+  v2625 = v2624;
+  v2626 = v2625;
+  v2627 = v2626;
+  v2628 = v2627;
+  v2629 = v2628;
+  v2630 = v2629;
+  v2631 = v2630;
+  v2632 = v2631;
+  v2633 = v2632;
+  v2634 = v2633;
+  v2635 = v2634;
+  v2636 = v2635;
+  v2637 = v2636;
+  v2638 = v2637;
+  v2639 = v2638;
+  v2640 = v2639;
+  v2641 = v2640;
+  v2642 = v2641;
+  v2643 = v2642;
+  v2644 = v2643;
+  v2645 = v2644;
+  v2646 = v2645;
+  v2647 = v2646;
+  v2648 = v2647;
+  v2649 = v2648;
+  v2650 = v2649;
+  v2651 = v2650;
+  v2652 = v2651;
+  v2653 = v2652;
+  v2654 = v2653;
+  v2655 = v2654;
+  v2656 = v2655;
+  v2657 = v2656;
+  v2658 = v2657;
+  v2659 = v2658;
+  v2660 = v2659;
+  v2661 = v2660;
+  v2662 = v2661;
+  v2663 = v2662;
+  v2664 = v2663;
+  v2665 = v2664;
+  v2666 = v2665;
+  v2667 = v2666;
+  v2668 = v2667;
+  v2669 = v2668;
+  v2670 = v2669;
+  v2671 = v2670;
+  v2672 = v2671;
+  v2673 = v2672;
+  v2674 = v2673;
+  v2675 = v2674;
+  v2676 = v2675;
+  v2677 = v2676;
+  v2678 = v2677;
+  v2679 = v2678;
+  v2680 = v2679;
+  v2681 = v2680;
+  v2682 = v2681;
+  v2683 = v2682;
+  v2684 = v2683;
+  v2685 = v2684;
+  v2686 = v2685;
+  v2687 = v2686;
+  v2688 = v2687;
+  v2689 = v2688;
+  v2690 = v2689;
+  v2691 = v2690;
+  v2692 = v2691;
+  v2693 = v2692;
+  v2694 = v2693;
+  v2695 = v2694;
+  v2696 = v2695;
+  v2697 = v2696;
+  v2698 = v2697;
+  v2699 = v2698;
+  v2700 = v2699;
+  v2701 = v2700;
+  v2702 = v2701;
+  v2703 = v2702;
+  v2704 = v2703;
+  v2705 = v2704;
+  v2706 = v2705;
+  v2707 = v2706;
+  v2708 = v2707;
+  v2709 = v2708;
+  v2710 = v2709;
+  v2711 = v2710;
+  v2712 = v2711;
+  v2713 = v2712;
+  v2714 = v2713;
+  v2715 = v2714;
+  v2716 = v2715;
+  v2717 = v2716;
+  v2718 = v2717;
+  v2719 = v2718;
+  v2720 = v2719;
+  v2721 = v2720;
+  v2722 = v2721;
+  v2723 = v2722;
+  v2724 = v2723;
+  v2725 = v2724;
+  v2726 = v2725;
+  v2727 = v2726;
+  v2728 = v2727;
+  v2729 = v2728;
+  v2730 = v2729;
+  v2731 = v2730;
+  v2732 = v2731;
+  v2733 = v2732;
+  v2734 = v2733;
+  v2735 = v2734;
+  v2736 = v2735;
+  v2737 = v2736;
+  v2738 = v2737;
+  v2739 = v2738;
+  v2740 = v2739;
+  v2741 = v2740;
+  v2742 = v2741;
+  v2743 = v2742;
+  v2744 = v2743;
+  v2745 = v2744;
+  v2746 = v2745;
+  v2747 = v2746;
+  v2748 = v2747;
+  v2749 = v2748;
+  v2750 = v2749;
+  v2751 = v2750;
+  v2752 = v2751;
+  v2753 = v2752;
+  v2754 = v2753;
+  v2755 = v2754;
+  v2756 = v2755;
+  v2757 = v2756;
+  v2758 = v2757;
+  v2759 = v2758;
+  v2760 = v2759;
+  v2761 = v2760;
+  v2762 = v2761;
+  v2763 = v2762;
+  v2764 = v2763;
+  v2765 = v2764;
+  v2766 = v2765;
+  v2767 = v2766;
+  v2768 = v2767;
+  v2769 = v2768;
+  v2770 = v2769;
+  v2771 = v2770;
+  v2772 = v2771;
+  v2773 = v2772;
+  v2774 = v2773;
+  v2775 = v2774;
+  v2776 = v2775;
+  v2777 = v2776;
+  v2778 = v2777;
+  v2779 = v2778;
+  v2780 = v2779;
+  v2781 = v2780;
+  v2782 = v2781;
+  v2783 = v2782;
+  v2784 = v2783;
+  v2785 = v2784;
+  v2786 = v2785;
+  v2787 = v2786;
+  v2788 = v2787;
+  v2789 = v2788;
+  v2790 = v2789;
+  v2791 = v2790;
+  v2792 = v2791;
+  v2793 = v2792;
+  v2794 = v2793;
+  v2795 = v2794;
+  v2796 = v2795;
+  v2797 = v2796;
+  v2798 = v2797;
+  v2799 = v2798;
+  v2800 = v2799;
+  v2801 = v2800;
+  v2802 = v2801;
+  v2803 = v2802;
+  v2804 = v2803;
+  v2805 = v2804;
+  v2806 = v2805;
+  v2807 = v2806;
+  v2808 = v2807;
+  v2809 = v2808;
+  v2810 = v2809;
+  v2811 = v2810;
+  v2812 = v2811;
+  v2813 = v2812;
+  v2814 = v2813;
+  v2815 = v2814;
+  v2816 = v2815;
+  v2817 = v2816;
+  v2818 = v2817;
+  v2819 = v2818;
+  v2820 = v2819;
+  v2821 = v2820;
+  v2822 = v2821;
+  v2823 = v2822;
+  v2824 = v2823;
+  v2825 = v2824;
+  v2826 = v2825;
+  v2827 = v2826;
+  v2828 = v2827;
+  v2829 = v2828;
+  v2830 = v2829;
+  v2831 = v2830;
+  v2832 = v2831;
+  v2833 = v2832;
+  v2834 = v2833;
+  v2835 = v2834;
+  v2836 = v2835;
+  v2837 = v2836;
+  v2838 = v2837;
+  v2839 = v2838;
+  v2840 = v2839;
+  v2841 = v2840;
+  v2842 = v2841;
+  v2843 = v2842;
+  v2844 = v2843;
+  v2845 = v2844;
+  v2846 = v2845;
+  v2847 = v2846;
+  v2848 = v2847;
+  v2849 = v2848;
+  v2850 = v2849;
+  v2851 = v2850;
+  v2852 = v2851;
+  v2853 = v2852;
+  v2854 = v2853;
+  v2855 = v2854;
+  v2856 = v2855;
+  v2857 = v2856;
+  v2858 = v2857;
+  v2859 = v2858;
+  v2860 = v2859;
+  v2861 = v2860;
+  v2862 = v2861;
+  v2863 = v2862;
+  v2864 = v2863;
+  v2865 = v2864;
+  v2866 = v2865;
+  v2867 = v2866;
+  v2868 = v2867;
+  v2869 = v2868;
+  v2870 = v2869;
+  v2871 = v2870;
+  v2872 = v2871;
+  v2873 = v2872;
+  v2874 = v2873;
+  v2875 = v2874;
+  v2876 = v2875;
+  v2877 = v2876;
+  v2878 = v2877;
+  v2879 = v2878;
+  v2880 = v2879;
+  v2881 = v2880;
+  v2882 = v2881;
+  v2883 = v2882;
+  v2884 = v2883;
+  v2885 = v2884;
+  v2886 = v2885;
+  v2887 = v2886;
+  v2888 = v2887;
+  v2889 = v2888;
+  v2890 = v2889;
+  v2891 = v2890;
+  v2892 = v2891;
+  v2893 = v2892;
+  v2894 = v2893;
+  v2895 = v2894;
+  v2896 = v2895;
+  v2897 = v2896;
+  v2898 = v2897;
+  v2899 = v2898;
+  v2900 = v2899;
+  v2901 = v2900;
+  v2902 = v2901;
+  v2903 = v2902;
+  v2904 = v2903;
+  v2905 = v2904;
+  v2906 = v2905;
+  v2907 = v2906;
+  v2908 = v2907;
+  v2909 = v2908;
+  v2910 = v2909;
+  v2911 = v2910;
+  v2912 = v2911;
+  v2913 = v2912;
+  v2914 = v2913;
+  v2915 = v2914;
+  v2916 = v2915;
+  v2917 = v2916;
+  v2918 = v2917;
+  v2919 = v2918;
+  v2920 = v2919;
+  v2921 = v2920;
+  v2922 = v2921;
+  v2923 = v2922;
+  v2924 = v2923;
+  v2925 = v2924;
+  v2926 = v2925;
+  v2927 = v2926;
+  v2928 = v2927;
+  v2929 = v2928;
+  v2930 = v2929;
+  v2931 = v2930;
+  v2932 = v2931;
+  v2933 = v2932;
+  v2934 = v2933;
+  v2935 = v2934;
+  v2936 = v2935;
+  v2937 = v2936;
+  v2938 = v2937;
+  v2939 = v2938;
+  v2940 = v2939;
+  v2941 = v2940;
+  v2942 = v2941;
+  v2943 = v2942;
+  v2944 = v2943;
+  v2945 = v2944;
+  v2946 = v2945;
+  v2947 = v2946;
+  v2948 = v2947;
+  v2949 = v2948;
+  v2950 = v2949;
+  v2951 = v2950;
+  v2952 = v2951;
+  v2953 = v2952;
+  v2954 = v2953;
+  v2955 = v2954;
+  v2956 = v2955;
+  v2957 = v2956;
+  v2958 = v2957;
+  v2959 = v2958;
+  v2960 = v2959;
+  v2961 = v2960;
+  v2962 = v2961;
+  v2963 = v2962;
+  v2964 = v2963;
+  v2965 = v2964;
+  v2966 = v2965;
+  v2967 = v2966;
+  v2968 = v2967;
+  v2969 = v2968;
+  v2970 = v2969;
+  v2971 = v2970;
+  v2972 = v2971;
+  v2973 = v2972;
+  v2974 = v2973;
+  v2975 = v2974;
+  v2976 = v2975;
+  v2977 = v2976;
+  v2978 = v2977;
+  v2979 = v2978;
+  v2980 = v2979;
+  v2981 = v2980;
+  v2982 = v2981;
+  v2983 = v2982;
+  v2984 = v2983;
+  v2985 = v2984;
+  v2986 = v2985;
+  v2987 = v2986;
+  v2988 = v2987;
+  v2989 = v2988;
+  v2990 = v2989;
+  v2991 = v2990;
+  v2992 = v2991;
+  v2993 = v2992;
+  v2994 = v2993;
+  v2995 = v2994;
+  v2996 = v2995;
+  v2997 = v2996;
+  v2998 = v2997;
+  v2999 = v2998;
+  v3000 = v2999;
+  v3001 = v3000;
+  v3002 = v3001;
+  v3003 = v3002;
+  v3004 = v3003;
+  v3005 = v3004;
+  v3006 = v3005;
+  v3007 = v3006;
+  v3008 = v3007;
+  v3009 = v3008;
+  v3010 = v3009;
+  v3011 = v3010;
+  v3012 = v3011;
+  v3013 = v3012;
+  v3014 = v3013;
+  v3015 = v3014;
+  v3016 = v3015;
+  v3017 = v3016;
+  v3018 = v3017;
+  v3019 = v3018;
+  v3020 = v3019;
+  v3021 = v3020;
+  v3022 = v3021;
+  v3023 = v3022;
+  v3024 = v3023;
+  v3025 = v3024;
+  v3026 = v3025;
+  v3027 = v3026;
+  v3028 = v3027;
+  v3029 = v3028;
+  v3030 = v3029;
+  v3031 = v3030;
+  v3032 = v3031;
+  v3033 = v3032;
+  v3034 = v3033;
+  v3035 = v3034;
+  v3036 = v3035;
+  v3037 = v3036;
+  v3038 = v3037;
+  v3039 = v3038;
+  v3040 = v3039;
+  v3041 = v3040;
+  v3042 = v3041;
+  v3043 = v3042;
+  v3044 = v3043;
+  v3045 = v3044;
+  v3046 = v3045;
+  v3047 = v3046;
+  v3048 = v3047;
+  v3049 = v3048;
+  v3050 = v3049;
+  v3051 = v3050;
+  v3052 = v3051;
+  v3053 = v3052;
+  v3054 = v3053;
+  v3055 = v3054;
+  v3056 = v3055;
+  v3057 = v3056;
+  v3058 = v3057;
+  v3059 = v3058;
+  v3060 = v3059;
+  v3061 = v3060;
+  v3062 = v3061;
+  v3063 = v3062;
+  v3064 = v3063;
+  v3065 = v3064;
+  v3066 = v3065;
+  v3067 = v3066;
+  v3068 = v3067;
+  v3069 = v3068;
+  v3070 = v3069;
+  v3071 = v3070;
+  v3072 = v3071;
+  v3073 = v3072;
+  v3074 = v3073;
+  v3075 = v3074;
+  v3076 = v3075;
+  v3077 = v3076;
+  v3078 = v3077;
+  v3079 = v3078;
+  v3080 = v3079;
+  v3081 = v3080;
+  v3082 = v3081;
+  v3083 = v3082;
+  v3084 = v3083;
+  v3085 = v3084;
+  v3086 = v3085;
+  v3087 = v3086;
+  v3088 = v3087;
+  v3089 = v3088;
+  v3090 = v3089;
+  v3091 = v3090;
+  v3092 = v3091;
+  v3093 = v3092;
+  v3094 = v3093;
+  v3095 = v3094;
+  v3096 = v3095;
+  v3097 = v3096;
+  v3098 = v3097;
+  v3099 = v3098;
+  v3100 = v3099;
+  v3101 = v3100;
+  v3102 = v3101;
+  v3103 = v3102;
+  v3104 = v3103;
+  v3105 = v3104;
+  v3106 = v3105;
+  v3107 = v3106;
+  v3108 = v3107;
+  v3109 = v3108;
+  v3110 = v3109;
+  v3111 = v3110;
+  v3112 = v3111;
+  v3113 = v3112;
+  v3114 = v3113;
+  v3115 = v3114;
+  v3116 = v3115;
+  v3117 = v3116;
+  v3118 = v3117;
+  v3119 = v3118;
+  v3120 = v3119;
+  v3121 = v3120;
+  v3122 = v3121;
+  v3123 = v3122;
+  v3124 = v3123;
+  v3125 = v3124;
+  v3126 = v3125;
+  v3127 = v3126;
+  v3128 = v3127;
+  v3129 = v3128;
+  v3130 = v3129;
+  v3131 = v3130;
+  v3132 = v3131;
+  v3133 = v3132;
+  v3134 = v3133;
+  v3135 = v3134;
+  v3136 = v3135;
+  v3137 = v3136;
+  v3138 = v3137;
+  v3139 = v3138;
+  v3140 = v3139;
+  v3141 = v3140;
+  v3142 = v3141;
+  v3143 = v3142;
+  v3144 = v3143;
+  v3145 = v3144;
+  v3146 = v3145;
+  v3147 = v3146;
+  v3148 = v3147;
+  v3149 = v3148;
+  v3150 = v3149;
+  v3151 = v3150;
+  v3152 = v3151;
+  v3153 = v3152;
+  v3154 = v3153;
+  v3155 = v3154;
+  v3156 = v3155;
+  v3157 = v3156;
+  v3158 = v3157;
+  v3159 = v3158;
+  v3160 = v3159;
+  v3161 = v3160;
+  v3162 = v3161;
+  v3163 = v3162;
+  v3164 = v3163;
+  v3165 = v3164;
+  v3166 = v3165;
+  v3167 = v3166;
+  v3168 = v3167;
+  v3169 = v3168;
+  v3170 = v3169;
+  v3171 = v3170;
+  v3172 = v3171;
+  v3173 = v3172;
+  v3174 = v3173;
+  v3175 = v3174;
+  v3176 = v3175;
+  v3177 = v3176;
+  v3178 = v3177;
+  v3179 = v3178;
+  v3180 = v3179;
+  v3181 = v3180;
+  v3182 = v3181;
+  v3183 = v3182;
+  v3184 = v3183;
+  v3185 = v3184;
+  v3186 = v3185;
+  v3187 = v3186;
+  v3188 = v3187;
+  v3189 = v3188;
+  v3190 = v3189;
+  v3191 = v3190;
+  v3192 = v3191;
+  v3193 = v3192;
+  v3194 = v3193;
+  v3195 = v3194;
+  v3196 = v3195;
+  v3197 = v3196;
+  v3198 = v3197;
+  v3199 = v3198;
+  v3200 = v3199;
+  v3201 = v3200;
+  v3202 = v3201;
+  v3203 = v3202;
+  v3204 = v3203;
+  v3205 = v3204;
+  v3206 = v3205;
+  v3207 = v3206;
+  v3208 = v3207;
+  v3209 = v3208;
+  v3210 = v3209;
+  v3211 = v3210;
+  v3212 = v3211;
+  v3213 = v3212;
+  v3214 = v3213;
+  v3215 = v3214;
+  v3216 = v3215;
+  v3217 = v3216;
+  v3218 = v3217;
+  v3219 = v3218;
+  v3220 = v3219;
+  v3221 = v3220;
+  v3222 = v3221;
+  v3223 = v3222;
+  v3224 = v3223;
+  v3225 = v3224;
+  v3226 = v3225;
+  v3227 = v3226;
+  v3228 = v3227;
+  v3229 = v3228;
+  v3230 = v3229;
+  v3231 = v3230;
+  v3232 = v3231;
+  v3233 = v3232;
+  v3234 = v3233;
+  v3235 = v3234;
+  v3236 = v3235;
+  v3237 = v3236;
+  v3238 = v3237;
+  v3239 = v3238;
+  v3240 = v3239;
+  v3241 = v3240;
+  v3242 = v3241;
+  v3243 = v3242;
+  v3244 = v3243;
+  v3245 = v3244;
+  v3246 = v3245;
+  v3247 = v3246;
+  v3248 = v3247;
+  v3249 = v3248;
+  v3250 = v3249;
+  v3251 = v3250;
+  v3252 = v3251;
+  v3253 = v3252;
+  v3254 = v3253;
+  v3255 = v3254;
+  v3256 = v3255;
+  v3257 = v3256;
+  v3258 = v3257;
+  v3259 = v3258;
+  v3260 = v3259;
+  v3261 = v3260;
+  v3262 = v3261;
+  v3263 = v3262;
+  v3264 = v3263;
+  v3265 = v3264;
+  v3266 = v3265;
+  v3267 = v3266;
+  v3268 = v3267;
+  v3269 = v3268;
+  v3270 = v3269;
+  v3271 = v3270;
+  v3272 = v3271;
+  v3273 = v3272;
+  v3274 = v3273;
+  v3275 = v3274;
+  v3276 = v3275;
+  v3277 = v3276;
+  v3278 = v3277;
+  v3279 = v3278;
+  v3280 = v3279;
+  v3281 = v3280;
+  v3282 = v3281;
+  v3283 = v3282;
+  v3284 = v3283;
+  v3285 = v3284;
+  v3286 = v3285;
+  v3287 = v3286;
+  v3288 = v3287;
+  v3289 = v3288;
+  v3290 = v3289;
+  v3291 = v3290;
+  v3292 = v3291;
+  v3293 = v3292;
+  v3294 = v3293;
+  v3295 = v3294;
+  v3296 = v3295;
+  v3297 = v3296;
+  v3298 = v3297;
+  v3299 = v3298;
+  v3300 = v3299;
+  v3301 = v3300;
+  v3302 = v3301;
+  v3303 = v3302;
+  v3304 = v3303;
+  v3305 = v3304;
+  v3306 = v3305;
+  v3307 = v3306;
+  v3308 = v3307;
+  v3309 = v3308;
+  v3310 = v3309;
+  v3311 = v3310;
+  v3312 = v3311;
+  v3313 = v3312;
+  v3314 = v3313;
+  v3315 = v3314;
+  v3316 = v3315;
+  v3317 = v3316;
+  v3318 = v3317;
+  v3319 = v3318;
+  v3320 = v3319;
+  v3321 = v3320;
+  v3322 = v3321;
+  v3323 = v3322;
+  v3324 = v3323;
+  v3325 = v3324;
+  v3326 = v3325;
+  v3327 = v3326;
+  v3328 = v3327;
+  v3329 = v3328;
+  v3330 = v3329;
+  v3331 = v3330;
+  v3332 = v3331;
+  v3333 = v3332;
+  v3334 = v3333;
+  v3335 = v3334;
+  v3336 = v3335;
+  v3337 = v3336;
+  v3338 = v3337;
+  v3339 = v3338;
+  v3340 = v3339;
+  v3341 = v3340;
+  v3342 = v3341;
+  v3343 = v3342;
+  v3344 = v3343;
+  v3345 = v3344;
+  v3346 = v3345;
+  v3347 = v3346;
+  v3348 = v3347;
+  v3349 = v3348;
+  v3350 = v3349;
+  v3351 = v3350;
+  v3352 = v3351;
+  v3353 = v3352;
+  v3354 = v3353;
+  v3355 = v3354;
+  v3356 = v3355;
+  v3357 = v3356;
+  v3358 = v3357;
+  v3359 = v3358;
+  v3360 = v3359;
+  v3361 = v3360;
+  v3362 = v3361;
+  v3363 = v3362;
+  v3364 = v3363;
+  v3365 = v3364;
+  v3366 = v3365;
+  v3367 = v3366;
+  v3368 = v3367;
+  v3369 = v3368;
+  v3370 = v3369;
+  v3371 = v3370;
+  v3372 = v3371;
+  v3373 = v3372;
+  v3374 = v3373;
+  v3375 = v3374;
+  v3376 = v3375;
+  v3377 = v3376;
+  v3378 = v3377;
+  v3379 = v3378;
+  v3380 = v3379;
+  v3381 = v3380;
+  v3382 = v3381;
+  v3383 = v3382;
+  v3384 = v3383;
+  v3385 = v3384;
+  v3386 = v3385;
+  v3387 = v3386;
+  v3388 = v3387;
+  v3389 = v3388;
+  v3390 = v3389;
+  v3391 = v3390;
+  v3392 = v3391;
+  v3393 = v3392;
+  v3394 = v3393;
+  v3395 = v3394;
+  v3396 = v3395;
+  v3397 = v3396;
+  v3398 = v3397;
+  v3399 = v3398;
+  v3400 = v3399;
+  v3401 = v3400;
+  v3402 = v3401;
+  v3403 = v3402;
+  v3404 = v3403;
+  v3405 = v3404;
+  v3406 = v3405;
+  v3407 = v3406;
+  v3408 = v3407;
+  v3409 = v3408;
+  v3410 = v3409;
+  v3411 = v3410;
+  v3412 = v3411;
+  v3413 = v3412;
+  v3414 = v3413;
+  v3415 = v3414;
+  v3416 = v3415;
+  v3417 = v3416;
+  v3418 = v3417;
+  v3419 = v3418;
+  v3420 = v3419;
+  v3421 = v3420;
+  v3422 = v3421;
+  v3423 = v3422;
+  v3424 = v3423;
+  v3425 = v3424;
+  v3426 = v3425;
+  v3427 = v3426;
+  v3428 = v3427;
+  v3429 = v3428;
+  v3430 = v3429;
+  v3431 = v3430;
+  v3432 = v3431;
+  v3433 = v3432;
+  v3434 = v3433;
+  v3435 = v3434;
+  v3436 = v3435;
+  v3437 = v3436;
+  v3438 = v3437;
+  v3439 = v3438;
+  v3440 = v3439;
+  v3441 = v3440;
+  v3442 = v3441;
+  v3443 = v3442;
+  v3444 = v3443;
+  v3445 = v3444;
+  v3446 = v3445;
+  v3447 = v3446;
+  v3448 = v3447;
+  v3449 = v3448;
+  v3450 = v3449;
+  v3451 = v3450;
+  v3452 = v3451;
+  v3453 = v3452;
+  v3454 = v3453;
+  v3455 = v3454;
+  v3456 = v3455;
+  v3457 = v3456;
+  v3458 = v3457;
+  v3459 = v3458;
+  v3460 = v3459;
+  v3461 = v3460;
+  v3462 = v3461;
+  v3463 = v3462;
+  v3464 = v3463;
+  v3465 = v3464;
+  v3466 = v3465;
+  v3467 = v3466;
+  v3468 = v3467;
+  v3469 = v3468;
+  v3470 = v3469;
+  v3471 = v3470;
+  v3472 = v3471;
+  v3473 = v3472;
+  v3474 = v3473;
+  v3475 = v3474;
+  v3476 = v3475;
+  v3477 = v3476;
+  v3478 = v3477;
+  v3479 = v3478;
+  v3480 = v3479;
+  v3481 = v3480;
+  v3482 = v3481;
+  v3483 = v3482;
+  v3484 = v3483;
+  v3485 = v3484;
+  v3486 = v3485;
+  v3487 = v3486;
+  v3488 = v3487;
+  v3489 = v3488;
+  v3490 = v3489;
+  v3491 = v3490;
+  v3492 = v3491;
+  v3493 = v3492;
+  v3494 = v3493;
+  v3495 = v3494;
+  v3496 = v3495;
+  v3497 = v3496;
+  v3498 = v3497;
+  v3499 = v3498;
+  v3500 = v3499;
+  v3501 = v3500;
+  v3502 = v3501;
+  v3503 = v3502;
+  v3504 = v3503;
+  v3505 = v3504;
+  v3506 = v3505;
+  v3507 = v3506;
+  v3508 = v3507;
+  v3509 = v3508;
+  v3510 = v3509;
+  v3511 = v3510;
+  v3512 = v3511;
+  v3513 = v3512;
+  v3514 = v3513;
+  v3515 = v3514;
+  v3516 = v3515;
+  v3517 = v3516;
+  v3518 = v3517;
+  v3519 = v3518;
+  v3520 = v3519;
+  v3521 = v3520;
+  v3522 = v3521;
+  v3523 = v3522;
+  v3524 = v3523;
+  v3525 = v3524;
+  v3526 = v3525;
+  v3527 = v3526;
+  v3528 = v3527;
+  v3529 = v3528;
+  v3530 = v3529;
+  v3531 = v3530;
+  v3532 = v3531;
+  v3533 = v3532;
+  v3534 = v3533;
+  v3535 = v3534;
+  v3536 = v3535;
+  v3537 = v3536;
+  v3538 = v3537;
+  v3539 = v3538;
+  v3540 = v3539;
+  v3541 = v3540;
+  v3542 = v3541;
+  v3543 = v3542;
+  v3544 = v3543;
+  v3545 = v3544;
+  v3546 = v3545;
+  v3547 = v3546;
+  v3548 = v3547;
+  v3549 = v3548;
+  v3550 = v3549;
+  v3551 = v3550;
+  v3552 = v3551;
+  v3553 = v3552;
+  v3554 = v3553;
+  v3555 = v3554;
+  v3556 = v3555;
+  v3557 = v3556;
+  v3558 = v3557;
+  v3559 = v3558;
+  v3560 = v3559;
+  v3561 = v3560;
+  v3562 = v3561;
+  v3563 = v3562;
+  v3564 = v3563;
+  v3565 = v3564;
+  v3566 = v3565;
+  v3567 = v3566;
+  v3568 = v3567;
+  v3569 = v3568;
+  v3570 = v3569;
+  v3571 = v3570;
+  v3572 = v3571;
+  v3573 = v3572;
+  v3574 = v3573;
+  v3575 = v3574;
+  v3576 = v3575;
+  v3577 = v3576;
+  v3578 = v3577;
+  v3579 = v3578;
+  v3580 = v3579;
+  v3581 = v3580;
+  v3582 = v3581;
+  v3583 = v3582;
+  v3584 = v3583;
+  v3585 = v3584;
+  v3586 = v3585;
+  v3587 = v3586;
+  v3588 = v3587;
+  v3589 = v3588;
+  v3590 = v3589;
+  v3591 = v3590;
+  v3592 = v3591;
+  v3593 = v3592;
+  v3594 = v3593;
+  v3595 = v3594;
+  v3596 = v3595;
+  v3597 = v3596;
+  v3598 = v3597;
+  v3599 = v3598;
+  v3600 = v3599;
+  v3601 = v3600;
+  v3602 = v3601;
+  v3603 = v3602;
+  v3604 = v3603;
+  v3605 = v3604;
+  v3606 = v3605;
+  v3607 = v3606;
+  v3608 = v3607;
+  v3609 = v3608;
+  v3610 = v3609;
+  v3611 = v3610;
+  v3612 = v3611;
+  v3613 = v3612;
+  v3614 = v3613;
+  v3615 = v3614;
+  v3616 = v3615;
+  v3617 = v3616;
+  v3618 = v3617;
+  v3619 = v3618;
+  v3620 = v3619;
+  v3621 = v3620;
+  v3622 = v3621;
+  v3623 = v3622;
+  v3624 = v3623;
+  v3625 = v3624;
+  v3626 = v3625;
+  v3627 = v3626;
+  v3628 = v3627;
+  v3629 = v3628;
+  v3630 = v3629;
+  v3631 = v3630;
+  v3632 = v3631;
+  v3633 = v3632;
+  v3634 = v3633;
+  v3635 = v3634;
+  v3636 = v3635;
+  v3637 = v3636;
+  v3638 = v3637;
+  v3639 = v3638;
+  v3640 = v3639;
+  v3641 = v3640;
+  v3642 = v3641;
+  v3643 = v3642;
+  v3644 = v3643;
+  v3645 = v3644;
+  v3646 = v3645;
+  v3647 = v3646;
+  v3648 = v3647;
+  v3649 = v3648;
+  v3650 = v3649;
+  v3651 = v3650;
+  v3652 = v3651;
+  v3653 = v3652;
+  v3654 = v3653;
+  v3655 = v3654;
+  v3656 = v3655;
+  v3657 = v3656;
+  v3658 = v3657;
+  v3659 = v3658;
+  v3660 = v3659;
+  v3661 = v3660;
+  v3662 = v3661;
+  v3663 = v3662;
+  v3664 = v3663;
+  v3665 = v3664;
+  v3666 = v3665;
+  v3667 = v3666;
+  v3668 = v3667;
+  v3669 = v3668;
+  v3670 = v3669;
+  v3671 = v3670;
+  v3672 = v3671;
+  v3673 = v3672;
+  v3674 = v3673;
+  v3675 = v3674;
+  v3676 = v3675;
+  v3677 = v3676;
+  v3678 = v3677;
+  v3679 = v3678;
+  v3680 = v3679;
+  v3681 = v3680;
+  v3682 = v3681;
+  v3683 = v3682;
+  v3684 = v3683;
+  v3685 = v3684;
+  v3686 = v3685;
+  v3687 = v3686;
+  v3688 = v3687;
+  v3689 = v3688;
+  v3690 = v3689;
+  v3691 = v3690;
+  v3692 = v3691;
+  v3693 = v3692;
+  v3694 = v3693;
+  v3695 = v3694;
+  v3696 = v3695;
+  v3697 = v3696;
+  v3698 = v3697;
+  v3699 = v3698;
+  v3700 = v3699;
+  v3701 = v3700;
+  v3702 = v3701;
+  v3703 = v3702;
+  v3704 = v3703;
+  v3705 = v3704;
+  v3706 = v3705;
+  v3707 = v3706;
+  v3708 = v3707;
+  v3709 = v3708;
+  v3710 = v3709;
+  v3711 = v3710;
+  v3712 = v3711;
+  v3713 = v3712;
+  v3714 = v3713;
+  v3715 = v3714;
+  v3716 = v3715;
+  v3717 = v3716;
+  v3718 = v3717;
+  v3719 = v3718;
+  v3720 = v3719;
+  v3721 = v3720;
+  v3722 = v3721;
+  v3723 = v3722;
+  v3724 = v3723;
+  v3725 = v3724;
+  v3726 = v3725;
+  v3727 = v3726;
+  v3728 = v3727;
+  v3729 = v3728;
+  v3730 = v3729;
+  v3731 = v3730;
+  v3732 = v3731;
+  v3733 = v3732;
+  v3734 = v3733;
+  v3735 = v3734;
+  v3736 = v3735;
+  v3737 = v3736;
+  v3738 = v3737;
+  v3739 = v3738;
+  v3740 = v3739;
+  v3741 = v3740;
+  v3742 = v3741;
+  v3743 = v3742;
+  v3744 = v3743;
+  v3745 = v3744;
+  v3746 = v3745;
+  v3747 = v3746;
+  v3748 = v3747;
+  v3749 = v3748;
+  v3750 = v3749;
+  v3751 = v3750;
+  v3752 = v3751;
+  v3753 = v3752;
+  v3754 = v3753;
+  v3755 = v3754;
+  v3756 = v3755;
+  v3757 = v3756;
+  v3758 = v3757;
+  v3759 = v3758;
+  v3760 = v3759;
+  v3761 = v3760;
+  v3762 = v3761;
+  v3763 = v3762;
+  v3764 = v3763;
+  v3765 = v3764;
+  v3766 = v3765;
+  v3767 = v3766;
+  v3768 = v3767;
+  v3769 = v3768;
+  v3770 = v3769;
+  v3771 = v3770;
+  v3772 = v3771;
+  v3773 = v3772;
+  v3774 = v3773;
+  v3775 = v3774;
+  v3776 = v3775;
+  v3777 = v3776;
+  v3778 = v3777;
+  v3779 = v3778;
+  v3780 = v3779;
+  v3781 = v3780;
+  v3782 = v3781;
+  v3783 = v3782;
+  v3784 = v3783;
+  v3785 = v3784;
+  v3786 = v3785;
+  v3787 = v3786;
+  v3788 = v3787;
+  v3789 = v3788;
+  v3790 = v3789;
+  v3791 = v3790;
+  v3792 = v3791;
+  v3793 = v3792;
+  v3794 = v3793;
+  v3795 = v3794;
+  v3796 = v3795;
+  v3797 = v3796;
+  v3798 = v3797;
+  v3799 = v3798;
+  v3800 = v3799;
+  v3801 = v3800;
+  v3802 = v3801;
+  v3803 = v3802;
+  v3804 = v3803;
+  v3805 = v3804;
+  v3806 = v3805;
+  v3807 = v3806;
+  v3808 = v3807;
+  v3809 = v3808;
+  v3810 = v3809;
+  v3811 = v3810;
+  v3812 = v3811;
+  v3813 = v3812;
+  v3814 = v3813;
+  v3815 = v3814;
+  v3816 = v3815;
+  v3817 = v3816;
+  v3818 = v3817;
+  v3819 = v3818;
+  v3820 = v3819;
+  v3821 = v3820;
+  v3822 = v3821;
+  v3823 = v3822;
+  v3824 = v3823;
+  v3825 = v3824;
+  v3826 = v3825;
+  v3827 = v3826;
+  v3828 = v3827;
+  v3829 = v3828;
+  v3830 = v3829;
+  v3831 = v3830;
+  v3832 = v3831;
+  v3833 = v3832;
+  v3834 = v3833;
+  v3835 = v3834;
+  v3836 = v3835;
+  v3837 = v3836;
+  v3838 = v3837;
+  v3839 = v3838;
+  v3840 = v3839;
+  v3841 = v3840;
+  v3842 = v3841;
+  v3843 = v3842;
+  v3844 = v3843;
+  v3845 = v3844;
+  v3846 = v3845;
+  v3847 = v3846;
+  v3848 = v3847;
+  v3849 = v3848;
+  v3850 = v3849;
+  v3851 = v3850;
+  v3852 = v3851;
+  v3853 = v3852;
+  v3854 = v3853;
+  v3855 = v3854;
+  v3856 = v3855;
+  v3857 = v3856;
+  v3858 = v3857;
+  v3859 = v3858;
+  v3860 = v3859;
+  v3861 = v3860;
+  v3862 = v3861;
+  v3863 = v3862;
+  v3864 = v3863;
+  v3865 = v3864;
+  v3866 = v3865;
+  v3867 = v3866;
+  v3868 = v3867;
+  v3869 = v3868;
+  v3870 = v3869;
+  v3871 = v3870;
+  v3872 = v3871;
+  v3873 = v3872;
+  v3874 = v3873;
+  v3875 = v3874;
+  v3876 = v3875;
+  v3877 = v3876;
+  v3878 = v3877;
+  v3879 = v3878;
+  v3880 = v3879;
+  v3881 = v3880;
+  v3882 = v3881;
+  v3883 = v3882;
+  v3884 = v3883;
+  v3885 = v3884;
+  v3886 = v3885;
+  v3887 = v3886;
+  v3888 = v3887;
+  v3889 = v3888;
+  v3890 = v3889;
+  v3891 = v3890;
+  v3892 = v3891;
+  v3893 = v3892;
+  v3894 = v3893;
+  v3895 = v3894;
+  v3896 = v3895;
+  v3897 = v3896;
+  v3898 = v3897;
+  v3899 = v3898;
+  v3900 = v3899;
+  v3901 = v3900;
+  v3902 = v3901;
+  v3903 = v3902;
+  v3904 = v3903;
+  v3905 = v3904;
+  v3906 = v3905;
+  v3907 = v3906;
+  v3908 = v3907;
+  v3909 = v3908;
+  v3910 = v3909;
+  v3911 = v3910;
+  v3912 = v3911;
+  v3913 = v3912;
+  v3914 = v3913;
+  v3915 = v3914;
+  v3916 = v3915;
+  v3917 = v3916;
+  v3918 = v3917;
+  v3919 = v3918;
+  v3920 = v3919;
+  v3921 = v3920;
+  v3922 = v3921;
+  v3923 = v3922;
+  v3924 = v3923;
+  v3925 = v3924;
+  v3926 = v3925;
+  v3927 = v3926;
+  v3928 = v3927;
+  v3929 = v3928;
+  v3930 = v3929;
+  v3931 = v3930;
+  v3932 = v3931;
+  v3933 = v3932;
+  v3934 = v3933;
+  v3935 = v3934;
+  v3936 = v3935;
+  v3937 = v3936;
+  v3938 = v3937;
+  v3939 = v3938;
+  v3940 = v3939;
+  v3941 = v3940;
+  v3942 = v3941;
+  v3943 = v3942;
+  v3944 = v3943;
+  v3945 = v3944;
+  v3946 = v3945;
+  v3947 = v3946;
+  v3948 = v3947;
+  v3949 = v3948;
+  v3950 = v3949;
+  v3951 = v3950;
+  v3952 = v3951;
+  v3953 = v3952;
+  v3954 = v3953;
+  v3955 = v3954;
+  v3956 = v3955;
+  v3957 = v3956;
+  v3958 = v3957;
+  v3959 = v3958;
+  v3960 = v3959;
+  v3961 = v3960;
+  v3962 = v3961;
+  v3963 = v3962;
+  v3964 = v3963;
+  v3965 = v3964;
+  v3966 = v3965;
+  v3967 = v3966;
+  v3968 = v3967;
+  v3969 = v3968;
+  v3970 = v3969;
+  v3971 = v3970;
+  v3972 = v3971;
+  v3973 = v3972;
+  v3974 = v3973;
+  v3975 = v3974;
+  v3976 = v3975;
+  v3977 = v3976;
+  v3978 = v3977;
+  v3979 = v3978;
+  v3980 = v3979;
+  v3981 = v3980;
+  v3982 = v3981;
+  v3983 = v3982;
+  v3984 = v3983;
+  v3985 = v3984;
+  v3986 = v3985;
+  v3987 = v3986;
+  v3988 = v3987;
+  v3989 = v3988;
+  v3990 = v3989;
+  v3991 = v3990;
+  v3992 = v3991;
+  v3993 = v3992;
+  v3994 = v3993;
+  v3995 = v3994;
+  v3996 = v3995;
+  v3997 = v3996;
+  v3998 = v3997;
+  v3999 = v3998;
+  if (v3999 >= 0) {      // a >= 0 reaches the end of the chain: folds to 1
+    return v3999;
+  }
+  return -1;
+}
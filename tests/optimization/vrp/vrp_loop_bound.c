@@ -0,0 +1,20 @@
+int main() {
+    int n;
+    int i;
+    int s;
+    n = 0;
+    while (n < 7) {      // n is not a compile-time constant below
+        n = n + 1;
+    }
+    i = 0;
+    s = 0;
+    while (i < n) {      // i only counts up from 0, so i >= 0 in the body
+        if (i >= 0) {        // always true: the test and the else arm go
+            s = s + i;
+        } else {
+            s = s - 100;
+        }
+        i = i + 1;
+    }
+    return s;            // 21
+}
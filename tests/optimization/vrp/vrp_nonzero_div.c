@@ -0,0 +1,18 @@
+int main() {
+    int n;
+    int d;
+    int i;
+    int s;
+    n = 0;
+    while (n < 4) {
+        n = n + 1;
+    }
+    d = n + 1;           // n >= 0 on every path, so d >= 1: never zero
+    i = 0;
+    s = 0;
+    while (i < 10) {
+        s = s + 100 / d;     // safe to hoist in front of the loop
+        i = i + 1;
+    }
+    return s;            // 200
+}